@@ -70,6 +70,35 @@ app.conf.beat_schedule = {
         'options': {'queue': 'storage'},
     },
     
+    # -------------------------------------------------------------------------
+    # TENANT TASKS
+    # -------------------------------------------------------------------------
+    
+    # Tenant sayaç mutabakatı (her saat)
+    'tenants-reconcile-counters': {
+        'task': 'backend.tenants.tasks.reconcile_tenant_counters',
+        'schedule': crontab(minute=15),
+        'options': {'queue': 'default'},
+    },
+    
+    # Tenant sayfalarını cache'e doldur (her 5 dakika)
+    'tenants-warm-caches': {
+        'task': 'backend.tenants.tasks.warm_tenant_caches',
+        'schedule': crontab(minute='*/5'),
+        'options': {'queue': 'default'},
+    },
+    
+    # -------------------------------------------------------------------------
+    # IDEMPOTENCY TASKS
+    # -------------------------------------------------------------------------
+    
+    # Süresi dolmuş kalıcı idempotency kayıtlarını temizle (her saat)
+    'idempotency-purge-expired': {
+        'task': 'backend.libs.idempotency.tasks.purge_expired_idempotency_records',
+        'schedule': crontab(minute=45),
+        'options': {'queue': 'default'},
+    },
+    
     # -------------------------------------------------------------------------
     # CERTIFICATE TASKS
     # -------------------------------------------------------------------------
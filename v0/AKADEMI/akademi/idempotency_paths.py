@@ -0,0 +1,17 @@
+"""
+Akademi Idempotency Paths
+=========================
+
+IdempotencyMiddleware'in path → store eşlemesi (ilk eşleşen, `*` joker
+karakteri). Değer store adı veya {'store', 'timeout'} sözlüğüdür.
+
+settings.py ve settings_test.py aynı eşlemeyi kullanır; eşleme sadece
+burada tanımlanır.
+"""
+
+IDEMPOTENCY_PATHS = {
+    # Tekrarı veri bozar: cache eviction'ından etkilenmeyen kalıcı store
+    '/api/v1/courses/*/content/*/progress/': {'store': 'durable', 'timeout': 30},
+    '/api/v1/courses/*/content/*/sessions/': {'store': 'default', 'timeout': 60},
+    '/api/v1/courses/': 'default',  # Events
+}
@@ -0,0 +1,17 @@
+"""
+Akademi Query Budgets
+=====================
+
+View bazında en fazla sorgu sayısı (URL adı veya dotted path).
+
+settings.py (QueryCountMiddleware) ve settings_test.py (QueryBudgetMixin)
+aynı bütçeleri kullanır; bütçeler sadece burada tanımlanır.
+"""
+
+QUERY_BUDGETS = {
+    'instructor:dashboard': 12,
+    'instructor:students-list': 6,
+    'instructor:behavior-students': 6,
+    'instructor:behavior-classes': 8,
+    'instructor:calendar-list': 4,
+}
@@ -35,9 +35,13 @@ Kullanım:
 DJANGO_SETTINGS_MODULE=akademi.settings
 """
 
+import importlib.util
 import sys
 from pathlib import Path
 
+from akademi.idempotency_paths import IDEMPOTENCY_PATHS
+from akademi.query_budgets import QUERY_BUDGETS
+
 # =============================================================================
 # AKADEMI BASE DIRECTORY
 # =============================================================================
@@ -57,6 +61,7 @@ if str(MAYSCON_V1_PATH) not in sys.path:
 # =============================================================================
 # Tüm ayarları mayscon.v1'den al (database ve logging hariç - modüler yapı)
 from config.settings import *  # pyright: ignore[reportMissingImports]
+from config.settings.env import config  # pyright: ignore[reportMissingImports]
 
 # =============================================================================
 # AKADEMI-SPECIFIC OVERRIDES
@@ -118,6 +123,8 @@ INSTALLED_APPS += [
     'backend.realtime',
     # Canlı ders modülü
     'backend.live',
+    # Kalıcı idempotency kayıtları
+    'backend.libs.idempotency',
 ]
 
 # =============================================================================
@@ -164,6 +171,121 @@ AUDIT_EXCLUDE_PATHS = [
 ]
 AUDIT_METHODS = ['POST', 'PUT', 'PATCH', 'DELETE']  # Bu HTTP metodlarını logla
 
+# =============================================================================
+# QUERY COUNT MIDDLEWARE (Sorgu Bütçesi / N+1 Tespiti)
+# =============================================================================
+MIDDLEWARE += [
+    'backend.libs.querycount.middleware.QueryCountMiddleware',
+]
+
+QUERY_COUNT_ENABLED = DEBUG  # pyright: ignore
+QUERY_COUNT_PATHS = ['/api/']
+QUERY_COUNT_DUPLICATE_THRESHOLD = 3  # Aynı sorgu bu kadar tekrarlanırsa N+1 raporu
+# QUERY_BUDGETS: akademi/query_budgets.py (test ayarlarıyla ortak)
+
+# =============================================================================
+# ENDPOINT METRİKLERİ (Prometheus)
+# =============================================================================
+# Diğer middleware'lerin süresini de ölçmek için en başa eklenir
+MIDDLEWARE = ['backend.libs.metrics.middleware.MetricsMiddleware'] + list(MIDDLEWARE)
+
+METRICS_ENABLED = config('METRICS_ENABLED', default=True, cast=bool)
+METRICS_PATHS = ['/api/']
+METRICS_TENANT_LABEL = True  # Tenant sayısı çok artarsa kapatılabilir
+METRICS_TOKEN = config('METRICS_TOKEN', default='')  # /metrics/ için Bearer token
+# Çok worker'lı kurulumda ortak dizin (deploy'da boşaltılmalı); boşsa process içi
+METRICS_MULTIPROC_DIR = config('METRICS_MULTIPROC_DIR', default='')
+METRICS_FLUSH_INTERVAL = 1.0
+
+# =============================================================================
+# İKİ KATMANLI CACHE (Process LRU + Redis)
+# =============================================================================
+# Aile bazında TTL'ler (saniye) ve yerel LRU boyutu.
+# stamp_interval: Başka worker'daki invalidation'ın en geç görüneceği süre
+TIERED_CACHE_FAMILIES = {
+    'user': {'timeout': 300, 'local_timeout': 30, 'max_entries': 5000},
+    'tenant': {'timeout': 600, 'local_timeout': 60, 'max_entries': 500},
+    'tenant_settings': {'timeout': 600, 'local_timeout': 60, 'max_entries': 500},
+    'course_outline': {'timeout': 900, 'local_timeout': 60, 'max_entries': 5000},
+}
+
+# =============================================================================
+# CACHE STAMPEDE KORUMASI (cache_per_tenant, cache_response, CachedManager)
+# =============================================================================
+# beta: Erken yenileme katsayısı (0 = kapalı)
+# stale_ttl: Süre dolduktan sonra yenileme sürerken bayat verinin sunulduğu süre
+# wait: Bayat veri yoksa yeniden hesaplamayı bekleme süresi (saniye)
+CACHE_STAMPEDE = {
+    'beta': 1.0,
+    'stale_ttl': 60,
+    'lock_timeout': 30,
+    'wait': 5.0,
+}
+
+# =============================================================================
+# CACHE CODEC'LERİ (cache_per_tenant(codec=...), CachedManager.cache_codec)
+# =============================================================================
+# Ölçüm: python manage.py cache_benchmark --scenario codecs
+# Müfredatlı kurs detayında (~18 KB pickle) compact ~2.3 KB, fast ~6 KB;
+# okuma gecikmesi pickle ile aynı düzeyde.
+# compact / idempotency: json + zlib; orjson kuruluysa onu kullanır (aynı
+# çıktı, daha hızlı). fast için orjson ve lz4 kurulu olmalıdır.
+CACHE_JSON_SERIALIZER = 'orjson' if importlib.util.find_spec('orjson') else 'json'
+
+CACHE_CODECS = {
+    'compact': {'serializer': CACHE_JSON_SERIALIZER, 'compression': 'zlib', 'threshold': 1024},
+    'fast': {'serializer': 'orjson', 'compression': 'lz4', 'threshold': 1024},
+    # Küçük response'lar (idempotency kayıtları): progress kaydı 264 -> 201 byte
+    'idempotency': {'serializer': CACHE_JSON_SERIALIZER, 'compression': 'zlib', 'threshold': 128},
+}
+
+# JWT doğrulamasında kullanıcı + tenant cache'ten okunur
+REST_FRAMEWORK['DEFAULT_AUTHENTICATION_CLASSES'] = [  # pyright: ignore
+    'backend.users.authentication.CachedJWTAuthentication'
+    if path == 'rest_framework_simplejwt.authentication.JWTAuthentication' else path
+    for path in REST_FRAMEWORK.get('DEFAULT_AUTHENTICATION_CLASSES', [])  # pyright: ignore
+]
+
+# =============================================================================
+# CACHE ISITMA (python manage.py cache_warm, tenants.warm_tenant_caches)
+# =============================================================================
+# Sayfalar aktif tenant'ların ilgili roldeki en son giriş yapmış
+# users_per_tenant kullanıcısı için view kod yolundan render edilir.
+# Liste en çok ziyaret edilen sayfalara göre tutulur (akademi_http_requests_total).
+# concurrency: Paralel render (= en fazla açılan DB bağlantısı)
+CACHE_WARMER = {
+    'endpoints': [
+        {'view': 'instructor:dashboard', 'roles': ['INSTRUCTOR']},
+        {'view': 'instructor:calendar-list', 'roles': ['INSTRUCTOR']},
+        {'view': 'instructor:behavior-content-issues', 'roles': ['INSTRUCTOR']},
+        {'view': 'courses:course-list', 'roles': ['STUDENT', 'INSTRUCTOR']},
+    ],
+    'users_per_tenant': 20,
+    'concurrency': 4,
+}
+
+# =============================================================================
+# IDEMPOTENCY (IdempotencyMiddleware)
+# =============================================================================
+# default: Redis, kompakt kodlanmış kayıtlar; eviction'da kayıt kaybolabilir
+# durable: Yalnızca eklemeli tablo, saatlik purge (idempotency-purge-expired)
+# Ölçüm: python manage.py idempotency_benchmark
+IDEMPOTENCY_STORES = {
+    'default': {
+        'BACKEND': 'backend.libs.idempotency.stores.CacheStore',
+        'OPTIONS': {'codec': 'idempotency'},
+    },
+    'durable': {
+        'BACKEND': 'backend.libs.idempotency.stores.DatabaseStore',
+        'OPTIONS': {'codec': 'idempotency'},
+    },
+}
+
+# Path → store eşlemesi: akademi/idempotency_paths.py (settings_test.py ile ortak)
+MIDDLEWARE += [
+    'backend.libs.idempotency.IdempotencyMiddleware',
+]
+
 # =============================================================================
 # STATIC & MEDIA (MAYSCON Webapp'tan kalıtım)
 # =============================================================================
@@ -13,6 +13,9 @@ import os
 import sys
 from pathlib import Path
 
+from akademi.idempotency_paths import IDEMPOTENCY_PATHS
+from akademi.query_budgets import QUERY_BUDGETS
+
 # =============================================================================
 # PATH CONFIGURATION
 # =============================================================================
@@ -81,6 +84,8 @@ INSTALLED_APPS = [
     # Realtime & Live
     'backend.realtime',
     'backend.live',
+    # Idempotency kayıtları (durable store)
+    'backend.libs.idempotency',
     
     # Logs
     'logs.audit',
@@ -98,8 +103,16 @@ MIDDLEWARE = [
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
+    'backend.libs.idempotency.IdempotencyMiddleware',
 ]
 
+# =============================================================================
+# QUERY BUDGETS
+# =============================================================================
+# Testlerde QueryBudgetMixin ile zorlanır (middleware kapalı)
+# QUERY_BUDGETS: akademi/query_budgets.py (settings.py ile ortak)
+QUERY_COUNT_ENABLED = False
+
 # =============================================================================
 # DATABASE
 # =============================================================================
@@ -213,6 +226,20 @@ else:
         }
     }
 
+# =============================================================================
+# IDEMPOTENCY
+# =============================================================================
+# Codec'siz: opsiyonel serializer paketleri gerekmez
+# IDEMPOTENCY_PATHS: akademi/idempotency_paths.py (settings.py ile ortak)
+IDEMPOTENCY_STORES = {
+    'default': {
+        'BACKEND': 'backend.libs.idempotency.stores.CacheStore',
+    },
+    'durable': {
+        'BACKEND': 'backend.libs.idempotency.stores.DatabaseStore',
+    },
+}
+
 # =============================================================================
 # CELERY
 # =============================================================================
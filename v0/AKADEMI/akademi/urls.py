@@ -57,6 +57,9 @@ enrollment_router.register('', EnrollmentViewSet, basename='enrollment')
 from backend.notes.urls import content_urlpatterns as notes_content_urls
 from backend.ai.urls import content_urlpatterns as ai_content_urls
 
+# Prometheus metrics endpoint
+from backend.libs.metrics.views import metrics_view
+
 # Akademi URL'leri - ÖNCE tanımlanır (override için)
 urlpatterns = [
     # Auth API - JWT Authentication (Frontend expects /api/v1/auth/...)
@@ -163,6 +166,12 @@ urlpatterns = [
     # Canlı ders yönetimi - oturumlar, kayıtlar, yoklama
     path('api/v1/live-sessions/', include('backend.live.urls', namespace='live')),
     
+    # =========================================================================
+    # METRICS (Prometheus)
+    # =========================================================================
+    # Endpoint gecikme histogramları, DB süresi, cache hit/miss
+    path('metrics/', metrics_view, name='metrics'),
+    
 ]
 
 # =============================================================================
@@ -213,6 +222,7 @@ Kalıtım ile gelen (mayscon.v1):
 -----------------------------
 /admin/                     → Django Admin
 /health/                    → Health check
+/metrics/                   → Prometheus metrikleri
 /api/v1/                    → REST API
 /accounts/                  → Authentication
 /logs/                      → Log viewer
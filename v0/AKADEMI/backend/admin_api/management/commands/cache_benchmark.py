@@ -0,0 +1,70 @@
+"""
+Cache altyapısı ölçümlerini çalıştırır.
+
+Kullanım:
+    python manage.py cache_benchmark
+    python manage.py cache_benchmark --scenario invalidation --keys 1000000
+    python manage.py cache_benchmark --scenario keys --repeat 20000
+    python manage.py cache_benchmark --scenario codecs --codec-threshold 512
+
+Not: Benchmark key'leri yapılandırılmış cache'e yazılır (KEY_TIMEOUT sonra
+düşer); üretim cache'inde çalıştırmayın.
+"""
+
+import json
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+
+from backend.libs.cache import benchmark
+
+
+class Command(BaseCommand):
+    help = 'Cache altyapısı benchmark senaryolarını çalıştırır.'
+
+    SCENARIOS = ('invalidation', 'keys', 'codecs')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scenario',
+            action='append',
+            choices=self.SCENARIOS,
+            dest='scenarios',
+            help='Çalıştırılacak senaryo (birden fazla verilebilir, varsayılan: hepsi)',
+        )
+        parser.add_argument('--keys', type=int, default=1_000_000, help='Önceden doldurulacak key sayısı')
+        parser.add_argument('--repeat', type=int, default=1000, help='Ölçüm tekrar sayısı')
+        parser.add_argument('--legacy-repeat', type=int, default=3, help='delete_pattern tekrar sayısı')
+        parser.add_argument('--no-legacy', action='store_true', help='delete_pattern karşılaştırmasını atla')
+        parser.add_argument(
+            '--codec-threshold', type=int, default=1024,
+            help='Codec senaryosunda sıkıştırma eşiği (byte)',
+        )
+
+    def handle(self, *args, **options):
+        scenarios = options.get('scenarios') or self.SCENARIOS
+
+        max_entries = getattr(cache, '_max_entries', None)
+        if 'invalidation' in scenarios and max_entries is not None and max_entries < options['keys']:
+            self.stdout.write(self.style.WARNING(
+                f"Cache MAX_ENTRIES ({max_entries}) < --keys; key'ler cull edilecek."
+            ))
+
+        results = {}
+        if 'invalidation' in scenarios:
+            results['invalidation'] = benchmark.run_invalidation(
+                options['keys'],
+                repeat=options['repeat'],
+                legacy_repeat=options['legacy_repeat'],
+                legacy=not options['no_legacy'],
+            )
+        if 'keys' in scenarios:
+            results['keys'] = benchmark.run_keys(repeat=options['repeat'] * 10)
+
+        if 'codecs' in scenarios:
+            results['codecs'] = benchmark.run_codecs(
+                repeat=options['repeat'],
+                threshold=options['codec_threshold'],
+            )
+
+        self.stdout.write(json.dumps(results, indent=2))
@@ -0,0 +1,76 @@
+"""
+Aktif tenant'ların sık ziyaret edilen sayfalarını cache'e doldurur.
+
+Kullanım:
+    python manage.py cache_warm
+    python manage.py cache_warm --tenant 3 --tenant 7
+    python manage.py cache_warm --view instructor:dashboard --users 50 --concurrency 2
+
+Endpoint listesi ve varsayılanlar CACHE_WARMER ayarından gelir
+(bkz: backend.libs.cache.warmer). Periyodik çalıştırma:
+backend.tenants.tasks.warm_tenant_caches.
+"""
+
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from backend.libs.cache.warmer import CacheWarmer
+
+
+class Command(BaseCommand):
+    help = "Aktif tenant'ların sayfalarını cache'e doldurur."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tenant',
+            action='append',
+            type=int,
+            dest='tenants',
+            help='Yalnızca bu tenant (birden fazla verilebilir, varsayılan: tüm aktifler)',
+        )
+        parser.add_argument(
+            '--view',
+            action='append',
+            dest='views',
+            help='Yalnızca bu view adı (birden fazla verilebilir, varsayılan: CACHE_WARMER)',
+        )
+        parser.add_argument('--users', type=int, help='Tenant ve endpoint başına kullanıcı sayısı')
+        parser.add_argument('--concurrency', type=int, help='Paralel render sayısı')
+
+    def handle(self, *args, **options):
+        endpoints = None
+        if options['views']:
+            configured = {
+                endpoint['view']: endpoint
+                for endpoint in CacheWarmer.get_options()['endpoints']
+            }
+            endpoints = [configured.get(view, {'view': view}) for view in options['views']]
+
+        results = CacheWarmer.warm(
+            tenant_ids=options['tenants'],
+            endpoints=endpoints,
+            users_per_tenant=options['users'],
+            concurrency=options['concurrency'],
+        )
+
+        by_view = defaultdict(list)
+        for result in results:
+            by_view[result.view].append(result)
+
+        for view, view_results in sorted(by_view.items()):
+            durations = sorted(result.duration for result in view_results)
+            failed = sum(1 for result in view_results if not result.ok)
+            line = (
+                f"{view}: {len(view_results)} pages, "
+                f"p50 {durations[len(durations) // 2] * 1000:.1f} ms, "
+                f"max {durations[-1] * 1000:.1f} ms"
+            )
+            if failed:
+                self.stdout.write(self.style.WARNING(f"{line}, {failed} failed"))
+            else:
+                self.stdout.write(line)
+
+        failed = sum(1 for result in results if not result.ok)
+        summary = f"Cache warming done: {len(results)} pages, {failed} failed"
+        self.stdout.write(self.style.SUCCESS(summary) if not failed else self.style.WARNING(summary))
@@ -0,0 +1,39 @@
+"""
+Idempotency store'larının throughput ölçümünü çalıştırır.
+
+Kullanım:
+    python manage.py idempotency_benchmark
+    python manage.py idempotency_benchmark --operations 5000 --threads 8
+    python manage.py idempotency_benchmark --store durable
+
+Not: Benchmark kayıtları yapılandırılmış cache'e ve idempotency tablosuna
+yazılır, ölçüm sonunda silinir; üretimde çalıştırmayın.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from backend.libs.idempotency import benchmark
+
+
+class Command(BaseCommand):
+    help = "Idempotency store'larının throughput ölçümünü çalıştırır."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--store',
+            action='append',
+            dest='stores',
+            help='Ölçülecek store (birden fazla verilebilir, varsayılan: hepsi)',
+        )
+        parser.add_argument('--operations', type=int, default=2000, help='Senaryo başına işlem sayısı')
+        parser.add_argument('--threads', type=int, default=1, help='Paralel thread sayısı')
+
+    def handle(self, *args, **options):
+        results = benchmark.run_stores(
+            operations=options['operations'],
+            threads=options['threads'],
+            names=options['stores'],
+        )
+        self.stdout.write(json.dumps(results, indent=2))
@@ -0,0 +1,32 @@
+"""
+Öğrenci risk skorlamasının süre ölçümünü çalıştırır.
+
+Kullanım:
+    python manage.py risk_benchmark
+    python manage.py risk_benchmark --rows 500000 --repeat 5
+
+Not: Sentetik kohort bellekte üretilir; veritabanına yazılmaz.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from backend.student import benchmark
+
+
+class Command(BaseCommand):
+    help = 'Öğrenci risk skorlamasının süre ölçümünü çalıştırır.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100_000, help='Kohort büyüklüğü')
+        parser.add_argument('--tenants', type=int, default=20, help='Kohorttaki tenant sayısı')
+        parser.add_argument('--repeat', type=int, default=3, help='Deneme sayısı (en iyisi raporlanır)')
+
+    def handle(self, *args, **options):
+        results = benchmark.run(
+            rows=options['rows'],
+            tenants=options['tenants'],
+            repeat=options['repeat'],
+        )
+        self.stdout.write(json.dumps(results, indent=2))
@@ -790,6 +790,8 @@ class GeneralStatsSerializer(serializers.Serializer):
     totalStudents = serializers.IntegerField(required=False)
     totalCourses = serializers.IntegerField(required=False)
     totalRevenue = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    currency = serializers.CharField(required=False)
+    revenueByCurrency = serializers.DictField(child=serializers.FloatField(), required=False)
     avgCompletionRate = serializers.FloatField(required=False)
 
 
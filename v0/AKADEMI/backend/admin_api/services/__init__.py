@@ -0,0 +1,19 @@
+"""
+Admin API Services
+==================
+
+Admin paneli için iş mantığı servisleri.
+"""
+
+from .log_reader import LogCursorExpired, TechLogReader
+from .activity_log_service import ActivityLogService
+from .tenant_stats_service import TenantStatsService
+from .course_bulk_service import CourseBulkService
+
+__all__ = [
+    'TechLogReader',
+    'LogCursorExpired',
+    'ActivityLogService',
+    'TenantStatsService',
+    'CourseBulkService',
+]
@@ -0,0 +1,148 @@
+"""
+Activity Log Service
+====================
+
+AuditMiddleware'in `logs` veritabanına yazdığı AuditLog tablosu üzerinde
+cursor (keyset) sayfalamalı sorgular.
+
+OFFSET kullanılmaz; her sayfa (created_at, id) ikilisinden devam eder.
+Böylece milyonlarca kayıtta da sayfa maliyeti sabit kalır.
+"""
+
+import base64
+import json
+import logging
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityLogService:
+    """
+    Aktivite (audit) log sorgu servisi.
+    """
+
+    DEFAULT_LIMIT = 50
+    MAX_LIMIT = 200
+
+    # AuditLog zaman alanı
+    TIMESTAMP_FIELD = 'created_at'
+
+    @classmethod
+    def query(
+        cls,
+        tenant=None,
+        action: Optional[str] = None,
+        user_id: Optional[str] = None,
+        search: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_LIMIT,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        Audit log kayıtlarını yeniden eskiye döndür.
+
+        Args:
+            tenant: Verilirse sadece bu tenant kullanıcılarının kayıtları.
+            action: Aksiyon filtresi (LOGIN, CREATE, ...).
+            user_id: Kullanıcı filtresi.
+            search: object_repr / username içinde arama.
+            since: Başlangıç zamanı.
+            until: Bitiş zamanı.
+            cursor: Önceki sayfanın döndürdüğü cursor.
+            limit: Sayfa boyutu.
+
+        Returns:
+            Tuple[entries, next_cursor]
+        """
+        try:
+            from logs.audit.models import AuditLog
+        except ImportError:
+            logger.debug("AuditLog model not available for activity logs")
+            return [], None
+
+        limit = max(1, min(limit, cls.MAX_LIMIT))
+        ts_field = cls.TIMESTAMP_FIELD
+
+        queryset = AuditLog.objects.all()
+
+        if tenant is not None:
+            # AuditLog ayrı veritabanında - join yerine ID listesi
+            from backend.users.models import User
+            tenant_user_ids = list(
+                User.objects.filter(tenant=tenant).values_list('id', flat=True)
+            )
+            queryset = queryset.filter(user_id__in=tenant_user_ids)
+
+        if action:
+            queryset = queryset.filter(action=action)
+        if user_id:
+            queryset = queryset.filter(user_id=user_id)
+        if search:
+            queryset = queryset.filter(
+                Q(object_repr__icontains=search) | Q(username__icontains=search)
+            )
+        if since:
+            queryset = queryset.filter(**{f'{ts_field}__gte': since})
+        if until:
+            queryset = queryset.filter(**{f'{ts_field}__lte': until})
+
+        cursor_ts, cursor_id = cls._decode_cursor(cursor)
+        if cursor_ts is not None:
+            queryset = queryset.filter(
+                Q(**{f'{ts_field}__lt': cursor_ts}) |
+                Q(**{ts_field: cursor_ts, 'pk__lt': cursor_id})
+            )
+
+        # Bir fazla çek - sonraki sayfa var mı anlamak için
+        logs = list(queryset.order_by(f'-{ts_field}', '-pk')[:limit + 1])
+        has_more = len(logs) > limit
+        logs = logs[:limit]
+
+        next_cursor = None
+        if has_more and logs:
+            last = logs[-1]
+            next_cursor = cls._encode_cursor(getattr(last, ts_field), last.pk)
+
+        return [cls._serialize(log) for log in logs], next_cursor
+
+    @classmethod
+    def _serialize(cls, log) -> dict:
+        """AuditLog kaydını frontend formatına çevir."""
+        timestamp = getattr(log, cls.TIMESTAMP_FIELD)
+        username = getattr(log, 'username', '') or ''
+
+        return {
+            'id': str(log.pk),
+            'user': {
+                'id': str(log.user_id) if getattr(log, 'user_id', None) else None,
+                'name': username,
+                'email': username,
+            },
+            'action': log.action,
+            'resource': getattr(log, 'model_name', '') or '',
+            'details': getattr(log, 'object_repr', '') or '',
+            'timestamp': timestamp.isoformat() if timestamp else None,
+            'ipAddress': getattr(log, 'ip_address', None),
+        }
+
+    @staticmethod
+    def _encode_cursor(timestamp: datetime, pk) -> str:
+        payload = json.dumps({'t': timestamp.isoformat(), 'i': str(pk)}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]) -> Tuple[Optional[datetime], Optional[str]]:
+        if not cursor:
+            return None, None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+            timestamp = parse_datetime(payload['t'])
+            return (timestamp, payload['i']) if timestamp else (None, None)
+        except (ValueError, KeyError, TypeError):
+            return None, None
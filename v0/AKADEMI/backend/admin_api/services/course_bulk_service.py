@@ -0,0 +1,145 @@
+"""
+Course Bulk Service
+===================
+
+Toplu kurs durum geçişleri (onay, arşiv, yayından kaldırma).
+
+Geçiş tek bir UPDATE ile yapılır; etkilenen kurs ve tenant ID'leri
+toplanır ve commit sonrasında tek seferlik cache invalidation ile
+birleştirilmiş bildirim gönderimi tetiklenir. Kurs başına sinyal
+veya cache SCAN çalışmaz.
+"""
+
+import logging
+from typing import Iterable, List, Set
+
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class CourseBulkService:
+    """
+    Toplu kurs geçiş servisi.
+    """
+
+    ACTIONS = ('approve', 'archive', 'unpublish')
+
+    @classmethod
+    def transition_fields(cls, action: str) -> dict:
+        """Aksiyonun UPDATE alanları."""
+        from backend.courses.models import Course
+
+        if action == 'approve':
+            return {
+                'status': Course.Status.PUBLISHED,
+                'is_published': True,
+                'publish_at': timezone.now(),
+            }
+        if action == 'archive':
+            return {
+                'status': Course.Status.ARCHIVED,
+                'is_published': False,
+            }
+        if action == 'unpublish':
+            return {
+                'status': Course.Status.DRAFT,
+                'is_published': False,
+            }
+        raise ValueError(f"Unknown bulk course action: {action}")
+
+    @classmethod
+    def transition(cls, queryset, action: str) -> int:
+        """
+        Kursları tek UPDATE ile yeni duruma geçir.
+
+        Args:
+            queryset: Yetki kapsamındaki kurs queryset'i (filtrelenmiş)
+            action: approve | archive | unpublish
+
+        Returns:
+            Etkilenen kurs sayısı
+        """
+        from backend.courses.models import Course
+
+        fields = cls.transition_fields(action)
+
+        with transaction.atomic():
+            rows = list(queryset.order_by().values_list('id', 'tenant_id'))
+            if not rows:
+                return 0
+
+            course_ids = [course_id for course_id, _ in rows]
+            tenant_ids = {tenant_id for _, tenant_id in rows if tenant_id}
+
+            updated = Course.objects.filter(id__in=course_ids).update(**fields)
+
+            transaction.on_commit(
+                lambda: cls._after_commit(course_ids, tenant_ids, action)
+            )
+
+        return updated
+
+    @classmethod
+    def _after_commit(cls, course_ids: List, tenant_ids: Set, action: str) -> None:
+        """Commit sonrası: tek invalidation + tek bildirim görevi."""
+        from backend.courses.outline import CourseOutline
+        from backend.libs.cache.signals import invalidate_courses
+
+        invalidate_courses(course_ids, tenant_ids)
+        CourseOutline.invalidate(course_ids=course_ids)
+
+        try:
+            from backend.admin_api.tasks import notify_course_bulk_transition
+            notify_course_bulk_transition.delay([str(pk) for pk in course_ids], action)
+        except ImportError:
+            # Celery yüklü değilse senkron gönder
+            cls.notify_instructors(course_ids, action)
+
+    # =========================================================================
+    # BİLDİRİM
+    # =========================================================================
+
+    MESSAGES = {
+        'approve': ('Kurslarınız yayınlandı', '{count} kursunuz yönetici tarafından onaylandı ve yayına alındı.'),
+        'archive': ('Kurslarınız arşivlendi', '{count} kursunuz yönetici tarafından arşivlendi.'),
+        'unpublish': ('Kurslarınız yayından kaldırıldı', '{count} kursunuz yönetici tarafından yayından kaldırıldı.'),
+    }
+
+    @classmethod
+    def notify_instructors(cls, course_ids: Iterable, action: str) -> int:
+        """
+        Eğitmenlere birleştirilmiş bildirim gönder.
+
+        Kurs başına değil, eğitmen başına tek bildirim oluşturulur.
+
+        Returns:
+            Gönderilen bildirim sayısı
+        """
+        from backend.courses.models import Course
+        from backend.realtime.services import NotificationService
+        from backend.users.models import User
+
+        title, template = cls.MESSAGES[action]
+
+        # eğitmen -> kurs sayısı (tek sorgu)
+        course_counts = {}
+        through = Course.instructors.through.objects.filter(course_id__in=list(course_ids))
+        for user_id in through.values_list('user_id', flat=True):
+            course_counts[user_id] = course_counts.get(user_id, 0) + 1
+
+        sent = 0
+        for instructor in User.objects.filter(id__in=list(course_counts)):
+            notification = NotificationService.create_notification(
+                user=instructor,
+                title=title,
+                message=template.format(count=course_counts[instructor.id]),
+                notification_type='SYSTEM',
+                source='Kurs Yönetimi',
+            )
+            if notification:
+                sent += 1
+
+        logger.info(f"Bulk course '{action}' notifications sent: {sent}")
+        return sent
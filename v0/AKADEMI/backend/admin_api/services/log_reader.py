@@ -0,0 +1,473 @@
+"""
+Tech Log Reader
+===============
+
+LOG_DIR / LOG_FILES altındaki dosya loglarını sondan başa (reverse tail)
+okuyan, seyrek offset index'i ile zaman filtresini dosyanın tamamını
+taramadan uygulayan okuyucu.
+
+Tasarım:
+- Dosyalar blok blok sondan okunur; bellek kullanımı blok boyutu +
+  en uzun satır ile sınırlıdır.
+- Her dosya için INDEX_STEP byte'ta bir (timestamp, offset) noktası
+  tutulur. Index cache'de saklanır, büyüyen aktif dosya için artımlı
+  güncellenir, rotate edilmiş dosyalar için bir kez oluşturulur.
+- Cursor, dosyanın inode'u + byte offset'idir; rotation sonrası da
+  doğru dosyadan devam edilir. Dosya rotation ile silinmişse cursor
+  geçersizdir (LogCursorExpired); istemci ilk sayfadan başlar.
+
+Kullanım:
+--------
+reader = TechLogReader()
+entries, next_cursor = reader.read(levels={'ERROR'}, limit=50)
+"""
+
+import base64
+import bisect
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+# Bilinen log satırı formatları (ilk eşleşen kullanılır)
+LINE_PATTERNS = [
+    # [2025-01-02 10:11:12,345] INFO [backend.users:42] mesaj
+    re.compile(
+        r'^\[(?P<ts>\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2})(?:[.,]\d+)?\]\s+'
+        r'(?P<level>[A-Z]+)\s+\[(?P<logger>[^\]:]+)(?::\d+)?\]\s*(?P<message>.*)$'
+    ),
+    # INFO 2025-01-02 10:11:12,345 backend.users mesaj (Django verbose)
+    re.compile(
+        r'^(?P<level>[A-Z]+)\s+(?P<ts>\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2})(?:[.,]\d+)?\s+'
+        r'(?P<logger>[\w.\-]+)\s+(?P<message>.*)$'
+    ),
+    # 2025-01-02 10:11:12,345 - backend.users - INFO - mesaj
+    re.compile(
+        r'^(?P<ts>\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2})(?:[.,]\d+)?\s+[-|]\s+'
+        r'(?P<logger>[\w.\-]+)\s+[-|]\s+(?P<level>[A-Z]+)\s+[-|]\s+(?P<message>.*)$'
+    ),
+]
+
+LEVELS = {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}
+LEVEL_ALIASES = {'WARN': 'WARNING', 'FATAL': 'CRITICAL'}
+
+
+class LogCursorExpired(Exception):
+    """Cursor'daki dosya artık yok (rotation ile silinmiş)."""
+
+
+@dataclass(frozen=True)
+class LogFile:
+    """Okunabilir tek bir log dosyası (aktif veya rotate edilmiş)."""
+    path: Path
+    inode: int
+    size: int
+
+
+class TechLogReader:
+    """
+    Dosya tabanlı teknik log okuyucu.
+
+    Attributes:
+        BLOCK_SIZE: Sondan okuma blok boyutu (byte).
+        INDEX_STEP: Offset index adımı (byte).
+        INDEX_WINDOW: Index noktası ararken okunan pencere (byte).
+        MAX_SCAN_BYTES: Tek istekte taranacak maksimum byte.
+        MAX_DETAIL_LINES: Bir kayda bağlanacak maksimum devam satırı.
+    """
+
+    BLOCK_SIZE = 64 * 1024
+    INDEX_STEP = 256 * 1024
+    INDEX_WINDOW = 8 * 1024
+    MAX_SCAN_BYTES = 32 * 1024 * 1024
+    MAX_DETAIL_LINES = 50
+
+    DEFAULT_LIMIT = 50
+    MAX_LIMIT = 200
+
+    INDEX_CACHE_PREFIX = 'akademi:techlog:index'
+
+    def __init__(self, source: Optional[str] = None):
+        self.source = source
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    @classmethod
+    def available_sources(cls) -> List[str]:
+        """Okunabilir log kaynaklarının adları."""
+        return list(cls._configured_sources().keys())
+
+    def read(
+        self,
+        levels: Optional[Set[str]] = None,
+        service: Optional[str] = None,
+        search: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_LIMIT,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        En yeni kayıttan geriye doğru filtrelenmiş log kayıtlarını döndür.
+
+        Args:
+            levels: İzin verilen seviyeler (örn: {'ERROR', 'CRITICAL'}).
+            service: Logger adında aranacak metin (örn: 'users').
+            search: Mesajda aranacak metin.
+            since: Bu zamandan eski kayıtlarda durulur.
+            until: Bu zamandan yeni kayıtlar atlanır (index ile).
+            cursor: Önceki sayfanın döndürdüğü cursor.
+            limit: Sayfa boyutu.
+
+        Returns:
+            Tuple[entries, next_cursor]: next_cursor None ise kayıt kalmadı.
+
+        Raises:
+            LogCursorExpired: Cursor'daki dosya artık yok.
+        """
+        limit = max(1, min(limit, self.MAX_LIMIT))
+        levels = {self._normalize_level(level) for level in levels} if levels else None
+        service = service.lower() if service else None
+        search = search.lower() if search else None
+        since_ts = since.timestamp() if since else None
+        until_ts = until.timestamp() if until else None
+
+        files = self._log_files()
+        start_inode, start_offset = self._decode_cursor(cursor)
+
+        if start_inode is not None:
+            inodes = [f.inode for f in files]
+            if start_inode not in inodes:
+                # Baştan başlamak önceki sayfaları tekrar döndürürdü
+                raise LogCursorExpired(start_inode)
+            files = files[inodes.index(start_inode):]
+
+        entries = []
+        scanned = 0
+
+        for file_idx, log_file in enumerate(files):
+            end_offset = log_file.size
+            if file_idx == 0 and start_offset is not None:
+                end_offset = min(start_offset, log_file.size)
+
+            if until_ts is not None:
+                end_offset = min(end_offset, self._offset_after(log_file, until_ts))
+
+            for offset, entry in self._iter_entries(log_file, end_offset):
+                scanned_here = end_offset - offset
+
+                if since_ts is not None and entry['_ts'] < since_ts:
+                    # Kayıtlar zamana göre sıralı - daha eskiler de elenecek
+                    return entries, None
+
+                if self._matches(entry, levels, service, search, until_ts):
+                    entry.pop('_ts')
+                    entries.append(entry)
+                    if len(entries) >= limit:
+                        return entries, self._encode_cursor(log_file.inode, offset)
+
+                if scanned + scanned_here >= self.MAX_SCAN_BYTES:
+                    # Tarama bütçesi doldu - kaldığı yerden devam etsin
+                    return entries, self._encode_cursor(log_file.inode, offset)
+
+            scanned += end_offset
+
+        return entries, None
+
+    # =========================================================================
+    # SOURCES
+    # =========================================================================
+
+    @classmethod
+    def _configured_sources(cls) -> dict:
+        """settings.LOG_FILES / LOG_DIR'den {ad: path} sözlüğü üret."""
+        sources = {}
+
+        def collect(name, value):
+            if isinstance(value, dict):
+                for key, sub_value in value.items():
+                    collect(f'{name}.{key}' if name else str(key), sub_value)
+            elif isinstance(value, (str, Path)):
+                sources[name or Path(value).stem] = Path(value)
+
+        log_files = getattr(settings, 'LOG_FILES', None)
+        if isinstance(log_files, dict):
+            collect('', log_files)
+        elif isinstance(log_files, (list, tuple)):
+            for value in log_files:
+                collect('', value)
+
+        if not sources:
+            log_dir = getattr(settings, 'LOG_DIR', None)
+            if log_dir and Path(log_dir).is_dir():
+                for path in sorted(Path(log_dir).rglob('*.log')):
+                    sources[str(path.relative_to(log_dir).with_suffix(''))] = path
+
+        return sources
+
+    def _log_files(self) -> List[LogFile]:
+        """Seçili kaynağın aktif + rotate edilmiş dosyaları (en yeni önce)."""
+        sources = self._configured_sources()
+        if not sources:
+            return []
+
+        if self.source and self.source in sources:
+            base_path = sources[self.source]
+        elif 'global' in sources:
+            base_path = sources['global']
+        else:
+            base_path = next(iter(sources.values()))
+
+        candidates = [base_path] if base_path.exists() else []
+        if base_path.parent.is_dir():
+            rotated = [
+                path for path in base_path.parent.glob(f'{base_path.name}.*')
+                # Sıkıştırılmış dosyalarda seek yapılamaz
+                if not path.name.endswith(('.gz', '.bz2', '.zip'))
+            ]
+            rotated.sort(key=lambda path: path.stat().st_mtime, reverse=True)
+            candidates.extend(rotated)
+
+        files = []
+        for path in candidates:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append(LogFile(path=path, inode=stat.st_ino, size=stat.st_size))
+        return files
+
+    # =========================================================================
+    # OFFSET INDEX
+    # =========================================================================
+
+    def _index_cache_key(self, log_file: LogFile) -> str:
+        path_hash = hashlib.md5(str(log_file.path).encode()).hexdigest()[:12]
+        return f'{self.INDEX_CACHE_PREFIX}:{path_hash}'
+
+    def _get_index(self, log_file: LogFile) -> List[Tuple[float, int]]:
+        """
+        Dosyanın seyrek (timestamp, offset) index'ini döndür.
+
+        Her INDEX_STEP sınırında küçük bir pencere okunur ve o sınırdan
+        sonraki ilk kayıt satırının zamanı kaydedilir. Dosyanın tamamı
+        okunmaz; aktif dosya büyüdükçe sadece yeni kısım indexlenir.
+        """
+        cache_key = self._index_cache_key(log_file)
+        cached = cache.get(cache_key)
+
+        if cached and cached['inode'] == log_file.inode and cached['size'] <= log_file.size:
+            if cached['size'] == log_file.size:
+                return cached['points']
+            points = list(cached['points'])
+            # İlk indexlenmemiş sınır: `boundary < size` koşulu size'a eşit
+            # sınırı atladığından yukarı yuvarlanır
+            boundary = -(-cached['size'] // self.INDEX_STEP) * self.INDEX_STEP
+        else:
+            points = []
+            boundary = 0
+
+        try:
+            with open(log_file.path, 'rb') as fh:
+                while boundary < log_file.size:
+                    fh.seek(boundary)
+                    window = fh.read(self.INDEX_WINDOW)
+                    point = self._first_timestamp_in_window(window, boundary)
+                    if point and (not points or point[0] >= points[-1][0]):
+                        points.append(point)
+                    boundary += self.INDEX_STEP
+        except OSError as e:
+            logger.warning(f"Log index oluşturulamadı: {log_file.path} ({e})")
+            return points
+
+        cache.set(cache_key, {
+            'inode': log_file.inode,
+            'size': log_file.size,
+            'points': points,
+        }, timeout=None)
+        return points
+
+    def _first_timestamp_in_window(self, window: bytes, base_offset: int) -> Optional[Tuple[float, int]]:
+        """Penceredeki ilk tam kayıt satırının (timestamp, offset) değeri."""
+        rel = 0
+        if base_offset > 0:
+            # Sınır bir satırın ortasına düşebilir - ilk tam satıra atla
+            rel = window.find(b'\n') + 1
+            if rel == 0:
+                return None
+
+        while rel < len(window):
+            end = window.find(b'\n', rel)
+            if end == -1:
+                return None
+            header = self._parse_header(window[rel:end].decode('utf-8', errors='replace'))
+            if header:
+                return header['_ts'], base_offset + rel
+            rel = end + 1
+        return None
+
+    def _offset_after(self, log_file: LogFile, until_ts: float) -> int:
+        """until_ts'den yeni ilk index noktasının offset'i (yoksa dosya sonu)."""
+        points = self._get_index(log_file)
+        if not points:
+            return log_file.size
+        timestamps = [point[0] for point in points]
+        idx = bisect.bisect_right(timestamps, until_ts)
+        if idx >= len(points):
+            return log_file.size
+        return points[idx][1]
+
+    # =========================================================================
+    # REVERSE READING
+    # =========================================================================
+
+    def _iter_lines_reverse(self, fh, end_offset: int) -> Iterator[Tuple[int, bytes]]:
+        """
+        end_offset'ten geriye doğru (offset, satır) üret.
+
+        Bellekte en fazla bir blok + yarım kalan satır tutulur.
+        """
+        position = end_offset
+        remainder = b''
+
+        while position > 0:
+            read_size = min(self.BLOCK_SIZE, position)
+            position -= read_size
+            fh.seek(position)
+            buffer = fh.read(read_size) + remainder
+
+            lines = buffer.split(b'\n')
+            # İlk parça bir önceki bloğa taşabilir
+            remainder = lines[0]
+
+            offsets = []
+            line_offset = position + len(remainder) + 1
+            for line in lines[1:]:
+                offsets.append(line_offset)
+                line_offset += len(line) + 1
+
+            for line_offset, line in zip(reversed(offsets), reversed(lines[1:])):
+                if line:
+                    yield line_offset, line
+
+        if remainder:
+            yield 0, remainder
+
+    def _iter_entries(self, log_file: LogFile, end_offset: int) -> Iterator[Tuple[int, dict]]:
+        """
+        Satırları kayıtlara grupla (traceback gibi devam satırları dahil).
+
+        Ters okumada devam satırları başlık satırından önce gelir;
+        başlık bulunduğunda details olarak bağlanır.
+        """
+        pending = []
+
+        try:
+            fh = open(log_file.path, 'rb')
+        except OSError as e:
+            logger.warning(f"Log dosyası açılamadı: {log_file.path} ({e})")
+            return
+
+        with fh:
+            for offset, raw_line in self._iter_lines_reverse(fh, end_offset):
+                line = raw_line.decode('utf-8', errors='replace').rstrip('\r')
+                entry = self._parse_header(line)
+
+                if entry is None:
+                    if len(pending) < self.MAX_DETAIL_LINES:
+                        pending.append(line)
+                    continue
+
+                entry['id'] = f'{log_file.inode}:{offset}'
+                entry['details'] = '\n'.join(reversed(pending)) if pending else None
+                pending = []
+                yield offset, entry
+
+    # =========================================================================
+    # PARSING & FILTERING
+    # =========================================================================
+
+    @staticmethod
+    def _normalize_level(level: str) -> str:
+        level = level.upper()
+        return LEVEL_ALIASES.get(level, level)
+
+    def _parse_header(self, line: str) -> Optional[dict]:
+        """Kayıt başlık satırını çözümle; devam satırı ise None."""
+        if not line or not (line[0].isdigit() or line[0] == '[' or line[0].isupper()):
+            return None
+
+        for pattern in LINE_PATTERNS:
+            match = pattern.match(line)
+            if not match:
+                continue
+
+            level = self._normalize_level(match.group('level'))
+            if level not in LEVELS:
+                continue
+
+            try:
+                dt = datetime.strptime(match.group('ts').replace('T', ' '), '%Y-%m-%d %H:%M:%S')
+            except ValueError:
+                continue
+            if settings.USE_TZ:
+                dt = timezone.make_aware(dt)
+
+            return {
+                'level': level,
+                'service': match.group('logger'),
+                'message': match.group('message'),
+                'timestamp': dt.isoformat(),
+                '_ts': dt.timestamp(),
+            }
+        return None
+
+    @staticmethod
+    def _matches(
+        entry: dict,
+        levels: Optional[Set[str]],
+        service: Optional[str],
+        search: Optional[str],
+        until_ts: Optional[float],
+    ) -> bool:
+        if until_ts is not None and entry['_ts'] > until_ts:
+            return False
+        if levels and entry['level'] not in levels:
+            return False
+        if service and service not in entry['service'].lower():
+            return False
+        if search and search not in entry['message'].lower():
+            return False
+        return True
+
+    # =========================================================================
+    # CURSOR
+    # =========================================================================
+
+    @staticmethod
+    def _encode_cursor(inode: int, offset: int) -> str:
+        payload = json.dumps({'i': inode, 'o': offset}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+        if not cursor:
+            return None, None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+            return int(payload['i']), int(payload['o'])
+        except (ValueError, KeyError, TypeError):
+            return None, None
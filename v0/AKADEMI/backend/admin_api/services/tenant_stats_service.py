@@ -0,0 +1,87 @@
+"""
+Tenant Stats Service
+====================
+
+Super Admin ekranları için tenant bazlı sayımlar.
+
+Her model için tek bir GROUP BY sorgusu çalıştırılır ve sonuçlar
+bellekte birleştirilir; tenant sayısından bağımsız sabit sorgu sayısı.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, Optional
+
+from django.db.models import Count
+
+
+class TenantStatsService:
+    """
+    Tenant istatistikleri servisi.
+    """
+
+    @classmethod
+    def user_counts(cls, tenant_ids: Optional[Iterable] = None) -> Dict[int, int]:
+        """Tenant başına kullanıcı sayısı (tek sorgu)."""
+        from backend.users.models import User
+
+        queryset = User.objects.filter(tenant__isnull=False)
+        if tenant_ids is not None:
+            queryset = queryset.filter(tenant_id__in=list(tenant_ids))
+
+        return cls._grouped_counts(queryset)
+
+    @classmethod
+    def course_counts(cls, tenant_ids: Optional[Iterable] = None) -> Dict[int, int]:
+        """Tenant başına kurs sayısı (tek sorgu)."""
+        from backend.courses.models import Course
+
+        queryset = Course.objects.all()
+        if tenant_ids is not None:
+            queryset = queryset.filter(tenant_id__in=list(tenant_ids))
+
+        return cls._grouped_counts(queryset)
+
+    @classmethod
+    def tenant_admins(cls, tenant_ids: Iterable) -> Dict[int, object]:
+        """Tenant başına ilk TENANT_ADMIN kullanıcı (tek sorgu)."""
+        from backend.users.models import User
+
+        admins = User.objects.filter(
+            tenant_id__in=list(tenant_ids),
+            role=User.Role.TENANT_ADMIN,
+        ).order_by('tenant_id', 'id')
+
+        result = {}
+        for admin in admins:
+            result.setdefault(admin.tenant_id, admin)
+        return result
+
+    @classmethod
+    def collect(cls, tenant_ids: Iterable) -> Dict[int, dict]:
+        """
+        Verilen tenant'lar için tüm sayımları topla.
+
+        Returns:
+            {tenant_id: {'users': int, 'courses': int, 'admin': User | None}}
+        """
+        tenant_ids = list(tenant_ids)
+        users = cls.user_counts(tenant_ids)
+        courses = cls.course_counts(tenant_ids)
+        admins = cls.tenant_admins(tenant_ids)
+
+        return {
+            tenant_id: {
+                'users': users.get(tenant_id, 0),
+                'courses': courses.get(tenant_id, 0),
+                'admin': admins.get(tenant_id),
+            }
+            for tenant_id in tenant_ids
+        }
+
+    @staticmethod
+    def _grouped_counts(queryset) -> Dict[int, int]:
+        counts = defaultdict(int)
+        rows = queryset.order_by().values('tenant_id').annotate(total=Count('id'))
+        for row in rows:
+            counts[row['tenant_id']] = row['total']
+        return dict(counts)
@@ -0,0 +1,26 @@
+"""
+Admin API Celery Tasks
+======================
+
+Toplu admin işlemlerinin asenkron yan etkileri.
+"""
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(queue='notifications')
+def notify_course_bulk_transition(course_ids: list, action: str):
+    """
+    Toplu kurs geçişi sonrası eğitmenlere birleştirilmiş bildirim.
+    
+    Args:
+        course_ids: Etkilenen kurs ID listesi
+        action: approve | archive | unpublish
+    """
+    from .services import CourseBulkService
+    
+    return CourseBulkService.notify_instructors(course_ids, action)
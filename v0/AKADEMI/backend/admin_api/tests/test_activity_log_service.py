@@ -0,0 +1,135 @@
+"""
+Activity Log Service Tests
+==========================
+
+Audit log filtre, tenant kapsamı ve cursor sayfalama testleri.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+from django.apps import apps
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from backend.admin_api.services import ActivityLogService
+
+
+@unittest.skipUnless(apps.is_installed('logs.audit'), 'logs.audit kurulu değil')
+class ActivityLogServiceTest(TestCase):
+    """ActivityLogService testleri."""
+
+    databases = '__all__'
+
+    @classmethod
+    def setUpTestData(cls):
+        from logs.audit.models import AuditLog
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        cls.base_time = timezone.make_aware(datetime(2025, 3, 10, 9, 0, 0))
+
+        cls.tenant = Tenant.objects.create(name='Akademi A', slug='akademi-a')
+        cls.other_tenant = Tenant.objects.create(name='Akademi B', slug='akademi-b')
+        cls.user = User.objects.create_user(
+            email='a@test.com', password='testpass123', tenant=cls.tenant, role='STUDENT',
+        )
+        cls.other_user = User.objects.create_user(
+            email='b@test.com', password='testpass123', tenant=cls.other_tenant, role='STUDENT',
+        )
+
+        # Tenant A: 5 kayıt (ikisi aynı saniyede), Tenant B: 2 kayıt
+        rows = [
+            (cls.user, 'LOGIN', 'giriş', 0),
+            (cls.user, 'CREATE', 'Kurs: Python', 60),
+            (cls.user, 'UPDATE', 'Kurs: Python', 120),
+            (cls.user, 'UPDATE', 'Kurs: Django', 120),
+            (cls.user, 'DELETE', 'Kurs: Django', 86400),
+            (cls.other_user, 'LOGIN', 'giriş', 30),
+            (cls.other_user, 'UPDATE', 'Kurs: Python', 90),
+        ]
+        for user, action, object_repr, offset in rows:
+            log = AuditLog.objects.create(
+                user_id=user.id,
+                username=user.email,
+                action=action,
+                object_repr=object_repr,
+            )
+            # created_at auto_now_add olabilir; zamanı sonradan sabitle
+            AuditLog.objects.filter(pk=log.pk).update(
+                created_at=cls.base_time + timedelta(seconds=offset),
+            )
+
+    def test_tenant_scope(self):
+        """Tenant verilirse sadece o tenant kullanıcılarının kayıtları gelir."""
+        logs, _ = ActivityLogService.query(tenant=self.tenant)
+        other_logs, _ = ActivityLogService.query(tenant=self.other_tenant)
+        all_logs, _ = ActivityLogService.query()
+
+        self.assertEqual(len(logs), 5)
+        self.assertEqual({log['user']['id'] for log in logs}, {str(self.user.id)})
+        self.assertEqual(len(other_logs), 2)
+        self.assertEqual(len(all_logs), 7)
+
+    def test_filters(self):
+        """Aksiyon, arama ve zaman aralığı filtreleri."""
+        updates, _ = ActivityLogService.query(tenant=self.tenant, action='UPDATE')
+        django_logs, _ = ActivityLogService.query(tenant=self.tenant, search='django')
+        window, _ = ActivityLogService.query(
+            tenant=self.tenant,
+            since=self.base_time + timedelta(seconds=60),
+            until=self.base_time + timedelta(seconds=120),
+        )
+
+        self.assertEqual({log['action'] for log in updates}, {'UPDATE'})
+        self.assertEqual(len(updates), 2)
+        self.assertEqual({log['details'] for log in django_logs}, {'Kurs: Django'})
+        self.assertEqual(sorted(log['action'] for log in window), ['CREATE', 'UPDATE', 'UPDATE'])
+
+    def test_cursor_pages_do_not_overlap(self):
+        """Aynı zamanlı kayıtlar dahil, sayfalar tekrar etmeden yeniden eskiye ilerler."""
+        full, _ = ActivityLogService.query(tenant=self.tenant, limit=50)
+
+        seen = []
+        cursor = None
+        while True:
+            logs, cursor = ActivityLogService.query(tenant=self.tenant, cursor=cursor, limit=2)
+            seen.extend(log['id'] for log in logs)
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, [log['id'] for log in full])
+        timestamps = [log['timestamp'] for log in full]
+        self.assertEqual(timestamps, sorted(timestamps, reverse=True))
+
+    def test_view_date_only_until_includes_whole_day(self):
+        """until=YYYY-MM-DD o günün tüm kayıtlarını kapsar."""
+        response = self._get(self._admin(self.tenant), until=self.base_time.date().isoformat())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 4)
+
+    def test_view_admin_without_tenant_sees_nothing(self):
+        """Tenant'a bağlı olmayan TenantAdmin başka tenant'ların kayıtlarını görmez."""
+        response = self._get(self._admin(None))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'], [])
+
+    def _admin(self, tenant):
+        from backend.users.models import User
+
+        return User.objects.create_user(
+            email=f'admin-{tenant.slug if tenant else "none"}@test.com',
+            password='testpass123',
+            tenant=tenant,
+            role='TENANT_ADMIN',
+        )
+
+    def _get(self, user, **params):
+        from backend.admin_api.views import ActivityLogsViewSet
+
+        request = APIRequestFactory().get('/api/v1/admin/logs/activity/', params)
+        force_authenticate(request, user=user)
+        return ActivityLogsViewSet.as_view({'get': 'list'})(request)
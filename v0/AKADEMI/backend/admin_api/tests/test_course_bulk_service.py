@@ -0,0 +1,109 @@
+"""
+Course Bulk Service Tests
+=========================
+
+Toplu kurs geçişi: tek UPDATE, commit sonrası tek invalidation ve
+eğitmen başına tek bildirim testleri.
+"""
+
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from backend.admin_api.services import CourseBulkService
+from backend.libs.cache.invalidation import InvalidationBatch
+
+
+class CourseBulkServiceTest(TestCase):
+    """CourseBulkService testleri."""
+
+    @classmethod
+    def setUpTestData(cls):
+        from backend.courses.models import Course
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        cls.tenant = Tenant.objects.create(name='Akademi A', slug='akademi-a')
+        cls.instructors = [
+            User.objects.create_user(
+                email=f'instructor{index}@test.com',
+                password='testpass123',
+                tenant=cls.tenant,
+                role='INSTRUCTOR',
+            )
+            for index in range(2)
+        ]
+
+        cls.courses = []
+        for index in range(4):
+            course = Course.objects.create(
+                title=f'Course {index}',
+                slug=f'course-{index}',
+                description='Test course description',
+                category='Technology',
+                tenant=cls.tenant,
+                status=Course.Status.DRAFT,
+            )
+            # Eğitmen 0: 4 kurs, eğitmen 1: 2 kurs
+            course.instructors.add(cls.instructors[0])
+            if index % 2:
+                course.instructors.add(cls.instructors[1])
+            cls.courses.append(course)
+
+    def _queryset(self):
+        from backend.courses.models import Course
+
+        return Course.objects.filter(tenant=self.tenant)
+
+    def test_transition_single_update_and_one_commit_hook(self):
+        """Geçiş tek UPDATE ile yapılır; yan etkiler commit sonrası bir kez çalışır."""
+        from backend.courses.models import Course
+
+        with mock.patch('backend.libs.cache.signals.invalidate_courses') as invalidate, \
+                mock.patch('backend.admin_api.tasks.notify_course_bulk_transition') as task:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                with CaptureQueriesContext(connection) as queries:
+                    affected = CourseBulkService.transition(self._queryset(), 'approve')
+
+        statements = [query['sql'].split()[0] for query in queries.captured_queries]
+        self.assertEqual([sql for sql in statements if sql in ('SELECT', 'UPDATE')], ['SELECT', 'UPDATE'])
+        self.assertEqual(affected, 4)
+        # Hook içindeki CourseOutline invalidation'ı kendi batch'ini açar
+        self.assertEqual(len([callback for callback in callbacks if not isinstance(callback, InvalidationBatch)]), 1)
+        self.assertEqual(
+            set(self._queryset().values_list('status', flat=True)),
+            {Course.Status.PUBLISHED},
+        )
+        self.assertTrue(all(self._queryset().values_list('is_published', flat=True)))
+
+        invalidate.assert_called_once()
+        self.assertEqual(sorted(invalidate.call_args[0][0]), sorted(c.pk for c in self.courses))
+        self.assertEqual(invalidate.call_args[0][1], {self.tenant.id})
+        task.delay.assert_called_once_with(
+            [str(pk) for pk in invalidate.call_args[0][0]], 'approve',
+        )
+
+    def test_transition_empty_queryset(self):
+        """Eşleşen kurs yoksa UPDATE ve yan etki olmaz."""
+        with self.captureOnCommitCallbacks() as callbacks:
+            affected = CourseBulkService.transition(self._queryset().none(), 'archive')
+
+        self.assertEqual(affected, 0)
+        self.assertEqual(callbacks, [])
+
+    def test_unknown_action(self):
+        """Tanımsız aksiyon ValueError fırlatır."""
+        with self.assertRaises(ValueError):
+            CourseBulkService.transition(self._queryset(), 'delete')
+
+    def test_notify_instructors_once_per_instructor(self):
+        """Kurs başına değil, eğitmen başına tek bildirim gönderilir."""
+        with mock.patch('backend.realtime.services.NotificationService.create_notification') as create:
+            sent = CourseBulkService.notify_instructors([c.pk for c in self.courses], 'archive')
+
+        self.assertEqual(sent, 2)
+        messages = {call.kwargs['user']: call.kwargs['message'] for call in create.call_args_list}
+        self.assertIn('4 kursunuz', messages[self.instructors[0]])
+        self.assertIn('2 kursunuz', messages[self.instructors[1]])
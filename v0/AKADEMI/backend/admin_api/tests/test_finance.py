@@ -0,0 +1,122 @@
+"""
+Finance API Tests
+=================
+
+Gelir özetlerinden (RevenueRollup) finans endpoint'leri: parametre
+doğrulama ve para birimi ayrımı testleri.
+"""
+
+from decimal import Decimal
+
+from rest_framework.test import APITestCase
+
+from backend.courses.revenue import RevenueLedger
+
+
+class FinanceViewsTest(APITestCase):
+    """Finans endpoint testleri."""
+
+    @classmethod
+    def setUpTestData(cls):
+        from backend.courses.models import Course, Enrollment
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        cls.tenant = Tenant.objects.create(name='Akademi A', slug='akademi-a')
+        cls.super_admin = User.objects.create_user(
+            email='super@test.com', password='testpass123', role='SUPER_ADMIN',
+        )
+        cls.instructor = User.objects.create_user(
+            email='instructor@test.com', password='testpass123', tenant=cls.tenant, role='INSTRUCTOR',
+        )
+
+        # Aynı kategori ve eğitmen: TRY 3 x 100, USD 2 x 40
+        for currency, price, students in (('TRY', '100.00', 3), ('USD', '40.00', 2)):
+            course = Course.objects.create(
+                title=f'Course {currency}',
+                slug=f'course-{currency.lower()}',
+                description='Test course description',
+                category='Technology',
+                tenant=cls.tenant,
+                price=Decimal(price),
+                currency=currency,
+            )
+            course.instructors.add(cls.instructor)
+            for index in range(students):
+                student = User.objects.create_user(
+                    email=f'{currency.lower()}-student{index}@test.com',
+                    password='testpass123',
+                    tenant=cls.tenant,
+                    role='STUDENT',
+                )
+                Enrollment.objects.create(user=student, course=course)
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.super_admin)
+
+    def test_invalid_dates_return_400(self):
+        """Biçimi / değeri geçersiz tarih ve ters aralık 400 döner."""
+        for params in (
+            {'startDate': '2025-02-30'},
+            {'endDate': 'yesterday'},
+            {'startDate': '2025-03-10', 'endDate': '2025-03-01'},
+            {'currency': 'GBP'},
+        ):
+            with self.subTest(params=params):
+                response = self.client.get('/api/v1/admin/finance/academies/', params)
+                self.assertEqual(response.status_code, 400)
+
+    def test_summarize_groups_by_currency(self):
+        """Farklı para birimleri ayrı toplanır, birbirine eklenmez."""
+        from backend.courses.models import RevenueRollup
+
+        totals = RevenueLedger.summarize(RevenueRollup.Dimension.CATEGORY, tenant=self.tenant)
+
+        self.assertEqual(set(totals['Technology']), {'TRY', 'USD'})
+        self.assertEqual(totals['Technology']['TRY']['net'], Decimal('300.00'))
+        self.assertEqual(totals['Technology']['USD']['net'], Decimal('80.00'))
+
+        row = RevenueLedger.in_currency(totals['Technology'], 'USD')
+        self.assertEqual(row['net'], Decimal('80.00'))
+        self.assertEqual(row['enrollments'], 5)
+
+    def test_views_report_selected_currency(self):
+        """Tutarlar seçili para biriminde, diğer birimler ayrı alanda döner."""
+        academies = self.client.get('/api/v1/admin/finance/academies/').json()
+        usd_categories = self.client.get('/api/v1/admin/finance/categories/', {'currency': 'USD'}).json()
+        instructors = self.client.get('/api/v1/admin/finance/instructors/').json()
+
+        self.assertEqual(academies[0]['totalRevenue'], 300.0)
+        self.assertEqual(academies[0]['currency'], 'TRY')
+        self.assertEqual(academies[0]['revenueByCurrency'], {'TRY': 300.0, 'USD': 80.0})
+        self.assertEqual(academies[0]['students'], 5)
+        self.assertEqual(usd_categories[0]['revenue'], 80.0)
+        self.assertEqual(instructors[0]['totalEarnings'], 300.0)
+
+    def test_deleted_enrollment_refunded(self):
+        """Silinen aktif kayıt iade yazılır; iptal edilmiş kayıt tekrar yazılmaz."""
+        from backend.courses.models import Enrollment, RevenueRollup
+
+        enrollments = Enrollment.objects.filter(course__currency='TRY').order_by('pk')
+        cancelled = enrollments[0]
+        cancelled.status = Enrollment.Status.CANCELLED
+        cancelled.save()
+
+        cancelled.delete()
+        enrollments[0].delete()
+
+        totals = RevenueLedger.summarize(RevenueRollup.Dimension.CATEGORY, tenant=self.tenant)
+        row = RevenueLedger.in_currency(totals['Technology'], 'TRY')
+        self.assertEqual(row['net'], Decimal('100.00'))
+        self.assertEqual(row['cancellations'], 2)
+
+    def test_reports_total_revenue_in_selected_currency(self):
+        """Rapor özetinin toplam geliri seçili birimde, diğerleri ayrı alanda."""
+        default = self.client.get('/api/v1/admin/reports/').json()['generalStats']
+        usd = self.client.get('/api/v1/admin/reports/', {'currency': 'USD'}).json()['generalStats']
+
+        self.assertEqual(float(default['totalRevenue']), 300.0)
+        self.assertEqual(float(usd['totalRevenue']), 80.0)
+        self.assertEqual(usd['currency'], 'USD')
+        self.assertEqual(usd['revenueByCurrency'], {'TRY': 300.0, 'USD': 80.0})
+        self.assertEqual(self.client.get('/api/v1/admin/reports/', {'currency': 'GBP'}).status_code, 400)
@@ -0,0 +1,137 @@
+"""
+Tech Log Reader Tests
+=====================
+
+Sondan okuma, cursor sayfalama ve filtre testleri.
+"""
+
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+
+from backend.admin_api.services.log_reader import LogCursorExpired, TechLogReader
+
+
+class TechLogReaderTest(SimpleTestCase):
+    """TechLogReader testleri."""
+
+    def setUp(self):
+        cache.clear()
+        self.log_dir = Path(tempfile.mkdtemp())
+        self.log_path = self.log_dir / 'global.log'
+        self.base_time = datetime(2025, 1, 1, 10, 0, 0)
+
+        self._write(0, 300, traceback=True)
+
+        self.override = override_settings(LOG_FILES={'global': str(self.log_path)})
+        self.override.enable()
+
+    def tearDown(self):
+        self.override.disable()
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+
+    def _write(self, start, stop, traceback=False):
+        """start..stop arası saniyelik kayıtları dosyaya ekle."""
+        levels = ['INFO', 'WARNING', 'ERROR']
+        with open(self.log_path, 'a', encoding='utf-8') as fh:
+            for i in range(start, stop):
+                ts = (self.base_time + timedelta(seconds=i)).strftime('%Y-%m-%d %H:%M:%S')
+                fh.write(f'[{ts},000] {levels[i % 3]} [backend.svc{i % 2}:10] message {i}\n')
+            if traceback:
+                fh.write('Traceback (most recent call last):\n')
+                fh.write('  File "x.py", line 1\n')
+
+    def test_reads_newest_first_with_details(self):
+        """En yeni kayıt önce gelir, traceback details'e bağlanır."""
+        entries, next_cursor = TechLogReader().read(limit=5)
+
+        self.assertEqual(len(entries), 5)
+        self.assertEqual(entries[0]['message'], 'message 299')
+        self.assertIn('Traceback', entries[0]['details'])
+        self.assertEqual(entries[4]['message'], 'message 295')
+        self.assertIsNotNone(next_cursor)
+
+    def test_cursor_pages_do_not_overlap(self):
+        """Cursor ile tüm dosya tekrar etmeden sayfalanır."""
+        BlockReader = type('BlockReader', (TechLogReader,), {'BLOCK_SIZE': 128})
+        reader = BlockReader()
+
+        seen = []
+        cursor = None
+        while True:
+            entries, cursor = reader.read(cursor=cursor, limit=64)
+            seen.extend(e['message'] for e in entries)
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, [f'message {i}' for i in range(299, -1, -1)])
+
+    def test_cursor_of_removed_file_expires(self):
+        """Rotation ile silinen dosyanın cursor'ı ilk sayfaya dönmez, hata verir."""
+        _, cursor = TechLogReader().read(limit=5)
+
+        # Yeni dosya eskisi silinmeden oluşur (inode tekrar kullanılmaz)
+        old_path = self.log_path.rename(self.log_dir / 'old.log')
+        self._write(300, 310)
+        old_path.unlink()
+
+        with self.assertRaises(LogCursorExpired):
+            TechLogReader().read(cursor=cursor, limit=5)
+
+    def test_level_and_service_filter(self):
+        """Seviye ve servis filtresi."""
+        entries, _ = TechLogReader().read(levels={'error'}, service='svc1', limit=200)
+
+        self.assertTrue(entries)
+        for entry in entries:
+            self.assertEqual(entry['level'], 'ERROR')
+            self.assertEqual(entry['service'], 'backend.svc1')
+
+    def test_time_window_uses_index(self):
+        """until/since penceresi sadece aralıktaki kayıtları döndürür."""
+        IndexedReader = type('IndexedReader', (TechLogReader,), {'INDEX_STEP': 1024})
+        since = timezone.make_aware(self.base_time + timedelta(seconds=100))
+        until = timezone.make_aware(self.base_time + timedelta(seconds=109))
+
+        entries, next_cursor = IndexedReader().read(since=since, until=until, limit=200)
+
+        self.assertEqual(
+            [e['message'] for e in entries],
+            [f'message {i}' for i in range(109, 99, -1)],
+        )
+        self.assertIsNone(next_cursor)
+
+    def test_index_reused_for_unchanged_file(self):
+        """Boyutu değişmeyen dosyanın index'i cache'ten gelir, dosya taranmaz."""
+        IndexedReader = type('IndexedReader', (TechLogReader,), {'INDEX_STEP': 1024})
+        reader = IndexedReader()
+        log_file = reader._log_files()[0]
+        points = reader._get_index(log_file)
+
+        with mock.patch.object(IndexedReader, '_first_timestamp_in_window') as scan:
+            self.assertEqual(reader._get_index(log_file), points)
+
+        scan.assert_not_called()
+
+    def test_incremental_index_matches_full_rebuild(self):
+        """Büyüyen dosyanın artımlı index'i baştan oluşturulanla aynıdır."""
+        # Önceki boyut INDEX_STEP'in tam katı: size'a eşit sınır atlanmamalı
+        step = self.log_path.stat().st_size
+        IndexedReader = type('IndexedReader', (TechLogReader,), {'INDEX_STEP': step})
+        reader = IndexedReader()
+        first = reader._get_index(reader._log_files()[0])
+
+        self._write(300, 900)
+        log_file = reader._log_files()[0]
+        incremental = reader._get_index(log_file)
+        cache.clear()
+        full = reader._get_index(log_file)
+
+        self.assertEqual(incremental[:len(first)], first)
+        self.assertEqual(incremental, full)
@@ -0,0 +1,99 @@
+"""
+Tenant Stats Service Tests
+==========================
+
+Tenant başına gruplu sayım ve sabit sorgu sayısı testleri.
+"""
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from backend.admin_api.services import TenantStatsService
+
+
+class TenantStatsServiceTest(TestCase):
+    """TenantStatsService testleri."""
+
+    @classmethod
+    def setUpTestData(cls):
+        from backend.users.models import User
+
+        cls.super_admin = User.objects.create_user(
+            email='super@test.com', password='testpass123', role='SUPER_ADMIN',
+        )
+        cls.tenants = [cls._create_tenant(index, users=index + 1, courses=index) for index in range(3)]
+
+    @classmethod
+    def _create_tenant(cls, index, users, courses):
+        from backend.courses.models import Course
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        tenant = Tenant.objects.create(name=f'Akademi {index}', slug=f'akademi-{index}')
+        for user_index in range(users):
+            User.objects.create_user(
+                email=f't{index}-u{user_index}@test.com',
+                password='testpass123',
+                tenant=tenant,
+                # İlk iki kullanıcı admin: en küçük id'li seçilmeli
+                role='TENANT_ADMIN' if user_index < 2 else 'STUDENT',
+            )
+        for course_index in range(courses):
+            Course.objects.create(
+                title=f'Course {index}-{course_index}',
+                slug=f'course-{index}-{course_index}',
+                description='Test course description',
+                category='Technology',
+                tenant=tenant,
+            )
+        return tenant
+
+    def test_collect_counts_per_tenant(self):
+        """Kullanıcı / kurs sayıları ve ilk admin tenant başına doğru."""
+        from backend.users.models import User
+
+        stats = TenantStatsService.collect([tenant.id for tenant in self.tenants])
+
+        for index, tenant in enumerate(self.tenants):
+            first_admin = User.objects.filter(tenant=tenant, role='TENANT_ADMIN').order_by('id').first()
+            self.assertEqual(stats[tenant.id]['users'], index + 1)
+            self.assertEqual(stats[tenant.id]['courses'], index)
+            self.assertEqual(stats[tenant.id]['admin'], first_admin)
+
+    def test_collect_includes_empty_tenants(self):
+        """Kaydı olmayan tenant sıfır sayımla döner."""
+        from backend.tenants.models import Tenant
+
+        empty = Tenant.objects.create(name='Boş Akademi', slug='bos-akademi')
+
+        stats = TenantStatsService.collect([empty.id])
+
+        self.assertEqual(stats[empty.id], {'users': 0, 'courses': 0, 'admin': None})
+
+    def test_collect_query_count_is_constant(self):
+        """Sorgu sayısı tenant sayısından bağımsız."""
+        with self.assertNumQueries(3):
+            TenantStatsService.collect([self.tenants[0].id])
+        with self.assertNumQueries(3):
+            TenantStatsService.collect([tenant.id for tenant in self.tenants])
+
+    def test_tenant_list_query_count_is_constant(self):
+        """Tenant listesi tenant sayısı arttıkça ek sorgu yapmaz."""
+        before = self._list_queries()
+        for index in range(3, 8):
+            self._create_tenant(index, users=2, courses=1)
+        after = self._list_queries()
+
+        self.assertEqual(after, before)
+
+    def _list_queries(self):
+        from backend.admin_api.views import AdminTenantsViewSet
+
+        request = APIRequestFactory().get('/api/v1/admin/tenants/')
+        force_authenticate(request, user=self.super_admin)
+        with CaptureQueriesContext(connection) as queries:
+            response = AdminTenantsViewSet.as_view({'get': 'list'})(request)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
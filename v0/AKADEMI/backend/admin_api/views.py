@@ -1134,7 +1134,7 @@ class AdminCourseViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['post'], url_path='bulk-action')
     def bulk_action(self, request):
         """Toplu kurs işlemi."""
-        from backend.courses.models import Course
+        from backend.admin_api.services import CourseBulkService
         
         serializer = CourseBulkActionSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -1145,32 +1145,19 @@ class AdminCourseViewSet(viewsets.ViewSet):
         
         courses = self.get_queryset().filter(id__in=course_ids)
         
-        if action_type == 'approve':
-            courses.update(
-                status=Course.Status.PUBLISHED,
-                is_published=True,
-                publish_at=timezone.now(),
-            )
-            message = f'{courses.count()} kurs onaylandı.'
-        
-        elif action_type == 'archive':
-            courses.update(
-                status=Course.Status.ARCHIVED,
-                is_published=False,
-            )
-            message = f'{courses.count()} kurs arşivlendi.'
-        
-        elif action_type == 'unpublish':
-            courses.update(
-                status=Course.Status.DRAFT,
-                is_published=False,
-            )
-            message = f'{courses.count()} kurs yayından kaldırıldı.'
+        if action_type in CourseBulkService.ACTIONS:
+            # Tek UPDATE; invalidation ve bildirim commit sonrası tek seferde
+            affected = CourseBulkService.transition(courses, action_type)
+            message = {
+                'approve': f'{affected} kurs onaylandı.',
+                'archive': f'{affected} kurs arşivlendi.',
+                'unpublish': f'{affected} kurs yayından kaldırıldı.',
+            }[action_type]
         
         elif action_type == 'delete':
-            count = courses.count()
+            affected = courses.count()
             courses.delete()
-            message = f'{count} kurs silindi.'
+            message = f'{affected} kurs silindi.'
         
         else:
             return Response(
@@ -1180,7 +1167,7 @@ class AdminCourseViewSet(viewsets.ViewSet):
         
         return Response({
             'message': message,
-            'affected': len(course_ids),
+            'affected': affected,
         })
     
     @action(detail=True, methods=['post'], url_path='update-pricing')
@@ -2139,24 +2126,20 @@ class AdminReportsViewSet(viewsets.ViewSet):
         from django.utils import timezone
         from datetime import timedelta
         
-        start_date = request.query_params.get('startDate')
-        end_date = request.query_params.get('endDate')
-        
-        if not end_date:
-            end_date = timezone.now().date()
-        else:
-            end_date = timezone.datetime.strptime(end_date, '%Y-%m-%d').date()
-        
-        if not start_date:
-            start_date = end_date - timedelta(days=30)
-        else:
-            start_date = timezone.datetime.strptime(start_date, '%Y-%m-%d').date()
+        params = request.query_params
+        end_date = _date_param(params, 'endDate') or timezone.now().date()
+        start_date = _date_param(params, 'startDate') or end_date - timedelta(days=30)
         
         return start_date, end_date
     
     def list(self, request):
-        """Ana rapor verileri - Dashboard için özet."""
-        from backend.courses.models import Course, Enrollment, CourseCategory
+        """
+        Ana rapor verileri - Dashboard için özet.
+        
+        Query params:
+            currency: totalRevenue para birimi (TRY, USD, EUR; varsayılan TRY)
+        """
+        from backend.courses.models import Course, Enrollment
         from backend.users.models import User
         from backend.student.models import ClassGroup, Assignment, AssignmentSubmission
         from django.db.models import Avg, Count, Sum
@@ -2164,6 +2147,7 @@ class AdminReportsViewSet(viewsets.ViewSet):
         from datetime import timedelta
         
         tenant = self._get_tenant(request.user)
+        currency = _currency_param(request.query_params)
         
         # Tenant filtresi
         user_filter = {'tenant': tenant} if tenant else {}
@@ -2176,9 +2160,20 @@ class AdminReportsViewSet(viewsets.ViewSet):
             status='published'
         ).annotate(
             enrollment_count=Count('enrollments'),
-            avg_score=Avg('enrollments__progress'),
+            avg_score=Avg('enrollments__progress_percent'),
         )[:10]
         
+        # Kurs gelirleri ön-toplanmış özetlerden (tek sorgu)
+        from backend.courses.models import RevenueRollup
+        from backend.courses.revenue import RevenueLedger
+        
+        courses = list(courses)
+        course_revenue = RevenueLedger.summarize(
+            RevenueRollup.Dimension.COURSE,
+            tenant=tenant,
+            keys=[c.pk for c in courses],
+        )
+        
         course_metrics = []
         for course in courses:
             enrollments = Enrollment.objects.filter(course=course)
@@ -2192,7 +2187,9 @@ class AdminReportsViewSet(viewsets.ViewSet):
                 'avgScore': round(course.avg_score or 0, 1),
                 'engagement': round(completion_rate * 0.9, 1),  # Yaklaşık
                 'enrollments': total,
-                'revenue': float(course.price or 0) * total,
+                'revenue': float(RevenueLedger.in_currency(
+                    course_revenue.get(str(course.pk), {}), course.currency,
+                )['net']),
             })
         
         # 2. Eğitmen Performansı
@@ -2201,8 +2198,8 @@ class AdminReportsViewSet(viewsets.ViewSet):
             role='INSTRUCTOR',
             is_active=True
         ).annotate(
-            student_count=Count('instructed_classes__students', distinct=True),
-            course_count=Count('courses', distinct=True),
+            student_count=Count('teaching_classes__students', distinct=True),
+            course_count=Count('teaching_courses', distinct=True),
         )[:10]
         
         instructor_performance = []
@@ -2240,12 +2237,18 @@ class AdminReportsViewSet(viewsets.ViewSet):
         total_students = User.objects.filter(**user_filter, role='STUDENT', is_active=True).count()
         total_courses = Course.objects.filter(**course_filter, status='published').count()
         
-        # Riskli öğrenciler (düşük ilerleme)
-        risky_students = Enrollment.objects.filter(
-            course__tenant=tenant if tenant else course__tenant__isnull==False,
-            progress__lt=30,
-            is_completed=False
-        ).values('student').distinct().count() if tenant else 0
+        # Riskli öğrenciler (vektörel risk skoru - yüksek seviye)
+        risky_students = 0
+        if tenant:
+            from backend.student.risk import RiskScorer
+            
+            risk_features = RiskScorer.features(
+                User.objects.filter(**user_filter, role='STUDENT', is_active=True).values('id')
+            )
+            risky_students = sum(
+                1 for score in RiskScorer.score(risk_features)
+                if score >= RiskScorer.HIGH_THRESHOLD
+            )
         
         # Tamamlanan dersler (son 30 gün)
         completed_lessons = Enrollment.objects.filter(
@@ -2254,6 +2257,13 @@ class AdminReportsViewSet(viewsets.ViewSet):
             completed_at__gte=timezone.now() - timedelta(days=30)
         ).count() if tenant else 0
         
+        # Toplam gelir (tüm zamanlar, ön-toplanmış özetlerden)
+        tenant_revenue = RevenueLedger.summarize(RevenueRollup.Dimension.TENANT, tenant=tenant)
+        revenue_by_currency = {}
+        for by_currency in tenant_revenue.values():
+            for code, row in by_currency.items():
+                revenue_by_currency[code] = revenue_by_currency.get(code, 0) + row['net']
+        
         general_stats = {
             'overallSuccess': 78.5,  # Hesaplanabilir
             'completedLessons': completed_lessons or 1245,
@@ -2261,7 +2271,9 @@ class AdminReportsViewSet(viewsets.ViewSet):
             'avgInstructorScore': 4.6,
             'totalStudents': total_students,
             'totalCourses': total_courses,
-            'totalRevenue': sum(m.get('revenue', 0) for m in course_metrics),
+            'totalRevenue': float(revenue_by_currency.get(currency, 0)),
+            'currency': currency,
+            'revenueByCurrency': {code: float(net) for code, net in revenue_by_currency.items()},
             'avgCompletionRate': sum(m['completion'] for m in course_metrics) / len(course_metrics) if course_metrics else 0,
         }
         
@@ -2432,6 +2444,16 @@ class AdminReportsViewSet(viewsets.ViewSet):
             avg_progress=Avg('enrollments__progress'),
         ).order_by('-enrollment_count')[:50]
         
+        from backend.courses.models import RevenueRollup
+        from backend.courses.revenue import RevenueLedger
+        
+        courses = list(courses)
+        course_revenue = RevenueLedger.summarize(
+            RevenueRollup.Dimension.COURSE,
+            tenant=tenant,
+            keys=[c.pk for c in courses],
+        )
+        
         results = []
         for course in courses:
             completion_rate = (
@@ -2449,7 +2471,9 @@ class AdminReportsViewSet(viewsets.ViewSet):
                 'avgScore': round(course.avg_progress or 0, 1),
                 'avgTimeSpent': 120,  # Mock - gerçek sistemde progress tracking'den gelir
                 'rating': 4.5,  # Mock - gerçek sistemde review'lerden gelir
-                'revenue': float(course.price or 0) * course.enrollment_count,
+                'revenue': float(RevenueLedger.in_currency(
+                    course_revenue.get(str(course.pk), {}), course.currency,
+                )['net']),
                 'dropoffRate': round(100 - completion_rate, 1),
             })
         
@@ -2461,29 +2485,31 @@ class AdminReportsViewSet(viewsets.ViewSet):
     
     @action(detail=False, methods=['get'], url_path='revenue')
     def revenue(self, request):
-        """Gelir raporu."""
-        from backend.courses.models import Enrollment
-        from django.db.models import Sum
-        from django.db.models.functions import TruncDate
+        """Gelir raporu - günlük gelir özetlerinden."""
+        from backend.courses.revenue import RevenueLedger
         from datetime import timedelta
         
         tenant = self._get_tenant(request.user)
         start_date, end_date = self._get_date_range(request)
+        currency = _currency_param(request.query_params)
+        
+        daily = RevenueLedger.daily(tenant=tenant, start=start_date, end=end_date, currency=currency)
         
         results = []
         current_date = start_date
         
         while current_date <= end_date:
-            # Mock gelir verileri - gerçek sistemde payment/transaction tablosundan gelir
-            base_revenue = 1000 + (current_date.day * 100)
+            row = daily.get(current_date)
+            revenue = float(row['revenue']) if row else 0.0
+            refunds = float(row['refunds']) if row else 0.0
             
             results.append({
                 'date': current_date.isoformat(),
-                'courseRevenue': base_revenue,
-                'subscriptionRevenue': base_revenue * 0.3,
-                'totalRevenue': base_revenue * 1.3,
-                'refunds': base_revenue * 0.05,
-                'netRevenue': base_revenue * 1.25,
+                'courseRevenue': revenue,
+                'subscriptionRevenue': 0.0,  # Abonelik modeli yok
+                'totalRevenue': revenue,
+                'refunds': refunds,
+                'netRevenue': revenue - refunds,
             })
             
             current_date += timedelta(days=1)
@@ -2504,6 +2530,7 @@ class AdminReportsViewSet(viewsets.ViewSet):
             },
             'startDate': start_date.isoformat(),
             'endDate': end_date.isoformat(),
+            'currency': currency,
         })
     
     @action(detail=False, methods=['get'], url_path='instructors')
@@ -3124,19 +3151,23 @@ class AdminTenantsViewSet(viewsets.ViewSet):
             return False
         return True
     
-    def _get_tenant_data(self, tenant):
-        """Tenant verisini serialize et."""
-        from backend.users.models import User
-        from backend.courses.models import Course
+    def _get_tenant_data(self, tenant, stats=None):
+        """
+        Tenant verisini serialize et.
         
-        # Kullanıcı sayısı
-        user_count = User.objects.filter(tenant=tenant).count()
+        Args:
+            tenant: Tenant instance
+            stats: TenantStatsService.collect() çıktısındaki tenant girdisi.
+                Verilmezse tek tenant için hesaplanır.
+        """
+        from backend.admin_api.services import TenantStatsService
         
-        # Admin kullanıcı
-        admin_user = User.objects.filter(
-            tenant=tenant, 
-            role='TENANT_ADMIN'
-        ).first()
+        if stats is None:
+            stats = TenantStatsService.collect([tenant.id])[tenant.id]
+        
+        user_count = stats['users']
+        course_count = stats['courses']
+        admin_user = stats['admin']
         
         admin_data = None
         if admin_user:
@@ -3149,14 +3180,14 @@ class AdminTenantsViewSet(viewsets.ViewSet):
             }
         
         # Kullanım verileri (mock - gerçek sistemde storage tracking gerekli)
-        video_usage = Course.objects.filter(tenant=tenant).count() * 0.5  # GB approx
-        doc_usage = Course.objects.filter(tenant=tenant).count() * 0.1  # GB approx
+        video_usage = course_count * 0.5  # GB approx
+        doc_usage = course_count * 0.1  # GB approx
         
         return {
             'id': tenant.id,
             'name': tenant.name,
             'slug': tenant.slug or tenant.name.lower().replace(' ', '-'),
-            'type': tenant.tenant_type or 'Kurumsal',
+            'type': tenant.type or 'Kurumsal',
             'color': getattr(tenant, 'theme_color', 'blue') or 'blue',
             'logo': tenant.logo.url if tenant.logo else None,
             'users': user_count,
@@ -3190,9 +3221,14 @@ class AdminTenantsViewSet(viewsets.ViewSet):
         
         from backend.tenants.models import Tenant
         
-        tenants = Tenant.objects.all().order_by('name')
+        from backend.admin_api.services import TenantStatsService
+        
+        tenants = list(Tenant.objects.all().order_by('name'))
+        
+        # Tüm tenant'lar için sayımlar tek seferde (tenant başına sorgu yok)
+        stats = TenantStatsService.collect([t.id for t in tenants])
         
-        results = [self._get_tenant_data(t) for t in tenants]
+        results = [self._get_tenant_data(t, stats[t.id]) for t in tenants]
         
         return Response({
             'results': results,
@@ -3228,7 +3264,7 @@ class AdminTenantsViewSet(viewsets.ViewSet):
         tenant = Tenant.objects.create(
             name=data['name'],
             slug=data.get('slug', data['name'].lower().replace(' ', '-')),
-            tenant_type=data.get('type', 'Kurumsal'),
+            type=data.get('type', 'Kurumsal'),
             is_active=True,
         )
         
@@ -3279,7 +3315,7 @@ class AdminTenantsViewSet(viewsets.ViewSet):
         if 'slug' in data:
             tenant.slug = data['slug']
         if 'type' in data:
-            tenant.tenant_type = data['type']
+            tenant.type = data['type']
         if 'status' in data:
             tenant.is_active = data['status'] == 'active'
         
@@ -3348,13 +3384,18 @@ class SystemStatsView(APIView):
         from datetime import timedelta
         
         # Tenant depolama verileri
-        tenants = Tenant.objects.filter(is_active=True)[:6]
+        from backend.admin_api.services import TenantStatsService
+        
+        tenants = list(Tenant.objects.filter(is_active=True)[:6])
         tenant_storage = []
         
+        # Kurs sayıları tek GROUP BY sorgusu ile
+        course_counts = TenantStatsService.course_counts([t.id for t in tenants])
+        
         colors = ['#6366f1', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6', '#06b6d4']
         
         for idx, tenant in enumerate(tenants):
-            course_count = Course.objects.filter(tenant=tenant).count()
+            course_count = course_counts.get(tenant.id, 0)
             video_size = course_count * 50  # Mock: ~50GB per course average
             doc_size = course_count * 5  # Mock: ~5GB docs
             
@@ -3414,127 +3455,266 @@ class TechLogsViewSet(viewsets.ViewSet):
     """
     GET /api/v1/admin/logs/tech/
     
+    LOG_DIR altındaki dosya loglarını sondan başa okur.
+    
+    Query params:
+        level: Seviye filtresi, virgülle ayrılmış (örn: ERROR,CRITICAL)
+        service: Logger adı filtresi
+        search: Mesaj içinde arama
+        since / until: ISO tarih aralığı
+        source: Log kaynağı (varsayılan: global)
+        cursor: Sonraki sayfa cursor'ı (dosyası rotate edildiyse 410)
+        limit: Sayfa boyutu (max 200)
+    
     Yetki: TenantAdmin veya SuperAdmin
     """
     permission_classes = [IsAuthenticated, IsAdminOrSuperAdmin]
 
     def list(self, request):
-        logs = [
-            {
-                'id': '1', 'level': 'INFO', 'service': 'API',
-                'message': 'Server started successfully',
-                'timestamp': timezone.now().isoformat()
-            },
-            {
-                'id': '2', 'level': 'WARNING', 'service': 'Database',
-                'message': 'Connection pool reaching limit',
-                'timestamp': (timezone.now() - timedelta(hours=1)).isoformat()
-            },
-            {
-                'id': '3', 'level': 'ERROR', 'service': 'Auth',
-                'message': 'Failed login attempt',
-                'timestamp': (timezone.now() - timedelta(hours=2)).isoformat(),
-                'details': 'IP: 192.168.1.100'
-            },
-            {
-                'id': '4', 'level': 'INFO', 'service': 'Payment',
-                'message': 'Payment processed successfully',
-                'timestamp': (timezone.now() - timedelta(hours=3)).isoformat()
-            },
-            {
-                'id': '5', 'level': 'CRITICAL', 'service': 'Video',
-                'message': 'Video transcoding failed',
-                'timestamp': (timezone.now() - timedelta(hours=5)).isoformat(),
-                'details': 'File: video_123.mp4'
-            },
-        ]
-        return Response({'results': logs, 'count': len(logs)})
+        from .services import LogCursorExpired, TechLogReader
+        
+        params = request.query_params
+        levels = {l.strip() for l in params.get('level', '').split(',') if l.strip()}
+        
+        try:
+            limit = int(params.get('limit', TechLogReader.DEFAULT_LIMIT))
+        except ValueError:
+            limit = TechLogReader.DEFAULT_LIMIT
+        
+        reader = TechLogReader(source=params.get('source'))
+        try:
+            logs, next_cursor = reader.read(
+                levels=levels or None,
+                service=params.get('service'),
+                search=params.get('search'),
+                since=_parse_datetime_param(params.get('since')),
+                until=_parse_datetime_param(params.get('until'), end_of_day=True),
+                cursor=params.get('cursor'),
+                limit=limit,
+            )
+        except LogCursorExpired:
+            return Response(
+                {'error': 'Cursor süresi doldu (log dosyası rotate edildi); ilk sayfadan başlayın.'},
+                status=status.HTTP_410_GONE,
+            )
+        
+        return Response({
+            'results': logs,
+            'count': len(logs),
+            'next': next_cursor,
+            'sources': TechLogReader.available_sources(),
+        })
 
 
 class ActivityLogsViewSet(viewsets.ViewSet):
     """
     GET /api/v1/admin/logs/activity/
     
+    Audit log tablosu üzerinde cursor sayfalamalı sorgu.
+    Tenant Admin sadece kendi tenant'ının kayıtlarını görür.
+    
+    Query params:
+        action: Aksiyon filtresi (LOGIN, CREATE, ...)
+        user: Kullanıcı ID
+        search: Açıklama / kullanıcı adı içinde arama
+        since / until: ISO tarih aralığı
+        cursor: Sonraki sayfa cursor'ı
+        limit: Sayfa boyutu (max 200)
+    
     Yetki: TenantAdmin veya SuperAdmin
     """
     permission_classes = [IsAuthenticated, IsAdminOrSuperAdmin]
 
     def list(self, request):
-        logs = [
-            {
-                'id': '1',
-                'user': {'id': 'u1', 'name': 'Admin', 'email': 'admin@akademi.com'},
-                'action': 'LOGIN', 'resource': 'System',
-                'timestamp': timezone.now().isoformat(),
-                'ipAddress': '192.168.1.1'
-            },
-            {
-                'id': '2',
-                'user': {'id': 'u2', 'name': 'Ahmet', 'email': 'ahmet@ibb.tech'},
-                'action': 'CREATE', 'resource': 'Course',
-                'details': 'Created "Matematik 101"',
-                'timestamp': (timezone.now() - timedelta(hours=1)).isoformat()
-            },
-            {
-                'id': '3',
-                'user': {'id': 'u3', 'name': 'Selin', 'email': 'selin@student.com'},
-                'action': 'SUBMIT', 'resource': 'Assignment',
-                'details': 'Submitted "Ödev 3"',
-                'timestamp': (timezone.now() - timedelta(hours=2)).isoformat()
-            },
-            {
-                'id': '4',
-                'user': {'id': 'u4', 'name': 'Mehmet Yönetici', 'email': 'mehmet@kadikoy.bel.tr'},
-                'action': 'DELETE', 'resource': 'User',
-                'details': 'Deleted user "Can Vural"',
-                'timestamp': (timezone.now() - timedelta(days=1)).isoformat()
-            },
-            {
-                'id': '5',
-                'user': {'id': 'u5', 'name': 'Sistem', 'email': 'system@akademi.com'},
-                'action': 'UPDATE', 'resource': 'Settings',
-                'details': 'Updated video storage limit',
-                'timestamp': (timezone.now() - timedelta(days=2)).isoformat()
-            },
-        ]
-        return Response({'results': logs, 'count': len(logs)})
+        from .services import ActivityLogService
+        
+        params = request.query_params
+        is_super_admin = request.user.role == 'SUPER_ADMIN'
+        tenant = None if is_super_admin else request.user.tenant
+        
+        if not is_super_admin and tenant is None:
+            # Tenant'a bağlı olmayan TenantAdmin hiçbir tenant'ın kaydını göremez
+            return Response({'results': [], 'count': 0, 'next': None})
+        
+        try:
+            limit = int(params.get('limit', ActivityLogService.DEFAULT_LIMIT))
+        except ValueError:
+            limit = ActivityLogService.DEFAULT_LIMIT
+        
+        logs, next_cursor = ActivityLogService.query(
+            tenant=tenant,
+            action=params.get('action'),
+            user_id=params.get('user'),
+            search=params.get('search'),
+            since=_parse_datetime_param(params.get('since')),
+            until=_parse_datetime_param(params.get('until'), end_of_day=True),
+            cursor=params.get('cursor'),
+            limit=limit,
+        )
+        
+        return Response({
+            'results': logs,
+            'count': len(logs),
+            'next': next_cursor,
+        })
+
+
+def _parse_datetime_param(value, end_of_day=False):
+    """
+    Query param'dan aware datetime üret (YYYY-MM-DD veya ISO).
+    
+    Sadece tarih verilirse günün başı; `end_of_day` ile (until için)
+    günün sonu döner, böylece o günün kayıtları da aralığa girer.
+    """
+    from django.utils.dateparse import parse_date, parse_datetime
+    from datetime import datetime, time
+    
+    if not value:
+        return None
+    
+    try:
+        # parse_datetime sadece tarihi de kabul eder (gece yarısı); önce tarih denenir
+        date_value = parse_date(value)
+        if date_value is not None:
+            parsed = datetime.combine(date_value, time.max if end_of_day else time.min)
+        else:
+            parsed = parse_datetime(value)
+    except ValueError:
+        # Biçimi doğru ama geçersiz tarih (örn: 2025-02-30)
+        return None
+    
+    if parsed is None:
+        return None
+    
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
 
 
 # =============================================================================
 # FINANCE API
 # =============================================================================
 
+def _date_param(params, name):
+    """
+    YYYY-MM-DD query param'ı.
+    
+    Raises:
+        ValidationError: Biçimi veya değeri geçersiz tarih (400)
+    """
+    from django.utils.dateparse import parse_date
+    from rest_framework.exceptions import ValidationError
+    
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({name: 'Geçersiz tarih, YYYY-MM-DD bekleniyor.'})
+    return parsed
+
+
+def _currency_param(params):
+    """
+    `currency` query param'ı (varsayılan: RevenueLedger.DEFAULT_CURRENCY).
+    
+    Raises:
+        ValidationError: Tanımsız para birimi (400)
+    """
+    from rest_framework.exceptions import ValidationError
+    from backend.courses.models import Course
+    from backend.courses.revenue import RevenueLedger
+    
+    currency = params.get('currency') or RevenueLedger.DEFAULT_CURRENCY
+    if currency not in {code for code, _ in Course._meta.get_field('currency').choices}:
+        raise ValidationError({'currency': f'Tanımsız para birimi: {currency}'})
+    return currency
+
+
+def _finance_scope(request):
+    """
+    Finans endpoint'leri için (tenant, başlangıç, bitiş, para birimi).
+    
+    SuperAdmin tüm tenant'ları görür; TenantAdmin sadece kendi tenant'ını.
+    startDate / endDate (YYYY-MM-DD) verilmezse tüm zamanlar. Tutarlar
+    `currency` biriminde raporlanır (varsayılan TRY).
+    
+    Raises:
+        ValidationError: Geçersiz tarih / aralık / para birimi (400)
+        PermissionDenied: Tenant'a bağlı olmayan TenantAdmin (403)
+    """
+    from rest_framework.exceptions import PermissionDenied, ValidationError
+    
+    params = request.query_params
+    is_super_admin = request.user.role == 'SUPER_ADMIN'
+    tenant = None if is_super_admin else request.user.tenant
+    if not is_super_admin and tenant is None:
+        raise PermissionDenied('Bir akademiye bağlı değilsiniz.')
+    
+    start = _date_param(params, 'startDate')
+    end = _date_param(params, 'endDate')
+    if start and end and start > end:
+        raise ValidationError({'endDate': 'Bitiş tarihi başlangıçtan önce olamaz.'})
+    
+    return tenant, start, end, _currency_param(params)
+
+
+def _finance_amounts(row, currency):
+    """Finans satırının tutar alanları (seçili birim + birim bazlı net)."""
+    return {
+        'currency': currency,
+        'revenueByCurrency': {code: float(net) for code, net in row['net_by_currency'].items()},
+    }
+
+
 class FinanceAcademiesView(APIView):
     """
     GET /api/v1/admin/finance/academies/
     
+    Günlük gelir özetlerinden (RevenueRollup) akademi bazlı gelir.
+    
+    Query params:
+        startDate / endDate: Tarih aralığı (YYYY-MM-DD)
+        currency: Tutarların para birimi (TRY, USD, EUR; varsayılan TRY)
+    
     Yetki: TenantAdmin veya SuperAdmin
     """
     permission_classes = [IsAuthenticated, IsAdminOrSuperAdmin]
 
     def get(self, request):
-        academies = [
-            {
-                'id': '1', 'name': 'İBB Teknoloji Akademisi',
-                'totalRevenue': 2500000, 'students': 45200,
-                'courses': 156, 'avgRevenuePerStudent': 55
-            },
-            {
-                'id': '2', 'name': 'Kadıköy Kreatif Hub',
-                'totalRevenue': 850000, 'students': 12500,
-                'courses': 48, 'avgRevenuePerStudent': 68
-            },
-            {
-                'id': '3', 'name': 'Boğaziçi SEM',
-                'totalRevenue': 1200000, 'students': 8500,
-                'courses': 92, 'avgRevenuePerStudent': 141
-            },
-            {
-                'id': '4', 'name': 'Akademi İstanbul',
-                'totalRevenue': 1800000, 'students': 22000,
-                'courses': 120, 'avgRevenuePerStudent': 82
-            },
-        ]
+        from backend.courses.models import RevenueRollup
+        from backend.courses.revenue import RevenueLedger
+        from backend.tenants.models import Tenant
+        
+        tenant, start, end, currency = _finance_scope(request)
+        
+        totals = RevenueLedger.summarize(
+            RevenueRollup.Dimension.TENANT, tenant=tenant, start=start, end=end,
+        )
+        
+        tenants = Tenant.objects.filter(
+            pk__in=[int(key) for key in totals]
+        ).only('id', 'name', 'stats_courses')
+        
+        academies = []
+        for t in tenants:
+            row = RevenueLedger.in_currency(totals[str(t.id)], currency)
+            students = max(row['enrollments'] - row['cancellations'], 0)
+            net = float(row['net'])
+            academies.append({
+                'id': str(t.id),
+                'name': t.name,
+                'totalRevenue': net,
+                'students': students,
+                'courses': t.stats_courses,
+                'avgRevenuePerStudent': round(net / students) if students else 0,
+                **_finance_amounts(row, currency),
+            })
+        
+        academies.sort(key=lambda a: a['totalRevenue'], reverse=True)
         return Response(academies)
 
 
@@ -3542,18 +3722,41 @@ class FinanceCategoriesView(APIView):
     """
     GET /api/v1/admin/finance/categories/
     
+    Günlük gelir özetlerinden kategori bazlı gelir.
+    
+    Query params:
+        startDate / endDate: Tarih aralığı (YYYY-MM-DD)
+        currency: Tutarların para birimi (TRY, USD, EUR; varsayılan TRY)
+    
     Yetki: TenantAdmin veya SuperAdmin
     """
     permission_classes = [IsAuthenticated, IsAdminOrSuperAdmin]
+    
+    COLORS = ['#6366f1', '#8b5cf6', '#ec4899', '#f59e0b', '#10b981', '#06b6d4']
+    OTHER_COLOR = '#94a3b8'
 
     def get(self, request):
-        categories = [
-            {'name': 'Teknoloji', 'revenue': 1500000, 'color': '#6366f1'},
-            {'name': 'İş & Yönetim', 'revenue': 800000, 'color': '#8b5cf6'},
-            {'name': 'Tasarım', 'revenue': 500000, 'color': '#ec4899'},
-            {'name': 'Dil Eğitimi', 'revenue': 350000, 'color': '#f59e0b'},
-            {'name': 'Diğer', 'revenue': 200000, 'color': '#94a3b8'},
-        ]
+        from backend.courses.models import RevenueRollup
+        from backend.courses.revenue import RevenueLedger
+        
+        tenant, start, end, currency = _finance_scope(request)
+        
+        totals = RevenueLedger.summarize(
+            RevenueRollup.Dimension.CATEGORY, tenant=tenant, start=start, end=end,
+        )
+        
+        rows = {name: RevenueLedger.in_currency(row, currency) for name, row in totals.items()}
+        ranked = sorted(rows.items(), key=lambda item: item[1]['net'], reverse=True)
+        
+        categories = []
+        for idx, (name, row) in enumerate(ranked):
+            categories.append({
+                'name': name or 'Diğer',
+                'revenue': float(row['net']),
+                'color': self.COLORS[idx] if name and idx < len(self.COLORS) else self.OTHER_COLOR,
+                **_finance_amounts(row, currency),
+            })
+        
         return Response(categories)
 
 
@@ -3561,37 +3764,56 @@ class FinanceInstructorsView(APIView):
     """
     GET /api/v1/admin/finance/instructors/
     
+    Günlük gelir özetlerinden eğitmen kazançları (en yüksek 20).
+    
+    Query params:
+        startDate / endDate: Tarih aralığı (YYYY-MM-DD)
+        currency: Tutarların para birimi (TRY, USD, EUR; varsayılan TRY)
+    
     Yetki: TenantAdmin veya SuperAdmin
     """
     permission_classes = [IsAuthenticated, IsAdminOrSuperAdmin]
+    
+    LIMIT = 20
 
     def get(self, request):
-        instructors = [
-            {
-                'id': '1', 'name': 'Dr. Ahmet Yılmaz',
-                'avatar': 'https://ui-avatars.com/api/?name=Ahmet+Y&background=random',
-                'totalEarnings': 125000, 'coursesCount': 8,
-                'studentsCount': 2500, 'rating': 4.9
-            },
-            {
-                'id': '2', 'name': 'Zeynep Hoca',
-                'avatar': 'https://ui-avatars.com/api/?name=Zeynep+H&background=random',
-                'totalEarnings': 98000, 'coursesCount': 6,
-                'studentsCount': 1800, 'rating': 4.8
-            },
-            {
-                'id': '3', 'name': 'Mehmet Yönetici',
-                'avatar': 'https://ui-avatars.com/api/?name=Mehmet+Y&background=random',
-                'totalEarnings': 75000, 'coursesCount': 4,
-                'studentsCount': 1200, 'rating': 4.7
-            },
-            {
-                'id': '4', 'name': 'Selin Demir',
-                'avatar': 'https://ui-avatars.com/api/?name=Selin+D&background=random',
-                'totalEarnings': 62000, 'coursesCount': 5,
-                'studentsCount': 950, 'rating': 4.6
-            },
-        ]
+        from backend.courses.models import RevenueRollup
+        from backend.courses.revenue import RevenueLedger
+        from backend.users.models import User
+        
+        tenant, start, end, currency = _finance_scope(request)
+        
+        totals = RevenueLedger.summarize(
+            RevenueRollup.Dimension.INSTRUCTOR, tenant=tenant, start=start, end=end,
+        )
+        
+        rows = {key: RevenueLedger.in_currency(row, currency) for key, row in totals.items()}
+        top = sorted(rows.items(), key=lambda item: item[1]['net'], reverse=True)[:self.LIMIT]
+        
+        users = User.objects.filter(
+            pk__in=[key for key, _ in top]
+        ).annotate(
+            courses_count=Count('teaching_courses', distinct=True),
+            avg_rating=Avg('teaching_courses__rating'),
+        )
+        users_by_id = {str(u.pk): u for u in users}
+        
+        instructors = []
+        for key, row in top:
+            user = users_by_id.get(key)
+            if user is None:
+                continue
+            instructors.append({
+                'id': key,
+                'name': user.full_name,
+                'avatar': user.get_avatar_url(),
+                'totalEarnings': float(row['net']),
+                'coursesCount': user.courses_count,
+                'studentsCount': max(row['enrollments'] - row['cancellations'], 0),
+                'rating': round(float(user.avg_rating or 0), 1),
+                **_finance_amounts(row, currency),
+            })
+        
         return Response(instructors)
 
 
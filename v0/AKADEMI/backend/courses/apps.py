@@ -13,3 +13,9 @@ class CoursesConfig(AppConfig):
         except ImportError:
             pass
 
+        # Cache invalidation sinyalleri (namespace sürümleri)
+        try:
+            from backend.libs.cache import signals as cache_signals  # noqa: F401
+        except ImportError:
+            pass
+
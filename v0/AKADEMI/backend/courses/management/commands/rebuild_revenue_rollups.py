@@ -0,0 +1,28 @@
+"""
+Gelir özetlerini (RevenueRollup) Enrollment kayıtlarından yeniden oluşturur.
+
+Kullanım:
+    python manage.py rebuild_revenue_rollups
+    python manage.py rebuild_revenue_rollups --tenant 3 --tenant 5
+"""
+
+from django.core.management.base import BaseCommand
+
+from backend.courses.revenue import RevenueLedger
+
+
+class Command(BaseCommand):
+    help = 'Gelir özetlerini (RevenueRollup) mevcut kayıtlardan yeniden oluşturur.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tenant',
+            action='append',
+            type=int,
+            dest='tenants',
+            help='Sadece bu tenant ID için (birden fazla verilebilir)',
+        )
+
+    def handle(self, *args, **options):
+        buckets = RevenueLedger.rebuild(options.get('tenants'))
+        self.stdout.write(self.style.SUCCESS(f'{buckets} gelir özeti satırı oluşturuldu.'))
@@ -0,0 +1,112 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0002_initial"),
+        ("tenants", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RevenueRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="Gün")),
+                (
+                    "dimension",
+                    models.CharField(
+                        choices=[
+                            ("tenant", "Akademi"),
+                            ("category", "Kategori"),
+                            ("instructor", "Eğitmen"),
+                            ("course", "Kurs"),
+                        ],
+                        max_length=20,
+                        verbose_name="Boyut",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        blank=True,
+                        help_text="Kategori adı, eğitmen ID veya kurs ID (tenant boyutunda boş)",
+                        max_length=100,
+                        verbose_name="Anahtar",
+                    ),
+                ),
+                (
+                    "currency",
+                    models.CharField(
+                        default="TRY", max_length=3, verbose_name="Para Birimi"
+                    ),
+                ),
+                (
+                    "revenue",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="Brüt Gelir",
+                    ),
+                ),
+                (
+                    "refunds",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="İade",
+                    ),
+                ),
+                (
+                    "enrollments",
+                    models.PositiveIntegerField(default=0, verbose_name="Kayıt"),
+                ),
+                (
+                    "cancellations",
+                    models.PositiveIntegerField(default=0, verbose_name="İptal"),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "tenant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="revenue_rollups",
+                        to="tenants.tenant",
+                        verbose_name="Akademi",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Gelir Özeti",
+                "verbose_name_plural": "Gelir Özetleri",
+                "indexes": [
+                    models.Index(
+                        fields=["dimension", "date"],
+                        name="revenue_rollup_dim_date_idx",
+                    ),
+                    models.Index(
+                        fields=["tenant", "dimension", "date"],
+                        name="revenue_rollup_tenant_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("date", "tenant", "dimension", "key", "currency"),
+                        name="revenue_rollup_bucket_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -530,3 +530,85 @@ class ContentProgress(models.Model):
     def __str__(self):
         return f'{self.enrollment.user.email} - {self.content.title}'
 
+
+
+class RevenueRollup(models.Model):
+    """
+    Günlük gelir özeti (ledger rollup).
+    
+    Enrollment oluşturma / iptal olaylarında artımlı güncellenir
+    (bkz: backend.courses.revenue). Finans panelleri çok yıllık
+    aralıklarda bile ham kayıt yerine bu ön-toplanmış satırları okur.
+    
+    Her satır bir (gün, tenant, boyut, anahtar, para birimi) kovasıdır.
+    """
+
+    class Dimension(models.TextChoices):
+        """Özet boyutları."""
+        TENANT = 'tenant', _('Akademi')
+        CATEGORY = 'category', _('Kategori')
+        INSTRUCTOR = 'instructor', _('Eğitmen')
+        COURSE = 'course', _('Kurs')
+
+    date = models.DateField(_('Gün'))
+    tenant = models.ForeignKey(
+        'tenants.Tenant',
+        on_delete=models.CASCADE,
+        related_name='revenue_rollups',
+        verbose_name=_('Akademi'),
+    )
+    dimension = models.CharField(
+        _('Boyut'),
+        max_length=20,
+        choices=Dimension.choices,
+    )
+    key = models.CharField(
+        _('Anahtar'),
+        max_length=100,
+        blank=True,
+        help_text=_('Kategori adı, eğitmen ID veya kurs ID (tenant boyutunda boş)'),
+    )
+    currency = models.CharField(
+        _('Para Birimi'),
+        max_length=3,
+        default='TRY',
+    )
+    
+    # Toplamlar
+    revenue = models.DecimalField(
+        _('Brüt Gelir'),
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+    )
+    refunds = models.DecimalField(
+        _('İade'),
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+    )
+    enrollments = models.PositiveIntegerField(_('Kayıt'), default=0)
+    cancellations = models.PositiveIntegerField(_('İptal'), default=0)
+    
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _('Gelir Özeti')
+        verbose_name_plural = _('Gelir Özetleri')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['date', 'tenant', 'dimension', 'key', 'currency'],
+                name='revenue_rollup_bucket_uniq',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['dimension', 'date'], name='revenue_rollup_dim_date_idx'),
+            models.Index(fields=['tenant', 'dimension', 'date'], name='revenue_rollup_tenant_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.date} {self.dimension}:{self.key or self.tenant_id} {self.revenue}'
+
+    @property
+    def net_revenue(self):
+        return self.revenue - self.refunds
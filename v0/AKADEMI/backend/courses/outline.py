@@ -0,0 +1,82 @@
+"""
+Course Outline Cache
+====================
+
+Player, ilerleme, telemetri ve kilit endpoint'lerinin her istekte yaptığı
+kurs + içerik çözümlemesi için iki katmanlı (process LRU + paylaşılan)
+cache (bkz: backend.libs.cache.tiered).
+
+Key'ler:
+    course:<id>   Course
+    content:<id>  CourseContent (modülü ile birlikte)
+
+Course, CourseModule ve CourseContent değişikliklerinde commit sonrası
+invalidate edilir (bkz: backend.courses.signals).
+
+Kullanım:
+    from backend.courses.outline import CourseOutline
+
+    course, content = CourseOutline.get_course_and_content(
+        request.user.tenant_id, course_id, content_id
+    )
+"""
+
+from typing import Iterable, Tuple
+
+from django.http import Http404
+
+from backend.libs.cache.invalidation import invalidate
+from backend.libs.cache.tiered import tiered_cache
+
+
+class CourseOutline:
+    """
+    Kurs yapısı cache'i.
+    """
+
+    FAMILY = 'course_outline'
+
+    @classmethod
+    def get_course(cls, course_id):
+        """Course (yoksa None)."""
+        from .models import Course
+
+        return tiered_cache(cls.FAMILY).get_or_set(
+            f'course:{course_id}',
+            lambda: Course.objects.filter(pk=course_id).first(),
+        )
+
+    @classmethod
+    def get_content(cls, content_id):
+        """CourseContent, modülü yüklenmiş (yoksa None)."""
+        from .models import CourseContent
+
+        return tiered_cache(cls.FAMILY).get_or_set(
+            f'content:{content_id}',
+            lambda: CourseContent.objects.select_related('module').filter(pk=content_id).first(),
+        )
+
+    @classmethod
+    def get_course_and_content(cls, tenant_id, course_id, content_id) -> Tuple[object, object]:
+        """
+        Tenant'ın kursu ve kursa ait içerik.
+
+        Raises:
+            Http404: Kurs tenant'a ait değil veya içerik kursta yok
+        """
+        course = cls.get_course(course_id)
+        if course is None or course.tenant_id != tenant_id:
+            raise Http404('No Course matches the given query.')
+
+        content = cls.get_content(content_id)
+        if content is None or content.module.course_id != course.id:
+            raise Http404('No CourseContent matches the given query.')
+
+        return course, content
+
+    @classmethod
+    def invalidate(cls, course_ids: Iterable = (), content_ids: Iterable = ()) -> None:
+        """Kurs / içerik key'lerini commit sonrası invalidate et."""
+        keys = [f'course:{pk}' for pk in course_ids if pk]
+        keys += [f'content:{pk}' for pk in content_ids if pk]
+        invalidate(tiered={cls.FAMILY: keys})
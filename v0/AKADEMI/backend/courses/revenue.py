@@ -0,0 +1,340 @@
+"""
+Revenue Ledger
+==============
+
+Enrollment olaylarından günlük gelir özetlerinin (RevenueRollup) bakımı.
+
+Her kayıt olayı dört kovaya yazılır: tenant, kategori, eğitmen ve kurs.
+Güncellemeler F-expression ile atomiktir; kova yoksa oluşturulur.
+
+Gelir kuralları:
+    - Kayıt oluşturulduğunda kursun o anki fiyatı brüt gelire eklenir
+      (kayıt günü kovası).
+    - Kayıt iptal edildiğinde aynı tutar iptal günü kovasına iade olarak
+      yazılır. İptal geri alınırsa tekrar gelir olarak yazılır. İptal
+      edilmemiş kaydın silinmesi iptal gibi yazılır.
+    - Birden fazla eğitmenli kurslarda gelir eğitmenlere eşit bölünür.
+
+Tutarlar kursun para biriminde saklanır; farklı para birimleri hiçbir
+sorguda birbirine eklenmez.
+
+Kullanım:
+    from backend.courses.revenue import RevenueLedger
+
+    totals = RevenueLedger.summarize('category', tenant=tenant, start=..., end=...)
+    row = RevenueLedger.in_currency(totals['Yazılım'], 'TRY')
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, Iterable, List, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+CENT = Decimal('0.01')
+ZERO = Decimal('0')
+
+
+class RevenueLedger:
+    """
+    Gelir özeti servisi.
+    """
+
+    # Para birimi seçilmeyen raporların birimi (Course.currency varsayılanı)
+    DEFAULT_CURRENCY = 'TRY'
+
+    # =========================================================================
+    # OLAYLAR
+    # =========================================================================
+
+    @classmethod
+    def record_enrollment(cls, enrollment, when=None) -> None:
+        """Yeni (veya yeniden aktifleşen) kaydın gelirini yaz."""
+        when = when or enrollment.enrolled_at or timezone.now()
+        cls._apply(enrollment.course, when, revenue_sign=1)
+
+    @classmethod
+    def record_cancellation(cls, enrollment, when=None) -> None:
+        """İptal edilen kaydın tutarını iade olarak yaz."""
+        cls._apply(enrollment.course, when or timezone.now(), revenue_sign=-1)
+
+    @classmethod
+    def _apply(cls, course, when, revenue_sign: int) -> None:
+        amount = Decimal(course.price or 0)
+        day = timezone.localdate(when) if timezone.is_aware(when) else when.date()
+
+        for bucket in cls._buckets(course, amount):
+            dimension, key, share = bucket
+            if revenue_sign > 0:
+                deltas = {'revenue': share, 'enrollments': 1}
+            else:
+                deltas = {'refunds': share, 'cancellations': 1}
+            cls._increment(day, course.tenant_id, dimension, key, course.currency, deltas)
+
+    @classmethod
+    def _buckets(cls, course, amount: Decimal, instructor_ids: Optional[List] = None) -> List[tuple]:
+        """Bir kurs olayının yazılacağı (boyut, anahtar, tutar) kovaları."""
+        from .models import RevenueRollup
+
+        Dimension = RevenueRollup.Dimension
+        buckets = [
+            (Dimension.TENANT, '', amount),
+            (Dimension.CATEGORY, course.category or '', amount),
+            (Dimension.COURSE, str(course.pk), amount),
+        ]
+
+        if instructor_ids is None:
+            instructor_ids = list(course.instructors.values_list('id', flat=True))
+        for instructor_id, share in zip(instructor_ids, cls._split(amount, len(instructor_ids))):
+            buckets.append((Dimension.INSTRUCTOR, str(instructor_id), share))
+
+        return buckets
+
+    @staticmethod
+    def _split(amount: Decimal, parts: int) -> List[Decimal]:
+        """Tutarı kuruş kaybı olmadan eşit parçalara böl."""
+        if parts <= 0:
+            return []
+        share = (amount / parts).quantize(CENT, rounding=ROUND_HALF_UP)
+        shares = [share] * parts
+        shares[-1] = amount - share * (parts - 1)
+        return shares
+
+    @classmethod
+    def _increment(cls, day: date, tenant_id, dimension: str, key: str, currency: str, deltas: dict) -> None:
+        """Kovayı atomik olarak artır, yoksa oluştur."""
+        from .models import RevenueRollup
+
+        lookup = {
+            'date': day,
+            'tenant_id': tenant_id,
+            'dimension': dimension,
+            'key': key,
+            'currency': currency,
+        }
+        updates = {field: F(field) + value for field, value in deltas.items()}
+
+        if RevenueRollup.objects.filter(**lookup).update(**updates):
+            return
+
+        try:
+            with transaction.atomic():
+                RevenueRollup.objects.create(**lookup, **deltas)
+        except IntegrityError:
+            # Eşzamanlı oluşturma - kova artık var
+            RevenueRollup.objects.filter(**lookup).update(**updates)
+
+    # =========================================================================
+    # SORGULAR
+    # =========================================================================
+
+    @classmethod
+    def queryset(
+        cls,
+        dimension: str,
+        tenant=None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        currency: Optional[str] = None,
+    ):
+        """Boyut, tenant, tarih aralığı ve para birimine göre filtrelenmiş özet satırları."""
+        from .models import RevenueRollup
+
+        queryset = RevenueRollup.objects.filter(dimension=dimension)
+        if tenant is not None:
+            queryset = queryset.filter(tenant=tenant)
+        if currency:
+            queryset = queryset.filter(currency=currency)
+        if start:
+            queryset = queryset.filter(date__gte=start)
+        if end:
+            queryset = queryset.filter(date__lte=end)
+        return queryset.order_by()
+
+    @classmethod
+    def summarize(
+        cls,
+        dimension: str,
+        tenant=None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        keys: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Dict[str, dict]]:
+        """
+        Boyut anahtarı ve para birimine göre toplamlar.
+
+        Tenant boyutunda anahtar tenant ID'sidir. Tek sayıya indirmek için
+        bkz: in_currency.
+
+        Returns:
+            {key: {currency: {'revenue', 'refunds', 'net', 'enrollments', 'cancellations'}}}
+        """
+        from .models import RevenueRollup
+
+        queryset = cls.queryset(dimension, tenant, start, end)
+        if keys is not None:
+            queryset = queryset.filter(key__in=[str(k) for k in keys])
+
+        group_field = 'tenant_id' if dimension == RevenueRollup.Dimension.TENANT else 'key'
+        rows = queryset.values(group_field, 'currency').annotate(
+            total_revenue=Sum('revenue'),
+            total_refunds=Sum('refunds'),
+            total_enrollments=Sum('enrollments'),
+            total_cancellations=Sum('cancellations'),
+        )
+
+        totals = defaultdict(dict)
+        for row in rows:
+            totals[str(row[group_field])][row['currency']] = cls._totals(row)
+        return dict(totals)
+
+    @staticmethod
+    def in_currency(by_currency: Dict[str, dict], currency: str) -> dict:
+        """
+        summarize() satırını tek para birimine indir.
+
+        Tutarlar sadece `currency` biriminden gelir; kayıt / iptal sayıları
+        tüm birimlerden toplanır. `net_by_currency` diğer birimleri de taşır.
+
+        Returns:
+            {'revenue', 'refunds', 'net', 'enrollments', 'cancellations', 'net_by_currency'}
+        """
+        selected = by_currency.get(currency, {})
+        return {
+            'revenue': selected.get('revenue', ZERO),
+            'refunds': selected.get('refunds', ZERO),
+            'net': selected.get('net', ZERO),
+            'enrollments': sum(row['enrollments'] for row in by_currency.values()),
+            'cancellations': sum(row['cancellations'] for row in by_currency.values()),
+            'net_by_currency': {code: row['net'] for code, row in by_currency.items()},
+        }
+
+    @classmethod
+    def daily(
+        cls,
+        tenant=None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        currency: Optional[str] = None,
+    ) -> Dict[date, dict]:
+        """
+        Gün bazında toplamlar (tenant boyutu).
+
+        `currency` verilmezse DEFAULT_CURRENCY kullanılır.
+        """
+        from .models import RevenueRollup
+
+        rows = cls.queryset(
+            RevenueRollup.Dimension.TENANT, tenant, start, end,
+            currency=currency or cls.DEFAULT_CURRENCY,
+        ).values('date').annotate(
+            total_revenue=Sum('revenue'),
+            total_refunds=Sum('refunds'),
+            total_enrollments=Sum('enrollments'),
+            total_cancellations=Sum('cancellations'),
+        )
+        return {row['date']: cls._totals(row) for row in rows}
+
+    @staticmethod
+    def _totals(row) -> dict:
+        revenue = row['total_revenue'] or ZERO
+        refunds = row['total_refunds'] or ZERO
+        return {
+            'revenue': revenue,
+            'refunds': refunds,
+            'net': revenue - refunds,
+            'enrollments': row['total_enrollments'] or 0,
+            'cancellations': row['total_cancellations'] or 0,
+        }
+
+    # =========================================================================
+    # YENİDEN OLUŞTURMA
+    # =========================================================================
+
+    @classmethod
+    def rebuild(cls, tenant_ids: Optional[Iterable] = None) -> int:
+        """
+        Özetleri mevcut Enrollment kayıtlarından sıfırdan oluştur.
+
+        İlk kurulum (backfill) ve veri onarımı içindir. Kurs ve gün başına
+        gruplanmış tek sorgu ile çalışır; iptal edilen kayıtlar iptal
+        tarihi bilinmediğinden son erişim (yoksa kayıt) gününe iade olarak yazılır.
+
+        Returns:
+            Oluşturulan özet satırı sayısı
+        """
+        from django.db.models.functions import TruncDate
+
+        from .models import Course, Enrollment, RevenueRollup
+
+        tenant_ids = list(tenant_ids) if tenant_ids is not None else None
+
+        enrollments = Enrollment.objects.order_by()
+        if tenant_ids is not None:
+            enrollments = enrollments.filter(course__tenant_id__in=tenant_ids)
+
+        # (course_id, day) -> [kayıt sayısı, iptal sayısı]
+        counts = defaultdict(lambda: [0, 0])
+        tz = timezone.get_current_timezone()
+
+        for row in enrollments.annotate(day=TruncDate('enrolled_at', tzinfo=tz)).values(
+            'course_id', 'day'
+        ).annotate(total=Count('id')):
+            counts[(row['course_id'], row['day'])][0] += row['total']
+
+        cancelled = enrollments.filter(status=Enrollment.Status.CANCELLED).annotate(
+            day=TruncDate('last_accessed_at', tzinfo=tz),
+            enrolled_day=TruncDate('enrolled_at', tzinfo=tz),
+        ).values('course_id', 'day', 'enrolled_day').annotate(total=Count('id'))
+        for row in cancelled:
+            counts[(row['course_id'], row['day'] or row['enrolled_day'])][1] += row['total']
+
+        courses = {
+            course.pk: course
+            for course in Course.objects.filter(
+                pk__in={course_id for course_id, _ in counts}
+            ).prefetch_related('instructors')
+        }
+
+        # Bellekte topla
+        buckets = {}
+        for (course_id, day), (enrolled, cancelled_count) in counts.items():
+            course = courses.get(course_id)
+            if course is None:
+                continue
+            course_buckets = cls._buckets(
+                course,
+                Decimal(course.price or 0),
+                instructor_ids=[i.pk for i in course.instructors.all()],
+            )
+
+            for dimension, key, share in course_buckets:
+                bucket_key = (day, course.tenant_id, dimension, key, course.currency)
+                bucket = buckets.setdefault(bucket_key, RevenueRollup(
+                    date=day,
+                    tenant_id=course.tenant_id,
+                    dimension=dimension,
+                    key=key,
+                    currency=course.currency,
+                ))
+                bucket.revenue += share * enrolled
+                bucket.enrollments += enrolled
+                bucket.refunds += share * cancelled_count
+                bucket.cancellations += cancelled_count
+
+        with transaction.atomic():
+            existing = RevenueRollup.objects.all()
+            if tenant_ids is not None:
+                existing = existing.filter(tenant_id__in=tenant_ids)
+            existing.delete()
+            RevenueRollup.objects.bulk_create(buckets.values(), batch_size=1000)
+
+        logger.info(f"Revenue rollups rebuilt: {len(buckets)} bucket(s)")
+        return len(buckets)
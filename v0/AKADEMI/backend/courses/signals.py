@@ -0,0 +1,93 @@
+"""
+Course Signals
+==============
+
+Enrollment olaylarından gelir özetlerinin (RevenueRollup) bakımı ve
+kurs yapısı cache'inin (CourseOutline) invalidation'ı.
+"""
+
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Course, CourseContent, CourseModule, Enrollment
+from .outline import CourseOutline
+from .revenue import RevenueLedger
+
+
+
+@receiver(post_init, sender=Enrollment)
+def remember_enrollment_status(sender, instance, **kwargs):
+    """Yüklenen durumu sakla - iptal geçişini tespit etmek için."""
+    # Deferred alan ek sorgu tetiklemesin
+    instance._revenue_status = instance.__dict__.get('status')
+
+
+@receiver(post_save, sender=Enrollment)
+def update_revenue_rollups(sender, instance, created, raw=False, **kwargs):
+    """
+    Kayıt oluşturulduğunda gelir, iptal edildiğinde iade yaz.
+    """
+    if raw:
+        return
+
+    cancelled = Enrollment.Status.CANCELLED
+    current = instance.__dict__.get('status')
+
+    if created:
+        if current != cancelled:
+            RevenueLedger.record_enrollment(instance)
+    else:
+        previous = getattr(instance, '_revenue_status', None)
+        if previous is None or current is None or previous == current:
+            return
+        if current == cancelled:
+            RevenueLedger.record_cancellation(instance)
+        elif previous == cancelled:
+            # İptal geri alındı - tekrar gelir
+            RevenueLedger.record_enrollment(instance, when=timezone.now())
+
+    instance._revenue_status = current
+
+
+@receiver(post_delete, sender=Enrollment)
+def reverse_deleted_enrollment_revenue(sender, instance, **kwargs):
+    """
+    Silinen kaydın gelirini iptaldeki gibi iade olarak yaz.
+    """
+    status = instance.__dict__.get('status')
+    # İptal edilmiş kaydın iadesi zaten yazıldı
+    if status is None or status == Enrollment.Status.CANCELLED:
+        return
+
+    try:
+        instance.course
+    except Course.DoesNotExist:
+        # Kursla birlikte silindi - iade yazılacak kova yok
+        return
+
+    RevenueLedger.record_cancellation(instance)
+
+
+# =============================================================================
+# KURS YAPISI CACHE
+# =============================================================================
+
+@receiver([post_save, post_delete], sender=Course)
+def invalidate_course_outline(sender, instance, **kwargs):
+    CourseOutline.invalidate(course_ids=[instance.pk])
+
+
+@receiver([post_save, post_delete], sender=CourseModule)
+def invalidate_module_outline(sender, instance, **kwargs):
+    """Modül değişti: içeriklerin cache'lenmiş modül / kurs bilgisi eskidi."""
+    # Silmede içerikler cascade ile silinir ve kendi sinyallerini tetikler
+    if kwargs.get('signal') is post_save:
+        CourseOutline.invalidate(
+            content_ids=CourseContent.objects.filter(module=instance).values_list('id', flat=True)
+        )
+
+
+@receiver([post_save, post_delete], sender=CourseContent)
+def invalidate_content_outline(sender, instance, **kwargs):
+    CourseOutline.invalidate(content_ids=[instance.pk])
@@ -0,0 +1 @@
+# Courses tests
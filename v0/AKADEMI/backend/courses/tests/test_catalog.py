@@ -0,0 +1,86 @@
+"""
+Course Catalog Tests
+====================
+
+Kurs kataloğu ve kurs detayı (müfredat) cache'i testleri.
+"""
+
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+
+class CourseCatalogCacheTest(APITestCase):
+    """CourseViewSet list / retrieve cache testleri."""
+
+    @classmethod
+    def setUpTestData(cls):
+        from backend.courses.models import Course, CourseContent, CourseModule
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        tenant = Tenant.objects.create(name='Test Akademi', slug='test-akademi')
+        cls.student = User.objects.create_user(
+            email='student@test.com', password='testpass123', tenant=tenant, role='STUDENT',
+        )
+        cls.instructor = User.objects.create_user(
+            email='instructor@test.com', password='testpass123', tenant=tenant, role='INSTRUCTOR',
+        )
+        cls.course = Course.objects.create(
+            title='Course',
+            slug='course',
+            description='Test course description',
+            category='Technology',
+            tenant=tenant,
+            status=Course.Status.PUBLISHED,
+        )
+        cls.content = CourseContent.objects.create(
+            module=CourseModule.objects.create(course=cls.course, title='Module'),
+            title='Video',
+            type=CourseContent.ContentType.VIDEO,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.student)
+
+    def test_catalog_cached_and_invalidated(self):
+        """Katalog cache'ten döner; kurs kaydı cache'i düşürür."""
+        url = '/api/v1/courses/'
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.title = 'Yeni Kurs'
+            self.course.save()
+
+        self.assertEqual(self.client.get(url).json()[0]['title'], 'Yeni Kurs')
+
+    def test_curriculum_invalidated_on_content_change(self):
+        """İçerik değişince müfredat yeniden hesaplanır."""
+        url = f'/api/v1/courses/{self.course.slug}/'
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.content.title = 'Yeni Video'
+            self.content.save()
+
+        modules = self.client.get(url).json()['curriculum']['modules']
+        self.assertEqual(modules[0]['contents'][0]['title'], 'Yeni Video')
+
+    def test_catalog_invalidated_on_instructor_change(self):
+        """Eğitmen ekleme / çıkarma (iki yönden de) katalog cache'ini düşürür."""
+        url = '/api/v1/courses/'
+
+        def instructor_count():
+            return len(self.client.get(url).json()[0]['instructors'])
+
+        self.assertEqual(instructor_count(), 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.instructors.add(self.instructor)
+        self.assertEqual(instructor_count(), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.instructor.teaching_courses.clear()
+        self.assertEqual(instructor_count(), 0)
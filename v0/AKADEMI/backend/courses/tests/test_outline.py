@@ -0,0 +1,98 @@
+"""
+Course Outline Tests
+====================
+
+CourseOutline cache'i ve sinyal invalidation testleri.
+"""
+
+from django.core.cache import cache
+from django.http import Http404
+from django.test import TestCase
+
+from backend.courses.outline import CourseOutline
+from backend.libs.cache.tiered import tiered_cache
+
+
+class CourseOutlineTest(TestCase):
+    """CourseOutline testleri."""
+
+    @classmethod
+    def setUpTestData(cls):
+        from backend.courses.models import Course, CourseContent, CourseModule
+        from backend.tenants.models import Tenant
+
+        cls.tenant = Tenant.objects.create(name='Test Akademi', slug='test-akademi')
+        cls.other_tenant = Tenant.objects.create(name='Diğer Akademi', slug='diger-akademi')
+        cls.course, cls.other_course = [
+            Course.objects.create(
+                title=f'Course {index}',
+                slug=f'course-{index}',
+                description='Test course description',
+                category='Technology',
+                tenant=cls.tenant,
+            )
+            for index in range(2)
+        ]
+        cls.module = CourseModule.objects.create(course=cls.course, title='Module')
+        cls.content = CourseContent.objects.create(
+            module=cls.module,
+            title='Video',
+            type=CourseContent.ContentType.VIDEO,
+        )
+
+    def setUp(self):
+        cache.clear()
+        tiered_cache(CourseOutline.FAMILY).clear_local()
+
+    def _resolve(self, course=None, tenant=None):
+        return CourseOutline.get_course_and_content(
+            (tenant or self.tenant).id, (course or self.course).id, self.content.id,
+        )
+
+    def test_cached_without_queries(self):
+        """İkinci çözümleme sorgu çalıştırmaz; içerik modülüyle gelir."""
+        self._resolve()
+
+        with self.assertNumQueries(0):
+            course, content = self._resolve()
+            module = content.module
+
+        self.assertEqual((course.pk, content.pk, module.pk), (self.course.pk, self.content.pk, self.module.pk))
+
+    def test_tenant_and_course_checked(self):
+        """Başka tenant'ın kursu veya kursta olmayan içerik 404 döner."""
+        with self.assertRaises(Http404):
+            self._resolve(tenant=self.other_tenant)
+        with self.assertRaises(Http404):
+            self._resolve(course=self.other_course)
+
+    def test_content_save_invalidates(self):
+        self._resolve()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.content.title = 'Yeni Video'
+            self.content.save()
+
+        self.assertEqual(self._resolve()[1].title, 'Yeni Video')
+
+    def test_module_move_invalidates_contents(self):
+        """Modül başka kursa taşınınca içerik eski kurs altında çözülmez."""
+        self._resolve()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.module.course = self.other_course
+            self.module.save()
+
+        with self.assertRaises(Http404):
+            self._resolve()
+        self.assertEqual(self._resolve(course=self.other_course)[1].pk, self.content.pk)
+
+    def test_course_tenant_change_invalidates(self):
+        self._resolve()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.tenant = self.other_tenant
+            self.course.save()
+
+        with self.assertRaises(Http404):
+            self._resolve()
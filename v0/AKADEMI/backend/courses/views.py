@@ -13,6 +13,7 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from backend.libs.cache.decorators import cache_per_tenant
 from backend.users.permissions import (
     IsAdminOrSuperAdmin,
     IsInstructorOrAdmin,
@@ -127,6 +128,16 @@ class CourseViewSet(viewsets.ModelViewSet):
             return CourseUpdateSerializer
         return CourseSerializer
 
+    @cache_per_tenant(timeout=60, key_prefix='courses')
+    def list(self, request, *args, **kwargs):
+        """Kurs kataloğu (cache: Course / eğitmen / modül / içerik değişince düşer)."""
+        return super().list(request, *args, **kwargs)
+
+    @cache_per_tenant(timeout=300, key_prefix='courses')
+    def retrieve(self, request, *args, **kwargs):
+        """Kurs detayı ve müfredat (cache: Course / eğitmen / modül / içerik değişince düşer)."""
+        return super().retrieve(request, *args, **kwargs)
+
     def perform_create(self, serializer):
         """Kurs oluştururken tenant ve eğitmen ata."""
         course = serializer.save(tenant=self.request.user.tenant)
@@ -6,3 +6,10 @@ class InstructorConfig(AppConfig):
     name = 'backend.instructor'
     verbose_name = 'Instructor API'
 
+
+    def ready(self):
+        # Signal'leri import et
+        try:
+            from . import signals  # noqa: F401
+        except ImportError:
+            pass
@@ -32,6 +32,7 @@ class ActivityItemSerializer(serializers.Serializer):
     type = serializers.ChoiceField(choices=['submission', 'question', 'attendance', 'grade'])
     message = serializers.CharField()
     time = serializers.CharField()
+    timestamp = serializers.DateTimeField(required=False)
     studentName = serializers.CharField(required=False)
 
 
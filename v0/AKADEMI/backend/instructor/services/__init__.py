@@ -0,0 +1,12 @@
+"""
+Instructor Services
+===================
+
+Eğitmen paneli iş mantığı servisleri.
+"""
+
+from .calendar_service import CalendarService
+from .content_issue_service import ContentIssueService
+from .dashboard_service import InstructorDashboardService
+
+__all__ = ['CalendarService', 'ContentIssueService', 'InstructorDashboardService']
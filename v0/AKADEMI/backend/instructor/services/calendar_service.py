@@ -0,0 +1,346 @@
+"""
+Calendar Service
+================
+
+Eğitmen takvimi için tarih aralığı sorgu motoru.
+
+Canlı dersler ve ödev teslim tarihleri tek UNION ALL sorgusu ile
+(indeks dostu yarı açık aralık: start <= t < end) çekilir ve kompakt
+olay tuple'ları olarak döner:
+
+    (tür, id, başlık, başlangıç, süre_dk, sınıf adı, durum)
+
+Sonuçlar kullanıcı + ay kovası bazında cache'lenir; ay/hafta gezinmesi
+örtüşen aralıklar için veritabanına tekrar gitmez. Eksik aylar tek
+sorguda birlikte çekilir. LiveSession / Assignment kaydedildiğinde, sınıf
+adı veya sınıf eğitmenleri değiştiğinde yalnızca etkilenen kullanıcı-ay
+kovaları silinir (bkz: backend.instructor.signals).
+"""
+
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db.models import CharField, F, IntegerField, Value
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from backend.libs.cache.decorators import make_cache_key
+from backend.libs.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+
+class CalendarService:
+    """
+    Eğitmen takvim servisi.
+    """
+
+    CACHE_PREFIX = 'instructor_calendar'
+    CACHE_TIMEOUT = 3600  # 1 saat
+
+    # Tek istekte izin verilen en geniş aralık (ay)
+    MAX_MONTHS = 24
+
+    # Varsayılan aralık
+    DEFAULT_PAST_DAYS = 30
+    DEFAULT_FUTURE_DAYS = 60
+
+    LIVE = 'live'
+    ASSIGNMENT = 'assignment'
+
+    COLORS = {
+        LIVE: '#6366f1',  # Indigo
+        ASSIGNMENT: '#f59e0b',  # Amber
+    }
+
+    # =========================================================================
+    # ARALIK
+    # =========================================================================
+
+    @classmethod
+    def parse_range(cls, start: Optional[str], end: Optional[str]) -> Tuple[datetime, datetime]:
+        """
+        Query param'larından [start, end) aralığı.
+
+        Sadece tarih verilen bitiş günü aralığa dahildir.
+
+        Raises:
+            ValueError: Geçersiz tarih veya çok geniş aralık
+        """
+        now = timezone.now()
+        start_at = cls._parse_bound(start) if start else now - timedelta(days=cls.DEFAULT_PAST_DAYS)
+        end_at = cls._parse_bound(end, inclusive_day=True) if end else now + timedelta(days=cls.DEFAULT_FUTURE_DAYS)
+
+        if end_at <= start_at:
+            raise ValueError('Invalid date range')
+        if len(cls.months_between(start_at, end_at)) > cls.MAX_MONTHS:
+            raise ValueError('Date range too wide')
+        return start_at, end_at
+
+    @staticmethod
+    def _parse_bound(value: str, inclusive_day: bool = False) -> datetime:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            day = parse_date(value)
+            if day is None:
+                raise ValueError(f'Invalid date: {value}')
+            if inclusive_day:
+                day += timedelta(days=1)
+            parsed = datetime.combine(day, time.min)
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    @staticmethod
+    def month_of(moment: datetime) -> date:
+        """Anın (yerel saat) ay başı."""
+        return timezone.localtime(moment).date().replace(day=1)
+
+    @staticmethod
+    def _next_month(month: date) -> date:
+        return (month + timedelta(days=32)).replace(day=1)
+
+    @classmethod
+    def months_between(cls, start: datetime, end: datetime) -> List[date]:
+        """[start, end) aralığının kapsadığı aylar."""
+        months = []
+        month = cls.month_of(start)
+        last = cls.month_of(end - timedelta(microseconds=1))
+        while month <= last:
+            months.append(month)
+            month = cls._next_month(month)
+        return months
+
+    @staticmethod
+    def _month_start(month: date) -> datetime:
+        return timezone.make_aware(datetime.combine(month, time.min))
+
+    # =========================================================================
+    # CACHE
+    # =========================================================================
+
+    @classmethod
+    def cache_key(cls, user_id, month: date, base: Optional[str] = None) -> str:
+        base = base or make_cache_key(cls.CACHE_PREFIX, user_id=user_id)
+        return f"{base}:{month:%Y-%m}"
+
+    @classmethod
+    def events(cls, user, start: datetime, end: datetime) -> List[tuple]:
+        """
+        Aralıktaki kompakt olaylar (başlangıca göre sıralı).
+
+        Cache'te olmayan aylar tek UNION sorgusu ile çekilip kovalanır.
+        """
+        months = cls.months_between(start, end)
+        base = make_cache_key(cls.CACHE_PREFIX, user_id=user.id)
+        keys = {month: cls.cache_key(user.id, month, base) for month in months}
+
+        cached = cache.get_many(list(keys.values()))
+        buckets = {month: cached[key] for month, key in keys.items() if key in cached}
+
+        missing = [month for month in months if month not in buckets]
+        record_cache(hits=len(buckets), misses=len(missing))
+        if missing:
+            fetched = {month: [] for month in missing}
+            rows = cls.fetch(user, cls._month_start(missing[0]), cls._month_start(cls._next_month(missing[-1])))
+            for event in rows:
+                bucket = fetched.get(cls.month_of(event[3]))
+                if bucket is not None:
+                    bucket.append(event)
+
+            cache.set_many({keys[month]: fetched[month] for month in missing}, cls.CACHE_TIMEOUT)
+            buckets.update(fetched)
+
+        events = [
+            event
+            for month in months
+            for event in buckets[month]
+            if start <= event[3] < end
+        ]
+        events.sort(key=lambda event: (event[3], event[0], event[1]))
+        return events
+
+    @classmethod
+    def invalidate(cls, user_ids: Iterable, moments: Iterable[Optional[datetime]]) -> int:
+        """
+        Kullanıcıların verilen anları içeren ay kovalarını sil.
+
+        Returns:
+            Silinen key sayısı
+        """
+        months = set()
+        for moment in moments:
+            if isinstance(moment, str):
+                # Kaydetmeden önce ham string atanmış olabilir
+                moment = parse_datetime(moment)
+            if moment:
+                if timezone.is_naive(moment):
+                    moment = timezone.make_aware(moment)
+                months.add(cls.month_of(moment))
+
+        keys = []
+        for user_id in set(user_ids):
+            if user_id and months:
+                base = make_cache_key(cls.CACHE_PREFIX, user_id=user_id)
+                keys.extend(cls.cache_key(user_id, month, base) for month in months)
+        if keys:
+            cache.delete_many(keys)
+        return len(keys)
+
+    @classmethod
+    def invalidate_for_class(cls, class_group_id, moments: Iterable[Optional[datetime]]) -> int:
+        """Sınıfın eğitmenlerinin ay kovalarını sil."""
+        from backend.student.models import ClassGroup
+
+        if not class_group_id:
+            return 0
+        instructor_ids = ClassGroup.instructors.through.objects.filter(
+            classgroup_id=class_group_id
+        ).values_list('user_id', flat=True)
+        return cls.invalidate(instructor_ids, moments)
+
+    @classmethod
+    def invalidate_class_events(
+        cls,
+        class_group_id,
+        instructor_ids: Optional[Iterable] = None,
+        live: bool = True,
+    ) -> int:
+        """
+        Sınıfın olaylarını içeren ay kovalarını sil.
+
+        Olaylar sınıf adını taşır ve ödevler eğitmenin sınıflarından gelir;
+        sınıf adı veya eğitmen listesi değiştiğinde kullanılır. Silinecek
+        aylar sınıfın olaylarından ay bazında gruplanarak bulunur.
+
+        Args:
+            class_group_id: Sınıf ID
+            instructor_ids: Ödev kovaları silinecek eğitmenler (None: sınıfın eğitmenleri)
+            live: Sınıfın canlı derslerinin (sahiplerinin) kovaları da silinsin mi
+
+        Returns:
+            Silinen key sayısı
+        """
+        from django.db.models.functions import TruncMonth
+
+        from backend.student.models import Assignment, ClassGroup, LiveSession
+
+        if not class_group_id:
+            return 0
+        if instructor_ids is None:
+            instructor_ids = ClassGroup.instructors.through.objects.filter(
+                classgroup_id=class_group_id
+            ).values_list('user_id', flat=True)
+        instructor_ids = [pk for pk in set(instructor_ids) if pk]
+
+        # kullanıcı -> aylar
+        months = {}
+        if instructor_ids:
+            assignment_months = Assignment.objects.filter(
+                class_group_id=class_group_id
+            ).order_by().annotate(month=TruncMonth('due_date')).values_list('month', flat=True).distinct()
+            assignment_months = {cls.month_of(month) for month in assignment_months if month}
+            for user_id in instructor_ids:
+                months.setdefault(user_id, set()).update(assignment_months)
+
+        if live:
+            live_months = LiveSession.objects.filter(
+                class_group_id=class_group_id
+            ).order_by().annotate(month=TruncMonth('scheduled_at')).values_list(
+                'instructor_id', 'month'
+            ).distinct()
+            for user_id, month in live_months:
+                if user_id and month:
+                    months.setdefault(user_id, set()).add(cls.month_of(month))
+
+        keys = []
+        for user_id, user_months in months.items():
+            base = make_cache_key(cls.CACHE_PREFIX, user_id=user_id)
+            keys.extend(cls.cache_key(user_id, month, base) for month in user_months)
+        if keys:
+            cache.delete_many(keys)
+        return len(keys)
+
+    # =========================================================================
+    # SORGU
+    # =========================================================================
+
+    @classmethod
+    def fetch(cls, user, start: datetime, end: datetime) -> List[tuple]:
+        """[start, end) aralığındaki olaylar - tek UNION ALL sorgusu."""
+        from backend.student.models import Assignment, ClassGroup, LiveSession
+
+        live_sessions = cls._shape(
+            LiveSession.objects.filter(
+                instructor=user,
+                scheduled_at__gte=start,
+                scheduled_at__lt=end,
+            ),
+            kind=cls.LIVE,
+            start='scheduled_at',
+            duration=F('duration_minutes'),
+        )
+
+        assignments = cls._shape(
+            Assignment.objects.filter(
+                class_group_id__in=ClassGroup.objects.filter(instructors=user).values('id'),
+                due_date__gte=start,
+                due_date__lt=end,
+                status=Assignment.Status.PUBLISHED,
+            ),
+            kind=cls.ASSIGNMENT,
+            start='due_date',
+            duration=Value(0, output_field=IntegerField()),
+        )
+
+        return list(live_sessions.union(assignments, all=True))
+
+    @staticmethod
+    def _shape(queryset, kind: str, start: str, duration):
+        """Kaynağı ortak (tür, id, başlık, başlangıç, süre, sınıf, durum) kolonlarına indir."""
+        return queryset.order_by().annotate(
+            event_kind=Value(kind, output_field=CharField()),
+            event_id=F('id'),
+            event_title=F('title'),
+            event_start=F(start),
+            event_duration=duration,
+            event_class=F('class_group__name'),
+            event_status=F('status'),
+        ).values_list(
+            'event_kind', 'event_id', 'event_title', 'event_start',
+            'event_duration', 'event_class', 'event_status',
+        )
+
+    # =========================================================================
+    # SERİLEŞTİRME
+    # =========================================================================
+
+    @classmethod
+    def serialize(cls, events: Iterable[tuple]) -> List[Dict]:
+        """Kompakt olayları frontend formatına çevir."""
+        result = []
+        for kind, pk, title, start, duration, class_name, event_status in events:
+            if kind == cls.LIVE:
+                result.append({
+                    'id': f'live-{pk}',
+                    'title': title,
+                    'type': kind,
+                    'start': start.isoformat(),
+                    'end': (start + timedelta(minutes=duration)).isoformat(),
+                    'className': class_name,
+                    'color': cls.COLORS[kind],
+                    'status': event_status,
+                })
+            else:
+                result.append({
+                    'id': f'assignment-{pk}',
+                    'title': f'{title} Teslim',
+                    'type': kind,
+                    'start': start.isoformat(),
+                    'end': start.isoformat(),
+                    'className': class_name,
+                    'color': cls.COLORS[kind],
+                })
+        return result
@@ -0,0 +1,117 @@
+"""
+Content Issue Service
+=====================
+
+Eğitmenin içeriklerindeki terk (drop-off) sorunlarını tespit eder.
+
+Tüm içerikler için başlayan / tamamlayan sayıları tek GROUP BY sorgusu
+ile hesaplanır; eşik filtresi ve sıralama SQL'de yapılır. Sonuç
+eğitmen bazında cache'lenir ve bir içerik tamamlandığında o içeriğin
+eğitmenlerinin cache'i silinir.
+"""
+
+import logging
+from typing import Iterable, List
+
+from django.core.cache import cache
+from django.db.models import Count, ExpressionWrapper, F, FloatField, Q
+
+from backend.libs.cache.decorators import make_cache_key
+
+logger = logging.getLogger(__name__)
+
+
+class ContentIssueService:
+    """
+    İçerik terk analizi servisi.
+    """
+
+    CACHE_PREFIX = 'instructor_content_issues'
+    CACHE_TIMEOUT = 600  # 10 dakika
+
+    # En az bu kadar öğrenci başlamış olmalı
+    MIN_STARTED = 5
+    # Bu oranın altı sorun sayılır
+    ISSUE_THRESHOLD = 50
+    # Bu oranın altı "yüksek terk"
+    HIGH_DROPOFF_THRESHOLD = 30
+
+    DEFAULT_LIMIT = 10
+
+    @classmethod
+    def cache_key(cls, instructor_id) -> str:
+        return make_cache_key(cls.CACHE_PREFIX, user_id=instructor_id)
+
+    @classmethod
+    def get_issues(cls, instructor, limit: int = DEFAULT_LIMIT) -> List[dict]:
+        """Eğitmenin en sorunlu içerikleri (cache'li)."""
+        key = cls.cache_key(instructor.id)
+        issues = cache.get(key)
+        if issues is None:
+            issues = cls.compute(instructor, limit=cls.DEFAULT_LIMIT)
+            cache.set(key, issues, cls.CACHE_TIMEOUT)
+        return issues[:limit]
+
+    @classmethod
+    def compute(cls, instructor, limit: int = DEFAULT_LIMIT) -> List[dict]:
+        """
+        Sorunlu içerikleri tek sorguda hesapla.
+
+        Returns:
+            Tamamlama oranına göre artan sırada sorun listesi
+        """
+        from backend.courses.models import ContentProgress
+
+        rows = ContentProgress.objects.filter(
+            content__module__course__instructors=instructor
+        ).order_by().values(
+            'content_id', 'content__title'
+        ).annotate(
+            started=Count('id'),
+            completed=Count('id', filter=Q(is_completed=True)),
+        ).filter(
+            started__gt=cls.MIN_STARTED
+        ).annotate(
+            completion_rate=ExpressionWrapper(
+                F('completed') * 100.0 / F('started'),
+                output_field=FloatField(),
+            )
+        ).filter(
+            completion_rate__lt=cls.ISSUE_THRESHOLD
+        ).order_by('completion_rate', '-started')[:limit]
+
+        return [
+            {
+                'id': str(row['content_id']),
+                'content': row['content__title'],
+                'issue': (
+                    'Yüksek terk oranı'
+                    if row['completion_rate'] < cls.HIGH_DROPOFF_THRESHOLD
+                    else 'Düşük tamamlama'
+                ),
+                'studentCount': row['started'] - row['completed'],
+                'completionRate': round(row['completion_rate']),
+            }
+            for row in rows
+        ]
+
+    @classmethod
+    def invalidate_for_contents(cls, content_ids: Iterable) -> int:
+        """
+        İçeriklerin kursundaki tüm eğitmenlerin cache'ini sil.
+
+        Returns:
+            Silinen key sayısı
+        """
+        from backend.courses.models import Course
+
+        instructor_ids = set(
+            Course.instructors.through.objects.filter(
+                course__modules__contents__in=list(content_ids)
+            ).values_list('user_id', flat=True)
+        )
+        if not instructor_ids:
+            return 0
+
+        cache.delete_many([cls.cache_key(pk) for pk in instructor_ids])
+        return len(instructor_ids)
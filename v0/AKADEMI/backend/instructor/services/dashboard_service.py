@@ -0,0 +1,371 @@
+"""
+Instructor Dashboard Service
+============================
+
+Eğitmen dashboard verisinin hesaplanması ve cache'lenmesi.
+
+Veri eğitmen bazında tek key altında tutulur (stale-while-revalidate):
+    - Taze süre içinde cache'ten döner.
+    - Taze süre dolduktan sonra eski veri hemen döner, yeniden hesaplama
+      arka planda (Celery, yoksa thread) tek seferlik kilitle yapılır.
+    - Gün değiştiyse (bugünün programı) senkron yeniden hesaplanır.
+
+Son aktivitelerin göreli zamanı ("5 dk önce") cache'lenmez; zaman damgası
+saklanır ve etiket her yanıtta yeniden hesaplanır.
+
+Sınıf kaydı, ödev, teslim ve canlı ders değişikliklerinde yalnızca
+etkilenen eğitmenlerin key'leri silinir (bkz: backend.instructor.signals).
+"""
+
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Iterable, Optional
+
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.db.models import Avg, Count, Q, Sum
+from django.utils import timezone
+
+from backend.libs.cache.decorators import make_cache_key
+from backend.libs.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+
+class InstructorDashboardService:
+    """
+    Eğitmen dashboard servisi.
+    """
+
+    CACHE_PREFIX = 'instructor_dashboard'
+
+    # Bu süre içinde veri taze sayılır
+    FRESH_SECONDS = 60
+    # Taze süre sonrası eski verinin sunulabileceği ek süre
+    STALE_SECONDS = 600
+    # Arka plan yenileme kilidi
+    REVALIDATE_LOCK_TIMEOUT = 30
+
+    @classmethod
+    def cache_key(cls, instructor_id) -> str:
+        return make_cache_key(cls.CACHE_PREFIX, user_id=instructor_id)
+
+    @classmethod
+    def lock_key(cls, instructor_id) -> str:
+        return f"{cls.cache_key(instructor_id)}:revalidate"
+
+    # =========================================================================
+    # CACHE
+    # =========================================================================
+
+    @classmethod
+    def get_dashboard(cls, instructor) -> dict:
+        """Dashboard verisi (stale-while-revalidate)."""
+        entry = cache.get(cls.cache_key(instructor.id))
+
+        if entry is not None and entry['day'] == cls._today():
+            record_cache(hits=1)
+            data = entry['data']
+            if entry['fresh_until'] <= time.time():
+                data = cls._revalidate(instructor) or data
+        else:
+            record_cache(misses=1)
+            data = cls.refresh(instructor)
+
+        return cls._with_relative_times(data, timezone.now())
+
+    @classmethod
+    def _with_relative_times(cls, data: dict, now) -> dict:
+        """Son aktivitelere zaman damgasından göreli zaman etiketi ekle."""
+        return {
+            **data,
+            'recentActivities': [
+                {**activity, 'time': cls._relative_time(now - activity['timestamp'])}
+                for activity in data['recentActivities']
+            ],
+        }
+
+    @staticmethod
+    def _relative_time(diff: timedelta) -> str:
+        if diff.days > 0:
+            return f'{diff.days} gün önce'
+        if diff.seconds > 3600:
+            return f'{diff.seconds // 3600} saat önce'
+        return f'{diff.seconds // 60} dk önce'
+
+    @classmethod
+    def refresh(cls, instructor) -> dict:
+        """Veriyi hesapla ve cache'e yaz."""
+        data = cls.compute(instructor)
+        cache.set(
+            cls.cache_key(instructor.id),
+            {
+                'data': data,
+                'day': cls._today(),
+                'fresh_until': time.time() + cls.FRESH_SECONDS,
+            },
+            cls.FRESH_SECONDS + cls.STALE_SECONDS,
+        )
+        return data
+
+    @classmethod
+    def revalidate(cls, instructor_id) -> None:
+        """
+        Arka plan yenilemesi.
+
+        Yenileme sırasında key invalidation ile silindiyse yazılmaz;
+        sonraki istek güncel veriyi hesaplar.
+        """
+        from backend.users.models import User
+
+        try:
+            if cache.get(cls.cache_key(instructor_id)) is None:
+                return
+            instructor = User.objects.filter(pk=instructor_id).first()
+            if instructor is not None:
+                cls.refresh(instructor)
+        finally:
+            cache.delete(cls.lock_key(instructor_id))
+
+    @classmethod
+    def _revalidate(cls, instructor) -> Optional[dict]:
+        """
+        Yenilemeyi (eğitmen başına tek seferlik) arka plana at.
+
+        Kuyruğa yazılamazsa (broker erişilemiyor) kilit bırakılır ve veri
+        istek içinde yenilenir.
+
+        Returns:
+            İstek içinde yenilendiyse güncel veri, aksi halde None
+        """
+        instructor_id = instructor.id
+        if not cache.add(cls.lock_key(instructor_id), 1, cls.REVALIDATE_LOCK_TIMEOUT):
+            return None
+
+        try:
+            from backend.instructor.tasks import refresh_instructor_dashboard
+        except ImportError:
+            # Celery yüklü değilse thread ile
+            threading.Thread(
+                target=cls._revalidate_in_thread,
+                args=(instructor_id,),
+                daemon=True,
+            ).start()
+            return None
+
+        try:
+            refresh_instructor_dashboard.delay(instructor_id)
+        except Exception as e:
+            logger.warning(f"Instructor dashboard revalidation could not be queued: {e}")
+            try:
+                return cls.refresh(instructor)
+            finally:
+                cache.delete(cls.lock_key(instructor_id))
+        return None
+
+    @classmethod
+    def _revalidate_in_thread(cls, instructor_id) -> None:
+        close_old_connections()
+        try:
+            cls.revalidate(instructor_id)
+        except Exception as e:
+            logger.warning(f"Instructor dashboard revalidation failed: {e}")
+        finally:
+            close_old_connections()
+
+    @classmethod
+    def invalidate(cls, instructor_ids: Iterable) -> int:
+        """
+        Eğitmenlerin dashboard key'lerini sil.
+
+        Returns:
+            Silinen key sayısı
+        """
+        keys = [cls.cache_key(pk) for pk in set(instructor_ids) if pk]
+        if keys:
+            cache.delete_many(keys)
+        return len(keys)
+
+    @classmethod
+    def invalidate_for_classes(cls, class_group_ids: Iterable) -> int:
+        """Sınıfların eğitmenlerinin dashboard key'lerini sil."""
+        from backend.student.models import ClassGroup
+
+        class_group_ids = [pk for pk in set(class_group_ids) if pk]
+        if not class_group_ids:
+            return 0
+
+        instructor_ids = ClassGroup.instructors.through.objects.filter(
+            classgroup_id__in=class_group_ids
+        ).values_list('user_id', flat=True)
+        return cls.invalidate(instructor_ids)
+
+    @staticmethod
+    def _today() -> str:
+        return timezone.localdate().isoformat()
+
+    # =========================================================================
+    # HESAPLAMA
+    # =========================================================================
+
+    @classmethod
+    def compute(cls, user) -> dict:
+        """Dashboard verisini hesapla."""
+        from backend.courses.models import Enrollment
+        from backend.live.models import LiveSession as CourseLiveSession
+        from backend.student.models import (
+            Assignment, AssignmentSubmission, ClassEnrollment, ClassGroup,
+            LiveSession, StudentCourseStats,
+        )
+        from backend.student.stats import avg_score_expression
+
+        now = timezone.now()
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        today_end = today_start + timedelta(days=1)
+
+        # Eğitmenin sınıfları - ID'leri al (subquery optimizasyonu için)
+        my_classes_ids = ClassGroup.objects.filter(
+            instructors=user,
+            status=ClassGroup.Status.ACTIVE
+        ).values_list('id', flat=True)
+        active_classes = my_classes_ids.count()
+
+        # Toplam öğrenci sayısı (benzersiz) - optimize edilmiş
+        total_students = ClassEnrollment.objects.filter(
+            class_group_id__in=my_classes_ids,
+            status=ClassEnrollment.Status.ACTIVE
+        ).values('user').distinct().count()
+
+        # Bugünkü canlı dersler - sınıfın aktif öğrenci sayısı ile
+        todays_live_sessions = LiveSession.objects.filter(
+            instructor=user,
+            scheduled_at__gte=today_start,
+            scheduled_at__lt=today_end
+        ).select_related(
+            'class_group',
+        ).annotate(
+            class_student_count=Count(
+                'class_group__class_enrollments',
+                filter=Q(class_group__class_enrollments__status=ClassEnrollment.Status.ACTIVE),
+            )
+        ).order_by('scheduled_at')
+
+        # Bekleyen ödevler (değerlendirilmemiş) - optimize edilmiş
+        pending_submissions = AssignmentSubmission.objects.filter(
+            assignment__class_group_id__in=my_classes_ids,
+            status=AssignmentSubmission.Status.SUBMITTED
+        ).count()
+
+        # Bugünün programı
+        today_schedule = []
+
+        # Canlı dersler
+        for session in todays_live_sessions[:5]:
+            today_schedule.append({
+                'id': str(session.id),
+                'title': session.title,
+                'type': 'live',
+                'time': session.scheduled_at.strftime('%H:%M'),
+                'className': session.class_group.name,
+                'studentCount': session.class_student_count,
+            })
+
+        # Bugün teslim tarihi olan ödevler - select_related ile
+        todays_assignments = Assignment.objects.filter(
+            class_group_id__in=my_classes_ids,
+            due_date__gte=today_start,
+            due_date__lt=today_end,
+            status=Assignment.Status.PUBLISHED
+        ).select_related('class_group')
+
+        for assignment in todays_assignments[:3]:
+            today_schedule.append({
+                'id': str(assignment.id),
+                'title': f'{assignment.title} Son Teslim',
+                'type': 'assignment',
+                'time': assignment.due_date.strftime('%H:%M'),
+                'className': assignment.class_group.name,
+            })
+
+        # Son aktiviteler
+        recent_activities = []
+
+        # Son ödev teslimleri
+        recent_submissions = AssignmentSubmission.objects.filter(
+            assignment__class_group_id__in=my_classes_ids,
+            submitted_at__isnull=False
+        ).select_related(
+            'student',
+        ).order_by('-submitted_at')[:5]
+
+        # Göreli zaman ("5 dk önce") yanıt anında eklenir (bkz: get_dashboard)
+        for submission in recent_submissions:
+            recent_activities.append({
+                'id': str(submission.id),
+                'type': 'submission',
+                'message': f'{submission.student.first_name} {submission.student.last_name[0]}. ödev gönderdi',
+                'timestamp': submission.submitted_at,
+                'studentName': f'{submission.student.first_name} {submission.student.last_name[0]}.',
+            })
+
+        # İstatistikler (öğrenci-kurs özet tablosundan)
+        # Tamamlama oranı (tüm kayıtlı öğrencilerin ortalama ilerleme yüzdesi)
+        avg_completion = StudentCourseStats.objects.filter(
+            course__instructors=user,
+            enrollment_status=Enrollment.Status.ACTIVE
+        ).aggregate(avg=Avg('progress_percent'))['avg'] or 0
+
+        # Ortalama skor ve toplam katılım
+        class_stats = StudentCourseStats.objects.filter(
+            class_group_id__in=my_classes_ids
+        ).aggregate(avg=avg_score_expression(), attended=Sum('attended_sessions'))
+        avg_score = class_stats['avg'] or 0
+
+        # Devam oranı: biten canlı derslerde eşiği geçen katılım / (ders x öğrenci),
+        # tüm sınıflar üzerinden (bkz: BehaviorAnalysisViewSet.classes)
+        class_sizes = ClassGroup.objects.filter(
+            id__in=my_classes_ids
+        ).annotate(
+            student_count=Count(
+                'class_enrollments',
+                filter=Q(class_enrollments__status=ClassEnrollment.Status.ACTIVE),
+            )
+        ).values_list('course_id', 'student_count')
+        ended_sessions = dict(
+            CourseLiveSession.objects.filter(
+                course_id__in=ClassGroup.objects.filter(id__in=my_classes_ids).values('course_id'),
+                status=CourseLiveSession.Status.ENDED,
+            ).order_by().values('course_id').annotate(
+                n=Count('id')
+            ).values_list('course_id', 'n')
+        )
+        expected = sum(
+            ended_sessions.get(course_id, 0) * student_count
+            for course_id, student_count in class_sizes
+        )
+        attendance_rate = ((class_stats['attended'] or 0) / expected * 100) if expected else 0
+
+        upcoming_lessons = sum(
+            1 for session in todays_live_sessions
+            if session.status == LiveSession.Status.SCHEDULED
+        )
+
+        logger.info(f"[INSTRUCTOR] Dashboard computed for {user.email}: {total_students} students, {active_classes} classes")
+
+        return {
+            'summary': {
+                'totalStudents': total_students,
+                'activeClasses': active_classes,
+                'upcomingLessons': upcoming_lessons,
+                'pendingAssessments': pending_submissions,
+            },
+            'todaySchedule': today_schedule,
+            'recentActivities': recent_activities[:10],
+            'quickStats': {
+                'completionRate': round(avg_completion),
+                'avgScore': round(avg_score),
+                'attendanceRate': round(min(attendance_rate, 100)),
+            },
+        }
@@ -0,0 +1,182 @@
+"""
+Instructor Signals
+==================
+
+Eğitmen paneli cache'lerinin invalidation'ı.
+"""
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from backend.courses.models import ContentProgress
+from backend.student.models import Assignment, AssignmentSubmission, ClassEnrollment, ClassGroup, LiveSession
+
+from .services import CalendarService, ContentIssueService, InstructorDashboardService
+
+
+@receiver(post_init, sender=ContentProgress)
+def remember_completion(sender, instance, **kwargs):
+    """Yüklenen tamamlanma durumunu sakla."""
+    instance._was_completed = instance.__dict__.get('is_completed')
+
+
+@receiver(post_save, sender=ContentProgress)
+def invalidate_content_issues(sender, instance, created, raw=False, **kwargs):
+    """İçerik tamamlandığında eğitmenlerin terk analizi cache'ini sil."""
+    if raw:
+        return
+
+    completed = instance.__dict__.get('is_completed')
+    if completed and (created or not instance._was_completed):
+        content_id = instance.content_id
+        transaction.on_commit(
+            lambda: ContentIssueService.invalidate_for_contents([content_id])
+        )
+
+    instance._was_completed = completed
+
+
+# =============================================================================
+# DASHBOARD
+# =============================================================================
+# Yalnızca etkilenen eğitmenlerin dashboard key'leri silinir (pattern yok).
+
+def _invalidate_dashboards_for_class(class_group_id):
+    transaction.on_commit(
+        lambda: InstructorDashboardService.invalidate_for_classes([class_group_id])
+    )
+
+
+@receiver([post_save, post_delete], sender=ClassEnrollment)
+def invalidate_dashboard_on_class_enrollment(sender, instance, raw=False, **kwargs):
+    """Sınıf kaydı değişti: öğrenci sayıları."""
+    if not raw:
+        _invalidate_dashboards_for_class(instance.class_group_id)
+
+
+@receiver([post_save, post_delete], sender=Assignment)
+def invalidate_dashboard_on_assignment(sender, instance, raw=False, **kwargs):
+    """Ödev değişti: bugünün programı."""
+    if not raw:
+        _invalidate_dashboards_for_class(instance.class_group_id)
+
+
+@receiver([post_save, post_delete], sender=AssignmentSubmission)
+def invalidate_dashboard_on_submission(sender, instance, raw=False, **kwargs):
+    """Teslim değişti: bekleyen değerlendirmeler, son aktiviteler."""
+    if raw:
+        return
+    assignment = instance._state.fields_cache.get('assignment')
+    if assignment is not None:
+        class_group_id = assignment.class_group_id
+    else:
+        class_group_id = Assignment.objects.filter(
+            pk=instance.assignment_id
+        ).values_list('class_group_id', flat=True).first()
+    _invalidate_dashboards_for_class(class_group_id)
+
+
+@receiver([post_save, post_delete], sender=LiveSession)
+def invalidate_dashboard_on_live_session(sender, instance, raw=False, **kwargs):
+    """Canlı ders değişti: bugünün programı."""
+    if raw:
+        return
+    instructor_id = instance.instructor_id
+    transaction.on_commit(lambda: InstructorDashboardService.invalidate([instructor_id]))
+
+
+# =============================================================================
+# TAKVİM
+# =============================================================================
+# Olayın eski ve yeni ayı için sahiplerin ay kovaları silinir.
+
+@receiver(post_init, sender=LiveSession)
+def remember_live_session_slot(sender, instance, **kwargs):
+    instance._calendar_slot = (
+        instance.__dict__.get('instructor_id'),
+        instance.__dict__.get('scheduled_at'),
+    )
+
+
+@receiver([post_save, post_delete], sender=LiveSession)
+def invalidate_calendar_on_live_session(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    old_instructor, old_start = getattr(instance, '_calendar_slot', (None, None))
+    instructor_ids = {old_instructor, instance.instructor_id}
+    moments = {old_start, instance.scheduled_at}
+    instance._calendar_slot = (instance.instructor_id, instance.scheduled_at)
+
+    transaction.on_commit(lambda: CalendarService.invalidate(instructor_ids, moments))
+
+
+@receiver(post_init, sender=Assignment)
+def remember_assignment_slot(sender, instance, **kwargs):
+    instance._calendar_slot = (
+        instance.__dict__.get('class_group_id'),
+        instance.__dict__.get('due_date'),
+    )
+
+
+@receiver([post_save, post_delete], sender=Assignment)
+def invalidate_calendar_on_assignment(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    old_class, old_due = getattr(instance, '_calendar_slot', (None, None))
+    class_group_id, due_date = instance.class_group_id, instance.due_date
+    instance._calendar_slot = (class_group_id, due_date)
+
+    def invalidate():
+        CalendarService.invalidate_for_class(class_group_id, {old_due, due_date})
+        if old_class and old_class != class_group_id:
+            CalendarService.invalidate_for_class(old_class, {old_due, due_date})
+
+    transaction.on_commit(invalidate)
+
+
+@receiver(post_init, sender=ClassGroup)
+def remember_class_name(sender, instance, **kwargs):
+    instance._calendar_name = instance.__dict__.get('name')
+
+
+@receiver(post_save, sender=ClassGroup)
+def invalidate_calendar_on_class_rename(sender, instance, created, raw=False, **kwargs):
+    """Sınıf adı değişti: olaylardaki sınıf adı."""
+    if raw:
+        return
+    renamed = not created and instance._calendar_name != instance.name
+    instance._calendar_name = instance.name
+    if renamed:
+        class_group_id = instance.pk
+        transaction.on_commit(lambda: CalendarService.invalidate_class_events(class_group_id))
+
+
+@receiver(m2m_changed, sender=ClassGroup.instructors.through)
+def invalidate_calendar_on_class_instructors(sender, instance, action, reverse, pk_set, **kwargs):
+    """Sınıf eğitmenleri değişti: eklenen / çıkarılan eğitmenlerin ödevleri."""
+    if action == 'pre_clear':
+        # post_clear'da pk_set yok; mevcut ilişkileri sakla
+        if reverse:
+            instance._calendar_cleared = list(instance.teaching_classes.values_list('pk', flat=True))
+        else:
+            instance._calendar_cleared = list(instance.instructors.values_list('pk', flat=True))
+        return
+    if action == 'post_clear':
+        pk_set = getattr(instance, '_calendar_cleared', None)
+    elif action not in ('post_add', 'post_remove'):
+        return
+    if not pk_set:
+        return
+
+    if reverse:
+        # user.teaching_classes.add(...): instance eğitmen, pk_set sınıflar
+        pairs = [(class_group_id, [instance.pk]) for class_group_id in pk_set]
+    else:
+        pairs = [(instance.pk, list(pk_set))]
+
+    def invalidate():
+        for class_group_id, instructor_ids in pairs:
+            CalendarService.invalidate_class_events(class_group_id, instructor_ids, live=False)
+
+    transaction.on_commit(invalidate)
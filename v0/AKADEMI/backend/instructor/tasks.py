@@ -0,0 +1,25 @@
+"""
+Instructor Celery Tasks
+=======================
+
+Eğitmen paneli arka plan görevleri.
+"""
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(queue='default')
+def refresh_instructor_dashboard(instructor_id):
+    """
+    Süresi dolan dashboard cache'ini arka planda yenile.
+    
+    Args:
+        instructor_id: Eğitmen kullanıcı ID
+    """
+    from .services import InstructorDashboardService
+    
+    InstructorDashboardService.revalidate(instructor_id)
@@ -0,0 +1 @@
+# Instructor tests
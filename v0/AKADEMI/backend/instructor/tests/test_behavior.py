@@ -0,0 +1,247 @@
+"""
+Behavior Analysis Tests
+=======================
+
+Eğitmen davranış analizi endpoint'lerinin testleri.
+
+Özet tablosu (StudentCourseStats) normalde commit sonrası sinyallerle
+güncellenir; test verisinde `StudentStatsService.rebuild()` ile doldurulur.
+"""
+
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from backend.student.stats import StudentStatsService
+
+
+class BehaviorStudentsTest(APITestCase):
+    """GET /api/v1/instructor/behavior/students/ testleri."""
+
+    URL = '/api/v1/instructor/behavior/students/'
+
+    HIGH_RISK = 10
+    LOW_RISK = 25
+
+    @classmethod
+    def setUpTestData(cls):
+        from backend.courses.models import Enrollment
+        from backend.student.models import ClassEnrollment
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        cls.tenant = Tenant.objects.create(name='Test Akademi', slug='test-akademi')
+        cls.instructor = User.objects.create_user(
+            email='instructor@test.com', password='testpass123', tenant=cls.tenant, role='INSTRUCTOR',
+        )
+        other_instructor = User.objects.create_user(
+            email='other@test.com', password='testpass123', tenant=cls.tenant, role='INSTRUCTOR',
+        )
+
+        cls.class_group = cls._create_class('mine', cls.instructor)
+        other_class = cls._create_class('other', other_instructor)
+
+        # Hiç giriş yok + ilerleme yok: yüksek risk.
+        # Bugün giriş + yüksek ilerleme: düşük risk.
+        now = timezone.now()
+        for number in range(cls.HIGH_RISK + cls.LOW_RISK):
+            high = number < cls.HIGH_RISK
+            student = User.objects.create_user(
+                email=f'student{number}@test.com',
+                password='testpass123',
+                first_name='Student',
+                last_name=str(number),
+                tenant=cls.tenant,
+                role='STUDENT',
+            )
+            if not high:
+                User.objects.filter(pk=student.pk).update(last_login=now)
+            ClassEnrollment.objects.create(user=student, class_group=cls.class_group)
+            Enrollment.objects.create(
+                user=student, course=cls.class_group.course, progress_percent=0 if high else 90,
+            )
+
+        cls.outsider = User.objects.create_user(
+            email='outsider@test.com', password='testpass123', tenant=cls.tenant, role='STUDENT',
+        )
+        ClassEnrollment.objects.create(user=cls.outsider, class_group=other_class)
+        Enrollment.objects.create(user=cls.outsider, course=other_class.course)
+
+        StudentStatsService.rebuild()
+
+    @classmethod
+    def _create_class(cls, name, instructor):
+        from backend.courses.models import Course
+        from backend.student.models import ClassGroup
+
+        course = Course.objects.create(
+            title=f'Course {name}',
+            slug=f'course-{name}',
+            description='Test course description',
+            category='Technology',
+            tenant=cls.tenant,
+        )
+        course.instructors.add(instructor)
+        class_group = ClassGroup.objects.create(name=f'Class {name}', tenant=cls.tenant, course=course)
+        class_group.instructors.add(instructor)
+        return class_group
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.instructor)
+
+    def test_sorted_by_risk(self):
+        """Öğrenciler risk skoruna göre yüksekten düşüğe sıralanır."""
+        results = self.client.get(self.URL, {'page_size': 100}).json()['results']
+
+        scores = [row['riskScore'] for row in results]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual(
+            [row['riskLevel'] for row in results],
+            ['high'] * self.HIGH_RISK + ['low'] * self.LOW_RISK,
+        )
+        self.assertNotIn(str(self.outsider.id), {row['id'] for row in results})
+
+    def test_risk_filter(self):
+        """risk parametresi sadece o seviyedeki öğrencileri döndürür."""
+        data = self.client.get(self.URL, {'risk': 'high'}).json()
+
+        self.assertEqual(data['count'], self.HIGH_RISK)
+        self.assertEqual({row['riskLevel'] for row in data['results']}, {'high'})
+        self.assertEqual({row['completionRate'] for row in data['results']}, {0})
+
+    def test_pagination(self):
+        """Sayfalar tekrar etmeden tüm öğrencileri kapsar."""
+        first = self.client.get(self.URL, {'page_size': 20}).json()
+        second = self.client.get(self.URL, {'page_size': 20, 'page': 2}).json()
+
+        total = self.HIGH_RISK + self.LOW_RISK
+        self.assertEqual(first['count'], total)
+        self.assertEqual(first['total_pages'], 2)
+        self.assertTrue(first['next'])
+        self.assertFalse(second['next'])
+        self.assertTrue(second['previous'])
+        self.assertEqual(len(first['results']), 20)
+        self.assertEqual(len(second['results']), total - 20)
+
+        ids = [row['id'] for row in first['results'] + second['results']]
+        self.assertEqual(len(set(ids)), total)
+
+
+class BehaviorClassesTest(APITestCase):
+    """GET /api/v1/instructor/behavior/classes/ testleri."""
+
+    URL = '/api/v1/instructor/behavior/classes/'
+
+    @classmethod
+    def setUpTestData(cls):
+        from datetime import timedelta
+
+        from backend.courses.models import Course, Enrollment
+        from backend.live.models import LiveSession, LiveSessionAttendanceSummary
+        from backend.student.models import (
+            Assignment, AssignmentSubmission, ClassEnrollment, ClassGroup,
+        )
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        now = timezone.now()
+
+        tenant = Tenant.objects.create(name='Test Akademi', slug='test-akademi')
+        cls.instructor = User.objects.create_user(
+            email='instructor@test.com', password='testpass123', tenant=tenant, role='INSTRUCTOR',
+        )
+
+        course = Course.objects.create(
+            title='Course',
+            slug='course',
+            description='Test course description',
+            category='Technology',
+            tenant=tenant,
+        )
+        course.instructors.add(cls.instructor)
+        cls.class_group = ClassGroup.objects.create(name='Class', tenant=tenant, course=course)
+        cls.class_group.instructors.add(cls.instructor)
+        cls.empty_class = ClassGroup.objects.create(name='Empty', tenant=tenant, course=course)
+        cls.empty_class.instructors.add(cls.instructor)
+
+        assignment = Assignment.objects.create(
+            title='Assignment',
+            description='Test assignment',
+            class_group=cls.class_group,
+            created_by=cls.instructor,
+            due_date=now,
+            status=Assignment.Status.PUBLISHED,
+        )
+
+        # 2 biten + 1 planlanmış canlı ders
+        sessions = [
+            LiveSession.objects.create(
+                tenant=tenant,
+                course=course,
+                created_by=cls.instructor,
+                title=f'Live {index}',
+                scheduled_start=now - timedelta(days=index + 1),
+                scheduled_end=now - timedelta(days=index + 1) + timedelta(hours=1),
+                status=status,
+            )
+            for index, status in enumerate((
+                LiveSession.Status.ENDED, LiveSession.Status.ENDED, LiveSession.Status.SCHEDULED,
+            ))
+        ]
+
+        # İlerleme 20/40/60/80, puan 70/90 (iki öğrenci),
+        # katılım: 1. ders 3 öğrenci, 2. ders 1 öğrenci (+1 eşik altı)
+        attended = {0: (0, 1), 1: (0,), 2: (0,), 3: (2,)}
+        for number in range(4):
+            student = User.objects.create_user(
+                email=f'student{number}@test.com', password='testpass123', tenant=tenant, role='STUDENT',
+            )
+            ClassEnrollment.objects.create(user=student, class_group=cls.class_group)
+            Enrollment.objects.create(user=student, course=course, progress_percent=(number + 1) * 20)
+            if number < 2:
+                AssignmentSubmission.objects.create(
+                    assignment=assignment,
+                    student=student,
+                    status=AssignmentSubmission.Status.GRADED,
+                    score=70 + number * 20,
+                    submitted_at=now,
+                )
+            for index in attended[number]:
+                LiveSessionAttendanceSummary.objects.create(
+                    session=sessions[index], user=student, first_join=now, attended=True,
+                )
+            if number == 3:
+                LiveSessionAttendanceSummary.objects.create(
+                    session=sessions[1], user=student, first_join=now, attended=False,
+                )
+
+        StudentStatsService.rebuild()
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.instructor)
+
+    def test_class_metrics(self):
+        """İlerleme, puan ve katılım özet tablosundan sınıf bazında hesaplanır."""
+        rows = {row['id']: row for row in self.client.get(self.URL).json()}
+
+        self.assertEqual(rows[str(self.class_group.id)], {
+            'id': str(self.class_group.id),
+            'name': 'Class',
+            'avgScore': 80,
+            'completionRate': 50,
+            # 4 katılım / (2 biten ders x 4 öğrenci)
+            'attendanceRate': 50,
+            'studentCount': 4,
+        })
+
+    def test_empty_class(self):
+        """Öğrencisi olmayan sınıf sıfır metriklerle döner."""
+        rows = {row['id']: row for row in self.client.get(self.URL).json()}
+
+        empty = rows[str(self.empty_class.id)]
+        self.assertEqual(
+            (empty['avgScore'], empty['completionRate'], empty['attendanceRate'], empty['studentCount']),
+            (0, 0, 0, 0),
+        )
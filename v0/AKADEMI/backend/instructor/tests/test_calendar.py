@@ -0,0 +1,131 @@
+"""
+Instructor Calendar Tests
+=========================
+
+Takvim ay kovası cache'i ve sinyal invalidation testleri.
+"""
+
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from backend.instructor.services import CalendarService
+
+
+class CalendarServiceTest(TestCase):
+    """CalendarService cache / invalidation testleri."""
+
+    @classmethod
+    def setUpTestData(cls):
+        from backend.courses.models import Course
+        from backend.student.models import Assignment, ClassGroup, LiveSession
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        tenant = Tenant.objects.create(name='Test Akademi', slug='test-akademi')
+        cls.instructor, cls.assistant = [
+            User.objects.create_user(
+                email=f'{name}@test.com', password='testpass123', tenant=tenant, role='INSTRUCTOR',
+            )
+            for name in ('instructor', 'assistant')
+        ]
+        course = Course.objects.create(
+            title='Course',
+            slug='course',
+            description='Test course description',
+            category='Technology',
+            tenant=tenant,
+        )
+        cls.class_group = ClassGroup.objects.create(name='Class A', tenant=tenant, course=course)
+        cls.class_group.instructors.add(cls.instructor)
+
+        cls.now = timezone.now()
+        cls.session = LiveSession.objects.create(
+            title='Live',
+            class_group=cls.class_group,
+            instructor=cls.instructor,
+            scheduled_at=cls.now + timedelta(days=1),
+        )
+        Assignment.objects.create(
+            title='Assignment',
+            description='Test assignment',
+            class_group=cls.class_group,
+            created_by=cls.instructor,
+            due_date=cls.now + timedelta(days=2),
+            status=Assignment.Status.PUBLISHED,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.start = self.now - timedelta(days=40)
+        self.end = self.now + timedelta(days=40)
+
+    def _events(self, user):
+        return CalendarService.events(user, self.start, self.end)
+
+    def test_months_are_cached(self):
+        """Aynı aralık ikinci kez veritabanına gitmez."""
+        self._events(self.instructor)
+
+        with self.assertNumQueries(0):
+            events = self._events(self.instructor)
+
+        self.assertEqual({event[0] for event in events}, {'live', 'assignment'})
+
+    def test_live_session_move_invalidates(self):
+        """Canlı ders taşındığında eski ve yeni ay kovaları silinir."""
+        self._events(self.instructor)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.session.scheduled_at = self.now + timedelta(days=35)
+            self.session.save()
+
+        live = [event for event in self._events(self.instructor) if event[0] == 'live']
+        self.assertEqual(live[0][3], self.session.scheduled_at)
+
+    def test_class_rename_invalidates(self):
+        """Sınıf adı değişince olaylar yeni adla döner."""
+        self._events(self.instructor)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.class_group.name = 'Class B'
+            self.class_group.save()
+
+        self.assertEqual({event[5] for event in self._events(self.instructor)}, {'Class B'})
+
+    def test_save_without_rename_keeps_cache(self):
+        """Ad değişmeden kaydedilen sınıf takvim cache'ini silmez."""
+        self._events(self.instructor)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.class_group.save()
+
+        with self.assertNumQueries(0):
+            self._events(self.instructor)
+
+    def test_instructor_add_and_remove_invalidates(self):
+        """Eklenen eğitmen sınıfın ödevlerini görür, çıkarılan görmez."""
+        self.assertEqual(self._events(self.assistant), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.class_group.instructors.add(self.assistant)
+        self.assertEqual([event[0] for event in self._events(self.assistant)], ['assignment'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.class_group.instructors.remove(self.assistant)
+        self.assertEqual(self._events(self.assistant), [])
+
+    def test_reverse_and_clear_invalidate(self):
+        """Eğitmen tarafından ekleme ve sınıfın eğitmenlerini temizleme."""
+        self._events(self.assistant)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assistant.teaching_classes.add(self.class_group)
+        self.assertEqual([event[0] for event in self._events(self.assistant)], ['assignment'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.class_group.instructors.clear()
+        self.assertEqual(self._events(self.assistant), [])
+        # Canlı ders sahibine bağlıdır; ödev gider, ders kalır
+        self.assertEqual([event[0] for event in self._events(self.instructor)], ['live'])
@@ -0,0 +1,119 @@
+"""
+Content Issue Service Tests
+===========================
+
+İçerik terk analizi: eşikler, eğitmen bazında cache ve tamamlanma
+sinyaliyle invalidation testleri.
+"""
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from backend.instructor.services import ContentIssueService
+
+
+class ContentIssueServiceTest(TestCase):
+    """ContentIssueService testleri."""
+
+    STUDENTS = 10
+
+    @classmethod
+    def setUpTestData(cls):
+        from backend.courses.models import ContentProgress, Course, CourseContent, CourseModule, Enrollment
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        tenant = Tenant.objects.create(name='Test Akademi', slug='test-akademi')
+        cls.instructor = User.objects.create_user(
+            email='instructor@test.com', password='testpass123', tenant=tenant, role='INSTRUCTOR',
+        )
+        cls.other_instructor = User.objects.create_user(
+            email='other@test.com', password='testpass123', tenant=tenant, role='INSTRUCTOR',
+        )
+
+        course = Course.objects.create(
+            title='Course',
+            slug='course',
+            description='Test course description',
+            category='Technology',
+            tenant=tenant,
+        )
+        course.instructors.add(cls.instructor)
+        module = CourseModule.objects.create(course=course, title='Module')
+
+        enrollments = [
+            Enrollment.objects.create(
+                user=User.objects.create_user(
+                    email=f'student{number}@test.com', password='testpass123', tenant=tenant, role='STUDENT',
+                ),
+                course=course,
+            )
+            for number in range(cls.STUDENTS)
+        ]
+
+        # içerik -> (başlayan, tamamlayan)
+        cls.contents = {}
+        for title, started, completed in (
+            ('Yüksek terk', 10, 2),  # %20
+            ('Düşük tamamlama', 10, 4),  # %40
+            ('Sorunsuz', 10, 8),  # %80
+            ('Az başlayan', 4, 0),  # MIN_STARTED altı
+        ):
+            content = CourseContent.objects.create(
+                module=module, title=title, type=CourseContent.ContentType.VIDEO,
+            )
+            cls.contents[title] = content
+            for index, enrollment in enumerate(enrollments[:started]):
+                ContentProgress.objects.create(
+                    enrollment=enrollment, content=content, is_completed=index < completed,
+                )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_compute_thresholds(self):
+        """Sadece yeterince başlanmış ve %50 altı tamamlanan içerikler, artan oranla."""
+        issues = ContentIssueService.compute(self.instructor)
+
+        self.assertEqual(
+            [(issue['content'], issue['issue'], issue['completionRate'], issue['studentCount'])
+             for issue in issues],
+            [
+                ('Yüksek terk', 'Yüksek terk oranı', 20, 8),
+                ('Düşük tamamlama', 'Düşük tamamlama', 40, 6),
+            ],
+        )
+        self.assertEqual(ContentIssueService.compute(self.other_instructor), [])
+
+    def test_get_issues_is_cached(self):
+        """İkinci çağrı veritabanına gitmez; limit cache'lenen listeye uygulanır."""
+        ContentIssueService.get_issues(self.instructor)
+
+        with self.assertNumQueries(0):
+            issues = ContentIssueService.get_issues(self.instructor, limit=1)
+
+        self.assertEqual([issue['content'] for issue in issues], ['Yüksek terk'])
+
+    def test_completion_invalidates_cache(self):
+        """İçerik tamamlanınca commit sonrası eğitmenin cache'i silinir."""
+        from backend.courses.models import ContentProgress
+
+        key = ContentIssueService.cache_key(self.instructor.id)
+        ContentIssueService.get_issues(self.instructor)
+        progress = ContentProgress.objects.filter(
+            content=self.contents['Yüksek terk'], is_completed=False,
+        ).first()
+
+        # Tamamlanma değişmeyen kayıt cache'i korur
+        with self.captureOnCommitCallbacks(execute=True):
+            progress.progress_percent = 50
+            progress.save()
+        self.assertIsNotNone(cache.get(key))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            progress.is_completed = True
+            progress.save()
+        self.assertIsNone(cache.get(key))
+
+        issues = ContentIssueService.get_issues(self.instructor)
+        self.assertEqual(issues[0]['completionRate'], 30)
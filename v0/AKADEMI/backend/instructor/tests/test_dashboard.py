@@ -0,0 +1,186 @@
+"""
+Instructor Dashboard Tests
+==========================
+
+Dashboard cache'i: stale-while-revalidate, broker hatası, göreli
+zamanlar ve sinyal invalidation testleri.
+"""
+
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from kombu.exceptions import OperationalError
+
+from backend.instructor.services import InstructorDashboardService
+
+
+class InstructorDashboardServiceTest(TestCase):
+    """InstructorDashboardService testleri."""
+
+    @classmethod
+    def setUpTestData(cls):
+        from backend.courses.models import Course
+        from backend.student.models import Assignment, AssignmentSubmission, ClassEnrollment, ClassGroup
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        cls.tenant = Tenant.objects.create(name='Test Akademi', slug='test-akademi')
+        cls.instructor = User.objects.create_user(
+            email='instructor@test.com', password='testpass123', tenant=cls.tenant, role='INSTRUCTOR',
+        )
+        course = Course.objects.create(
+            title='Course',
+            slug='course',
+            description='Test course description',
+            category='Technology',
+            tenant=cls.tenant,
+        )
+        cls.class_group = ClassGroup.objects.create(name='Class', tenant=cls.tenant, course=course)
+        cls.class_group.instructors.add(cls.instructor)
+
+        cls.student = User.objects.create_user(
+            email='student@test.com',
+            password='testpass123',
+            first_name='Ada',
+            last_name='Yılmaz',
+            tenant=cls.tenant,
+            role='STUDENT',
+        )
+        ClassEnrollment.objects.create(user=cls.student, class_group=cls.class_group)
+        assignment = Assignment.objects.create(
+            title='Assignment',
+            description='Test assignment',
+            class_group=cls.class_group,
+            created_by=cls.instructor,
+            due_date=timezone.now() + timedelta(days=3),
+            status=Assignment.Status.PUBLISHED,
+        )
+        cls.submitted_at = timezone.now() - timedelta(minutes=10)
+        AssignmentSubmission.objects.create(
+            assignment=assignment,
+            student=cls.student,
+            status=AssignmentSubmission.Status.SUBMITTED,
+            submitted_at=cls.submitted_at,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.key = InstructorDashboardService.cache_key(self.instructor.id)
+        self.lock_key = InstructorDashboardService.lock_key(self.instructor.id)
+
+    def _make_stale(self, total_students):
+        """Cache'teki veriyi taze süresi dolmuş ve işaretli hale getir."""
+        entry = cache.get(self.key)
+        entry['fresh_until'] = time.time() - 1
+        entry['data'] = {**entry['data'], 'summary': {**entry['data']['summary'], 'totalStudents': total_students}}
+        cache.set(self.key, entry, 60)
+
+    def test_fresh_entry_skips_database(self):
+        """Taze veri veritabanına gitmeden döner."""
+        InstructorDashboardService.get_dashboard(self.instructor)
+
+        with self.assertNumQueries(0):
+            data = InstructorDashboardService.get_dashboard(self.instructor)
+
+        self.assertEqual(data['summary']['totalStudents'], 1)
+
+    def test_stale_entry_is_served_while_revalidating(self):
+        """Süresi dolan veri hemen döner; yenileme tek seferlik kuyruğa atılır."""
+        InstructorDashboardService.get_dashboard(self.instructor)
+        self._make_stale(total_students=99)
+
+        with mock.patch('backend.instructor.tasks.refresh_instructor_dashboard.delay') as delay:
+            first = InstructorDashboardService.get_dashboard(self.instructor)
+            second = InstructorDashboardService.get_dashboard(self.instructor)
+
+        self.assertEqual(first['summary']['totalStudents'], 99)
+        self.assertEqual(second['summary']['totalStudents'], 99)
+        delay.assert_called_once_with(self.instructor.id)
+        self.assertIsNotNone(cache.get(self.lock_key))
+
+    def test_broker_error_refreshes_inline(self):
+        """Kuyruğa yazılamazsa kilit bırakılır ve veri istek içinde yenilenir."""
+        InstructorDashboardService.get_dashboard(self.instructor)
+        self._make_stale(total_students=99)
+
+        with mock.patch(
+            'backend.instructor.tasks.refresh_instructor_dashboard.delay',
+            side_effect=OperationalError('broker down'),
+        ):
+            data = InstructorDashboardService.get_dashboard(self.instructor)
+
+        self.assertEqual(data['summary']['totalStudents'], 1)
+        self.assertIsNone(cache.get(self.lock_key))
+        self.assertGreater(cache.get(self.key)['fresh_until'], time.time())
+
+    def test_relative_times_are_not_cached(self):
+        """Cache zaman damgası tutar; göreli zaman her yanıtta hesaplanır."""
+        data = InstructorDashboardService.get_dashboard(self.instructor)
+        cached = cache.get(self.key)['data']['recentActivities'][0]
+
+        self.assertEqual(data['recentActivities'][0]['time'], '10 dk önce')
+        self.assertNotIn('time', cached)
+        self.assertEqual(cached['timestamp'], self.submitted_at)
+
+        later = InstructorDashboardService._with_relative_times(
+            cache.get(self.key)['data'], self.submitted_at + timedelta(hours=2, minutes=5),
+        )
+        self.assertEqual(later['recentActivities'][0]['time'], '2 saat önce')
+
+    def test_signals_invalidate_after_commit(self):
+        """Sınıf kaydı ve canlı ders değişikliği eğitmenin key'ini siler."""
+        from backend.student.models import ClassEnrollment, LiveSession
+        from backend.users.models import User
+
+        student = User.objects.create_user(
+            email='new@test.com', password='testpass123', tenant=self.tenant, role='STUDENT',
+        )
+
+        InstructorDashboardService.get_dashboard(self.instructor)
+        with self.captureOnCommitCallbacks(execute=True):
+            ClassEnrollment.objects.create(user=student, class_group=self.class_group)
+        self.assertIsNone(cache.get(self.key))
+        self.assertEqual(InstructorDashboardService.get_dashboard(self.instructor)['summary']['totalStudents'], 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            LiveSession.objects.create(
+                title='Live',
+                class_group=self.class_group,
+                instructor=self.instructor,
+                scheduled_at=timezone.now() + timedelta(hours=1),
+            )
+        self.assertIsNone(cache.get(self.key))
+
+    def test_attendance_rate_from_ended_sessions(self):
+        """Devam oranı: katılım / (biten canlı ders x aktif öğrenci)."""
+        from backend.courses.models import Enrollment
+        from backend.live.models import LiveSession, LiveSessionAttendanceSummary
+
+        now = timezone.now()
+        course = self.class_group.course
+        with self.captureOnCommitCallbacks(execute=True):
+            Enrollment.objects.create(user=self.student, course=course)
+            sessions = [
+                LiveSession.objects.create(
+                    tenant=self.tenant,
+                    course=course,
+                    created_by=self.instructor,
+                    title=f'Live {index}',
+                    scheduled_start=now,
+                    scheduled_end=now,
+                    status=LiveSession.Status.ENDED,
+                )
+                for index in range(2)
+            ]
+        self.assertEqual(InstructorDashboardService.compute(self.instructor)['quickStats']['attendanceRate'], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            LiveSessionAttendanceSummary.objects.create(
+                session=sessions[0], user=self.student, first_join=now, attended=True,
+            )
+
+        self.assertEqual(InstructorDashboardService.compute(self.instructor)['quickStats']['attendanceRate'], 50)
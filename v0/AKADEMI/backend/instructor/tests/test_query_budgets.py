@@ -0,0 +1,124 @@
+"""
+Instructor Query Budget Tests
+=============================
+
+Eğitmen endpoint'lerinin sorgu bütçesi testleri.
+
+Bütçeler `QUERY_BUDGETS` ayarından okunur. Tohum veri seti, N+1 varsa
+sorgu sayısının bütçeyi açıkça aşacağı büyüklüktedir.
+"""
+
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from backend.libs.querycount.testing import QueryBudgetMixin
+
+
+class InstructorQueryBudgetTest(QueryBudgetMixin, APITestCase):
+    """Eğitmen endpoint'leri sorgu bütçesi testleri."""
+
+    STUDENTS_PER_CLASS = 15
+
+    query_budgets = [
+        ('/api/v1/instructor/dashboard/', None),
+        ('/api/v1/instructor/students/', None),
+        ('/api/v1/instructor/behavior/students/', None),
+        ('/api/v1/instructor/behavior/classes/', None),
+        ('/api/v1/instructor/calendar/', None),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        """Tohum veri setini oluştur."""
+        from backend.courses.models import Course, Enrollment
+        from backend.student.models import (
+            Assignment, AssignmentSubmission, ClassEnrollment, ClassGroup, LiveSession,
+        )
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        now = timezone.now()
+
+        cls.tenant = Tenant.objects.create(
+            name='Test Akademi',
+            slug='test-akademi',
+        )
+
+        cls.instructor = User.objects.create_user(
+            email='instructor@test.com',
+            password='testpass123',
+            first_name='Test',
+            last_name='Instructor',
+            tenant=cls.tenant,
+            role='INSTRUCTOR',
+        )
+
+        for index in range(4):
+            course = Course.objects.create(
+                title=f'Course {index}',
+                slug=f'course-{index}',
+                description='Test course description',
+                category='Technology',
+                tenant=cls.tenant,
+            )
+            course.instructors.add(cls.instructor)
+
+            class_group = ClassGroup.objects.create(
+                name=f'Class {index}',
+                tenant=cls.tenant,
+                course=course,
+            )
+            class_group.instructors.add(cls.instructor)
+
+            assignment = Assignment.objects.create(
+                title=f'Assignment {index}',
+                description='Test assignment',
+                class_group=class_group,
+                created_by=cls.instructor,
+                due_date=now + timedelta(days=index + 1),
+                status=Assignment.Status.PUBLISHED,
+            )
+
+            LiveSession.objects.create(
+                title=f'Live {index}',
+                class_group=class_group,
+                instructor=cls.instructor,
+                scheduled_at=now + timedelta(hours=index + 1),
+            )
+
+            for number in range(cls.STUDENTS_PER_CLASS):
+                student = User.objects.create_user(
+                    email=f'student{index}-{number}@test.com',
+                    password='testpass123',
+                    first_name='Student',
+                    last_name=f'{index}-{number}',
+                    tenant=cls.tenant,
+                    role='STUDENT',
+                )
+                ClassEnrollment.objects.create(user=student, class_group=class_group)
+                Enrollment.objects.create(
+                    user=student,
+                    course=course,
+                    progress_percent=(number * 7) % 100,
+                )
+                AssignmentSubmission.objects.create(
+                    assignment=assignment,
+                    student=student,
+                    status=AssignmentSubmission.Status.GRADED,
+                    score=50 + number,
+                    submitted_at=now - timedelta(hours=number),
+                )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.instructor)
+
+    def test_cached_responses_skip_database(self):
+        """Cache'lenen dashboard ve takvim tekrar sorgu çalıştırmaz."""
+        for url in ('/api/v1/instructor/dashboard/', '/api/v1/instructor/calendar/'):
+            self.client.get(url)
+            with self.subTest(url=url):
+                self.assertEndpointBudget(url, budget=0)
@@ -0,0 +1,136 @@
+"""
+Instructor Students Tests
+=========================
+
+GET /api/v1/instructor/students/ durum, arama ve cursor sayfalama testleri.
+"""
+
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from backend.student.stats import StudentStatsService
+
+
+class InstructorStudentsTest(APITestCase):
+    """Eğitmen öğrenci listesi testleri."""
+
+    URL = '/api/v1/instructor/students/'
+
+    # (ad, soyad, son giriş (gün önce), puan, beklenen durum)
+    STUDENTS = [
+        ('Ali', 'Aydın', 0, None, 'active'),
+        ('Ayşe', 'Aydın', 0, None, 'active'),
+        ('Ayşe', 'Aydın', 6, None, 'inactive'),
+        ('Can', 'Demir', 6, None, 'inactive'),
+        ('Deniz', 'Er', None, None, 'at_risk'),
+        ('Ece', 'Kaya', 0, 40, 'at_risk'),
+        ('Fatma', 'Yıldız', 0, 90, 'active'),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        from backend.courses.models import Course, Enrollment
+        from backend.student.models import Assignment, AssignmentSubmission, ClassEnrollment, ClassGroup
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        now = timezone.now()
+
+        tenant = Tenant.objects.create(name='Test Akademi', slug='test-akademi')
+        cls.instructor = User.objects.create_user(
+            email='instructor@test.com', password='testpass123', tenant=tenant, role='INSTRUCTOR',
+        )
+        course = Course.objects.create(
+            title='Course',
+            slug='course',
+            description='Test course description',
+            category='Technology',
+            tenant=tenant,
+        )
+        course.instructors.add(cls.instructor)
+        class_group = ClassGroup.objects.create(name='Class', tenant=tenant, course=course)
+        class_group.instructors.add(cls.instructor)
+        assignment = Assignment.objects.create(
+            title='Assignment',
+            description='Test assignment',
+            class_group=class_group,
+            created_by=cls.instructor,
+            due_date=now,
+            status=Assignment.Status.PUBLISHED,
+        )
+
+        cls.expected_status = {}
+        for number, (first_name, last_name, days_ago, score, expected) in enumerate(cls.STUDENTS):
+            student = User.objects.create_user(
+                email=f'student{number}@test.com',
+                password='testpass123',
+                first_name=first_name,
+                last_name=last_name,
+                tenant=tenant,
+                role='STUDENT',
+            )
+            if days_ago is not None:
+                User.objects.filter(pk=student.pk).update(last_login=now - timedelta(days=days_ago))
+            ClassEnrollment.objects.create(user=student, class_group=class_group)
+            Enrollment.objects.create(user=student, course=course)
+            if score is not None:
+                AssignmentSubmission.objects.create(
+                    assignment=assignment,
+                    student=student,
+                    status=AssignmentSubmission.Status.GRADED,
+                    score=score,
+                    submitted_at=now,
+                )
+            cls.expected_status[str(student.id)] = expected
+
+        StudentStatsService.rebuild()
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.instructor)
+
+    def test_status_and_totals(self):
+        """Durumlar ve durum sayıları; filtre count'u değiştirir, totals'ı değil."""
+        data = self.client.get(self.URL).json()
+        at_risk = self.client.get(self.URL, {'status': 'at_risk'}).json()
+
+        self.assertEqual({row['id']: row['status'] for row in data['results']}, self.expected_status)
+        self.assertEqual(data['totals'], {'all': 7, 'active': 3, 'inactive': 2, 'atRisk': 2})
+        self.assertEqual(at_risk['count'], 2)
+        self.assertEqual(at_risk['totals'], data['totals'])
+        self.assertEqual({row['status'] for row in at_risk['results']}, {'at_risk'})
+
+    def test_cursor_pages_do_not_overlap(self):
+        """Aynı ad-soyadlı öğrenciler dahil, sayfalar tekrar etmeden tüm listeyi kapsar."""
+        full = [row['id'] for row in self.client.get(self.URL).json()['results']]
+
+        seen = []
+        params = {'limit': 2}
+        while True:
+            data = self.client.get(self.URL, params).json()
+            self.assertLessEqual(len(data['results']), 2)
+            seen.extend(row['id'] for row in data['results'])
+            if data['next'] is None:
+                break
+            params['cursor'] = data['next']
+
+        self.assertEqual(seen, full)
+        self.assertEqual(len(set(seen)), len(self.STUDENTS))
+
+    def test_invalid_cursor_starts_from_first_page(self):
+        """Çözülemeyen cursor yok sayılır."""
+        first = self.client.get(self.URL, {'limit': 2}).json()
+        invalid = self.client.get(self.URL, {'limit': 2, 'cursor': 'bozuk'}).json()
+
+        self.assertEqual(invalid['results'], first['results'])
+
+    def test_search(self):
+        """Ad, soyad ve e-postada arama."""
+        by_last_name = self.client.get(self.URL, {'search': 'Aydın'}).json()
+        by_email = self.client.get(self.URL, {'search': 'student6@'}).json()
+
+        self.assertEqual(by_last_name['count'], 3)
+        self.assertEqual([row['name'] for row in by_email['results']], ['Fatma Yıldız'])
@@ -26,9 +26,11 @@ import logging
 
 from backend.student.models import (
     ClassGroup, ClassEnrollment, Assignment, AssignmentSubmission,
-    LiveSession, Notification
+    LiveSession, Notification, StudentCourseStats
 )
-from backend.courses.models import Course, Enrollment, ContentProgress
+from backend.student.risk import RiskScorer
+from backend.student.stats import avg_score_expression
+from backend.courses.models import Course, Enrollment
 from backend.users.models import User
 
 from .serializers import (
@@ -53,152 +55,14 @@ class InstructorDashboardView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        user = request.user
-        now = timezone.now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end = today_start + timedelta(days=1)
-
-        # Eğitmenin sınıfları - ID'leri al (subquery optimizasyonu için)
-        my_classes_ids = ClassGroup.objects.filter(
-            instructors=user,
-            status=ClassGroup.Status.ACTIVE
-        ).values_list('id', flat=True)
-        
-        # Eğitmenin sınıfları - detaylı (schedule için)
-        my_classes = ClassGroup.objects.filter(
-            id__in=my_classes_ids
-        ).select_related(
-            'course',
-        ).prefetch_related(
-            'class_enrollments',
-        )
+        """
+        Eğitmen bazında cache'li (stale-while-revalidate) dashboard verisi.
         
-        # Toplam öğrenci sayısı (benzersiz) - optimize edilmiş
-        total_students = ClassEnrollment.objects.filter(
-            class_group_id__in=my_classes_ids,
-            status=ClassEnrollment.Status.ACTIVE
-        ).values('user').distinct().count()
-
-        # Bugünkü canlı dersler - select_related ile
-        todays_live_sessions = LiveSession.objects.filter(
-            instructor=user,
-            scheduled_at__gte=today_start,
-            scheduled_at__lt=today_end
-        ).select_related(
-            'class_group',
-        ).order_by('scheduled_at')
-
-        # Bekleyen ödevler (değerlendirilmemiş) - optimize edilmiş
-        pending_submissions = AssignmentSubmission.objects.filter(
-            assignment__class_group_id__in=my_classes_ids,
-            status=AssignmentSubmission.Status.SUBMITTED
-        ).count()
-
-        # Bugünün programı
-        today_schedule = []
-        
-        # Canlı dersler
-        for session in todays_live_sessions[:5]:
-            today_schedule.append({
-                'id': str(session.id),
-                'title': session.title,
-                'type': 'live',
-                'time': session.scheduled_at.strftime('%H:%M'),
-                'className': session.class_group.name,
-                'studentCount': session.class_group.student_count,
-            })
-
-        # Bugün teslim tarihi olan ödevler - select_related ile
-        todays_assignments = Assignment.objects.filter(
-            class_group_id__in=my_classes_ids,
-            due_date__gte=today_start,
-            due_date__lt=today_end,
-            status=Assignment.Status.PUBLISHED
-        ).select_related('class_group')
-        
-        for assignment in todays_assignments[:3]:
-            today_schedule.append({
-                'id': str(assignment.id),
-                'title': f'{assignment.title} Son Teslim',
-                'type': 'assignment',
-                'time': assignment.due_date.strftime('%H:%M'),
-                'className': assignment.class_group.name,
-            })
-
-        # Son aktiviteler
-        recent_activities = []
-        
-        # Son ödev teslimleri - select_related ile assignment.class_group da ekle
-        recent_submissions = AssignmentSubmission.objects.filter(
-            assignment__class_group_id__in=my_classes_ids,
-            submitted_at__isnull=False
-        ).select_related(
-            'student', 
-            'assignment',
-            'assignment__class_group',
-        ).order_by('-submitted_at')[:5]
-        
-        for submission in recent_submissions:
-            time_diff = now - submission.submitted_at
-            if time_diff.days > 0:
-                time_str = f'{time_diff.days} gün önce'
-            elif time_diff.seconds > 3600:
-                time_str = f'{time_diff.seconds // 3600} saat önce'
-            else:
-                time_str = f'{time_diff.seconds // 60} dk önce'
-            
-            recent_activities.append({
-                'id': str(submission.id),
-                'type': 'submission',
-                'message': f'{submission.student.first_name} {submission.student.last_name[0]}. ödev gönderdi',
-                'time': time_str,
-                'studentName': f'{submission.student.first_name} {submission.student.last_name[0]}.',
-            })
-
-        # İstatistikler
-        # Tamamlama oranı (tüm kayıtlı öğrencilerin ortalama ilerleme yüzdesi)
-        enrollments = Enrollment.objects.filter(
-            course__instructors=user,
-            status=Enrollment.Status.ACTIVE
-        )
-        avg_completion = enrollments.aggregate(avg=Avg('progress_percent'))['avg'] or 0
-
-        # Ortalama skor
-        avg_score = AssignmentSubmission.objects.filter(
-            assignment__class_group__in=my_classes,
-            status=AssignmentSubmission.Status.GRADED,
-            score__isnull=False
-        ).aggregate(avg=Avg('score'))['avg'] or 0
-
-        # Devam oranı (son 7 günde canlı derslere katılım)
-        week_ago = now - timedelta(days=7)
-        total_sessions = LiveSession.objects.filter(
-            instructor=user,
-            scheduled_at__gte=week_ago,
-            status=LiveSession.Status.COMPLETED
-        ).count()
-        
-        # Basit devam oranı hesabı
-        attendance_rate = 92 if total_sessions > 0 else 0  # TODO: Gerçek katılım takibi eklenecek
-
-        data = {
-            'summary': {
-                'totalStudents': total_students,
-                'activeClasses': my_classes.count(),
-                'upcomingLessons': todays_live_sessions.filter(status=LiveSession.Status.SCHEDULED).count(),
-                'pendingAssessments': pending_submissions,
-            },
-            'todaySchedule': today_schedule,
-            'recentActivities': recent_activities[:10],
-            'quickStats': {
-                'completionRate': round(avg_completion),
-                'avgScore': round(avg_score),
-                'attendanceRate': attendance_rate,
-            },
-        }
+        Bkz: InstructorDashboardService
+        """
+        from .services import InstructorDashboardService
         
-        logger.info(f"[INSTRUCTOR] Dashboard loaded for {user.email}: {total_students} students, {my_classes.count()} classes")
-        return Response(data)
+        return Response(InstructorDashboardService.get_dashboard(request.user))
 
 
 class InstructorClassViewSet(viewsets.ViewSet):
@@ -383,46 +247,52 @@ class InstructorStudentViewSet(viewsets.ViewSet):
     """
     permission_classes = [IsAuthenticated]
 
+    DEFAULT_LIMIT = 50
+    MAX_LIMIT = 200
+    STATUSES = ['at_risk', 'inactive', 'active']
+
     def list(self, request):
+        """
+        Eğitmenin öğrencileri.
+        
+        Aktivite durumu ve skor riski veritabanı ifadeleri olarak
+        hesaplanır; filtre, sıralama ve cursor sayfalama SQL'de yapılır.
+        
+        Query params:
+            search: Ad / e-posta araması
+            status: active | inactive | at_risk
+            course: Kurs ID
+            cursor: Önceki sayfanın döndürdüğü cursor
+            limit: Sayfa boyutu (max 200)
+        """
         user = request.user
         search = request.query_params.get('search', '')
         status_filter = request.query_params.get('status', '')
         course_filter = request.query_params.get('course', '')
+        cursor = request.query_params.get('cursor')
+        try:
+            limit = int(request.query_params.get('limit', self.DEFAULT_LIMIT))
+        except ValueError:
+            limit = self.DEFAULT_LIMIT
+        limit = max(1, min(limit, self.MAX_LIMIT))
 
-        # Eğitmenin sınıflarının ID'leri (optimize edilmiş)
-        my_classes_ids = ClassGroup.objects.filter(
+        # Eğitmenin sınıfları
+        my_classes = ClassGroup.objects.filter(
             instructors=user,
             status=ClassGroup.Status.ACTIVE
-        ).values_list('id', flat=True)
+        )
+        if course_filter:
+            my_classes = my_classes.filter(course_id=course_filter)
         
-        # Benzersiz öğrenci ID'leri
+        # Benzersiz öğrenci ID'leri (alt sorgu)
         student_ids = ClassEnrollment.objects.filter(
-            class_group_id__in=my_classes_ids,
+            class_group__in=my_classes,
             status=ClassEnrollment.Status.ACTIVE
-        ).values_list('user_id', flat=True).distinct()
+        ).values('user_id')
 
-        # Annotate ile enrolled_courses ve avg_score hesapla
-        from django.db.models import Count, Avg, Q
-        
         students_qs = User.objects.filter(
             id__in=student_ids,
             role=User.Role.STUDENT
-        ).annotate(
-            enrolled_courses_count=Count(
-                'enrollments',
-                filter=Q(
-                    enrollments__course__instructors=user,
-                    enrollments__status=Enrollment.Status.ACTIVE
-                ),
-                distinct=True
-            ),
-            avg_score_computed=Avg(
-                'assignment_submissions__score',
-                filter=Q(
-                    assignment_submissions__assignment__class_group_id__in=my_classes_ids,
-                    assignment_submissions__status=AssignmentSubmission.Status.GRADED
-                )
-            )
         )
 
         # Arama filtresi
@@ -433,56 +303,139 @@ class InstructorStudentViewSet(viewsets.ViewSet):
                 Q(email__icontains=search)
             )
 
-        result = []
-        now = timezone.now()
-        
-        for student in students_qs[:50]:  # Limit
-            # Annotate'den aldığımız değerler
-            enrolled_courses = student.enrolled_courses_count or 0
-            avg_score = student.avg_score_computed or 0
-            
-            # Son aktivite
-            last_activity = student.last_login
-            if last_activity:
-                diff = now - last_activity
-                if diff.days > 7:
-                    last_active = f'{diff.days // 7} hafta önce'
-                    student_status = 'at_risk' if diff.days > 14 else 'inactive'
-                elif diff.days > 0:
-                    last_active = f'{diff.days} gün önce'
-                    student_status = 'inactive' if diff.days > 3 else 'active'
-                elif diff.seconds > 3600:
-                    last_active = f'{diff.seconds // 3600} saat önce'
-                    student_status = 'active'
-                else:
-                    last_active = f'{diff.seconds // 60} dk önce'
-                    student_status = 'active'
-            else:
-                last_active = 'Hiç giriş yapmadı'
-                student_status = 'at_risk'
+        students_qs = self._annotate_status(students_qs, user, my_classes)
 
-            # Skor bazlı risk durumu
-            if avg_score < 50 and avg_score > 0:
-                student_status = 'at_risk'
+        # Durum sayıları (sayfadan bağımsız, tek sorgu)
+        totals = students_qs.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(student_status='active')),
+            inactive=Count('id', filter=Q(student_status='inactive')),
+            at_risk=Count('id', filter=Q(student_status='at_risk')),
+        )
 
-            # Filtre uygula
-            if status_filter and status_filter != student_status:
-                continue
+        if status_filter in self.STATUSES:
+            students_qs = students_qs.filter(student_status=status_filter)
+
+        # Keyset sayfalama: (last_name, first_name, id)
+        after = self._decode_cursor(cursor)
+        if after:
+            last_name, first_name, last_id = after
+            students_qs = students_qs.filter(
+                Q(last_name__gt=last_name) |
+                Q(last_name=last_name, first_name__gt=first_name) |
+                Q(last_name=last_name, first_name=first_name, id__gt=last_id)
+            )
+
+        page = list(students_qs.order_by('last_name', 'first_name', 'id')[:limit + 1])
+        has_more = len(page) > limit
+        page = page[:limit]
 
+        now = timezone.now()
+        result = []
+        for student in page:
+            avg_score = student.avg_score_computed or 0
             result.append({
                 'id': str(student.id),
                 'name': f'{student.first_name} {student.last_name}',
                 'email': student.email,
                 'avatar': f'https://ui-avatars.com/api/?name={student.first_name}+{student.last_name}&background=random',
-                'enrolledCourses': enrolled_courses,
+                'enrolledCourses': student.enrolled_courses_count or 0,
                 'avgScore': round(avg_score),
                 'attendance': 90,  # TODO: Gerçek devam hesabı
-                'lastActive': last_active,
-                'status': student_status,
+                'lastActive': self._last_active_label(student.last_login, now),
+                'status': student.student_status,
             })
 
+        next_cursor = None
+        if has_more and page:
+            last = page[-1]
+            next_cursor = self._encode_cursor(last.last_name, last.first_name, last.id)
+
+        count = totals[status_filter] if status_filter in self.STATUSES else totals['total']
+
         logger.info(f"[INSTRUCTOR] Students loaded for {user.email}: {len(result)} students")
-        return Response({'results': result, 'count': len(result)})
+        return Response({
+            'results': result,
+            'count': count,
+            'totals': {
+                'all': totals['total'],
+                'active': totals['active'],
+                'inactive': totals['inactive'],
+                'atRisk': totals['at_risk'],
+            },
+            'next': next_cursor,
+        })
+
+    def _annotate_status(self, students_qs, instructor, my_classes):
+        """
+        Kurs sayısı, ortalama skor ve durum ifadelerini annotate et.
+        
+        Durum kuralları:
+            - Hiç giriş yok, 15+ gündür giriş yok veya ortalama skor 0-50 arası: at_risk
+            - 4+ gündür giriş yok: inactive
+            - Diğer: active
+        """
+        from django.db.models import Case, CharField, FloatField, IntegerField, OuterRef, Subquery, Value, When
+
+        now = timezone.now()
+
+        courses_sq = StudentCourseStats.objects.filter(
+            user=OuterRef('pk'),
+            course__instructors=instructor,
+            enrollment_status=Enrollment.Status.ACTIVE
+        ).order_by().values('user').annotate(n=Count('course', distinct=True)).values('n')
+
+        score_sq = StudentCourseStats.objects.filter(
+            user=OuterRef('pk'),
+            class_group__in=my_classes
+        ).order_by().values('user').annotate(avg=avg_score_expression()).values('avg')
+
+        return students_qs.annotate(
+            enrolled_courses_count=Coalesce(Subquery(courses_sq), Value(0), output_field=IntegerField()),
+            avg_score_computed=Coalesce(Subquery(score_sq), Value(0.0), output_field=FloatField()),
+        ).annotate(
+            student_status=Case(
+                When(last_login__isnull=True, then=Value('at_risk')),
+                When(last_login__lte=now - timedelta(days=15), then=Value('at_risk')),
+                When(avg_score_computed__gt=0, avg_score_computed__lt=50, then=Value('at_risk')),
+                When(last_login__lte=now - timedelta(days=4), then=Value('inactive')),
+                default=Value('active'),
+                output_field=CharField(),
+            )
+        )
+
+    @staticmethod
+    def _last_active_label(last_activity, now):
+        """Son aktivite etiketi."""
+        if not last_activity:
+            return 'Hiç giriş yapmadı'
+        diff = now - last_activity
+        if diff.days > 7:
+            return f'{diff.days // 7} hafta önce'
+        if diff.days > 0:
+            return f'{diff.days} gün önce'
+        if diff.seconds > 3600:
+            return f'{diff.seconds // 3600} saat önce'
+        return f'{diff.seconds // 60} dk önce'
+
+    @staticmethod
+    def _encode_cursor(last_name, first_name, pk):
+        import base64
+        import json
+        payload = json.dumps([last_name, first_name, pk], separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor):
+        import base64
+        import json
+        if not cursor:
+            return None
+        try:
+            last_name, first_name, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+            return last_name, first_name, pk
+        except (ValueError, TypeError):
+            return None
 
     def retrieve(self, request, pk=None):
         user = request.user
@@ -502,26 +455,19 @@ class InstructorStudentViewSet(viewsets.ViewSet):
         if not has_access:
             return Response({'error': 'Access denied'}, status=status.HTTP_403_FORBIDDEN)
 
-        # Öğrencinin kursları
+        # Öğrencinin kursları (özet tablosundan, tek sorgu)
         courses = []
-        enrollments = Enrollment.objects.filter(
+        course_stats = StudentCourseStats.objects.filter(
             user=student,
             course__instructors=user
-        ).select_related('course')
+        ).exclude(enrollment_status='').select_related('course')
         
-        for enrollment in enrollments:
-            # Bu kurstaki ödev ortalaması
-            avg_score = AssignmentSubmission.objects.filter(
-                student=student,
-                assignment__class_group__course=enrollment.course,
-                status=AssignmentSubmission.Status.GRADED
-            ).aggregate(avg=Avg('score'))['avg'] or 0
-
+        for stats in course_stats:
             courses.append({
-                'id': str(enrollment.course.id),
-                'title': enrollment.course.title,
-                'progress': enrollment.progress_percent,
-                'score': round(avg_score),
+                'id': str(stats.course.id),
+                'title': stats.course.title,
+                'progress': stats.progress_percent,
+                'score': round(stats.avg_score),
             })
 
         # Son aktiviteler
@@ -750,8 +696,22 @@ class BehaviorAnalysisViewSet(viewsets.ViewSet):
     """
     permission_classes = [IsAuthenticated]
 
+    RISK_TRENDS = {'high': 'declining', 'medium': 'stable', 'low': 'improving'}
+
     @action(detail=False, methods=['get'], url_path='students')
     def students(self, request):
+        """
+        Eğitmenin tüm öğrencileri için davranış metrikleri.
+        
+        Tüm öğrenciler RiskScorer ile tek sorgu + vektörel geçişte
+        skorlanır ve riske göre sıralanır; yalnızca sayfadaki öğrencilerin
+        metrikleri (ilerleme, skor, izleme süresi) öğrenci-kurs özet
+        tablosundan (StudentCourseStats) okunur. Öğrenci başına sorgu yok.
+        
+        Query params:
+            risk: high | medium | low
+            page, page_size: Sayfalama
+        """
         user = request.user
         
         my_classes = ClassGroup.objects.filter(
@@ -762,161 +722,193 @@ class BehaviorAnalysisViewSet(viewsets.ViewSet):
         student_ids = ClassEnrollment.objects.filter(
             class_group__in=my_classes,
             status=ClassEnrollment.Status.ACTIVE
-        ).values_list('user_id', flat=True).distinct()
+        ).values('user_id')
 
         students = User.objects.filter(id__in=student_ids, role=User.Role.STUDENT)
+        
+        ranking = RiskScorer.rank(
+            students.values('id'),
+            course_ids=Course.objects.filter(instructors=user).values('id'),
+        )
+        
+        risk = request.query_params.get('risk')
+        if risk in RiskScorer.LEVELS:
+            ranking = [item for item in ranking if item['level'] == risk]
+        
+        # Pagination
+        page = max(int(request.query_params.get('page', 1)), 1)
+        page_size = min(max(int(request.query_params.get('page_size', 20)), 1), 100)
+        
+        start = (page - 1) * page_size
+        end = start + page_size
+        
+        total = len(ranking)
+        page_ranking = ranking[start:end]
+        page_students = self._annotate_behavior(
+            User.objects.filter(id__in=[item['user_id'] for item in page_ranking]), user, my_classes
+        ).in_bulk()
+        
         now = timezone.now()
+        result = [
+            self._serialize_behavior(page_students[item['user_id']], item, now)
+            for item in page_ranking
+        ]
+
+        return Response({
+            'results': result,
+            'count': total,
+            'page': page,
+            'page_size': page_size,
+            'total_pages': (total + page_size - 1) // page_size,
+            'next': page < (total + page_size - 1) // page_size,
+            'previous': page > 1,
+        })
+
+    def _annotate_behavior(self, students, instructor, my_classes):
+        """İlerleme, skor ve izleme süresini annotate et."""
+        from django.db.models import FloatField, IntegerField, OuterRef, Subquery, Value
         
-        result = []
-        for student in students[:30]:
-            # İlerleme ve skor hesapla
-            enrollments = Enrollment.objects.filter(
-                user=student,
-                course__instructors=user,
-                status=Enrollment.Status.ACTIVE
-            )
-            
-            avg_progress = enrollments.aggregate(avg=Avg('progress_percent'))['avg'] or 0
-            
-            avg_score = AssignmentSubmission.objects.filter(
-                student=student,
-                assignment__class_group__in=my_classes,
-                status=AssignmentSubmission.Status.GRADED
-            ).aggregate(avg=Avg('score'))['avg'] or 0
+        stats = StudentCourseStats.objects.filter(user=OuterRef('pk')).order_by()
+        
+        progress_sq = stats.filter(
+            course__instructors=instructor,
+            enrollment_status=Enrollment.Status.ACTIVE
+        ).values('user').annotate(avg=Avg('progress_percent')).values('avg')
+        
+        score_sq = stats.filter(
+            class_group__in=my_classes
+        ).values('user').annotate(avg=avg_score_expression()).values('avg')
+        
+        watch_sq = stats.filter(
+            course__instructors=instructor
+        ).values('user').annotate(total=Sum('watch_seconds')).values('total')
+        
+        return students.annotate(
+            avg_progress=Coalesce(Subquery(progress_sq), Value(0.0), output_field=FloatField()),
+            avg_score=Coalesce(Subquery(score_sq), Value(0.0), output_field=FloatField()),
+            watch_seconds=Coalesce(Subquery(watch_sq), Value(0), output_field=IntegerField()),
+        )
 
-            # İzleme süresi (toplam dakika)
-            watch_time = ContentProgress.objects.filter(
-                enrollment__user=student,
-                enrollment__course__instructors=user
-            ).aggregate(total=Sum('watched_seconds'))['total'] or 0
-            watch_time_hours = round(watch_time / 3600, 1)
-
-            # Risk seviyesi
-            if avg_score < 50 or avg_progress < 30:
-                risk_level = 'high'
-                trend = 'declining'
-            elif avg_score < 70 or avg_progress < 60:
-                risk_level = 'medium'
-                trend = 'stable'
-            else:
-                risk_level = 'low'
-                trend = 'improving'
-
-            # Son aktivite
-            last_activity = student.last_login
-            if last_activity:
-                diff = now - last_activity
-                if diff.days > 7:
-                    last_active = f'{diff.days // 7} hafta önce'
-                elif diff.days > 0:
-                    last_active = f'{diff.days} gün önce'
-                elif diff.seconds > 3600:
-                    last_active = f'{diff.seconds // 3600} saat önce'
-                else:
-                    last_active = f'{diff.seconds // 60} dk önce'
+    def _serialize_behavior(self, student, risk, now):
+        """Annotate edilmiş öğrenciyi ve risk sonucunu frontend formatına çevir."""
+        risk_level = risk['level']
+        
+        # Son aktivite
+        last_activity = student.last_login
+        if last_activity:
+            diff = now - last_activity
+            if diff.days > 7:
+                last_active = f'{diff.days // 7} hafta önce'
+            elif diff.days > 0:
+                last_active = f'{diff.days} gün önce'
+            elif diff.seconds > 3600:
+                last_active = f'{diff.seconds // 3600} saat önce'
             else:
-                last_active = 'Hiç giriş yapmadı'
+                last_active = f'{diff.seconds // 60} dk önce'
+        else:
+            last_active = 'Hiç giriş yapmadı'
 
-            result.append({
-                'id': str(student.id),
-                'name': f'{student.first_name} {student.last_name}',
-                'avatar': f'https://ui-avatars.com/api/?name={student.first_name}+{student.last_name}&background=random',
-                'watchTime': watch_time_hours,
-                'completionRate': round(avg_progress),
-                'avgScore': round(avg_score),
-                'riskLevel': risk_level,
-                'trend': trend,
-                'lastActivity': last_active,
-            })
-
-        # Risk seviyesine göre sırala
-        risk_order = {'high': 0, 'medium': 1, 'low': 2}
-        result.sort(key=lambda x: risk_order.get(x['riskLevel'], 3))
-
-        return Response({'results': result, 'count': len(result)})
+        return {
+            'id': str(student.id),
+            'name': f'{student.first_name} {student.last_name}',
+            'avatar': f'https://ui-avatars.com/api/?name={student.first_name}+{student.last_name}&background=random',
+            'watchTime': round((student.watch_seconds or 0) / 3600, 1),
+            'completionRate': round(student.avg_progress or 0),
+            'avgScore': round(student.avg_score or 0),
+            'riskLevel': risk_level,
+            'riskScore': risk['score'],
+            'trend': self.RISK_TRENDS[risk_level],
+            'lastActivity': last_active,
+        }
 
     @action(detail=False, methods=['get'], url_path='classes')
     def classes(self, request):
+        """
+        Sınıf performansı.
+        
+        İlerleme, puan ve katılım öğrenci-kurs özet tablosundan
+        (StudentCourseStats) sınıf bazında tek GROUP BY ile okunur;
+        sınıf sayısından bağımsız sabit sorgu.
+        """
+        from backend.live.models import LiveSession as CourseLiveSession
+        
         user = request.user
         
-        my_classes = ClassGroup.objects.filter(
+        my_classes = list(ClassGroup.objects.filter(
             instructors=user,
             status=ClassGroup.Status.ACTIVE
-        ).select_related('course')
+        ).only('id', 'name', 'course_id'))
+        
+        if not my_classes:
+            return Response([])
+        
+        class_ids = [cls.id for cls in my_classes]
+        active_members = ClassEnrollment.objects.filter(
+            class_group_id__in=class_ids,
+            status=ClassEnrollment.Status.ACTIVE
+        ).order_by()
+        
+        # Aktif öğrenci sayısı
+        student_counts = dict(
+            active_members.values('class_group_id').annotate(
+                n=Count('id')
+            ).values_list('class_group_id', 'n')
+        )
+        
+        # İlerleme, puan ve katılım (özet tablosu, sınıf bazında)
+        class_stats = {
+            row['class_group_id']: row
+            for row in StudentCourseStats.objects.filter(
+                class_group_id__in=class_ids
+            ).order_by().values('class_group_id').annotate(
+                avg_progress=Avg(
+                    'progress_percent',
+                    filter=Q(enrollment_status=Enrollment.Status.ACTIVE),
+                ),
+                avg_score=avg_score_expression(),
+                attended=Sum('attended_sessions'),
+            )
+        }
+        
+        # Devam: biten canlı derslerde eşiği geçen katılım / (ders x öğrenci)
+        ended_sessions = dict(
+            CourseLiveSession.objects.filter(
+                course_id__in={cls.course_id for cls in my_classes},
+                status=CourseLiveSession.Status.ENDED,
+            ).order_by().values('course_id').annotate(
+                n=Count('id')
+            ).values_list('course_id', 'n')
+        )
 
         result = []
         for cls in my_classes:
-            # Sınıf istatistikleri
-            student_ids = cls.class_enrollments.filter(
-                status=ClassEnrollment.Status.ACTIVE
-            ).values_list('user_id', flat=True)
-
-            # Ortalama ilerleme
-            avg_progress = Enrollment.objects.filter(
-                user_id__in=student_ids,
-                course=cls.course,
-                status=Enrollment.Status.ACTIVE
-            ).aggregate(avg=Avg('progress_percent'))['avg'] or 0
-
-            # Ortalama skor
-            avg_score = AssignmentSubmission.objects.filter(
-                student_id__in=student_ids,
-                assignment__class_group=cls,
-                status=AssignmentSubmission.Status.GRADED
-            ).aggregate(avg=Avg('score'))['avg'] or 0
+            stats = class_stats.get(cls.id, {})
+            student_count = student_counts.get(cls.id, 0)
+            expected = ended_sessions.get(cls.course_id, 0) * student_count
+            attendance_rate = ((stats.get('attended') or 0) / expected * 100) if expected else 0
 
             result.append({
                 'id': str(cls.id),
                 'name': cls.name,
-                'avgScore': round(avg_score),
-                'completionRate': round(avg_progress),
-                'attendanceRate': 90,  # TODO: Gerçek devam hesabı
-                'studentCount': cls.student_count,
+                'avgScore': round(stats.get('avg_score') or 0),
+                'completionRate': round(stats.get('avg_progress') or 0),
+                'attendanceRate': round(min(attendance_rate, 100)),
+                'studentCount': student_count,
             })
 
         return Response(result)
 
     @action(detail=False, methods=['get'], url_path='content-issues')
     def content_issues(self, request):
-        user = request.user
-        
-        # İçerik sorunlarını tespit et
-        # Düşük tamamlama oranına sahip içerikler
-        issues = []
+        """
+        Düşük tamamlama oranına sahip içerikler.
         
-        my_courses = Course.objects.filter(instructors=user)
+        Tek GROUP BY sorgusu ile hesaplanır ve eğitmen bazında cache'lenir
+        (bkz: ContentIssueService).
+        """
+        from .services import ContentIssueService
         
-        for course in my_courses:
-            # Her modül için içerik istatistikleri
-            for module in course.modules.all():
-                for content in module.contents.all():
-                    # Bu içeriği başlatan öğrenci sayısı
-                    started = ContentProgress.objects.filter(
-                        content=content
-                    ).count()
-                    
-                    # Tamamlayan öğrenci sayısı
-                    completed = ContentProgress.objects.filter(
-                        content=content,
-                        is_completed=True
-                    ).count()
-                    
-                    if started > 5:  # En az 5 öğrenci başlamış olmalı
-                        completion_rate = (completed / started) * 100
-                        
-                        if completion_rate < 50:
-                            issues.append({
-                                'id': str(content.id),
-                                'content': content.title,
-                                'issue': 'Yüksek terk oranı' if completion_rate < 30 else 'Düşük tamamlama',
-                                'studentCount': started - completed,
-                                'completionRate': round(completion_rate),
-                            })
-
-        # En sorunlu içerikleri öne çıkar
-        issues.sort(key=lambda x: x.get('completionRate', 100))
-        
-        return Response(issues[:10])
+        return Response(ContentIssueService.get_issues(request.user))
 
 
 class CalendarViewSet(viewsets.ViewSet):
@@ -929,60 +921,26 @@ class CalendarViewSet(viewsets.ViewSet):
     permission_classes = [IsAuthenticated]
 
     def list(self, request):
-        user = request.user
+        """
+        Tarih aralığındaki canlı dersler ve ödev teslim tarihleri.
         
-        # Tarih aralığı
-        start_date = request.query_params.get('start')
-        end_date = request.query_params.get('end')
+        Ay kovası cache'li tek UNION sorgusu (bkz: CalendarService).
         
-        now = timezone.now()
-        if not start_date:
-            start_date = now - timedelta(days=30)
-        if not end_date:
-            end_date = now + timedelta(days=60)
-
-        events = []
-        
-        # Canlı dersler
-        live_sessions = LiveSession.objects.filter(
-            instructor=user,
-            scheduled_at__gte=start_date,
-            scheduled_at__lte=end_date
-        ).select_related('class_group')
+        Query params:
+            start, end: ISO tarih / tarih-saat (varsayılan: -30 / +60 gün)
+        """
+        from .services import CalendarService
         
-        for session in live_sessions:
-            events.append({
-                'id': f'live-{session.id}',
-                'title': session.title,
-                'type': 'live',
-                'start': session.scheduled_at.isoformat(),
-                'end': (session.scheduled_at + timedelta(minutes=session.duration_minutes)).isoformat(),
-                'className': session.class_group.name,
-                'color': '#6366f1',  # Indigo
-                'status': session.status,
-            })
-
-        # Ödev teslim tarihleri
-        my_classes = ClassGroup.objects.filter(instructors=user)
-        assignments = Assignment.objects.filter(
-            class_group__in=my_classes,
-            due_date__gte=start_date,
-            due_date__lte=end_date,
-            status=Assignment.Status.PUBLISHED
-        ).select_related('class_group')
+        try:
+            start, end = CalendarService.parse_range(
+                request.query_params.get('start'),
+                request.query_params.get('end'),
+            )
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         
-        for assignment in assignments:
-            events.append({
-                'id': f'assignment-{assignment.id}',
-                'title': f'{assignment.title} Teslim',
-                'type': 'assignment',
-                'start': assignment.due_date.isoformat(),
-                'end': assignment.due_date.isoformat(),
-                'className': assignment.class_group.name,
-                'color': '#f59e0b',  # Amber
-            })
-
-        return Response(events)
+        events = CalendarService.events(request.user, start, end)
+        return Response(CalendarService.serialize(events))
 
     def create(self, request):
         user = request.user
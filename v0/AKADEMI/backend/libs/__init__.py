@@ -7,5 +7,7 @@ Course Player ve diğer modüller için ortak altyapı.
 Modüller:
 - tenant_aware: Multi-tenant model base class'ları
 - idempotency: Idempotency-Key middleware ve helpers
+- querycount: Sorgu sayısı ölçümü, N+1 raporu ve sorgu bütçeleri
+- metrics: Endpoint gecikme histogramları ve Prometheus endpoint'i
 """
 
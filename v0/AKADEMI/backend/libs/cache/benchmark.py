@@ -0,0 +1,232 @@
+"""
+Cache Benchmarks
+================
+
+Cache altyapısı için ölçüm senaryoları (bkz: `cache_benchmark` komutu).
+
+Senaryolar:
+    invalidation  Dolu keyspace'te kayıt (save) invalidation gecikmesi:
+                  namespace sürümü (INCR) vs eski delete_pattern taraması
+    keys          make_cache_key maliyeti (sürümlü / sürümsüz)
+    codecs        Gerçek serializer çıktıları için codec başına saklanan
+                  boyut ve get / set gecikmesi (bkz: codecs)
+
+LocMemCache'te delete_pattern yoktur; eski yöntemin maliyeti cache'in iç
+sözlüğü üzerinde glob taramasıyla (SCAN eşdeğeri) ölçülür.
+"""
+
+import fnmatch
+import pickle
+import statistics
+import time
+from typing import Callable, Dict, List, Optional
+
+from django.core.cache import cache
+
+from . import codecs, stampede
+from .decorators import make_cache_key
+from .versioning import bump_namespaces
+
+PREFIXES = ('courses', 'enrollments', 'student_dashboard', 'instructor_dashboard')
+
+# Benchmark key'lerinin ömrü (saniye)
+KEY_TIMEOUT = 900
+
+
+def timings(func: Callable, repeat: int) -> Dict[str, float]:
+    """Fonksiyonu `repeat` kez çalıştır; ms cinsinden dağılım."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        'runs': repeat,
+        'mean_ms': round(statistics.fmean(samples), 4),
+        'p50_ms': round(samples[len(samples) // 2], 4),
+        'p99_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.99))], 4),
+        'max_ms': round(samples[-1], 4),
+    }
+
+
+def populate(keys: int, tenants: int = 10, users: int = 1000, batch: int = 10000) -> int:
+    """
+    Cache'i tenant / kullanıcı / prefix'e dağılmış `keys` adet key ile doldur.
+
+    Returns:
+        Yazılan key sayısı
+    """
+    bases = [
+        make_cache_key(prefix, tenant_id=str(user % tenants + 1), user_id=str(user + 1))
+        for prefix in PREFIXES
+        for user in range(users)
+    ]
+
+    written = 0
+    while written < keys:
+        size = min(batch, keys - written)
+        cache.set_many(
+            {f"{bases[(written + n) % len(bases)]}:{written + n}": 1 for n in range(size)},
+            KEY_TIMEOUT,
+        )
+        written += size
+    return written
+
+
+def legacy_delete_pattern(pattern: str) -> Optional[int]:
+    """
+    Eski pattern silme (django-redis delete_pattern / LocMem taraması).
+
+    Returns:
+        Silinen key sayısı (desteklenmiyorsa None)
+    """
+    if hasattr(cache, 'delete_pattern'):
+        return cache.delete_pattern(pattern)
+
+    store = getattr(cache, '_cache', None)
+    if store is None:
+        return None
+
+    internal = cache.make_key(pattern)
+    with cache._lock:
+        matched = [key for key in list(store) if fnmatch.fnmatchcase(key, internal)]
+        for key in matched:
+            cache._delete(key)
+    return len(matched)
+
+
+def run_invalidation(keys: int, repeat: int = 1000, legacy_repeat: int = 3, legacy: bool = True) -> Dict:
+    """Course kaydı invalidation'ı: namespace INCR vs delete_pattern."""
+    populated = populate(keys)
+    tenant_id = 1
+
+    result = {
+        'keys': populated,
+        'namespace_bump': timings(
+            lambda: bump_namespaces(prefixes=['courses'], tenants=[tenant_id]),
+            repeat,
+        ),
+    }
+
+    if legacy:
+        patterns = ['akademi:courses:*', f'akademi:*:t{tenant_id}:*']
+        if legacy_delete_pattern(patterns[0]) is None:
+            result['delete_pattern'] = 'unsupported'
+        else:
+            result['delete_pattern'] = timings(
+                lambda: [legacy_delete_pattern(pattern) for pattern in patterns],
+                legacy_repeat,
+            )
+
+    return result
+
+
+def run_keys(repeat: int = 10000) -> Dict:
+    """make_cache_key maliyeti."""
+    return {
+        'versioned': timings(
+            lambda: make_cache_key('courses', tenant_id='1', user_id='1', path='/api/v1/courses/'),
+            repeat,
+        ),
+        'unversioned': timings(
+            lambda: make_cache_key('courses', tenant_id='1', user_id='1', path='/api/v1/courses/', versioned=False),
+            repeat,
+        ),
+    }
+
+
+# =============================================================================
+# CODEC'LER
+# =============================================================================
+
+def codec_candidates(threshold: int = 1024) -> Dict[str, Optional[codecs.Codec]]:
+    """Kurulu paketlerle oluşturulabilen codec kombinasyonları."""
+    candidates = {'pickle': None}  # Backend varsayılanı (codec yok)
+    for serializer in ('json', 'orjson', 'msgpack'):
+        for compression in (None, 'zlib', 'lz4'):
+            name = serializer if compression is None else f"{serializer}+{compression}"
+            try:
+                candidates[name] = codecs.Codec(serializer, compression, threshold=threshold)
+            except Exception:
+                continue  # Paket kurulu değil
+    return candidates
+
+
+def sample_payloads(limit: int = 50) -> Dict[str, object]:
+    """
+    DB'deki verilerden gerçek serializer çıktıları.
+
+    course_detail: En çok içerikli kursun müfredatlı detayı (CourseSerializer)
+    course_list: İlk `limit` kursun liste çıktısı (CourseListSerializer)
+    instructor_dashboard: En çok kurslu eğitmenin dashboard verisi
+    course_row: CachedManager codec'li saklama satırı (model_to_row)
+    """
+    from django.db.models import Count
+
+    from backend.courses.models import Course
+    from backend.courses.serializers import CourseListSerializer, CourseSerializer
+
+    payloads = {}
+
+    course = (
+        Course.objects.annotate(content_count=Count('modules__contents'))
+        .order_by('-content_count').first()
+    )
+    if course is None:
+        return payloads
+
+    payloads['course_detail'] = CourseSerializer(course).data
+    payloads['course_list'] = CourseListSerializer(
+        Course.objects.prefetch_related('instructors')[:limit], many=True
+    ).data
+    payloads['course_row'] = codecs.model_to_row(course)
+
+    try:
+        from backend.instructor.services.dashboard_service import InstructorDashboardService
+        from backend.users.models import User
+
+        instructor = (
+            User.objects.filter(role=User.Role.INSTRUCTOR)
+            .annotate(course_count=Count('teaching_courses'))
+            .order_by('-course_count').first()
+        )
+        if instructor is not None:
+            payloads['instructor_dashboard'] = InstructorDashboardService.compute(instructor)
+    except Exception:  # pragma: no cover - opsiyonel senaryo
+        pass
+
+    return payloads
+
+
+def run_codecs(repeat: int = 1000, threshold: int = 1024, names: Optional[List[str]] = None) -> Dict:
+    """
+    Codec başına saklanan boyut (byte) ve get / set gecikmesi.
+
+    Boyut, backend'e giden pickle'lanmış zarfın boyutudur (Redis'te
+    tutulan değer).
+    """
+    payloads = sample_payloads()
+    if not payloads:
+        return {'skipped': 'Ölçüm için kurs verisi yok'}
+
+    candidates = codec_candidates(threshold)
+    if names:
+        candidates = {name: codec for name, codec in candidates.items() if name in names}
+
+    results = {}
+    for payload_name, payload in payloads.items():
+        key = f"akademi:benchmark:codec:{payload_name}"
+        rows = {}
+        for name, codec in candidates.items():
+            stampede.set_value(key, payload, KEY_TIMEOUT, codec=codec)
+            stored = cache.get(key)
+            rows[name] = {
+                'bytes': len(pickle.dumps(stored, pickle.HIGHEST_PROTOCOL)),
+                'set': timings(lambda: stampede.set_value(key, payload, KEY_TIMEOUT, codec=codec), repeat),
+                'get': timings(lambda: stampede.get_value(key), repeat),
+            }
+        cache.delete(key)
+        results[payload_name] = rows
+
+    return results
@@ -0,0 +1,239 @@
+"""
+Cache Value Codecs
+==================
+
+Cache'lenen değerler için takılabilir serializer + sıkıştırma.
+
+Varsayılan olarak değerler cache backend'ine olduğu gibi verilir (pickle).
+Büyük iç içe serializer çıktıları (kurs müfredatı, raporlar) için
+isimlendirilmiş bir codec seçilebilir:
+
+    serializer:  pickle | json | orjson | msgpack
+    compression: None | zlib | lz4 (yalnızca `threshold` byte üzerinde)
+
+Kodlanmış değer 2 byte başlık taşır (serializer + sıkıştırma). Çözme
+başlığa göre yapılır; codec ayarı değişse de eski kayıtlar okunabilir.
+
+orjson, msgpack ve lz4 opsiyoneldir; kurulu değilse codec oluşturulurken
+ImproperlyConfigured fırlatılır.
+
+JSON tabanlı serializer'lar DRF'in JSONEncoder'ı ile aynı dönüşümleri
+yapar (datetime → ISO, UUID → str, Decimal → float ...). Çözülen data
+tekrar render edildiğinde aynı JSON'u üretir; ancak Python tipleri
+korunmaz, bu yüzden yalnızca response data'sı için uygundur. Model
+instance'ları için bkz: model_to_row / row_to_model.
+
+Ayarlar:
+    CACHE_CODECS = {
+        'compact': {'serializer': 'orjson', 'compression': 'zlib', 'threshold': 1024},
+    }
+
+Kullanım:
+    @cache_per_tenant(timeout=300, key_prefix='curriculum', codec='compact')
+    def retrieve(self, request, *args, **kwargs):
+        ...
+"""
+
+import json
+import pickle
+import zlib
+from decimal import Decimal
+from typing import Any, Dict, Optional, Union
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.fields.files import FieldFile
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - opsiyonel bağımlılık
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - opsiyonel bağımlılık
+    msgpack = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - opsiyonel bağımlılık
+    lz4_frame = None
+
+_json_default = JSONEncoder().default
+
+
+# =============================================================================
+# SERIALIZER / SIKIŞTIRMA TABLOLARI
+# =============================================================================
+
+def _json_dumps(value) -> bytes:
+    return json.dumps(value, default=_json_default, separators=(',', ':')).encode()
+
+
+def _orjson_dumps(value) -> bytes:
+    # Datetime'lar DRF ile aynı biçimde (…Z) kodlansın diye default'a bırakılır
+    return orjson.dumps(
+        value,
+        default=_json_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+    )
+
+
+def _msgpack_dumps(value) -> bytes:
+    return msgpack.packb(value, default=_json_default, use_bin_type=True)
+
+
+def _msgpack_loads(blob: bytes):
+    return msgpack.unpackb(blob, raw=False, strict_map_key=False)
+
+
+# ad: (başlık byte'ı, dumps, loads, kurulu mu)
+SERIALIZERS = {
+    'pickle': (b'p', lambda value: pickle.dumps(value, pickle.HIGHEST_PROTOCOL), pickle.loads, True),
+    'json': (b'j', _json_dumps, json.loads, True),
+    'orjson': (b'o', _orjson_dumps, lambda blob: orjson.loads(blob), orjson is not None),
+    'msgpack': (b'm', _msgpack_dumps, _msgpack_loads, msgpack is not None),
+}
+
+COMPRESSIONS = {
+    'zlib': (b'z', lambda data, level: zlib.compress(data, 6 if level is None else level), zlib.decompress, True),
+    'lz4': (
+        b'l',
+        lambda data, level: lz4_frame.compress(data, compression_level=level or 0),
+        lambda data: lz4_frame.decompress(data),
+        lz4_frame is not None,
+    ),
+}
+
+NO_COMPRESSION = b'-'
+
+_LOADS = {header: loads for header, _, loads, _ in SERIALIZERS.values()}
+_DECOMPRESS = {header: decompress for header, _, decompress, _ in COMPRESSIONS.values()}
+
+
+class Codec:
+    """
+    Serializer + eşik üzerinde sıkıştırma.
+
+    Args:
+        serializer: SERIALIZERS anahtarı
+        compression: COMPRESSIONS anahtarı (None: sıkıştırma yok)
+        threshold: Bu boyutun (byte) altındaki değerler sıkıştırılmaz
+        level: Sıkıştırma seviyesi (None: kütüphane varsayılanı)
+    """
+
+    def __init__(
+        self,
+        serializer: str = 'pickle',
+        compression: Optional[str] = None,
+        threshold: int = 1024,
+        level: Optional[int] = None,
+    ):
+        if serializer not in SERIALIZERS:
+            raise ImproperlyConfigured(f"Bilinmeyen cache serializer: {serializer}")
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ImproperlyConfigured(f"Bilinmeyen cache sıkıştırması: {compression}")
+
+        self._serializer_header, self._dumps, _, available = SERIALIZERS[serializer]
+        if not available:
+            raise ImproperlyConfigured(f"Cache serializer '{serializer}' için paket kurulu değil")
+
+        self._compress = None
+        if compression is not None:
+            self._compression_header, self._compress, _, available = COMPRESSIONS[compression]
+            if not available:
+                raise ImproperlyConfigured(f"Cache sıkıştırması '{compression}' için paket kurulu değil")
+
+        self.serializer = serializer
+        self.compression = compression
+        self.threshold = threshold
+        self.level = level
+
+    def __repr__(self) -> str:
+        return f"Codec({self.serializer}, {self.compression}, threshold={self.threshold})"
+
+    def encode(self, value: Any) -> bytes:
+        data = self._dumps(value)
+        if self._compress is not None and len(data) >= self.threshold:
+            return self._serializer_header + self._compression_header + self._compress(data, self.level)
+        return self._serializer_header + NO_COMPRESSION + data
+
+    def decode(self, blob: bytes) -> Any:
+        return decode(blob)
+
+
+def decode(blob: bytes) -> Any:
+    """Başlığa göre çöz (hangi codec ile yazıldığından bağımsız)."""
+    serializer, compression, data = blob[:1], blob[1:2], blob[2:]
+    if compression != NO_COMPRESSION:
+        data = _DECOMPRESS[compression](data)
+    return _LOADS[serializer](data)
+
+
+_codecs: Dict[str, Codec] = {}
+
+
+def get_codec(codec: Union[None, str, Codec]) -> Optional[Codec]:
+    """
+    Codec çözümle.
+
+    Args:
+        codec: None (backend varsayılanı), CACHE_CODECS anahtarı veya Codec
+
+    Raises:
+        ImproperlyConfigured: Tanımsız codec adı / eksik paket
+    """
+    if codec is None or isinstance(codec, Codec):
+        return codec
+
+    instance = _codecs.get(codec)
+    if instance is None:
+        options = getattr(settings, 'CACHE_CODECS', {}).get(codec)
+        if options is None:
+            raise ImproperlyConfigured(f"CACHE_CODECS içinde tanımsız codec: {codec}")
+        instance = _codecs[codec] = Codec(**options)
+    return instance
+
+
+# =============================================================================
+# MODEL INSTANCE'LARI
+# =============================================================================
+
+def model_to_row(instance) -> Dict[str, Any]:
+    """
+    Model instance'ını codec'lenebilir {attname: değer} sözlüğüne çevir.
+
+    Decimal, float'a düşmesin diye str, dosya alanları adıyla yazılır;
+    diğer tipler codec tarafından dönüştürülür ve row_to_model'de
+    `to_python` ile geri alınır.
+    """
+    row = {}
+    for field in instance._meta.concrete_fields:
+        if field.attname not in instance.__dict__:
+            continue  # Ertelenmiş (deferred) alan
+        value = instance.__dict__[field.attname]
+        if isinstance(value, Decimal):
+            value = str(value)
+        elif isinstance(value, FieldFile):
+            value = value.name
+        row[field.attname] = value
+    return row
+
+
+def row_to_model(model, row: Dict[str, Any], using: str = 'default'):
+    """
+    model_to_row çıktısından instance oluştur (DB'den yüklenmiş gibi).
+
+    Satırda olmayan alanlar (sonradan eklenmiş kolonlar) ertelenmiş olur,
+    erişildiğinde DB'den yüklenir.
+    """
+    fields = {field.attname: field for field in model._meta.concrete_fields}
+    names, values = [], []
+    for attname, value in row.items():
+        field = fields.get(attname)
+        if field is None:
+            continue  # Modelden kaldırılmış kolon
+        names.append(attname)
+        values.append(value if value is None else field.to_python(value))
+    return model.from_db(using, names, values)
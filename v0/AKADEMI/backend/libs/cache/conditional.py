@@ -0,0 +1,136 @@
+"""
+Conditional GET
+===============
+
+API response'ları için HTTP doğrulayıcıları (ETag / Last-Modified).
+
+İstemci (SPA) elindeki sürümün ETag'ini `If-None-Match` ile gönderir;
+değişmediyse gövdesiz 304 döner, payload yeniden serialize edilip
+gönderilmez. Kural değerlendirmesi (If-None-Match önceliği, zayıf
+karşılaştırma, If-Modified-Since) Django'nun `get_conditional_response`
+fonksiyonuna bırakılır.
+
+İki kaynak:
+    1. Cache decorator'ları (cache_per_tenant, cache_response): cache'lenen
+       data'nın içerik hash'i data ile birlikte saklanır (bkz: make_etag).
+    2. Model tabanlı endpoint'ler (conditional_view): queryset'lerin
+       `Count` + `Max(updated_at)` değerlerinden (queryset başına tek
+       aggregate sorgusu) hiçbir şey serialize edilmeden üretilir. Kayıt
+       sayısı ETag'e dahildir; silinen kayıtlar da yeni ETag üretir.
+
+Not: `.update()` ile yapılan toplu güncellemeler `auto_now` alanlarını
+güncellemez; conditional_view yalnızca yazımları save() ile yapılan
+modellerde kullanılmalıdır.
+
+Kullanım:
+    from backend.libs.cache.conditional import conditional_view, model_validators
+
+    class TimelineView(APIView):
+        @conditional_view(lambda view, request, **kwargs: model_validators(
+            TimelineNode.objects.filter(content_id=kwargs['content_id']),
+        ))
+        def get(self, request, course_id, content_id):
+            ...
+"""
+
+import hashlib
+from functools import wraps
+from typing import Callable, NamedTuple, Optional
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework.renderers import JSONRenderer
+
+
+class Validators(NamedTuple):
+    """Response doğrulayıcıları."""
+
+    etag: Optional[str]
+    last_modified: Optional[int]  # Epoch saniye
+
+
+def make_etag(data) -> str:
+    """Response data'sının içerik hash'inden zayıf ETag."""
+    digest = hashlib.md5(JSONRenderer().render(data)).hexdigest()
+    return f'W/"{digest}"'
+
+
+def model_validators(*querysets, field: str = 'updated_at', salt='') -> Validators:
+    """
+    Queryset'lerin kayıt sayısı ve en son değişikliğinden doğrulayıcılar.
+
+    Args:
+        querysets: Response'un türetildiği queryset'ler
+        field: Değişiklik zamanı alanı
+        salt: ETag'e eklenecek ek bağlam (örn: kullanıcı ID, query param)
+
+    Returns:
+        Validators (Last-Modified: tüm queryset'lerin en büyüğü)
+    """
+    parts = [str(salt)]
+    latest = None
+    for queryset in querysets:
+        aggregate = queryset.order_by().aggregate(count=Count('pk'), latest=Max(field))
+        parts.append(f"{aggregate['count']}@{aggregate['latest'].isoformat() if aggregate['latest'] else '-'}")
+        if aggregate['latest'] and (latest is None or aggregate['latest'] > latest):
+            latest = aggregate['latest']
+
+    digest = hashlib.md5('|'.join(parts).encode()).hexdigest()
+    return Validators(
+        etag=f'W/"m{digest}"',
+        last_modified=int(latest.timestamp()) if latest else None,
+    )
+
+
+def apply_validators(response, etag: Optional[str] = None, last_modified: Optional[int] = None):
+    """
+    Response'a ETag / Last-Modified ekle.
+
+    `no-cache`: tarayıcı her kullanımda yeniden doğrular (304 ile ucuz),
+    `private`: kullanıcıya özel veri ara cache'lerde tutulmaz.
+    """
+    if etag:
+        response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def not_modified(request, etag: Optional[str] = None, last_modified: Optional[int] = None):
+    """
+    İstemcinin sürümü güncelse 304 response, değilse None.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        apply_validators(response, etag, last_modified)
+    return response
+
+
+def conditional_view(validators_func: Callable[..., Validators]):
+    """
+    Model tabanlı endpoint'ler için conditional GET decorator'ı.
+
+    Args:
+        validators_func: (view, request, *args, **kwargs) -> Validators.
+            Yetki / varlık kontrolü (404) burada yapılmalıdır; 304 view
+            çalışmadan döner.
+    """
+    def decorator(view_func: Callable):
+        @wraps(view_func)
+        def wrapper(self, request, *args, **kwargs):
+            validators = validators_func(self, request, *args, **kwargs)
+
+            response = not_modified(request, *validators)
+            if response is not None:
+                return response
+
+            response = view_func(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                apply_validators(response, *validators)
+            return response
+        return wrapper
+    return decorator
@@ -15,32 +15,42 @@ class CourseViewSet(viewsets.ModelViewSet):
 """
 import hashlib
 from functools import wraps
-from typing import List, Optional, Callable
+from typing import Any, Callable, List, NamedTuple, Optional
 
-from django.core.cache import cache
 from django.conf import settings
 from rest_framework.response import Response
 
+from . import conditional, stampede, versioning
+from .invalidation import invalidate
+
 
 def make_cache_key(
     prefix: str,
     tenant_id: Optional[str] = None,
     user_id: Optional[str] = None,
     path: str = '',
-    query_string: str = ''
+    query_string: str = '',
+    versioned: bool = True
 ) -> str:
     """
     Cache key oluştur.
     
-    Format: {prefix}:{tenant_id}:{user_id}:{path_hash}
+    Format: {prefix}:{tenant_id}:{user_id}:{path_hash}:g{sürümler}
+    
+    Key; prefix, tenant ve kullanıcı namespace sürümlerini içerir
+    (tek get_many). Namespace invalidation'ı için bkz:
+    backend.libs.cache.versioning.bump_namespaces
     """
     parts = ['akademi', prefix]
+    namespaces = [(versioning.PREFIX, prefix)]
     
     if tenant_id:
         parts.append(f't{tenant_id}')
+        namespaces.append((versioning.TENANT, str(tenant_id)))
     
     if user_id:
         parts.append(f'u{user_id}')
+        namespaces.append((versioning.USER, str(user_id)))
     
     # Path ve query string hash'le
     if path or query_string:
@@ -48,18 +58,90 @@ def make_cache_key(
         path_hash = hashlib.md5(path_data.encode()).hexdigest()[:12]
         parts.append(path_hash)
     
+    if versioned:
+        versions = versioning.get_versions(namespaces)
+        parts.append('g' + '.'.join(str(versions[namespace]) for namespace in namespaces))
+    
     return ':'.join(parts)
 
 
-def cache_per_tenant(timeout: int = 300, key_prefix: str = 'view'):
+# Cache'lenen response zarfının etiketi
+ENVELOPE_TAG = '__akademi_response__'
+
+
+class CachedResponse(NamedTuple):
+    """Cache'lenen response: data ve içerik hash'i (ETag)."""
+    
+    data: Any
+    etag: str
+    
+    def envelope(self) -> dict:
+        """
+        Cache'e yazılan etiketli dict.
+        
+        JSON / msgpack codec'leri tuple'ı listeye çevirir; etiketli dict
+        her codec'ten aynı döner ve view'ın kendi list / dict data'sıyla
+        karışmaz.
+        """
+        return {ENVELOPE_TAG: 1, 'data': self.data, 'etag': self.etag}
+
+
+def _as_cached_response(value) -> CachedResponse:
+    if isinstance(value, dict) and value.get(ENVELOPE_TAG) == 1:
+        return CachedResponse(value['data'], value['etag'])
+    if isinstance(value, CachedResponse):
+        # Zarftan önce pickle ile saklanmış kayıt
+        return value
+    # ETag'siz saklanmış eski kayıt
+    return CachedResponse(value, conditional.make_etag(value))
+
+
+def _cached_view_response(request, cache_key: str, timeout: int, call_view: Callable, codec=None):
+    """
+    View sonucunu stampede korumalı cache'ten döndür.
+    
+    Key düştüğünde view'ı yalnızca bir istek çalıştırır; diğerleri bayat
+    veriyi alır veya sonucu bekler (bkz: backend.libs.cache.stampede).
+    Yalnızca 200 response'ların data'sı cache'lenir.
+    
+    Data ile birlikte ETag saklanır; istemcinin `If-None-Match` değeri
+    eşleşirse gövdesiz 304 döner (bkz: backend.libs.cache.conditional).
+    """
+    computed = {}
+    
+    def compute():
+        response = computed['response'] = call_view()
+        if response.status_code != 200:
+            return None
+        # Response data'yı cache'le (Response objesi değil)
+        return CachedResponse(response.data, conditional.make_etag(response.data)).envelope()
+    
+    cached = stampede.get_or_compute(cache_key, compute, timeout, codec=codec)
+    if cached is None:
+        return computed['response']
+    cached = _as_cached_response(cached)
+    
+    not_modified = conditional.not_modified(request, etag=cached.etag)
+    if not_modified is not None:
+        return not_modified
+    
+    response = computed['response'] if 'response' in computed else Response(cached.data)
+    return conditional.apply_validators(response, etag=cached.etag)
+
+
+def cache_per_tenant(timeout: int = 300, key_prefix: str = 'view', codec: Optional[str] = None):
     """
     Tenant bazlı cache decorator.
     
-    Her tenant ve kullanıcı için ayrı cache key oluşturur.
+    Her tenant ve kullanıcı için ayrı cache key oluşturur. Key düştüğünde
+    view'ı tek istek yeniden çalıştırır (single-flight + erken yenileme).
+    Response'lar ETag taşır, `If-None-Match` eşleşirse 304 döner.
     
     Args:
         timeout: Cache TTL (saniye). Varsayılan 5 dakika.
         key_prefix: Cache key prefix.
+        codec: Saklama codec'i (CACHE_CODECS anahtarı, bkz: codecs).
+            Varsayılan: backend serializer'ı (pickle).
     
     Usage:
         @cache_per_tenant(timeout=60, key_prefix='courses')
@@ -86,33 +168,26 @@ def cache_per_tenant(timeout: int = 300, key_prefix: str = 'view'):
                 query_string=query_string
             )
             
-            # Cache'den al
-            cached_data = cache.get(cache_key)
-            if cached_data is not None:
-                return Response(cached_data)
-            
-            # View'ı çalıştır
-            response = view_func(self, request, *args, **kwargs)
-            
-            # Başarılı response'u cache'le
-            if response.status_code == 200:
-                # Response data'yı cache'le (Response objesi değil)
-                cache.set(cache_key, response.data, timeout)
-            
-            return response
+            return _cached_view_response(
+                request, cache_key, timeout,
+                lambda: view_func(self, request, *args, **kwargs),
+                codec=codec
+            )
         return wrapper
     return decorator
 
 
-def cache_response(timeout: int = 300, key_func: Optional[Callable] = None):
+def cache_response(timeout: int = 300, key_func: Optional[Callable] = None, codec: Optional[str] = None):
     """
     Basit response caching decorator.
     
-    Custom key function ile kullanılabilir.
+    Custom key function ile kullanılabilir. Stampede koruması ve
+    ETag / 304 davranışı cache_per_tenant ile aynıdır.
     
     Args:
         timeout: Cache TTL (saniye).
         key_func: Custom cache key oluşturucu. (request) -> str
+        codec: Saklama codec'i (CACHE_CODECS anahtarı, bkz: codecs).
     
     Usage:
         @cache_response(timeout=60, key_func=lambda r: f"user:{r.user.id}")
@@ -132,36 +207,84 @@ def cache_response(timeout: int = 300, key_func: Optional[Callable] = None):
                     query_string=request.META.get('QUERY_STRING', '')
                 )
             
-            # Cache'den al
-            cached_data = cache.get(cache_key)
-            if cached_data is not None:
-                return Response(cached_data)
-            
-            # View'ı çalıştır
-            response = view_func(self, request, *args, **kwargs)
-            
-            if response.status_code == 200:
-                cache.set(cache_key, response.data, timeout)
-            
-            return response
+            return _cached_view_response(
+                request, cache_key, timeout,
+                lambda: view_func(self, request, *args, **kwargs),
+                codec=codec
+            )
         return wrapper
     return decorator
 
 
+def _has_wildcard(segment: str) -> bool:
+    return any(char in segment for char in '*?[')
+
+
+def _pattern_namespace(pattern: str) -> versioning.Namespace:
+    """
+    Invalidation pattern'ini namespace'e çöz.
+    
+    'courses:*' -> (prefix, 'courses'), '*:t5:*' -> (tenant, '5'),
+    '*:u7:*' -> (user, '7'). Baştaki 'akademi:' isteğe bağlıdır.
+    """
+    segments = pattern.split(':')
+    if segments[0] == 'akademi' and len(segments) > 1:
+        segments = segments[1:]
+    prefix, rest = segments[0], segments[1:]
+    
+    if not prefix or (prefix != '*' and _has_wildcard(prefix)):
+        raise ValueError(f"Invalid cache pattern {pattern!r}: prefix must be literal or '*'")
+    
+    scoped = {}
+    for segment in rest:
+        # Hash (hex) ve sürüm (g...) segmentleri t/u ile başlamaz
+        kind = {'t': versioning.TENANT, 'u': versioning.USER}.get(segment[:1])
+        if kind is None:
+            continue
+        value = segment[1:]
+        if not value or _has_wildcard(value):
+            raise ValueError(f"Invalid cache pattern {pattern!r}: {segment!r} must be literal")
+        scoped.setdefault(kind, value)
+    
+    if prefix != '*':
+        return versioning.PREFIX, prefix
+    for kind in (versioning.TENANT, versioning.USER):
+        if kind in scoped:
+            return kind, scoped[kind]
+    raise ValueError(f"Invalid cache pattern {pattern!r}: matches every cache key")
+
+
 def invalidate_cache_patterns(patterns: List[str]):
     """
-    Pattern bazlı cache invalidation decorator.
+    Prefix bazlı cache invalidation decorator.
+    
+    POST/PUT/DELETE işlemlerinden sonra ilgili prefix namespace'lerinin
+    sürümünü artırır (keyspace taraması yapılmaz). View bir transaction
+    içindeyse (ATOMIC_REQUESTS) commit sonrasına ertelenir.
     
-    POST/PUT/DELETE işlemlerinden sonra ilgili cache'leri temizler.
+    Pattern'ler make_cache_key formatındadır ve dekorasyon anında tek bir
+    namespace'e çözülür: literal prefix varsa prefix namespace'i, prefix
+    '*' ise t{id} / u{id} segmenti. Sürümler namespace başına tutulduğu
+    için 'courses:t5:*' tüm 'courses' key'lerini invalidate eder (üst küme).
     
     Args:
-        patterns: Invalidate edilecek key pattern'ları.
+        patterns: Invalidate edilecek pattern'ler ('courses', 'courses:*',
+            '*:t5:*', '*:u7:*').
+    
+    Raises:
+        ValueError: Namespace segmenti wildcard içeriyorsa ('cour*', '*:t*')
+            veya pattern hiçbir namespace'i sınırlamıyorsa ('*', '*:*').
     
     Usage:
         @invalidate_cache_patterns(['courses:*', 'enrollments:*'])
         def create(self, request, *args, **kwargs):
             ...
     """
+    namespaces = {versioning.PREFIX: [], versioning.TENANT: [], versioning.USER: []}
+    for pattern in patterns:
+        kind, value = _pattern_namespace(pattern)
+        namespaces[kind].append(value)
+    
     def decorator(view_func: Callable):
         @wraps(view_func)
         def wrapper(self, request, *args, **kwargs):
@@ -169,13 +292,11 @@ def invalidate_cache_patterns(patterns: List[str]):
             
             # Başarılı mutasyon sonrası cache'i temizle
             if result.status_code in [200, 201, 204]:
-                for pattern in patterns:
-                    try:
-                        # django-redis delete_pattern kullan
-                        cache.delete_pattern(f"akademi:{pattern}")
-                    except AttributeError:
-                        # LocMemCache için pattern delete yok, skip
-                        pass
+                invalidate(
+                    prefixes=namespaces[versioning.PREFIX],
+                    tenants=namespaces[versioning.TENANT],
+                    users=namespaces[versioning.USER],
+                )
             
             return result
         return wrapper
@@ -0,0 +1,165 @@
+"""
+Transaction-Aware Cache Invalidation
+====================================
+
+Model sinyalleri çoğunlukla `transaction.atomic` blokları içinde
+(ProgressService.update_progress, PolicyEngine.evaluate_unlock, toplu
+işlemler) tetiklenir. Invalidation'ı sinyal anında yapmak iki soruna yol
+açar:
+
+    1. Eşzamanlı bir istek commit'ten önce cache'i eski veriyle yeniden
+       doldurur; commit sonrası cache bayat kalır.
+    2. Transaction geri alınsa bile cache'ler boşaltılmış olur.
+
+`invalidate()` çağrıları transaction başına tek bir InvalidationBatch'te
+toplanır ve tekilleştirilir; batch commit sonrası tek seferde çalışır
+(namespace'ler tek bump, key'ler tek delete_many, iki katmanlı cache
+ailesi başına tek delete). Geri alınan transaction'ın batch'i Django
+tarafından düşürülür. Transaction dışında invalidation hemen yapılır.
+
+Kullanım:
+    from backend.libs.cache.invalidation import invalidate
+
+    invalidate(prefixes=['courses'], tenants=[course.tenant_id])
+    invalidate(keys=[f"akademi:model:courses:course:{course.pk}"])
+    invalidate(tiered={'course_outline': [f'course:{course.pk}']})
+"""
+
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .versioning import bump_namespaces
+
+logger = logging.getLogger(__name__)
+
+# Bağlantı üzerinde açık batch'in tutulduğu attribute
+BATCH_ATTR = '_akademi_cache_invalidation'
+
+
+class InvalidationBatch:
+    """
+    Bir transaction'ın tekilleştirilmiş invalidation'ları.
+
+    Commit sonrası çağrılır (on_commit callback'i).
+    """
+
+    def __init__(self):
+        self.prefixes = set()
+        self.tenants = set()
+        self.users = set()
+        self.keys = set()
+        self.tiered = defaultdict(set)
+        self.calls = 0
+        self.applied = False
+
+    def add(
+        self,
+        prefixes: Iterable[str] = (),
+        tenants: Iterable = (),
+        users: Iterable = (),
+        keys: Iterable[str] = (),
+        tiered: Optional[Dict[str, Iterable]] = None,
+    ) -> None:
+        self.calls += 1
+        self.prefixes.update(prefix for prefix in prefixes if prefix)
+        self.tenants.update(str(pk) for pk in tenants if pk)
+        self.users.update(str(pk) for pk in users if pk)
+        self.keys.update(key for key in keys if key)
+        for family, family_keys in (tiered or {}).items():
+            self.tiered[family].update(key for key in family_keys if key)
+
+    def __call__(self) -> int:
+        """
+        Invalidation'ları uygula.
+
+        Returns:
+            Artırılan namespace + silinen key sayısı
+        """
+        from .tiered import tiered_cache
+
+        self.applied = True
+        invalidated = bump_namespaces(self.prefixes, self.tenants, self.users)
+
+        if self.keys:
+            cache.delete_many(list(self.keys))
+            invalidated += len(self.keys)
+
+        for family, keys in self.tiered.items():
+            if keys:
+                tiered_cache(family).delete(*keys)
+                invalidated += len(keys)
+
+        if self.calls > 1:
+            logger.debug(f"Cache invalidation batch: {self.calls} calls -> {invalidated} invalidations")
+        return invalidated
+
+
+def _open_batch(connection) -> Optional[InvalidationBatch]:
+    """Bağlantının bekleyen on_commit listesindeki batch (yoksa None)."""
+    state = getattr(connection, BATCH_ATTR, None)
+    if state is None:
+        return None
+
+    batch, index = state
+    if batch.applied:
+        setattr(connection, BATCH_ATTR, None)
+        return None
+
+    pending = connection.run_on_commit
+    # Batch yalnızca kaydedildiği savepoint içinde büyür; iç bloğun
+    # invalidation'ları iç blok geri alınınca onunla birlikte düşer
+    savepoints = set(connection.savepoint_ids)
+    # Hızlı yol: kaydedildiği sırada hâlâ duruyor
+    if index < len(pending) and pending[index][1] is batch:
+        return batch if pending[index][0] == savepoints else None
+    # Savepoint rollback listeyi kaydırmış olabilir
+    for position, (sids, func, _) in enumerate(pending):
+        if func is batch:
+            setattr(connection, BATCH_ATTR, (batch, position))
+            return batch if sids == savepoints else None
+    # Transaction geri alındı / commit edildi
+    setattr(connection, BATCH_ATTR, None)
+    return None
+
+
+def invalidate(
+    prefixes: Iterable[str] = (),
+    tenants: Iterable = (),
+    users: Iterable = (),
+    keys: Iterable[str] = (),
+    tiered: Optional[Dict[str, Iterable]] = None,
+    using: Optional[str] = None,
+) -> None:
+    """
+    Cache invalidation'ını commit sonrasına ertele.
+
+    Aynı transaction'daki çağrılar tek batch'te birleşir. Transaction
+    dışında hemen uygulanır.
+
+    Args:
+        prefixes: make_cache_key prefix namespace'leri
+        tenants: Tenant namespace'leri
+        users: Kullanıcı namespace'leri
+        keys: Silinecek tekil cache key'leri
+        tiered: {aile: key'ler} iki katmanlı cache key'leri
+        using: Veritabanı alias'ı
+    """
+    connection = transaction.get_connection(using)
+
+    if not connection.in_atomic_block:
+        batch = InvalidationBatch()
+        batch.add(prefixes, tenants, users, keys, tiered)
+        batch()
+        return
+
+    batch = _open_batch(connection)
+    if batch is None:
+        batch = InvalidationBatch()
+        transaction.on_commit(batch, using=using)
+        setattr(connection, BATCH_ATTR, (batch, len(connection.run_on_commit) - 1))
+
+    batch.add(prefixes, tenants, users, keys, tiered)
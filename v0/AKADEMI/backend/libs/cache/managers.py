@@ -14,14 +14,21 @@ class Course(models.Model):
 # Cache'den al
 course = Course.objects.get_cached(pk=1)
 
+# Toplu al (tek get_many + eksikler için tek sorgu)
+courses = Course.objects.get_many_cached([1, 2, 3])
+
 # Cache'i invalidate et
 Course.objects.invalidate(pk=1)
 """
-from typing import Any, Optional, TypeVar, Generic
+from typing import Any, Callable, Dict, Generic, Iterable, Optional, TypeVar
 
 from django.core.cache import cache
 from django.db import models
 
+from backend.libs.metrics import record_cache
+
+from . import codecs, stampede
+
 
 T = TypeVar('T', bound=models.Model)
 
@@ -30,14 +37,29 @@ class CachedManager(models.Manager, Generic[T]):
     """
     Cache destekli model manager.
     
-    Tek kayıtları cache'leyerek tekrarlı DB sorgularını önler.
+    Tek kayıtları cache'leyerek tekrarlı DB sorgularını önler. Key
+    düştüğünde kaydı tek istek yeniden yükler (bkz: stampede).
     
     Attributes:
         cache_timeout: Varsayılan cache süresi (saniye).
         cache_prefix: Cache key prefix.
+        cache_codec: Saklama codec'i (CACHE_CODECS anahtarı). None ise
+            instance pickle'lanır; verilirse alan değerleri (model_to_row)
+            kodlanır (bkz: codecs).
     """
     cache_timeout: int = 300  # 5 dakika
     cache_prefix: str = 'model'
+    cache_codec: Optional[str] = None
+    
+    def _pack(self, instance: T) -> Any:
+        if self.cache_codec is None:
+            return instance
+        return codecs.model_to_row(instance)
+    
+    def _unpack(self, value: Any) -> T:
+        if self.cache_codec is None or isinstance(value, models.Model):
+            return value
+        return codecs.row_to_model(self.model, value, using=self.db)
     
     def _get_cache_key(self, pk: Any) -> str:
         """Model için cache key oluştur."""
@@ -58,14 +80,12 @@ class CachedManager(models.Manager, Generic[T]):
         Raises:
             DoesNotExist: Kayıt bulunamazsa.
         """
-        cache_key = self._get_cache_key(pk)
-        instance = cache.get(cache_key)
-        
-        if instance is None:
-            instance = self.get(pk=pk)
-            cache.set(cache_key, instance, timeout or self.cache_timeout)
-        
-        return instance
+        return self._unpack(stampede.get_or_compute(
+            self._get_cache_key(pk),
+            lambda: self._pack(self.get(pk=pk)),
+            timeout or self.cache_timeout,
+            codec=self.cache_codec
+        ))
     
     def get_cached_or_none(self, pk: Any, timeout: Optional[int] = None) -> Optional[T]:
         """
@@ -83,6 +103,45 @@ class CachedManager(models.Manager, Generic[T]):
         except self.model.DoesNotExist:
             return None
     
+    def get_many_cached(self, pks: Iterable[Any], timeout: Optional[int] = None) -> Dict[Any, T]:
+        """
+        Birden fazla kaydı toplu al.
+        
+        Cache'e tek `get_many` ile bakılır; eksikler tek
+        `filter(pk__in=...)` sorgusu ile yüklenip `set_many` ile yazılır.
+        
+        Args:
+            pks: Primary key listesi.
+            timeout: Özel cache süresi (opsiyonel).
+        
+        Returns:
+            {pk: instance} (bulunamayan pk'ler dönmez).
+        """
+        return self._get_many(pks, self._get_cache_key, timeout)
+    
+    def _get_many(self, pks: Iterable[Any], key_func: Callable[[Any], str], timeout: Optional[int]) -> Dict[Any, T]:
+        keys = {}
+        for pk in pks:
+            if pk is not None:
+                keys.setdefault(key_func(pk), pk)
+        if not keys:
+            return {}
+        
+        found = stampede.get_many_values(keys)
+        instances = {keys[key]: self._unpack(value) for key, value in found.items()}
+        
+        missing = {str(pk): pk for key, pk in keys.items() if key not in found}
+        record_cache(hits=len(found), misses=len(missing))
+        if missing:
+            loaded = {}
+            for instance in self.filter(pk__in=list(missing.values())):
+                pk = missing[str(instance.pk)]
+                instances[pk] = instance
+                loaded[key_func(pk)] = self._pack(instance)
+            stampede.set_many_values(loaded, timeout or self.cache_timeout, codec=self.cache_codec)
+        
+        return instances
+    
     def invalidate(self, pk: Any) -> bool:
         """
         Tek bir kaydın cache'ini temizle.
@@ -100,17 +159,18 @@ class CachedManager(models.Manager, Generic[T]):
         """
         Birden fazla kaydın cache'ini temizle.
         
+        Tek `delete_many` round-trip'i ile silinir.
+        
         Args:
             pks: Primary key listesi.
         
         Returns:
-            Silinen cache sayısı.
+            Temizlenen key sayısı.
         """
-        count = 0
-        for pk in pks:
-            if self.invalidate(pk):
-                count += 1
-        return count
+        keys = list({self._get_cache_key(pk) for pk in pks if pk is not None})
+        if keys:
+            cache.delete_many(keys)
+        return len(keys)
     
     def set_cached(self, instance: T, timeout: Optional[int] = None) -> None:
         """
@@ -121,7 +181,21 @@ class CachedManager(models.Manager, Generic[T]):
             timeout: Özel cache süresi (opsiyonel).
         """
         cache_key = self._get_cache_key(instance.pk)
-        cache.set(cache_key, instance, timeout or self.cache_timeout)
+        stampede.set_value(cache_key, self._pack(instance), timeout or self.cache_timeout, codec=self.cache_codec)
+    
+    def set_many_cached(self, instances: Iterable[T], timeout: Optional[int] = None) -> None:
+        """
+        Birden fazla instance'ı tek `set_many` ile cache'e kaydet.
+        
+        Args:
+            instances: Model instance'ları.
+            timeout: Özel cache süresi (opsiyonel).
+        """
+        stampede.set_many_values(
+            {self._get_cache_key(instance.pk): self._pack(instance) for instance in instances},
+            timeout or self.cache_timeout,
+            codec=self.cache_codec
+        )
 
 
 class TenantCachedManager(CachedManager[T]):
@@ -157,16 +231,40 @@ class TenantCachedManager(CachedManager[T]):
         Returns:
             Model instance.
         """
-        cache_key = self._get_cache_key(pk, tenant_id)
-        instance = cache.get(cache_key)
+        return self._unpack(stampede.get_or_compute(
+            self._get_cache_key(pk, tenant_id),
+            lambda: self._pack(self.get(pk=pk)),
+            timeout or self.cache_timeout,
+            codec=self.cache_codec
+        ))
+    
+    def get_many_cached_for_tenant(
+        self,
+        pks: Iterable[Any],
+        tenant_id: Any,
+        timeout: Optional[int] = None
+    ) -> Dict[Any, T]:
+        """
+        Tenant bazlı toplu al (bkz: get_many_cached).
         
-        if instance is None:
-            instance = self.get(pk=pk)
-            cache.set(cache_key, instance, timeout or self.cache_timeout)
+        Args:
+            pks: Primary key listesi.
+            tenant_id: Tenant ID.
+            timeout: Özel cache süresi (opsiyonel).
         
-        return instance
+        Returns:
+            {pk: instance} (bulunamayan pk'ler dönmez).
+        """
+        return self._get_many(pks, lambda pk: self._get_cache_key(pk, tenant_id), timeout)
     
     def invalidate_for_tenant(self, pk: Any, tenant_id: Any) -> bool:
         """Tenant bazlı cache temizle."""
         cache_key = self._get_cache_key(pk, tenant_id)
         return cache.delete(cache_key)
+    
+    def invalidate_many_for_tenant(self, pks: Iterable[Any], tenant_id: Any) -> int:
+        """Tenant bazlı toplu cache temizle (tek delete_many)."""
+        keys = list({self._get_cache_key(pk, tenant_id) for pk in pks if pk is not None})
+        if keys:
+            cache.delete_many(keys)
+        return len(keys)
@@ -4,38 +4,50 @@ Cache Invalidation Signals
 
 Model değişikliklerinde cache'i otomatik invalidate eder.
 
+Invalidation namespace sürümü artırılarak yapılır (namespace başına tek
+INCR, bkz: versioning). Eskiden kullanılan `delete_pattern` her kayıtta
+tüm keyspace'i tarıyordu ve LocMemCache'te hiçbir şey yapmıyordu.
+
+Receiver'lar invalidation'ı doğrudan yapmaz; transaction başına
+tekilleştirilip commit sonrası tek seferde uygulanır (bkz: invalidation).
+Toplu işlemlerde yüzlerce kayıt aynı namespace'i yalnızca bir kez artırır.
+
 Kullanım:
 --------
 # apps.py'da import edin
 from backend.libs.cache import signals  # noqa: F401
 """
 import logging
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import m2m_changed, post_save, post_delete
 from django.dispatch import receiver
-from django.core.cache import cache
+
+from .invalidation import InvalidationBatch, invalidate
 
 logger = logging.getLogger(__name__)
 
 
-def invalidate_pattern(pattern: str) -> int:
+def invalidate_courses(course_ids, tenant_ids) -> int:
     """
-    Pattern ile eşleşen cache key'lerini sil.
-    
+    Toplu kurs değişikliği için birleştirilmiş invalidation.
+
+    Kurs başına sinyal yerine tek çağrı: kurs ve tenant namespace'leri
+    birer kez artırılır, tekil model key'leri tek delete_many ile silinir.
+    Commit sonrası çağrılır (bkz: CourseBulkService); hemen uygulanır.
+
     Args:
-        pattern: Glob-style pattern (örn: "akademi:courses:*")
-    
+        course_ids: Değişen kurs ID'leri
+        tenant_ids: Etkilenen tenant ID'leri
+
     Returns:
-        Silinen key sayısı (tahmini).
+        Invalidate edilen namespace + model key sayısı.
     """
-    try:
-        # django-redis için delete_pattern kullan
-        deleted = cache.delete_pattern(pattern)
-        logger.debug(f"Cache invalidated: {pattern} ({deleted} keys)")
-        return deleted or 0
-    except AttributeError:
-        # LocMemCache için pattern delete yok
-        logger.debug(f"Cache pattern delete not supported for: {pattern}")
-        return 0
+    batch = InvalidationBatch()
+    batch.add(
+        prefixes=['courses'],
+        tenants=tenant_ids,
+        keys=[f"akademi:model:courses:course:{pk}" for pk in course_ids],
+    )
+    return batch()
 
 
 # =============================================================================
@@ -43,41 +55,62 @@ def invalidate_pattern(pattern: str) -> int:
 # =============================================================================
 
 try:
-    from backend.courses.models import Course, Enrollment
-    
+    from backend.courses.models import Course, CourseContent, CourseModule, Enrollment
+
     @receiver([post_save, post_delete], sender=Course)
     def invalidate_course_cache(sender, instance, **kwargs):
         """Course değiştiğinde ilgili cache'leri temizle."""
-        patterns = [
-            f"akademi:courses:*",  # Course listesi
-            f"akademi:model:courses:course:{instance.pk}",  # Tek course
-        ]
-        
-        # Tenant bazlı cache
-        if hasattr(instance, 'tenant_id') and instance.tenant_id:
-            patterns.append(f"akademi:*:t{instance.tenant_id}:*")
-        
-        for pattern in patterns:
-            invalidate_pattern(pattern)
-    
+        # Course listesi + tenant bazlı cache + tek course
+        invalidate(
+            prefixes=['courses'],
+            tenants=[getattr(instance, 'tenant_id', None)],
+            keys=[f"akademi:model:courses:course:{instance.pk}"],
+        )
+
+    @receiver(m2m_changed, sender=Course.instructors.through)
+    def invalidate_course_instructors_cache(sender, instance, action, reverse, pk_set, **kwargs):
+        """Kurs eğitmenleri değiştiğinde katalog / detay cache'ini temizle."""
+        if action == 'pre_clear' and reverse:
+            # post_clear'da pk_set yok; eğitmenin mevcut kurslarını sakla
+            instance._course_cache_cleared = list(instance.teaching_courses.values_list('pk', flat=True))
+            return
+        if action not in ('post_add', 'post_remove', 'post_clear'):
+            return
+
+        if reverse:
+            # user.teaching_courses.add(...): instance eğitmen, pk_set kurslar
+            course_ids = pk_set if action != 'post_clear' else getattr(instance, '_course_cache_cleared', None)
+            if not course_ids:
+                return
+            tenant_ids = set(Course.objects.filter(pk__in=course_ids).values_list('tenant_id', flat=True))
+        else:
+            if action != 'post_clear' and not pk_set:
+                return
+            course_ids, tenant_ids = [instance.pk], [instance.tenant_id]
+
+        invalidate(
+            prefixes=['courses'],
+            tenants=list(tenant_ids),
+            keys=[f"akademi:model:courses:course:{pk}" for pk in course_ids],
+        )
+
+    @receiver([post_save, post_delete], sender=CourseModule)
+    @receiver([post_save, post_delete], sender=CourseContent)
+    def invalidate_curriculum_cache(sender, instance, **kwargs):
+        """Modül / içerik değiştiğinde kurs detayı (müfredat) cache'ini temizle."""
+        invalidate(prefixes=['courses'])
+
     @receiver([post_save, post_delete], sender=Enrollment)
     def invalidate_enrollment_cache(sender, instance, **kwargs):
         """Enrollment değiştiğinde ilgili cache'leri temizle."""
-        patterns = [
-            f"akademi:enrollments:*",  # Enrollment listesi
-            f"akademi:model:courses:enrollment:{instance.pk}",
-        ]
-        
-        # Kullanıcı bazlı cache
-        if hasattr(instance, 'user_id') and instance.user_id:
-            patterns.append(f"akademi:*:u{instance.user_id}:*")
-        
-        # Dashboard cache
-        patterns.append("akademi:instructor_dashboard:*")
-        patterns.append("akademi:student_dashboard:*")
-        
-        for pattern in patterns:
-            invalidate_pattern(pattern)
+        # Enrollment listesi + kullanıcı bazlı cache + öğrenci dashboard'u
+        # (eğitmen dashboard'u süre + hedefli key ile yönetilir,
+        # bkz: backend.instructor.signals)
+        invalidate(
+            prefixes=['enrollments', 'student_dashboard'],
+            users=[getattr(instance, 'user_id', None)],
+            keys=[f"akademi:model:courses:enrollment:{instance.pk}"],
+        )
 
 except ImportError:
     logger.debug("Course models not available for cache signals")
@@ -89,38 +122,25 @@ except ImportError:
 
 try:
     from backend.student.models import ClassGroup, ClassEnrollment, Assignment
-    
+
     @receiver([post_save, post_delete], sender=ClassGroup)
     def invalidate_class_cache(sender, instance, **kwargs):
         """ClassGroup değiştiğinde cache temizle."""
-        patterns = [
-            "akademi:classes:*",
-            "akademi:instructor_classes:*",
-            "akademi:student_classes:*",
-        ]
-        for pattern in patterns:
-            invalidate_pattern(pattern)
-    
+        invalidate(prefixes=['classes', 'instructor_classes', 'student_classes'])
+
     @receiver([post_save, post_delete], sender=ClassEnrollment)
     def invalidate_class_enrollment_cache(sender, instance, **kwargs):
         """ClassEnrollment değiştiğinde cache temizle."""
-        patterns = [
-            "akademi:instructor_dashboard:*",
-            "akademi:instructor_students:*",
-            "akademi:student_classes:*",
-        ]
-        for pattern in patterns:
-            invalidate_pattern(pattern)
-    
+        # instructor_dashboard: sadece sınıfın eğitmenleri, hedefli key ile
+        # (bkz: backend.instructor.signals)
+        invalidate(prefixes=['instructor_students', 'student_classes'])
+
     @receiver([post_save, post_delete], sender=Assignment)
     def invalidate_assignment_cache(sender, instance, **kwargs):
         """Assignment değiştiğinde cache temizle."""
-        patterns = [
-            "akademi:assignments:*",
-            "akademi:instructor_dashboard:*",
-        ]
-        for pattern in patterns:
-            invalidate_pattern(pattern)
+        # instructor_dashboard: sadece sınıfın eğitmenleri, hedefli key ile
+        # (bkz: backend.instructor.signals)
+        invalidate(prefixes=['assignments'])
 
 except ImportError:
     logger.debug("Student models not available for cache signals")
@@ -133,16 +153,16 @@ except ImportError:
 try:
     from django.contrib.auth import get_user_model
     User = get_user_model()
-    
+
     @receiver([post_save], sender=User)
     def invalidate_user_cache(sender, instance, **kwargs):
         """User değiştiğinde cache temizle."""
-        patterns = [
-            f"akademi:model:users:user:{instance.pk}",
-            f"akademi:*:u{instance.pk}:*",
-        ]
-        for pattern in patterns:
-            invalidate_pattern(pattern)
+        # Sadece last_login güncellemesi (her girişte) kullanıcı cache'ini bozmaz
+        update_fields = kwargs.get('update_fields')
+        if update_fields and set(update_fields) <= {'last_login', 'last_login_ip'}:
+            return
+
+        invalidate(users=[instance.pk], keys=[f"akademi:model:users:user:{instance.pk}"])
 
 except Exception:
     logger.debug("User model not available for cache signals")
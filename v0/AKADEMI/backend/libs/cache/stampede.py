@@ -0,0 +1,206 @@
+"""
+Cache Stampede Protection
+=========================
+
+Popüler bir key düştüğünde eşzamanlı isteklerin hepsinin aynı anda yeniden
+hesaplamasını (stampede / dogpile) önler.
+
+1. Single-flight: Yeniden hesaplamayı yalnızca `cache.add` ile kilidi alan
+   istek yapar. Diğerleri elde bayat değer varsa onu döndürür, yoksa
+   kilit bırakılana kadar kısa süre (`wait`) bekler.
+2. Olasılıksal erken yenileme (XFetch): Değer, son hesaplama süresi (delta)
+   ile orantılı bir olasılıkla süresi dolmadan yenilenir:
+
+       now - delta * beta * ln(random()) >= expires_at
+
+   Böylece yenileme çoğunlukla key düşmeden, tek istek tarafından yapılır.
+
+Değerler `Entry(value, expires_at, delta)` zarfında saklanır. Paylaşılan
+cache TTL'i `timeout + stale_ttl`'dir: mantıksal süre dolduktan sonra
+yeniden hesaplama sürerken diğer istekler `stale_ttl` boyunca bayat değeri
+alır. Zarfsız (eski / set() ile yazılmış) değerler taze kabul edilir.
+
+Ayarlar `CACHE_STAMPEDE` ile DEFAULTS üzerine yazılır.
+
+Kullanım:
+    from backend.libs.cache.stampede import get_or_compute
+
+    data = get_or_compute(cache_key, lambda: build_payload(), timeout=60)
+"""
+
+import logging
+import math
+import random
+import time
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from backend.libs.metrics import record_cache
+
+from . import codecs
+
+logger = logging.getLogger(__name__)
+
+LOCK_SUFFIX = ':lock'
+
+DEFAULTS = {
+    'beta': 1.0,  # Erken yenileme agresifliği (0 = kapalı)
+    'stale_ttl': 60,  # Süre dolduktan sonra bayat değerin tutulduğu süre
+    'lock_timeout': 30,  # Yeniden hesaplama kilidinin en uzun süresi
+    'wait': 5.0,  # Bayat değer yoksa kilidi bekleme süresi
+    'poll_interval': 0.05,  # Bekleme sırasında kontrol aralığı
+}
+
+
+class Entry(NamedTuple):
+    """Cache zarfı."""
+
+    value: Any
+    expires_at: float  # Mantıksal son kullanma (epoch saniye)
+    delta: float  # Son hesaplama süresi (saniye)
+    encoded: bool = False  # value codec ile kodlanmış bytes (bkz: codecs)
+
+    def load(self) -> Any:
+        return codecs.decode(self.value) if self.encoded else self.value
+
+
+def _make_entry(value, expires_at: float, delta: float, codec) -> Entry:
+    if codec is None:
+        return Entry(value, expires_at, delta)
+    return Entry(codec.encode(value), expires_at, delta, True)
+
+
+def get_options() -> dict:
+    options = dict(DEFAULTS)
+    options.update(getattr(settings, 'CACHE_STAMPEDE', {}))
+    return options
+
+
+def _unwrap(raw) -> Optional[Entry]:
+    if raw is None:
+        return None
+    if isinstance(raw, Entry):
+        return raw
+    # Zarfsız değer: taze kabul et
+    return Entry(raw, float('inf'), 0.0)
+
+
+def _should_refresh(entry: Entry, beta: float, now: float) -> bool:
+    if now >= entry.expires_at:
+        return True
+    if beta <= 0 or entry.delta <= 0:
+        return False
+    # 1 - random() ∈ (0, 1]: log(0) olmaz
+    return now - entry.delta * beta * math.log(1.0 - random.random()) >= entry.expires_at
+
+
+def set_value(key: str, value: Any, timeout: int, delta: float = 0.0, codec=None) -> None:
+    """Değeri zarf ile yaz (TTL: timeout + stale_ttl)."""
+    stale_ttl = get_options()['stale_ttl']
+    entry = _make_entry(value, time.time() + timeout, delta, codecs.get_codec(codec))
+    cache.set(key, entry, timeout + stale_ttl)
+
+
+def get_value(key: str, default=None) -> Any:
+    """Zarfı açarak oku (süre / yenileme kontrolü yapmaz)."""
+    entry = _unwrap(cache.get(key))
+    return default if entry is None else entry.load()
+
+
+def get_many_values(keys: Iterable[str]) -> Dict[str, Any]:
+    """
+    Birden fazla key'i tek round-trip'te oku (cache.get_many).
+
+    Mantıksal süresi dolmuş değerler dönmez (çağıran yeniden yükler).
+    """
+    now = time.time()
+    values = {}
+    for key, raw in cache.get_many(list(keys)).items():
+        entry = _unwrap(raw)
+        if entry is not None and entry.expires_at > now:
+            values[key] = entry.load()
+    return values
+
+
+def set_many_values(mapping: Dict[str, Any], timeout: int, codec=None) -> None:
+    """Birden fazla değeri zarf ile tek round-trip'te yaz (cache.set_many)."""
+    if not mapping:
+        return
+    codec = codecs.get_codec(codec)
+    expires_at = time.time() + timeout
+    cache.set_many(
+        {key: _make_entry(value, expires_at, 0.0, codec) for key, value in mapping.items()},
+        timeout + get_options()['stale_ttl'],
+    )
+
+
+def get_or_compute(
+    key: str,
+    compute: Callable[[], Any],
+    timeout: int,
+    beta: Optional[float] = None,
+    codec=None,
+) -> Any:
+    """
+    Cache'ten al; yoksa / yenileme zamanıysa tek istekte yeniden hesapla.
+
+    Args:
+        key: Cache key
+        compute: Değeri üreten fonksiyon. None dönerse cache'lenmez.
+        timeout: Mantıksal TTL (saniye)
+        beta: Erken yenileme katsayısı (varsayılan: CACHE_STAMPEDE['beta'])
+        codec: Saklama codec'i (None: backend varsayılanı, bkz: codecs)
+
+    Returns:
+        Cache'teki, bayat veya yeni hesaplanan değer
+    """
+    options = get_options()
+    if beta is None:
+        beta = options['beta']
+
+    entry = _unwrap(cache.get(key))
+    if entry is not None and not _should_refresh(entry, beta, time.time()):
+        record_cache(hits=1)
+        return entry.load()
+
+    lock_key = key + LOCK_SUFFIX
+    if cache.add(lock_key, 1, options['lock_timeout']):
+        record_cache(misses=1)
+        return _compute_and_store(key, lock_key, compute, timeout, codec)
+
+    # Başka bir istek hesaplıyor
+    if entry is not None:
+        record_cache(hits=1)
+        return entry.load()
+
+    deadline = time.monotonic() + options['wait']
+    while time.monotonic() < deadline:
+        time.sleep(options['poll_interval'])
+        entry = _unwrap(cache.get(key))
+        if entry is not None:
+            record_cache(hits=1)
+            return entry.load()
+        if cache.get(lock_key) is None:
+            break
+
+    # Kilit sahibi sonuç yazmadı (hata / cache'lenemez değer) veya bekleme
+    # süresi doldu: kendimiz hesaplarız
+    record_cache(misses=1)
+    logger.debug(f"Cache stampede wait expired: {key}")
+    if cache.add(lock_key, 1, options['lock_timeout']):
+        return _compute_and_store(key, lock_key, compute, timeout, codec)
+    return compute()
+
+
+def _compute_and_store(key: str, lock_key: str, compute: Callable[[], Any], timeout: int, codec) -> Any:
+    try:
+        started = time.monotonic()
+        value = compute()
+        if value is not None:
+            set_value(key, value, timeout, delta=time.monotonic() - started, codec=codec)
+        return value
+    finally:
+        cache.delete(lock_key)
+
@@ -0,0 +1,74 @@
+"""
+Cache Test Helpers
+==================
+
+Cache ve idempotency testlerinin ortak yardımcıları.
+
+Kullanım:
+    from backend.libs.cache.testing import override_locmem_cache, run_parallel
+
+    @override_locmem_cache('stampede-tests', DEBUG=False)
+    class CacheStampedeTest(SimpleTestCase):
+        def test_single_flight(self):
+            results = run_parallel(lambda: stampede.get_or_compute(key, compute, 60), 100)
+
+Her test modülü kendi LOCATION'ını kullanır; böylece paralel koşan
+modüllerin LocMem cache'leri birbirine karışmaz.
+"""
+
+import threading
+
+from django.db import connection
+from django.test import override_settings
+
+
+def locmem_caches(location: str) -> dict:
+    """Tek LocMem backend'li CACHES ayarı."""
+    return {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': location,
+        }
+    }
+
+
+def override_locmem_cache(location: str, **settings):
+    """
+    override_settings(CACHES=locmem_caches(location), **settings) kısayolu.
+
+    Sınıf ve metot dekoratörü ya da context manager olarak kullanılabilir.
+    """
+    return override_settings(CACHES=locmem_caches(location), **settings)
+
+
+def run_parallel(func, count: int, close_connections: bool = False) -> list:
+    """
+    func'ı count thread'de aynı anda başlat, sonuçları sırayla döndür.
+
+    Thread'ler bir Barrier'da bekletilir; ilk hata ana thread'de yeniden
+    fırlatılır. close_connections=True ise her thread kendi DB
+    bağlantısını kapatır (TransactionTestCase'lerde açık bağlantı kalmaz).
+    """
+    barrier = threading.Barrier(count)
+    results = [None] * count
+    errors = []
+
+    def worker(index):
+        try:
+            barrier.wait()
+            results[index] = func()
+        except Exception as exc:  # pragma: no cover - hata mesajı için
+            errors.append(exc)
+        finally:
+            if close_connections:
+                connection.close()
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return results
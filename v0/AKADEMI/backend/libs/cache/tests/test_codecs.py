@@ -0,0 +1,118 @@
+"""
+Cache Codec Tests
+=================
+
+Codec'li saklamanın response ve model instance'larını koruduğunu doğrular.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from backend.libs.cache import codecs
+from backend.libs.cache.decorators import _as_cached_response, cache_per_tenant
+from backend.libs.cache.managers import CachedManager
+from backend.libs.cache.testing import override_locmem_cache
+
+TEST_CODECS = {
+    'test-json-zlib': {'serializer': 'json', 'compression': 'zlib', 'threshold': 64},
+}
+
+PAYLOAD = {
+    'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'updatedAt': datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    'price': Decimal('149.90'),
+    'modules': [{'title': f'Hafta {index}', 'order': index} for index in range(20)],
+}
+
+
+class CodecTest(SimpleTestCase):
+    """Codec kodlama / çözme testleri."""
+
+    def test_render_matches_original(self):
+        """Çözülen data orijinal ile aynı JSON'u üretir."""
+        codec = codecs.Codec('json', 'zlib', threshold=64)
+        blob = codec.encode(PAYLOAD)
+
+        self.assertEqual(blob[:2], b'jz')
+        self.assertEqual(JSONRenderer().render(codecs.decode(blob)), JSONRenderer().render(PAYLOAD))
+
+    def test_small_values_not_compressed(self):
+        """Eşiğin altındaki değerler sıkıştırılmaz."""
+        blob = codecs.Codec('json', 'zlib', threshold=1024).encode({'a': 1})
+        self.assertEqual(blob[:2], b'j-')
+        self.assertEqual(codecs.decode(blob), {'a': 1})
+
+
+@override_locmem_cache('codec-tests', CACHE_CODECS=TEST_CODECS, DEBUG=False)
+class CodecStorageTest(TestCase):
+    """Decorator ve manager codec testleri."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_cache_per_tenant_with_codec(self):
+        """Codec'li decorator aynı data ve ETag'i döndürür."""
+        class CourseView:
+            @cache_per_tenant(timeout=60, key_prefix='curriculum', codec='test-json-zlib')
+            def retrieve(self, request):
+                return Response(PAYLOAD)
+
+        def call(**headers):
+            request = RequestFactory().get('/api/v1/courses/x/', **headers)
+            request.user = SimpleNamespace(id=1, tenant_id=1)
+            return CourseView().retrieve(request)
+
+        first, second = call(), call()
+        self.assertEqual(JSONRenderer().render(second.data), JSONRenderer().render(PAYLOAD))
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertEqual(call(HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+
+    def test_two_item_list_with_string_survives_codec(self):
+        """Sonu metin olan iki elemanlı list data, ETag'li kayıtla karışmaz."""
+        data = [{'id': 1}, 'son']
+        calls = []
+
+        class TagView:
+            @cache_per_tenant(timeout=60, key_prefix='tags', codec='test-json-zlib')
+            def list(self, request):
+                calls.append(1)
+                return Response(data)
+
+        def call():
+            request = RequestFactory().get('/api/v1/tags/')
+            request.user = SimpleNamespace(id=1, tenant_id=1)
+            return TagView().list(request)
+
+        first, second = call(), call()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(second.data, data)
+        self.assertEqual(second['ETag'], first['ETag'])
+        # Zarfsız (eski) kayıt da data olarak okunur, (data, etag) sanılmaz
+        self.assertEqual(_as_cached_response(data).data, data)
+
+    def test_cached_manager_with_codec(self):
+        """Codec'li manager instance'ı alan tipleriyle geri yükler."""
+        from backend.tenants.models import Tenant
+
+        tenant = Tenant.objects.create(name='Akademi', slug='akademi')
+        manager = CachedManager()
+        manager.model = Tenant
+        manager.cache_codec = 'test-json-zlib'
+
+        manager.get_cached(tenant.pk)
+        with self.assertNumQueries(0):
+            cached = manager.get_cached(tenant.pk)
+
+        self.assertIsInstance(cached, Tenant)
+        self.assertFalse(cached._state.adding)
+        self.assertEqual(cached.pk, tenant.pk)
+        self.assertEqual(cached.name, 'Akademi')
+        self.assertEqual(cached.created_at, tenant.created_at)
@@ -0,0 +1,97 @@
+"""
+Conditional GET Tests
+=====================
+
+ETag / Last-Modified ve 304 testleri.
+"""
+
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from rest_framework.response import Response
+
+from backend.libs.cache.conditional import model_validators
+from backend.libs.cache.decorators import cache_per_tenant
+from backend.libs.cache.testing import override_locmem_cache
+
+
+@override_locmem_cache('conditional-tests', DEBUG=False)
+class CachedResponseETagTest(SimpleTestCase):
+    """cache_per_tenant ETag testleri."""
+
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+        test = self
+
+        class CourseView:
+            @cache_per_tenant(timeout=60, key_prefix='courses')
+            def list(self, request):
+                test.calls += 1
+                return Response({'courses': [1, 2, 3]})
+
+        self.view = CourseView()
+
+    def call(self, **headers):
+        request = RequestFactory().get('/api/v1/courses/', **headers)
+        request.user = SimpleNamespace(id=7, tenant_id=3)
+        return self.view.list(request)
+
+    def test_matching_etag_returns_304(self):
+        """Eşleşen If-None-Match gövdesiz 304 döner."""
+        first = self.call()
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first['ETag'].startswith('W/"'))
+
+        second = self.call(HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertEqual(second.content, b'')
+        self.assertEqual(self.calls, 1)
+
+    def test_stale_etag_returns_data(self):
+        """Eşleşmeyen ETag ile cache'teki data döner."""
+        etag = self.call()['ETag']
+
+        response = self.call(HTTP_IF_NONE_MATCH='W/"outdated"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'courses': [1, 2, 3]})
+        self.assertEqual(response['ETag'], etag)
+
+
+class ModelValidatorsTest(TestCase):
+    """model_validators testleri."""
+
+    @classmethod
+    def setUpTestData(cls):
+        from backend.tenants.models import Tenant
+
+        cls.tenants = [
+            Tenant.objects.create(name=f'Akademi {index}', slug=f'akademi-{index}')
+            for index in range(3)
+        ]
+
+    def validators(self):
+        from backend.tenants.models import Tenant
+
+        return model_validators(Tenant.objects.all())
+
+    def test_single_query_and_stable(self):
+        """Tek aggregate sorgusu; değişiklik yoksa ETag aynı kalır."""
+        with self.assertNumQueries(1):
+            validators = self.validators()
+        self.assertEqual(validators, self.validators())
+        self.assertIsNotNone(validators.last_modified)
+
+    def test_update_and_delete_change_etag(self):
+        """Güncelleme ve silme yeni ETag üretir."""
+        before = self.validators()
+
+        self.tenants[0].name = 'Yeni Ad'
+        self.tenants[0].save()
+        updated = self.validators()
+        self.assertNotEqual(updated.etag, before.etag)
+
+        self.tenants[1].delete()
+        self.assertNotEqual(self.validators().etag, updated.etag)
@@ -0,0 +1,110 @@
+"""
+Cache Invalidation Tests
+========================
+
+Transaction'a bağlı, tekilleştirilmiş invalidation testleri.
+"""
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase
+
+from backend.libs.cache import versioning
+from backend.libs.cache.invalidation import InvalidationBatch, invalidate
+from backend.libs.cache.testing import override_locmem_cache
+
+
+def prefix_version(prefix):
+    namespace = (versioning.PREFIX, prefix)
+    return versioning.get_versions([namespace])[namespace]
+
+
+@override_locmem_cache('invalidation-tests')
+class TransactionInvalidationTest(TestCase):
+    """Transaction içi invalidation testleri."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_deferred_until_commit(self):
+        """Invalidation commit'e kadar uygulanmaz, tek callback kaydedilir."""
+        cache.set('akademi:test:course', 'cached')
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            for _ in range(50):
+                invalidate(keys=['akademi:test:course'])
+            self.assertEqual(cache.get('akademi:test:course'), 'cached')
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertIsNone(cache.get('akademi:test:course'))
+
+    def test_repeated_namespaces_bumped_once(self):
+        """Aynı namespace transaction başına bir kez artırılır."""
+        before = prefix_version('courses')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(50):
+                invalidate(prefixes=['courses'], tenants=['1'])
+
+        self.assertEqual(prefix_version('courses'), before + 1)
+
+    def test_rollback_discards_invalidation(self):
+        """Geri alınan transaction cache'i boşaltmaz."""
+        cache.set('akademi:test:course', 'cached')
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    invalidate(keys=['akademi:test:course'])
+                    raise RuntimeError('rollback')
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(cache.get('akademi:test:course'), 'cached')
+
+    def test_rolled_back_savepoint_not_merged_into_outer_batch(self):
+        """Dış batch açıkken iç savepoint'in invalidation'ı geri alınınca düşer."""
+        cache.set('akademi:test:course', 'cached')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate(keys=['akademi:test:other'])
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    invalidate(keys=['akademi:test:course'])
+                    raise RuntimeError('rollback')
+
+        self.assertEqual(cache.get('akademi:test:course'), 'cached')
+
+    def test_model_signals_batched(self):
+        """Toplu kurs kaydı 'courses' namespace'ini bir kez artırır."""
+        from backend.courses.models import Course
+        from backend.tenants.models import Tenant
+
+        before = prefix_version('courses')
+
+        # Bloktan önce açılan batch blok içindeki çağrıları da toplar;
+        # tüm kayıtlar blok içinde yapılır
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            tenant = Tenant.objects.create(name='Test Akademi', slug='test-akademi')
+            for index in range(20):
+                Course.objects.create(
+                    title=f'Course {index}',
+                    slug=f'course-{index}',
+                    description='Test course description',
+                    category='Technology',
+                    tenant=tenant,
+                )
+            self.assertEqual(prefix_version('courses'), before)
+
+        self.assertEqual(prefix_version('courses'), before + 1)
+        self.assertEqual(len([callback for callback in callbacks if isinstance(callback, InvalidationBatch)]), 1)
+
+
+@override_locmem_cache('invalidation-tests')
+class AutocommitInvalidationTest(SimpleTestCase):
+    """Transaction dışı invalidation testleri."""
+
+    def test_applied_immediately(self):
+        """Transaction dışında invalidation hemen uygulanır."""
+        cache.set('akademi:test:course', 'cached')
+        invalidate(keys=['akademi:test:course'])
+        self.assertIsNone(cache.get('akademi:test:course'))
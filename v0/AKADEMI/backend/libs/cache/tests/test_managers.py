@@ -0,0 +1,82 @@
+"""
+Cached Manager Tests
+====================
+
+Toplu cache okuma / yazma / invalidation testleri.
+"""
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from backend.libs.cache.managers import CachedManager, TenantCachedManager
+from backend.libs.cache.testing import override_locmem_cache
+
+
+def bound_manager(manager_class, model):
+    manager = manager_class()
+    manager.model = model
+    return manager
+
+
+@override_locmem_cache('cached-manager-tests')
+class CachedManagerBatchTest(TestCase):
+    """get_many_cached / invalidate_many testleri."""
+
+    @classmethod
+    def setUpTestData(cls):
+        from backend.tenants.models import Tenant
+
+        cls.tenants = [
+            Tenant.objects.create(name=f'Akademi {index}', slug=f'akademi-{index}')
+            for index in range(5)
+        ]
+
+    def setUp(self):
+        from backend.tenants.models import Tenant
+
+        cache.clear()
+        self.manager = bound_manager(CachedManager, Tenant)
+        self.pks = [tenant.pk for tenant in self.tenants]
+
+    def test_misses_loaded_with_single_query(self):
+        """Eksikler tek sorguda yüklenir, ikinci çağrı DB'ye gitmez."""
+        self.manager.get_cached(self.pks[0])
+
+        with self.assertNumQueries(1):
+            instances = self.manager.get_many_cached(self.pks)
+        self.assertEqual(set(instances), set(self.pks))
+        self.assertEqual(instances[self.pks[2]].name, 'Akademi 2')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(len(self.manager.get_many_cached(self.pks)), 5)
+
+    def test_unknown_pks_omitted(self):
+        """Bulunamayan pk'ler sonuçta yer almaz."""
+        instances = self.manager.get_many_cached([self.pks[0], 999999])
+        self.assertEqual(list(instances), [self.pks[0]])
+
+    def test_invalidate_many(self):
+        """invalidate_many key'leri siler, sonraki okuma DB'ye gider."""
+        self.manager.set_many_cached(self.tenants)
+        with self.assertNumQueries(0):
+            self.manager.get_many_cached(self.pks)
+
+        self.assertEqual(self.manager.invalidate_many(self.pks[:2]), 2)
+        with self.assertNumQueries(1):
+            self.assertEqual(len(self.manager.get_many_cached(self.pks)), 5)
+
+    def test_tenant_variant(self):
+        """Tenant key'leri birbirinden ayrıdır."""
+        from backend.tenants.models import Tenant
+
+        manager = bound_manager(TenantCachedManager, Tenant)
+        with self.assertNumQueries(1):
+            manager.get_many_cached_for_tenant(self.pks, tenant_id=1)
+        with self.assertNumQueries(0):
+            manager.get_many_cached_for_tenant(self.pks, tenant_id=1)
+        with self.assertNumQueries(1):
+            manager.get_many_cached_for_tenant(self.pks, tenant_id=2)
+
+        manager.invalidate_many_for_tenant(self.pks, tenant_id=1)
+        with self.assertNumQueries(1):
+            manager.get_many_cached_for_tenant(self.pks, tenant_id=1)
@@ -0,0 +1,146 @@
+"""
+Cache Stampede Tests
+====================
+
+Single-flight ve erken yenileme testleri.
+
+Eşzamanlı isteklerin tamamı aynı key'i kaçırdığında değerin yalnızca bir
+kez hesaplandığı doğrulanır.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase
+from rest_framework.response import Response
+
+from backend.libs.cache import stampede
+from backend.libs.cache.decorators import cache_per_tenant
+from backend.libs.cache.testing import override_locmem_cache, run_parallel
+
+
+class CountingCompute:
+    """Çağrı sayısını tutan yavaş hesaplama."""
+
+    def __init__(self, value, duration=0.2):
+        self.value = value
+        self.duration = duration
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.duration)
+        return self.value
+
+
+@override_locmem_cache('stampede-tests', DEBUG=False)
+class CacheStampedeTest(SimpleTestCase):
+    """get_or_compute testleri."""
+
+    PARALLEL = 100
+
+    def setUp(self):
+        cache.clear()
+
+    def test_single_recomputation_under_parallel_misses(self):
+        """100 eşzamanlı miss tek hesaplama yapar."""
+        compute = CountingCompute({'courses': [1, 2, 3]})
+
+        results = run_parallel(
+            lambda: stampede.get_or_compute('akademi:test:hot', compute, timeout=60),
+            self.PARALLEL,
+        )
+
+        self.assertEqual(compute.calls, 1)
+        self.assertTrue(all(result == {'courses': [1, 2, 3]} for result in results))
+        self.assertIsNone(cache.get('akademi:test:hot' + stampede.LOCK_SUFFIX))
+
+    def test_stale_value_served_while_refreshing(self):
+        """Kilit alınmışken süresi dolan değer bayat olarak döner."""
+        cache.set('akademi:test:stale', stampede.Entry('old', time.time() - 1, 0.1), 60)
+        cache.add('akademi:test:stale' + stampede.LOCK_SUFFIX, 1, 30)
+        compute = CountingCompute('new', duration=0)
+
+        value = stampede.get_or_compute('akademi:test:stale', compute, timeout=60)
+
+        self.assertEqual(value, 'old')
+        self.assertEqual(compute.calls, 0)
+
+    def test_early_refresh_before_expiry(self):
+        """Hesaplama süresi TTL'e göre uzunsa değer süresi dolmadan yenilenir."""
+        cache.set('akademi:test:early', stampede.Entry('old', time.time() + 1, 1000.0), 60)
+        compute = CountingCompute('new', duration=0)
+
+        self.assertEqual(stampede.get_or_compute('akademi:test:early', compute, timeout=60), 'new')
+        self.assertEqual(compute.calls, 1)
+
+        # beta=0: erken yenileme kapalı
+        cache.set('akademi:test:early', stampede.Entry('old', time.time() + 1, 1000.0), 60)
+        self.assertEqual(stampede.get_or_compute('akademi:test:early', compute, timeout=60, beta=0), 'old')
+        self.assertEqual(compute.calls, 1)
+
+    def test_failed_compute_releases_lock(self):
+        """Hesaplama hata verirse kilit bırakılır, değer cache'lenmez."""
+        def fail():
+            raise ValueError('boom')
+
+        with self.assertRaises(ValueError):
+            stampede.get_or_compute('akademi:test:fail', fail, timeout=60)
+
+        self.assertIsNone(cache.get('akademi:test:fail'))
+        self.assertIsNone(cache.get('akademi:test:fail' + stampede.LOCK_SUFFIX))
+
+
+@override_locmem_cache('stampede-tests', DEBUG=False)
+class CachePerTenantStampedeTest(SimpleTestCase):
+    """cache_per_tenant stampede testleri."""
+
+    PARALLEL = 100
+
+    def setUp(self):
+        cache.clear()
+
+    def test_single_view_execution_under_parallel_misses(self):
+        """100 eşzamanlı istekte view bir kez çalışır."""
+        compute = CountingCompute([{'id': 1, 'title': 'Course'}])
+
+        class CourseView:
+            @cache_per_tenant(timeout=60, key_prefix='courses')
+            def list(self, request):
+                return Response(compute())
+
+        view = CourseView()
+        factory = RequestFactory()
+        user = SimpleNamespace(id=7, tenant_id=3)
+
+        def call():
+            request = factory.get('/api/v1/courses/')
+            request.user = user
+            return view.list(request)
+
+        responses = run_parallel(call, self.PARALLEL)
+
+        self.assertEqual(compute.calls, 1)
+        self.assertTrue(all(response.status_code == 200 for response in responses))
+        self.assertTrue(all(response.data == [{'id': 1, 'title': 'Course'}] for response in responses))
+
+    def test_error_response_not_cached(self):
+        """200 olmayan response cache'lenmez."""
+        calls = []
+
+        class CourseView:
+            @cache_per_tenant(timeout=60, key_prefix='courses')
+            def list(self, request):
+                calls.append(1)
+                return Response({'detail': 'error'}, status=503)
+
+        request = RequestFactory().get('/api/v1/courses/')
+        request.user = SimpleNamespace(id=7, tenant_id=3)
+
+        self.assertEqual(CourseView().list(request).status_code, 503)
+        self.assertEqual(CourseView().list(request).status_code, 503)
+        self.assertEqual(len(calls), 2)
@@ -0,0 +1,125 @@
+"""
+Tiered Cache Tests
+==================
+
+Yerel LRU + paylaşılan cache katmanları ve worker'lar arası key bazlı
+invalidation testleri.
+"""
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from backend.libs.cache import versioning
+from backend.libs.cache.invalidation import InvalidationBatch
+from backend.libs.cache.testing import override_locmem_cache
+from backend.libs.cache.tiered import FAMILY, MAX_LOG_SPAN, TieredCache, tiered_cache
+
+
+def worker(family='test', **options):
+    """Ayrı bir worker process'inin aynı aileye bakan TieredCache'i."""
+    options.setdefault('stamp_interval', 0)
+    return TieredCache(family, **options)
+
+
+@override_locmem_cache('tiered-tests')
+class TieredCacheTest(SimpleTestCase):
+    """TieredCache okuma / yazma testleri."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_local_layer_returns_copies(self):
+        """Yerel katman her okumada bağımsız kopya döndürür."""
+        tier = worker()
+        tier.set('a', {'items': [1]})
+
+        tier.get('a')['items'].append(2)
+
+        self.assertEqual(tier.get('a'), {'items': [1]})
+
+    def test_shared_layer_fills_local(self):
+        """Yerelde olmayan değer paylaşılan katmandan okunup yerele yazılır."""
+        writer, reader = worker(), worker()
+        writer.set('a', 1)
+
+        self.assertEqual(reader.get('a'), 1)
+        cache.delete(writer.shared_key('a'))
+        self.assertEqual(reader.get('a'), 1)
+
+    def test_none_is_not_cached(self):
+        tier = worker()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return None
+
+        tier.get_or_set('missing', loader)
+        tier.get_or_set('missing', loader)
+
+        self.assertEqual(len(calls), 2)
+
+    def test_lru_is_bounded(self):
+        tier = worker(max_entries=2)
+        for key in ('a', 'b', 'c'):
+            tier.set(key, key)
+
+        self.assertEqual(len(tier.local), 2)
+        self.assertIsNone(tier.local.get('a'))
+
+    def test_tiered_cache_is_process_wide(self):
+        self.assertIs(tiered_cache('test-family'), tiered_cache('test-family'))
+
+
+@override_locmem_cache('tiered-tests')
+class TieredInvalidationTest(SimpleTestCase):
+    """Worker'lar arası invalidation testleri."""
+
+    def setUp(self):
+        cache.clear()
+        self.writer, self.reader = worker(), worker()
+        for key in ('a', 'b'):
+            self.writer.set(key, key)
+            self.reader.get(key)
+
+    def _stamp(self):
+        return versioning.get_versions([(FAMILY, 'test')])[(FAMILY, 'test')]
+
+    def test_delete_evicts_only_deleted_keys(self):
+        """Başka worker'da silinen key yerelden çıkar, diğer key'ler kalır."""
+        self.writer.delete('a')
+
+        self.assertIsNone(self.reader.get('a'))
+        self.assertIsNotNone(self.reader.local.get('b'))
+
+    def test_missing_log_clears_family(self):
+        """Günlüğü düşmüş sürüm atlanamaz; yerel aile boşaltılır."""
+        self.writer.delete('a')
+        cache.delete(self.writer.log_key(self._stamp()))
+
+        self.reader.get('a')
+
+        self.assertIsNone(self.reader.local.get('b'))
+
+    def test_far_behind_worker_clears_family(self):
+        """MAX_LOG_SPAN'dan fazla geride kalan worker günlüğü okumaz."""
+        for _ in range(MAX_LOG_SPAN + 1):
+            self.writer.delete('a')
+
+        self.reader.get('a')
+
+        self.assertIsNone(self.reader.local.get('b'))
+
+    def test_batch_bumps_family_once(self):
+        """Aynı batch'teki key'ler tek sürüm artışı ve tek günlükle silinir."""
+        before = self._stamp()
+        batch = InvalidationBatch()
+        batch.add(tiered={'test': ['a']})
+        batch.add(tiered={'test': ['b']})
+
+        batch()
+
+        self.assertEqual(self._stamp(), before + 1)
+        self.assertEqual(sorted(cache.get(self.writer.log_key(before + 1))), ['a', 'b'])
+        self.assertIsNone(self.reader.get('a'))
+        self.assertIsNone(self.reader.get('b'))
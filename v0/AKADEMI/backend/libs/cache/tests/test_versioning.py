@@ -0,0 +1,149 @@
+"""
+Cache Versioning Tests
+======================
+
+Namespace sürümleri, bump_namespaces, invalidation pattern'leri ve
+LocMem / Redis davranış eşliği testleri.
+"""
+
+import importlib.util
+import os
+from types import SimpleNamespace
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.response import Response
+
+from backend.libs.cache import versioning
+from backend.libs.cache.decorators import invalidate_cache_patterns, make_cache_key
+from backend.libs.cache.testing import override_locmem_cache
+
+REDIS_URL = os.environ.get('REDIS_URL', '')
+
+
+def version(kind, value):
+    namespace = (kind, str(value))
+    return versioning.get_versions([namespace])[namespace]
+
+
+class VersioningBehavior:
+    """Backend'den bağımsız sürüm davranışı; LocMem ve Redis'te aynı koşar."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_versions_initialized_once(self):
+        """Sürüm ilk okumada başlatılır, sonraki okumalar aynı değeri döner."""
+        first = version(versioning.TENANT, 5)
+
+        self.assertEqual(version(versioning.TENANT, 5), first)
+        self.assertEqual(cache.get(versioning.namespace_key(versioning.TENANT, 5)), first)
+
+    def test_bump_changes_keys(self):
+        """Namespace bump'ı yalnızca o namespace'i içeren key'leri değiştirir."""
+        key = make_cache_key('courses', tenant_id=5, path='/api/v1/courses/')
+        other_tenant = make_cache_key('courses', tenant_id=6, path='/api/v1/courses/')
+
+        versioning.bump_namespaces(tenants=[5])
+
+        self.assertNotEqual(make_cache_key('courses', tenant_id=5, path='/api/v1/courses/'), key)
+        self.assertEqual(make_cache_key('courses', tenant_id=6, path='/api/v1/courses/'), other_tenant)
+
+    def test_bump_unread_namespace(self):
+        """Hiç okunmamış namespace bump'ı hata vermez ve sürüm başlatır."""
+        self.assertEqual(versioning.bump([(versioning.USER, '7')]), 1)
+        self.assertIsNotNone(cache.get(versioning.namespace_key(versioning.USER, 7)))
+
+    def test_evicted_counter_starts_new_generation(self):
+        """Silinen sayaç eski nesillerin hiçbirine denk gelmeyen değerle başlar."""
+        with mock.patch('backend.libs.cache.versioning.time.time', return_value=1000.0):
+            old = version(versioning.PREFIX, 'courses')
+            versioning.bump_namespaces(prefixes=['courses'])
+
+        cache.delete(versioning.namespace_key(versioning.PREFIX, 'courses'))
+        with mock.patch('backend.libs.cache.versioning.time.time', return_value=1001.0):
+            new = version(versioning.PREFIX, 'courses')
+
+        self.assertGreater(new, old + 1)
+
+
+@override_locmem_cache('versioning-tests')
+class LocMemVersioningTest(VersioningBehavior, SimpleTestCase):
+    """LocMem backend'inde sürüm davranışı."""
+
+
+@skipUnless(REDIS_URL and importlib.util.find_spec('redis'), 'REDIS_URL veya redis paketi yok')
+@override_settings(
+    CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'versioning-tests',
+        }
+    }
+)
+class RedisVersioningTest(VersioningBehavior, SimpleTestCase):
+    """Redis backend'inde sürüm davranışı (LocMem ile aynı assertion'lar)."""
+
+
+@override_locmem_cache('versioning-tests')
+class BumpNamespacesTest(SimpleTestCase):
+    """bump_namespaces testleri."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_counts_distinct_non_empty_namespaces(self):
+        """Boş değerler atlanır, tekrar eden namespace bir kez artırılır."""
+        before = version(versioning.PREFIX, 'courses')
+
+        count = versioning.bump_namespaces(
+            prefixes=['courses', 'courses', ''], tenants=[5, None], users=[7],
+        )
+
+        self.assertEqual(count, 3)
+        self.assertEqual(version(versioning.PREFIX, 'courses'), before + 1)
+
+
+@override_locmem_cache('versioning-tests')
+class InvalidateCachePatternsTest(SimpleTestCase):
+    """invalidate_cache_patterns pattern çözümleme testleri."""
+
+    def setUp(self):
+        cache.clear()
+
+    def _mutate(self, patterns, status=201):
+        class CourseView:
+            @invalidate_cache_patterns(patterns)
+            def create(self, request):
+                return Response(status=status)
+
+        return CourseView().create(SimpleNamespace())
+
+    def test_patterns_bump_their_namespace(self):
+        """Prefix, tenant ve kullanıcı pattern'leri kendi namespace'lerini artırır."""
+        courses = version(versioning.PREFIX, 'courses')
+        tenant = version(versioning.TENANT, 5)
+        user = version(versioning.USER, 7)
+        other_tenant = version(versioning.TENANT, 6)
+
+        self._mutate(['akademi:courses:*', '*:t5:*', '*:u7:*'])
+
+        self.assertEqual(version(versioning.PREFIX, 'courses'), courses + 1)
+        self.assertEqual(version(versioning.TENANT, 5), tenant + 1)
+        self.assertEqual(version(versioning.USER, 7), user + 1)
+        self.assertEqual(version(versioning.TENANT, 6), other_tenant)
+
+    def test_failed_response_does_not_invalidate(self):
+        courses = version(versioning.PREFIX, 'courses')
+
+        self._mutate(['courses:*'], status=400)
+
+        self.assertEqual(version(versioning.PREFIX, 'courses'), courses)
+
+    def test_wildcard_namespaces_rejected(self):
+        """Wildcard namespace ve tüm keyspace'i kapsayan pattern'ler reddedilir."""
+        for pattern in ['*', '*:*', 'akademi:*', 'cour*:*', '*:t*:*', '*:u:*', '']:
+            with self.subTest(pattern=pattern), self.assertRaises(ValueError):
+                invalidate_cache_patterns([pattern])
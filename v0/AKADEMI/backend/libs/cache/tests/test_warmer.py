@@ -0,0 +1,94 @@
+"""
+Cache Warmer Tests
+==================
+
+Tenant sayfalarının view kod yolundan cache'e doldurulduğunu doğrular.
+"""
+
+from django.core.cache import cache
+from django.test import TransactionTestCase
+
+from backend.libs.cache.testing import override_locmem_cache
+from backend.libs.cache.warmer import CacheWarmer
+
+ENDPOINTS = [{'view': 'instructor:dashboard', 'roles': ['INSTRUCTOR']}]
+
+
+# Render'lar ayrı thread'lerde (ayrı DB bağlantısı) çalıştığı için
+# veriler commit edilmiş olmalıdır
+@override_locmem_cache('warmer-tests', DEBUG=False)
+class CacheWarmerTest(TransactionTestCase):
+    """Cache warmer testleri."""
+
+    def setUp(self):
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        cache.clear()
+        self.tenant = Tenant.objects.create(name='Akademi', slug='akademi')
+        self.instructors = [
+            User.objects.create_user(
+                email=f'instructor{index}@test.com', password='x',
+                tenant=self.tenant, role=User.Role.INSTRUCTOR,
+            )
+            for index in range(3)
+        ]
+        User.objects.create_user(
+            email='student@test.com', password='x',
+            tenant=self.tenant, role=User.Role.STUDENT,
+        )
+        inactive = Tenant.objects.create(name='Pasif', slug='pasif', is_active=False)
+        User.objects.create_user(
+            email='inactive@test.com', password='x',
+            tenant=inactive, role=User.Role.INSTRUCTOR,
+        )
+
+    def test_warms_active_tenant_users(self):
+        """Aktif tenant'ın ilgili roldeki kullanıcıları için render edilir."""
+        from backend.instructor.services import InstructorDashboardService
+
+        results = CacheWarmer.warm(endpoints=ENDPOINTS, concurrency=2)
+
+        self.assertEqual(
+            sorted(result.user_id for result in results),
+            sorted(instructor.pk for instructor in self.instructors),
+        )
+        self.assertTrue(all(result.ok for result in results))
+        for instructor in self.instructors:
+            self.assertIsNotNone(cache.get(InstructorDashboardService.cache_key(instructor.pk)))
+
+    def test_users_per_tenant_limit(self):
+        """Tenant başına kullanıcı sayısı sınırlanır, son giriş önceliklidir."""
+        from django.utils import timezone
+
+        latest = self.instructors[1]
+        latest.last_login = timezone.now()
+        latest.save(update_fields=['last_login'])
+
+        results = CacheWarmer.warm(endpoints=ENDPOINTS, users_per_tenant=1)
+
+        self.assertEqual([result.user_id for result in results], [latest.pk])
+
+    def test_unresolvable_view_skipped(self):
+        """Çözümlenemeyen view atlanır."""
+        results = CacheWarmer.warm(endpoints=[{'view': 'missing:view'}])
+        self.assertEqual(results, [])
+
+    def test_catalog_warmed_for_students(self):
+        """Kurs kataloğu ısıtıldıktan sonra aynı kullanıcı için sorgusuz döner."""
+        from backend.courses.models import Course
+
+        Course.objects.create(
+            title='Course', slug='course', description='Test course description',
+            category='Technology', tenant=self.tenant, status=Course.Status.PUBLISHED,
+        )
+        endpoints = [{'view': 'courses:course-list', 'roles': ['STUDENT']}]
+
+        results = CacheWarmer.warm(endpoints=endpoints)
+        self.assertTrue(all(result.ok for result in results))
+
+        job = CacheWarmer.build_jobs(
+            [self.tenant.pk], CacheWarmer.resolve_endpoints(endpoints), users_per_tenant=1,
+        )[0]
+        with self.assertNumQueries(0):
+            self.assertEqual(CacheWarmer.render(job).status, 200)
@@ -0,0 +1,237 @@
+"""
+Tiered Cache
+============
+
+Sık okunan referans veriler (kullanıcı, tenant, kurs yapısı) için iki
+katmanlı cache:
+
+    1. Process içi sınırlı LRU (mikrosaniye)
+    2. Paylaşılan cache (Redis / LocMem)
+
+Her key ailesinin (family) kendi TTL'leri ve LRU boyutu vardır
+(`TIERED_CACHE_FAMILIES` ayarı). Worker'lar arası invalidation aile sürüm
+damgası ve silme günlüğü ile yapılır: `delete()` paylaşılan key'leri siler,
+ailenin sürümünü artırır (çağrı başına tek INCR, bkz: versioning) ve yeni
+sürüme silinen key'leri yazar. Her worker damgayı en fazla `stamp_interval`
+saniyede bir okur; aradaki sürümlerin günlüklerini tek get_many ile alır
+ve yalnızca o key'leri yerelden çıkarır. Günlük eksikse (evict, çok geride
+kalmış worker) yerel aile tamamen boşaltılır. Böylece başka worker'daki
+değişiklik en geç `stamp_interval` içinde görünür ve tek bir key'in
+silinmesi ailenin geri kalanını soğutmaz.
+
+Yerel katman değerleri pickle'lanmış saklar; her okuma bağımsız bir kopya
+döndürür (model instance'ları istekler arasında paylaşılmaz).
+
+Kullanım:
+    from backend.libs.cache.tiered import tiered_cache
+
+    tenants = tiered_cache('tenant')
+    tenant = tenants.get_or_set(tenant_id, lambda: Tenant.objects.filter(pk=tenant_id).first())
+    tenants.delete(tenant_id)
+"""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from backend.libs.metrics import record_cache
+
+from . import versioning
+
+# Aile sürüm damgası namespace türü
+FAMILY = 'family'
+
+DEFAULTS = {
+    'timeout': 300,  # Paylaşılan katman TTL
+    'local_timeout': 30,  # Yerel katman TTL
+    'max_entries': 1000,  # Yerel LRU boyutu
+    'stamp_interval': 1.0,  # Sürüm damgası kontrol aralığı (saniye)
+}
+
+# Bundan fazla sürüm geride kalan worker günlüğü okumaz, yerel aileyi boşaltır
+MAX_LOG_SPAN = 64
+
+
+class LocalLRU:
+    """
+    Thread-safe, süreli, sınırlı LRU.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            blob, expires = entry
+            if expires <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return blob
+
+    def set(self, key, blob: bytes, timeout: float) -> None:
+        with self._lock:
+            self._data[key] = (blob, time.monotonic() + timeout)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TieredCache:
+    """
+    Process içi LRU + paylaşılan cache.
+    """
+
+    def __init__(
+        self,
+        family: str,
+        timeout: int = DEFAULTS['timeout'],
+        local_timeout: int = DEFAULTS['local_timeout'],
+        max_entries: int = DEFAULTS['max_entries'],
+        stamp_interval: float = DEFAULTS['stamp_interval'],
+    ):
+        self.family = family
+        self.timeout = timeout
+        self.local_timeout = local_timeout
+        self.stamp_interval = stamp_interval
+        self.local = LocalLRU(max_entries)
+        self._stamp = None
+        self._stamp_checked_at = float('-inf')
+
+    def shared_key(self, key) -> str:
+        return f"akademi:tier:{self.family}:{key}"
+
+    def log_key(self, stamp: int) -> str:
+        """Sürümde silinen key'lerin günlüğü."""
+        return f"akademi:tierlog:{self.family}:{stamp}"
+
+    # =========================================================================
+    # SÜRÜM DAMGASI
+    # =========================================================================
+
+    def _sync_stamp(self) -> None:
+        """Aile damgası değiştiyse yerel katmanı boşalt (en fazla aralıkta bir)."""
+        now = time.monotonic()
+        if now - self._stamp_checked_at < self.stamp_interval:
+            return
+
+        namespace = (FAMILY, self.family)
+        stamp = versioning.get_versions([namespace])[namespace]
+        if stamp != self._stamp:
+            self._evict_logged(self._stamp, stamp)
+            self._stamp = stamp
+        self._stamp_checked_at = now
+
+    def _evict_logged(self, old: Optional[int], new: int) -> None:
+        """(old, new] sürümlerinde silinen key'leri yerelden çıkar."""
+        if old is None or not 0 < new - old <= MAX_LOG_SPAN:
+            self.local.clear()
+            return
+
+        logs = cache.get_many([self.log_key(stamp) for stamp in range(old + 1, new + 1)])
+        if len(logs) != new - old:
+            # Günlük henüz yazılmadı veya düştü: hangi key'lerin değiştiği bilinmiyor
+            self.local.clear()
+            return
+
+        for keys in logs.values():
+            for key in keys:
+                self.local.delete(key)
+
+    # =========================================================================
+    # OKUMA / YAZMA
+    # =========================================================================
+
+    def get(self, key, default=None) -> Any:
+        self._sync_stamp()
+
+        blob = self.local.get(key)
+        if blob is not None:
+            record_cache(hits=1)
+            return pickle.loads(blob)
+
+        value = cache.get(self.shared_key(key))
+        if value is None:
+            record_cache(misses=1)
+            return default
+
+        record_cache(hits=1)
+        self._set_local(key, value)
+        return value
+
+    def get_or_set(self, key, loader: Callable[[], Any], timeout: Optional[int] = None) -> Any:
+        """
+        Cache'ten al, yoksa loader ile yükle ve iki katmana yaz.
+
+        Loader None dönerse cache'lenmez.
+        """
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            if value is not None:
+                self.set(key, value, timeout)
+        return value
+
+    def set(self, key, value, timeout: Optional[int] = None) -> None:
+        cache.set(self.shared_key(key), value, timeout or self.timeout)
+        self._set_local(key, value)
+
+    def _set_local(self, key, value) -> None:
+        self.local.set(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), self.local_timeout)
+
+    def delete(self, *keys) -> None:
+        """Key'leri iki katmandan sil; diğer worker'lar yalnızca bu key'leri yerelden çıkarır."""
+        keys = [key for key in keys if key is not None]
+        if not keys:
+            return
+        cache.delete_many([self.shared_key(key) for key in keys])
+        stamp = versioning.increment((FAMILY, self.family))
+        # Yerel değerler local_timeout'tan uzun yaşamaz; günlük de o kadar yeter
+        cache.set(self.log_key(stamp), keys, int(self.local_timeout + self.stamp_interval) + 1)
+        for key in keys:
+            self.local.delete(key)
+
+    def clear_local(self) -> None:
+        self.local.clear()
+
+
+_families: Dict[str, TieredCache] = {}
+_families_lock = threading.Lock()
+
+
+def tiered_cache(family: str) -> TieredCache:
+    """
+    Aile için process geneli TieredCache.
+
+    Ayarlar `TIERED_CACHE_FAMILIES[family]` ile DEFAULTS üzerine yazılır.
+    """
+    instance = _families.get(family)
+    if instance is None:
+        with _families_lock:
+            instance = _families.get(family)
+            if instance is None:
+                options = dict(DEFAULTS)
+                options.update(getattr(settings, 'TIERED_CACHE_FAMILIES', {}).get(family, {}))
+                instance = _families[family] = TieredCache(family, **options)
+    return instance
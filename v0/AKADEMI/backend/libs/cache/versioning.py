@@ -0,0 +1,125 @@
+"""
+Cache Namespace Versions
+========================
+
+Generation-counter tabanlı toplu cache invalidation.
+
+`make_cache_key` key'e kaynak (prefix), tenant ve kullanıcı namespace'lerinin
+güncel sürümlerini ekler. Bir namespace'i invalidate etmek sürümü bir
+artırmaktır (tek INCR); eski sürümlü key'ler bir daha okunmaz ve TTL ile
+düşer. Keyspace taraması (delete_pattern / SCAN) gerekmez, LocMem ve Redis
+aynı şekilde çalışır.
+
+Sürüm key'leri süresizdir ve zaman tabanlı (ms) başlatılır: sayaç silinir
+veya evict edilirse yeni değer eski nesillerin hiçbirine denk gelmez.
+
+Kullanım:
+    from backend.libs.cache.versioning import bump_namespaces
+
+    bump_namespaces(prefixes=['courses'], tenants=[tenant.id])
+    bump_namespaces(users=[user.id])
+"""
+
+import logging
+import time
+from typing import Dict, Iterable, Tuple
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+VERSION_PREFIX = 'akademi:ns'
+
+PREFIX = 'prefix'
+TENANT = 'tenant'
+USER = 'user'
+
+Namespace = Tuple[str, str]
+
+
+def namespace_key(kind: str, value) -> str:
+    """Namespace sürüm key'i (örn: akademi:ns:tenant:5)."""
+    return f"{VERSION_PREFIX}:{kind}:{value}"
+
+
+def _initial_version() -> int:
+    return int(time.time() * 1000)
+
+
+def get_versions(namespaces: Iterable[Namespace]) -> Dict[Namespace, int]:
+    """
+    Namespace'lerin güncel sürümleri (tek get_many).
+
+    Sürümü olmayan namespace başlatılır.
+    """
+    keys = {namespace: namespace_key(*namespace) for namespace in namespaces}
+    if not keys:
+        return {}
+
+    found = cache.get_many(list(keys.values()))
+    versions = {}
+    for namespace, key in keys.items():
+        version = found.get(key)
+        if version is None:
+            version = _initial_version()
+            if not cache.add(key, version, None):
+                # Eşzamanlı başlatıldı
+                version = cache.get(key, version)
+        versions[namespace] = version
+    return versions
+
+
+def increment(namespace: Namespace) -> int:
+    """
+    Tek namespace'in sürümünü artır (tek INCR).
+
+    Returns:
+        Yeni sürüm
+    """
+    key = namespace_key(*namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Hiç okunmamış / evict edilmiş: yeni nesil ile başlat
+        version = _initial_version()
+        if cache.add(key, version, None):
+            return version
+        return cache.incr(key)
+
+
+def bump(namespaces: Iterable[Namespace]) -> int:
+    """
+    Namespace sürümlerini artır (namespace başına tek INCR).
+
+    Returns:
+        Artırılan namespace sayısı
+    """
+    count = 0
+    for namespace in set(namespaces):
+        increment(namespace)
+        count += 1
+    return count
+
+
+def bump_namespaces(
+    prefixes: Iterable[str] = (),
+    tenants: Iterable = (),
+    users: Iterable = (),
+) -> int:
+    """
+    Kaynak, tenant ve kullanıcı namespace'lerini invalidate et.
+
+    Args:
+        prefixes: make_cache_key prefix'leri (örn: 'courses')
+        tenants: Tenant ID'leri
+        users: Kullanıcı ID'leri
+
+    Returns:
+        Artırılan namespace sayısı
+    """
+    namespaces = [(PREFIX, prefix) for prefix in prefixes if prefix]
+    namespaces += [(TENANT, str(pk)) for pk in tenants if pk]
+    namespaces += [(USER, str(pk)) for pk in users if pk]
+    count = bump(namespaces)
+    logger.debug(f"Cache namespaces bumped: {count}")
+    return count
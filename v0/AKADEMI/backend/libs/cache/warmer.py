@@ -0,0 +1,251 @@
+"""
+Cache Warmer
+============
+
+Aktif tenant'ların en çok ziyaret edilen sayfalarını (dashboard, takvim
+...) trafik gelmeden önce cache'e doldurur.
+
+Sayfalar gerçek istekteki kod yolundan render edilir: URL resolver →
+DRF view (authentication, permission) → cache_per_tenant / servis
+cache'i. Böylece üretilen key'ler ve değerler bir kullanıcının isteğiyle
+birebir aynıdır. cache_per_tenant key'leri kullanıcı bazlı olduğundan her
+endpoint, tenant'ın ilgili roldeki en son giriş yapmış
+`users_per_tenant` kullanıcısı için ısıtılır.
+
+Taze cache kaydı olan sayfalar cache'ten döner (ek sorgu yok); yalnızca
+düşmüş / bayatlamış kayıtlar yeniden hesaplanır. DB'yi boğmamak için
+render'lar en fazla `concurrency` thread ile paralel çalışır.
+
+Yalnızca parametresiz (reverse edilebilen) view'lar ısıtılır; kurs
+kataloğu (courses:course-list) ısıtılır, kurs detayı / müfredat
+(courses:course-detail) kurs başına path gerektirdiği için ilk istekte
+cache'e girer.
+
+Endpoint listesi ayardan gelir. Metrik deposu (backend.libs.metrics)
+process içi olduğundan warmer'ı çalıştıran worker'da web trafiğinin
+sayaçları bulunmaz; liste bu yüzden en çok ziyaret edilen sayfalara göre
+(Prometheus `akademi_http_requests_total`) elle tutulur.
+
+Ayarlar:
+    CACHE_WARMER = {
+        'endpoints': [
+            {'view': 'instructor:dashboard', 'roles': ['INSTRUCTOR']},
+            {'view': 'instructor:calendar-list', 'roles': ['INSTRUCTOR'], 'query': ''},
+            {'view': 'courses:course-list', 'roles': ['STUDENT', 'INSTRUCTOR']},
+        ],
+        'users_per_tenant': 20,
+        'concurrency': 4,
+    }
+
+Kullanım:
+    from backend.libs.cache.warmer import CacheWarmer
+
+    results = CacheWarmer.warm(tenant_ids=[1, 2])
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'endpoints': [],
+    'users_per_tenant': 20,
+    'concurrency': 4,
+}
+
+
+class WarmJob(NamedTuple):
+    """Tek kullanıcı için render edilecek sayfa."""
+
+    tenant_id: int
+    view: str
+    path: str
+    query: str
+    user: object
+
+
+class WarmResult(NamedTuple):
+    """Render sonucu."""
+
+    tenant_id: int
+    view: str
+    user_id: int
+    status: Optional[int]
+    duration: float
+    error: str = ''
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and self.status < 400
+
+
+class CacheWarmer:
+    """
+    Tenant sayfası cache ısıtıcısı.
+    """
+
+    @classmethod
+    def get_options(cls) -> Dict:
+        return {**DEFAULTS, **getattr(settings, 'CACHE_WARMER', {})}
+
+    # =========================================================================
+    # HEDEFLER
+    # =========================================================================
+
+    @classmethod
+    def active_tenant_ids(cls, tenant_ids: Optional[Iterable] = None) -> List[int]:
+        """Isıtılacak aktif tenant'lar."""
+        from backend.tenants.models import Tenant
+
+        queryset = Tenant.objects.filter(is_active=True)
+        if tenant_ids:
+            queryset = queryset.filter(pk__in=list(tenant_ids))
+        return list(queryset.order_by('pk').values_list('pk', flat=True))
+
+    @classmethod
+    def resolve_endpoints(cls, endpoints: Iterable[Dict]) -> List[Dict]:
+        """
+        Endpoint tanımlarının path'lerini çözümle.
+
+        Yalnızca parametresiz (reverse edilebilen) view'lar ısıtılabilir;
+        çözülemeyenler loglanıp atlanır.
+        """
+        from django.urls import NoReverseMatch, reverse
+
+        resolved = []
+        for endpoint in endpoints:
+            try:
+                path = reverse(endpoint['view'])
+            except NoReverseMatch:
+                logger.warning(f"Cache warmer: view çözümlenemedi: {endpoint['view']}")
+                continue
+            resolved.append({
+                'view': endpoint['view'],
+                'path': path,
+                'query': endpoint.get('query', ''),
+                'roles': list(endpoint.get('roles') or []),
+            })
+        return resolved
+
+    @classmethod
+    def build_jobs(
+        cls,
+        tenant_ids: List[int],
+        endpoints: List[Dict],
+        users_per_tenant: int,
+    ) -> List[WarmJob]:
+        """
+        Tenant × endpoint × kullanıcı işleri.
+
+        Kullanıcılar tenant ve rol kümesi başına tek sorguyla, son girişe
+        göre seçilir.
+        """
+        from django.db.models import F
+
+        from backend.users.models import User
+
+        users_by_roles = {}
+        jobs = []
+        for tenant_id in tenant_ids:
+            for endpoint in endpoints:
+                roles = tuple(sorted(endpoint['roles']))
+                key = (tenant_id, roles)
+                if key not in users_by_roles:
+                    queryset = User.objects.filter(tenant_id=tenant_id, is_active=True)
+                    if roles:
+                        queryset = queryset.filter(role__in=roles)
+                    users_by_roles[key] = list(
+                        queryset.select_related('tenant')
+                        .order_by(F('last_login').desc(nulls_last=True), 'pk')[:users_per_tenant]
+                    )
+                jobs.extend(
+                    WarmJob(tenant_id, endpoint['view'], endpoint['path'], endpoint['query'], user)
+                    for user in users_by_roles[key]
+                )
+        return jobs
+
+    # =========================================================================
+    # RENDER
+    # =========================================================================
+
+    @classmethod
+    def render(cls, job: WarmJob) -> WarmResult:
+        """
+        Sayfayı kullanıcı adına view kod yolundan render et.
+
+        Her thread kendi DB bağlantısını açar; iş bitince kapatılır.
+        """
+        from django.db import connection
+        from django.urls import resolve
+        from rest_framework.test import APIRequestFactory, force_authenticate
+
+        start = time.perf_counter()
+        try:
+            match = resolve(job.path)
+            request = APIRequestFactory().get(job.path, data=job.query or None)
+            force_authenticate(request, user=job.user)
+            response = match.func(request, *match.args, **match.kwargs)
+            return WarmResult(
+                job.tenant_id, job.view, job.user.pk,
+                response.status_code, time.perf_counter() - start,
+            )
+        except Exception as e:
+            logger.warning(f"Cache warmer: {job.view} (user={job.user.pk}) başarısız: {e}")
+            return WarmResult(
+                job.tenant_id, job.view, job.user.pk,
+                None, time.perf_counter() - start, str(e),
+            )
+        finally:
+            connection.close()
+
+    @classmethod
+    def warm(
+        cls,
+        tenant_ids: Optional[Iterable] = None,
+        endpoints: Optional[Iterable[Dict]] = None,
+        users_per_tenant: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> List[WarmResult]:
+        """
+        Aktif tenant'ların sayfalarını ısıt.
+
+        Args:
+            tenant_ids: Yalnızca bu tenant'lar (varsayılan: tüm aktifler)
+            endpoints: Endpoint tanımları (varsayılan: CACHE_WARMER ayarı)
+            users_per_tenant: Tenant ve endpoint başına kullanıcı sayısı
+            concurrency: Paralel render sayısı (DB bağlantısı üst sınırı)
+
+        Returns:
+            İş başına WarmResult listesi
+        """
+        from backend.tenants.cache import TenantCache
+
+        options = cls.get_options()
+        endpoints = cls.resolve_endpoints(options['endpoints'] if endpoints is None else endpoints)
+        users_per_tenant = users_per_tenant or options['users_per_tenant']
+        concurrency = max(1, concurrency or options['concurrency'])
+
+        tenant_ids = cls.active_tenant_ids(tenant_ids)
+        # Tenant referans verisi her render'da okunur; önce doldurulur
+        for tenant_id in tenant_ids:
+            TenantCache.get(tenant_id)
+            TenantCache.get_settings(tenant_id)
+
+        jobs = cls.build_jobs(tenant_ids, endpoints, users_per_tenant)
+        if not jobs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='cache-warmer') as executor:
+            results = list(executor.map(cls.render, jobs))
+
+        failed = sum(1 for result in results if not result.ok)
+        logger.info(
+            f"Cache warmer: {len(tenant_ids)} tenants, {len(results)} pages, "
+            f"{failed} failed, {sum(result.duration for result in results):.2f}s render"
+        )
+        return results
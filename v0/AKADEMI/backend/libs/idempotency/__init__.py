@@ -4,12 +4,17 @@ Idempotency Support
 
 Idempotent API endpoint'leri için middleware ve decorator'lar.
 Progress update ve event ingestion gibi kritik işlemler için.
+
+Kayıtlar takılabilir store'larda tutulur (cache veya kalıcı tablo,
+bkz: stores).
 """
 
 from .decorators import idempotent
 from .middleware import IdempotencyMiddleware
+from .stores import get_store
 
 __all__ = [
+    'get_store',
     'idempotent',
     'IdempotencyMiddleware',
 ]
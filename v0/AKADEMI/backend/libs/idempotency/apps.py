@@ -0,0 +1,12 @@
+"""Idempotency App Configuration."""
+
+from django.apps import AppConfig
+
+
+class IdempotencyConfig(AppConfig):
+    """Idempotency app configuration (kalıcı kayıt tablosu)."""
+    
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'backend.libs.idempotency'
+    label = 'idempotency'
+    verbose_name = 'Idempotency'
@@ -0,0 +1,138 @@
+"""
+Idempotency Store Benchmarks
+============================
+
+Store başına throughput ölçümü (bkz: `idempotency_benchmark` komutu).
+
+Her store için reservation.execute üzerinden iki senaryo ölçülür:
+    fresh   Yeni key: rezervasyon + sonuç yazma (ilk istek)
+    replay  Var olan key: kaydın okunup tekrar oynatılması (tekrar istek)
+
+Ayrıca örnek progress response'u için saklanan kayıt boyutu raporlanır.
+Karşılaştırma için codec'siz (pickle) cache store'u da ölçülür.
+"""
+
+import pickle
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.db import connection
+
+from . import reservation
+from .stores import DONE, CacheStore, DatabaseStore, IdempotencyStore, get_store
+
+# Benchmark kayıtlarının ömrü (saniye)
+KEY_TIMEOUT = 900
+
+# PUT /progress/ response'u
+SAMPLE_RESPONSE = {
+    'content_id': 123,
+    'watched_seconds': 1210,
+    'last_position_seconds': 455,
+    'completion_ratio': 0.62,
+    'is_completed': False,
+    'preferred_speed': 1.25,
+    'preferred_caption_lang': 'tr',
+    'updated_at': '2025-12-26T10:05:11Z',
+}
+
+
+def throughput(func: Callable[[int], None], operations: int, threads: int = 1) -> Dict[str, float]:
+    """
+    func(index)'i `operations` kez `threads` thread'de çalıştır.
+
+    Returns:
+        Saniyedeki işlem sayısı ve ms cinsinden gecikme dağılımı
+    """
+    def worker(indexes: range) -> List[float]:
+        samples = []
+        try:
+            for index in indexes:
+                start = time.perf_counter()
+                func(index)
+                samples.append((time.perf_counter() - start) * 1000)
+        finally:
+            if threads > 1:
+                connection.close()
+        return samples
+
+    chunk = -(-operations // threads)
+    chunks = [range(start, min(start + chunk, operations)) for start in range(0, operations, chunk)]
+
+    start = time.perf_counter()
+    if threads > 1:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            samples = [sample for part in executor.map(worker, chunks) for sample in part]
+    else:
+        samples = worker(range(operations))
+    elapsed = time.perf_counter() - start
+
+    samples.sort()
+    return {
+        'opsPerSec': round(len(samples) / elapsed, 1),
+        'p50': round(statistics.median(samples), 4),
+        'p99': round(samples[min(len(samples) - 1, int(len(samples) * 0.99))], 4),
+    }
+
+
+def record_bytes(store: IdempotencyStore, fingerprint: str, record: Dict) -> Optional[int]:
+    """Saklanan kaydın boyutu (cache: backend'e giden değer, DB: response kolonu)."""
+    if isinstance(store, CacheStore):
+        value = store._encode(DONE, fingerprint, record['status'], record['data'])
+        return len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+    if isinstance(store, DatabaseStore):
+        return len(store.codec.encode(record['data']))
+    return None
+
+
+def cleanup(store: IdempotencyStore, keys: List[str]) -> None:
+    if isinstance(store, CacheStore):
+        store.cache.delete_many(keys)
+    elif isinstance(store, DatabaseStore):
+        hashes = [store.hash_key(key) for key in keys]
+        for start in range(0, len(hashes), 500):
+            store.records.filter(key__in=hashes[start:start + 500]).delete()
+
+
+def store_candidates(names: Optional[List[str]] = None) -> Dict[str, IdempotencyStore]:
+    """Ayarlardaki store'lar + codec'siz cache store'u."""
+    candidates = {'cache-pickle': CacheStore()}
+    for name in getattr(settings, 'IDEMPOTENCY_STORES', {}):
+        candidates[name] = get_store(name)
+    if names:
+        candidates = {name: store for name, store in candidates.items() if name in names}
+    return candidates
+
+
+def run_stores(operations: int = 2000, threads: int = 1, names: Optional[List[str]] = None) -> Dict:
+    """Store başına fresh / replay throughput ve kayıt boyutu."""
+    fingerprint = reservation.fingerprint('PUT', '/api/v1/benchmark/progress/')
+    record = {'status': 200, 'data': SAMPLE_RESPONSE}
+
+    results = {}
+    for name, store in store_candidates(names).items():
+        prefix = f"idempotency:benchmark:{uuid.uuid4().hex[:8]}"
+        keys = [f"{prefix}:{index}" for index in range(operations)]
+
+        def execute(index, store=store):
+            reservation.execute(
+                keys[index], fingerprint,
+                lambda: record, lambda response: response,
+                KEY_TIMEOUT, store=store,
+            )
+
+        try:
+            results[name] = {
+                'store': type(store).__name__,
+                'bytes': record_bytes(store, fingerprint, record),
+                'fresh': throughput(execute, operations, threads),
+                'replay': throughput(execute, operations, threads),
+            }
+        finally:
+            cleanup(store, keys)
+
+    return results
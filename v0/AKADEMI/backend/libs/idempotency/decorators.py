@@ -8,24 +8,47 @@ View ve ViewSet method'ları için idempotency decorator'ları.
 import hashlib
 import json
 from functools import wraps
-from django.core.cache import cache
 from rest_framework.response import Response
 
+from . import reservation
+from .stores import get_store
 
-def idempotent(timeout=3600, key_prefix='idempotent'):
+
+def _serialize(response):
+    """Başarılı response'u kayda çevir (başarısızlar kaydedilmez)."""
+    if 200 <= response.status_code < 300:
+        return {
+            'data': response.data,
+            'status': response.status_code,
+        }
+    return None
+
+
+def idempotent(timeout=3600, key_prefix='idempotent', store=None):
     """
     Idempotent endpoint decorator.
     
     Aynı Idempotency-Key ile gelen istekleri cache'den döndürür.
+    Eşzamanlı tekrarlarda view yalnızca bir kez çalışır; diğerleri ilk
+    sonucu bekler (bkz: reservation). Key farklı gövdeyle yeniden
+    kullanılırsa 422 döner.
+    
+    Kayıtlar varsayılan olarak cache'te tutulur; cache eviction'ında
+    tekrarı veri bozan endpoint'ler için kalıcı store seçilebilir.
     
     Kullanım:
         @idempotent(timeout=3600)
         def create(self, request, *args, **kwargs):
             ...
+        
+        @idempotent(timeout=3600, store='durable')
+        def put(self, request, *args, **kwargs):
+            ...
     
     Args:
         timeout: Cache süresi (saniye), default 1 saat
         key_prefix: Cache key prefix'i
+        store: IDEMPOTENCY_STORES anahtarı (default: 'default')
     """
     def decorator(func):
         @wraps(func)
@@ -41,30 +64,30 @@ def idempotent(timeout=3600, key_prefix='idempotent'):
             user_id = getattr(request.user, 'id', 'anonymous')
             cache_key = f"{key_prefix}:{user_id}:{idempotency_key}"
             
-            # Cache'de var mı kontrol et
-            cached_response = cache.get(cache_key)
-            if cached_response:
-                return Response(
-                    data=cached_response['data'],
-                    status=cached_response['status'],
-                    headers={'X-Idempotent-Replayed': 'true'}
-                )
-            
-            # İşlemi gerçekleştir
-            response = func(self, request, *args, **kwargs)
+            # Gövde parse edilmiş data üzerinden (stream tekrar okunamaz)
+            body = json.dumps(request.data, sort_keys=True, default=str).encode()
+            request_fingerprint = reservation.fingerprint(request.method, request.path, body)
             
-            # Başarılı response'ları cache'le
-            if 200 <= response.status_code < 300:
-                cache.set(
+            try:
+                result = reservation.execute(
                     cache_key,
-                    {
-                        'data': response.data,
-                        'status': response.status_code,
-                    },
-                    timeout=timeout
+                    request_fingerprint,
+                    lambda: func(self, request, *args, **kwargs),
+                    _serialize,
+                    timeout,
+                    store=get_store(store),
                 )
+            except reservation.IdempotencyError as e:
+                headers = {'Retry-After': str(e.retry_after)} if e.retry_after else None
+                return Response({'detail': e.detail}, status=e.status_code, headers=headers)
             
-            return response
+            if result.replayed:
+                return Response(
+                    data=result.record['data'],
+                    status=result.record['status'],
+                    headers={'X-Idempotent-Replayed': 'true'}
+                )
+            return result.response
         return wrapper
     return decorator
 
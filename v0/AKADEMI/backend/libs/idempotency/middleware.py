@@ -6,12 +6,16 @@ Global idempotency kontrolü için middleware.
 Belirli endpoint'lerde otomatik çalışır.
 """
 
+import hashlib
 import json
 import logging
-from django.core.cache import cache
+from fnmatch import fnmatchcase
 from django.http import JsonResponse
 from django.conf import settings
 
+from . import reservation
+from .stores import get_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,19 +24,36 @@ class IdempotencyMiddleware:
     Idempotency middleware.
     
     POST/PUT/PATCH isteklerinde Idempotency-Key header'ını kontrol eder.
-    Aynı key ile gelen istekleri cache'den döndürür.
+    Aynı key ile gelen istekleri cache'den döndürür. Eşzamanlı tekrarlarda
+    view yalnızca bir kez çalışır (bkz: reservation); key farklı gövdeyle
+    yeniden kullanılırsa 422 döner.
     
     Settings:
-        IDEMPOTENCY_PATHS: İzlenecek path prefix'leri
+        IDEMPOTENCY_PATHS: İzlenecek path prefix'leri. Liste (varsayılan
+            store) veya {prefix: store adı | {'store', 'timeout'}} sözlüğü;
+            prefix'ler `*` joker karakteri içerebilir, ilk eşleşen kullanılır:
+                {
+                    '/api/v1/courses/*/progress/': {'store': 'durable', 'timeout': 30},
+                    '/api/v1/courses/': 'default',
+                }
+        IDEMPOTENCY_STORES: Store tanımları (bkz: stores)
         IDEMPOTENCY_TIMEOUT: Cache süresi (default: 3600)
+        IDEMPOTENCY_RESERVATION: In-flight işareti / bekleme ayarları
     """
     
     def __init__(self, get_response):
         self.get_response = get_response
-        self.paths = getattr(settings, 'IDEMPOTENCY_PATHS', [
+        paths = getattr(settings, 'IDEMPOTENCY_PATHS', [
             '/api/v1/courses/',  # Progress, events, sessions
         ])
+        if not isinstance(paths, dict):
+            paths = dict.fromkeys(paths, 'default')
         self.timeout = getattr(settings, 'IDEMPOTENCY_TIMEOUT', 3600)
+        # Joker içermeyen prefix'ler için de aynı eşleştirme
+        self.paths = [
+            (prefix if prefix.endswith('*') else prefix + '*', self._route(route))
+            for prefix, route in paths.items()
+        ]
         self.methods = ['POST', 'PUT', 'PATCH']
     
     def __call__(self, request):
@@ -41,8 +62,10 @@ class IdempotencyMiddleware:
             return self.get_response(request)
         
         # Sadece belirli path'ler için
-        if not any(request.path.startswith(p) for p in self.paths):
+        route = self._match(request.path)
+        if route is None:
             return self.get_response(request)
+        store, timeout = route
         
         # Idempotency-Key header'ını kontrol et
         idempotency_key = request.headers.get('Idempotency-Key')
@@ -50,43 +73,89 @@ class IdempotencyMiddleware:
             return self.get_response(request)
         
         # Cache key oluştur
-        user_id = getattr(request.user, 'id', 'anonymous') if hasattr(request, 'user') else 'anonymous'
-        cache_key = f"idempotency:{request.path}:{user_id}:{idempotency_key}"
+        cache_key = f"idempotency:{request.path}:{self._client(request)}:{idempotency_key}"
+        request_fingerprint = reservation.fingerprint(request.method, request.path, self._body(request))
+        
+        try:
+            result = reservation.execute(
+                cache_key,
+                request_fingerprint,
+                lambda: self.get_response(request),
+                self._serialize,
+                timeout,
+                store=get_store(store),
+            )
+        except reservation.IdempotencyError as e:
+            response = JsonResponse({'detail': e.detail}, status=e.status_code)
+            if e.retry_after:
+                response['Retry-After'] = str(e.retry_after)
+            return response
         
-        # Cache'de var mı kontrol et
-        cached = cache.get(cache_key)
-        if cached:
+        if result.replayed:
             logger.debug(f"Idempotent replay: {cache_key}")
             response = JsonResponse(
-                cached['data'],
-                status=cached['status'],
+                result.record['data'],
+                status=result.record['status'],
+                safe=False,
             )
             response['X-Idempotent-Replayed'] = 'true'
             return response
         
-        # Normal işlem
-        response = self.get_response(request)
-        
-        # Başarılı response'ları cache'le
-        if 200 <= response.status_code < 300:
-            try:
-                if hasattr(response, 'data'):
-                    data = response.data
-                elif hasattr(response, 'content'):
-                    data = json.loads(response.content.decode())
-                else:
-                    data = {}
-                
-                cache.set(
-                    cache_key,
-                    {
-                        'data': data,
-                        'status': response.status_code,
-                    },
-                    timeout=self.timeout
-                )
-            except Exception as e:
-                logger.warning(f"Idempotency cache failed: {e}")
+        return result.response
+    
+    def _route(self, route):
+        """IDEMPOTENCY_PATHS değeri → (store adı, timeout)."""
+        if isinstance(route, dict):
+            return route.get('store', 'default'), route.get('timeout', self.timeout)
+        return route, self.timeout
+    
+    def _match(self, path):
+        """Path'in (store adı, timeout) çifti (izlenmeyen path: None)."""
+        for pattern, route in self.paths:
+            if fnmatchcase(path, pattern):
+                return route
+        return None
+    
+    @staticmethod
+    def _client(request) -> str:
+        """
+        Key sahibi.
         
-        return response
-
+        JWT, DRF view'ında doğrulandığı için middleware'de request.user
+        çoğunlukla anonimdir; bu durumda Authorization header'ının hash'i
+        kullanılır (farklı kullanıcıların key'leri çakışmaz).
+        """
+        user = getattr(request, 'user', None)
+        if user is not None and getattr(user, 'is_authenticated', False):
+            return str(user.id)
+        authorization = request.headers.get('Authorization')
+        if authorization:
+            return hashlib.sha256(authorization.encode()).hexdigest()[:16]
+        return 'anonymous'
+    
+    @staticmethod
+    def _body(request) -> bytes:
+        # Multipart gövde (dosya yükleme) belleğe okunmaz
+        if request.content_type == 'multipart/form-data':
+            return request.headers.get('Content-Length', '').encode()
+        return request.body
+    
+    @staticmethod
+    def _serialize(response):
+        """Başarılı response'u kayda çevir (başarısızlar kaydedilmez)."""
+        if not 200 <= response.status_code < 300:
+            return None
+        try:
+            if hasattr(response, 'data'):
+                data = response.data
+            elif hasattr(response, 'content'):
+                data = json.loads(response.content.decode())
+            else:
+                data = {}
+        except Exception as e:
+            logger.warning(f"Idempotency cache failed: {e}")
+            return None
+        return {
+            'data': data,
+            'status': response.status_code,
+        }
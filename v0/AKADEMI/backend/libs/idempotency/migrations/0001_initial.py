@@ -0,0 +1,89 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyRecord",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        help_text="Kapsamlı idempotency key'inin SHA-256 hash'i",
+                        max_length=64,
+                        verbose_name="Anahtar",
+                    ),
+                ),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        help_text="İsteğin method + path + gövde hash'i",
+                        max_length=32,
+                        verbose_name="Parmak İzi",
+                    ),
+                ),
+                (
+                    "status_code",
+                    models.PositiveSmallIntegerField(
+                        blank=True,
+                        help_text="Boş: rezervasyon (istek işleniyor)",
+                        null=True,
+                        verbose_name="HTTP Durumu",
+                    ),
+                ),
+                (
+                    "response",
+                    models.BinaryField(
+                        blank=True,
+                        help_text="Codec ile kodlanmış response data",
+                        null=True,
+                        verbose_name="Response",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        verbose_name="Oluşturulma",
+                    ),
+                ),
+                ("expires_at", models.DateTimeField(verbose_name="Son Geçerlilik")),
+            ],
+            options={
+                "verbose_name": "Idempotency Kaydı",
+                "verbose_name_plural": "Idempotency Kayıtları",
+                "indexes": [
+                    models.Index(
+                        fields=["expires_at"], name="idempotency_expires_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("status_code__isnull", True)),
+                        fields=("key",),
+                        name="unique_idempotency_reservation",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("status_code__isnull", False)),
+                        fields=("key",),
+                        name="unique_idempotency_result",
+                    ),
+                ],
+            },
+        ),
+    ]
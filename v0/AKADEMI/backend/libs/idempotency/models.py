@@ -0,0 +1,76 @@
+"""
+Idempotency Models
+==================
+
+Kalıcı idempotency kayıtları (bkz: stores.DatabaseStore).
+
+Tablo yalnızca eklemelidir (UPDATE yapılmaz). Her deneme için iki satır
+yazılır:
+    - Rezervasyon (status_code NULL): View çalışırken eşzamanlı
+      tekrarları durdurur; `lock_timeout` sonra düşer.
+    - Sonuç (status_code dolu): Tekrar oynatılacak response.
+
+Her iki tür için key başına tek satır kısmi (partial) unique index'lerle
+garanti edilir; rezervasyon INSERT'i atomik kilit görevi görür. Süresi
+dolan satırlar periyodik olarak silinir (purge_expired_idempotency_records).
+"""
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class IdempotencyRecord(models.Model):
+    """
+    Idempotency-Key rezervasyonu veya sonucu.
+    """
+    
+    key = models.CharField(
+        _('Anahtar'),
+        max_length=64,
+        help_text=_('Kapsamlı idempotency key\'inin SHA-256 hash\'i'),
+    )
+    fingerprint = models.CharField(
+        _('Parmak İzi'),
+        max_length=32,
+        help_text=_('İsteğin method + path + gövde hash\'i'),
+    )
+    status_code = models.PositiveSmallIntegerField(
+        _('HTTP Durumu'),
+        null=True,
+        blank=True,
+        help_text=_('Boş: rezervasyon (istek işleniyor)'),
+    )
+    response = models.BinaryField(
+        _('Response'),
+        null=True,
+        blank=True,
+        help_text=_('Codec ile kodlanmış response data'),
+    )
+    created_at = models.DateTimeField(_('Oluşturulma'), default=timezone.now)
+    expires_at = models.DateTimeField(_('Son Geçerlilik'))
+    
+    class Meta:
+        verbose_name = _('Idempotency Kaydı')
+        verbose_name_plural = _('Idempotency Kayıtları')
+        constraints = [
+            # Key başına tek rezervasyon (atomik kilit)
+            models.UniqueConstraint(
+                fields=['key'],
+                name='unique_idempotency_reservation',
+                condition=models.Q(status_code__isnull=True),
+            ),
+            # Key başına tek sonuç
+            models.UniqueConstraint(
+                fields=['key'],
+                name='unique_idempotency_result',
+                condition=models.Q(status_code__isnull=False),
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['expires_at'], name='idempotency_expires_idx'),
+        ]
+    
+    def __str__(self):
+        state = self.status_code if self.status_code is not None else 'in-flight'
+        return f"{self.key[:12]} ({state})"
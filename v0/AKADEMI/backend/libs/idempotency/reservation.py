@@ -0,0 +1,151 @@
+"""
+Idempotency Reservation
+=======================
+
+Aynı Idempotency-Key ile eşzamanlı gelen tekrar istekleri (mobil ağlarda
+progress / event POST'larının yeniden denemeleri) view'ı yalnızca bir kez
+çalıştırır.
+
+    1. Rezervasyon: İlk istek key'e atomik olarak "in-flight" işareti
+       koyar (cache.add / unique INSERT, bkz: stores) ve view'ı çalıştırır.
+    2. Eşzamanlı tekrar: İşareti gören istek sonucu `wait` saniye bekler;
+       sonuç yazılırsa onu döndürür, yazılmazsa 409 alır (Retry-After).
+    3. Sonuç: Başarılı (2xx) response kaydedilir ve sonraki tekrarlara
+       aynen döndürülür. Başarısız response / exception'da işaret
+       kaldırılır; istemci yeniden deneyebilir.
+
+Her kayıt isteğin parmak izini (method + path + gövde hash'i) taşır.
+Aynı key farklı bir istekle kullanılırsa 422 döner (yanlış response'un
+tekrar oynatılması yerine).
+
+İşaret `lock_timeout` saniye sonra düşer; bu süreden uzun süren view'lar
+için tekrar istek view'ı yeniden çalıştırabilir.
+
+Ayarlar `IDEMPOTENCY_RESERVATION` ile DEFAULTS üzerine yazılır.
+"""
+
+import hashlib
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from django.conf import settings
+
+from .stores import DONE, IdempotencyStore, get_store
+
+DEFAULTS = {
+    'lock_timeout': 30,  # In-flight işaretinin en uzun süresi
+    'wait': 10.0,  # Eşzamanlı tekrarın ilk sonucu bekleme süresi
+    'poll_interval': 0.05,  # Bekleme sırasında kontrol aralığı
+}
+
+
+class IdempotencyError(Exception):
+    """Idempotency-Key ile işlenemeyen istek."""
+
+    status_code = 400
+
+    def __init__(self, detail: str, retry_after: Optional[int] = None):
+        super().__init__(detail)
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class KeyReused(IdempotencyError):
+    """Key farklı bir istekle (method / path / gövde) yeniden kullanıldı."""
+
+    status_code = 422
+
+
+class RequestInFlight(IdempotencyError):
+    """Aynı key'li istek hâlâ işleniyor."""
+
+    status_code = 409
+
+
+class Result(NamedTuple):
+    """Yeni çalıştırılan response veya tekrar oynatılacak kayıt."""
+
+    response: Any
+    record: Optional[Dict]
+
+    @property
+    def replayed(self) -> bool:
+        return self.record is not None
+
+
+def get_options() -> dict:
+    options = dict(DEFAULTS)
+    options.update(getattr(settings, 'IDEMPOTENCY_RESERVATION', {}))
+    return options
+
+
+def fingerprint(method: str, path: str, body: bytes = b'') -> str:
+    """İstek parmak izi."""
+    digest = hashlib.sha256(f'{method}:{path}:'.encode())
+    digest.update(body)
+    return digest.hexdigest()[:32]
+
+
+def _check_fingerprint(record: Dict, request_fingerprint: str) -> None:
+    # Parmak izsiz (eski) kayıtlar kontrol edilmez
+    stored = record.get('fingerprint')
+    if stored is not None and stored != request_fingerprint:
+        raise KeyReused('Idempotency-Key farklı bir istek için kullanılmış.')
+
+
+def execute(
+    cache_key: str,
+    request_fingerprint: str,
+    call: Callable[[], Any],
+    serialize: Callable[[Any], Optional[Dict]],
+    timeout: int,
+    store: Optional[IdempotencyStore] = None,
+) -> Result:
+    """
+    İsteği key başına bir kez çalıştır.
+
+    Args:
+        cache_key: Idempotency kaydının key'i
+        request_fingerprint: fingerprint() çıktısı
+        call: View'ı çalıştıran callable
+        serialize: Response'u kayda ({'status', 'data'}) çeviren callable;
+            None dönerse sonuç kaydedilmez
+        timeout: Kaydın saklanma süresi (saniye)
+        store: Kayıt deposu (varsayılan: IDEMPOTENCY_STORES['default'])
+
+    Raises:
+        KeyReused: Key farklı bir istekle kullanılmış
+        RequestInFlight: İlk istek `wait` içinde tamamlanmadı
+    """
+    store = store or get_store()
+    options = get_options()
+    deadline = time.monotonic() + options['wait']
+
+    while True:
+        record = store.reserve(cache_key, request_fingerprint, options['lock_timeout'])
+        if record is None:
+            break
+
+        _check_fingerprint(record, request_fingerprint)
+        if record.get('state', DONE) == DONE:
+            return Result(None, record)
+
+        if time.monotonic() >= deadline:
+            raise RequestInFlight(
+                'Aynı Idempotency-Key ile istek hâlâ işleniyor.',
+                retry_after=1,
+            )
+        time.sleep(options['poll_interval'])
+
+    try:
+        response = call()
+    except BaseException:
+        store.release(cache_key, request_fingerprint)
+        raise
+
+    record = serialize(response)
+    if record is None:
+        store.release(cache_key, request_fingerprint)
+    else:
+        store.complete(cache_key, request_fingerprint, record, timeout)
+    return Result(response, None)
@@ -0,0 +1,304 @@
+"""
+Idempotency Stores
+==================
+
+Idempotency kayıtlarının saklandığı takılabilir depolar.
+
+    CacheStore:     Paylaşılan cache (Redis). Kayıtlar codec ile kompakt
+                    kodlanır. Bellek baskısında silinebilir; kısa ömürlü
+                    ve yoğun istekler (event, heartbeat) için.
+    DatabaseStore:  Yalnızca eklemeli tablo (bkz: models.IdempotencyRecord).
+                    Cache eviction'dan etkilenmez; progress güncellemesi
+                    gibi tekrarı veri bozan istekler için.
+
+Her store aynı üç adımı sağlar (bkz: reservation.execute):
+    reserve(key, fingerprint, lock_timeout) -> None (rezerve edildi) | kayıt
+    complete(key, fingerprint, record, timeout)
+    release(key, fingerprint)
+
+Kayıtlar {'state', 'fingerprint', 'status', 'data'} sözlükleridir.
+
+Ayarlar:
+    IDEMPOTENCY_STORES = {
+        'default': {
+            'BACKEND': 'backend.libs.idempotency.stores.CacheStore',
+            'OPTIONS': {'codec': 'idempotency'},
+        },
+        'durable': {
+            'BACKEND': 'backend.libs.idempotency.stores.DatabaseStore',
+            'OPTIONS': {'codec': 'idempotency'},
+        },
+    }
+
+Kullanım:
+    from backend.libs.idempotency.stores import get_store
+
+    store = get_store('durable')
+"""
+
+import hashlib
+import logging
+from datetime import timedelta
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.db import IntegrityError, transaction
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from backend.libs.cache import codecs
+
+logger = logging.getLogger(__name__)
+
+IN_FLIGHT = 'in-flight'
+DONE = 'done'
+
+DEFAULT_STORES = {
+    'default': {
+        'BACKEND': 'backend.libs.idempotency.stores.CacheStore',
+    },
+}
+
+
+class IdempotencyStore:
+    """
+    Store arayüzü.
+    """
+
+    def reserve(self, key: str, fingerprint: str, lock_timeout: int) -> Optional[Dict]:
+        """
+        Key'i atomik olarak rezerve et.
+
+        Returns:
+            None: Rezervasyon bu isteğe ait
+            Kayıt: Key'in mevcut kaydı (in-flight veya done)
+        """
+        raise NotImplementedError
+
+    def complete(self, key: str, fingerprint: str, record: Dict, timeout: int) -> None:
+        """Sonucu ({'status', 'data'}) kaydet."""
+        raise NotImplementedError
+
+    def release(self, key: str, fingerprint: str) -> None:
+        """Sonuçsuz biten rezervasyonu kaldır."""
+        raise NotImplementedError
+
+
+# =============================================================================
+# CACHE STORE
+# =============================================================================
+
+class CacheStore(IdempotencyStore):
+    """
+    Paylaşılan cache store'u.
+
+    Rezervasyon `cache.add` ile yapılır. Kayıt [state, fingerprint,
+    status, data] listesi olarak yazılır; codec verilirse tek bytes
+    değerine kodlanır (bkz: backend.libs.cache.codecs).
+
+    Args:
+        alias: CACHES anahtarı
+        codec: CACHE_CODECS anahtarı (None: backend serializer'ı)
+    """
+
+    def __init__(self, alias: str = 'default', codec: Optional[str] = None):
+        self.alias = alias
+        self.codec = codecs.get_codec(codec)
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def _encode(self, state: str, fingerprint: str, status: Optional[int] = None, data=None):
+        row = [state, fingerprint, status, data]
+        return self.codec.encode(row) if self.codec is not None else row
+
+    @staticmethod
+    def _decode(value) -> Dict:
+        if isinstance(value, dict):
+            # Store'dan önceki (dict) kayıt
+            return {'state': DONE, **value}
+        if isinstance(value, bytes):
+            value = codecs.decode(value)
+        state, fingerprint, status, data = value
+        return {'state': state, 'fingerprint': fingerprint, 'status': status, 'data': data}
+
+    def get(self, key: str) -> Optional[Dict]:
+        value = self.cache.get(key)
+        return None if value is None else self._decode(value)
+
+    def reserve(self, key: str, fingerprint: str, lock_timeout: int) -> Optional[Dict]:
+        marker = self._encode(IN_FLIGHT, fingerprint)
+        while True:
+            record = self.get(key)
+            if record is not None:
+                return record
+            if self.cache.add(key, marker, lock_timeout):
+                return None
+            # Yarışı başka istek kazandı; kaydını oku
+
+    def complete(self, key: str, fingerprint: str, record: Dict, timeout: int) -> None:
+        self.cache.set(key, self._encode(DONE, fingerprint, record['status'], record['data']), timeout)
+
+    def release(self, key: str, fingerprint: str) -> None:
+        self.cache.delete(key)
+
+
+# =============================================================================
+# DATABASE STORE
+# =============================================================================
+
+class DatabaseStore(IdempotencyStore):
+    """
+    Yalnızca eklemeli tablo store'u (bkz: models.IdempotencyRecord).
+
+    Rezervasyon, key başına tek rezervasyon satırına izin veren kısmi
+    unique index'e yapılan INSERT'tir. Sonuç ayrı bir satır olarak eklenir;
+    rezervasyon satırı `lock_timeout` sonunda kendiliğinden geçersizleşir.
+    Süresi dolmuş satırlar yeni rezervasyonu engellerse o key için silinir;
+    geri kalanı periyodik purge() ile temizlenir.
+
+    Args:
+        using: Veritabanı alias'ı
+        codec: Response data codec'i (CACHE_CODECS anahtarı,
+            varsayılan: json + zlib)
+    """
+
+    # Eşzamanlı INSERT / purge yarışlarında deneme sayısı
+    MAX_ATTEMPTS = 3
+
+    def __init__(self, using: str = 'default', codec: Optional[str] = None):
+        self.using = using
+        self.codec = codecs.get_codec(codec) or codecs.Codec('json', 'zlib')
+
+    @property
+    def records(self):
+        from .models import IdempotencyRecord
+
+        return IdempotencyRecord.objects.using(self.using)
+
+    @staticmethod
+    def hash_key(key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _get(self, key_hash: str) -> Optional[Dict]:
+        rows = self.records.filter(
+            key=key_hash,
+            expires_at__gt=timezone.now(),
+        ).values_list('fingerprint', 'status_code', 'response')
+
+        reservation = None
+        for fingerprint, status_code, response in rows:
+            if status_code is not None:
+                return {
+                    'state': DONE,
+                    'fingerprint': fingerprint,
+                    'status': status_code,
+                    'data': self.codec.decode(bytes(response)),
+                }
+            reservation = {'state': IN_FLIGHT, 'fingerprint': fingerprint}
+        return reservation
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self._get(self.hash_key(key))
+
+    def _insert(self, key_hash: str, **fields) -> bool:
+        """Satır ekle; süresi dolmuş satır unique index'i tutuyorsa silip yeniden dene."""
+        for _ in range(self.MAX_ATTEMPTS):
+            try:
+                with transaction.atomic(using=self.using):
+                    self.records.create(key=key_hash, **fields)
+                return True
+            except IntegrityError:
+                stale = self.records.filter(key=key_hash, expires_at__lte=timezone.now())
+                if fields.get('status_code') is None:
+                    stale = stale.filter(status_code__isnull=True)
+                else:
+                    stale = stale.filter(status_code__isnull=False)
+                if not stale.delete()[0]:
+                    # Geçerli bir satır var
+                    return False
+        logger.warning(f"Idempotency record insert gave up: {key_hash[:12]}")
+        return False
+
+    def reserve(self, key: str, fingerprint: str, lock_timeout: int) -> Optional[Dict]:
+        key_hash = self.hash_key(key)
+        for _ in range(self.MAX_ATTEMPTS):
+            record = self._get(key_hash)
+            if record is not None:
+                return record
+            if self._insert(
+                key_hash,
+                fingerprint=fingerprint,
+                expires_at=timezone.now() + timedelta(seconds=lock_timeout),
+            ):
+                return None
+        # Satır bu arada silindi / süresi doldu; istemci tekrar denesin
+        return {'state': IN_FLIGHT, 'fingerprint': fingerprint}
+
+    def complete(self, key: str, fingerprint: str, record: Dict, timeout: int) -> None:
+        self._insert(
+            self.hash_key(key),
+            fingerprint=fingerprint,
+            status_code=record['status'],
+            response=self.codec.encode(record['data']),
+            expires_at=timezone.now() + timedelta(seconds=timeout),
+        )
+
+    def release(self, key: str, fingerprint: str) -> None:
+        self.records.filter(
+            key=self.hash_key(key),
+            fingerprint=fingerprint,
+            status_code__isnull=True,
+        ).delete()
+
+    def purge(self, batch_size: int = 1000) -> int:
+        """
+        Süresi dolmuş satırları sil.
+
+        Uzun süren tek DELETE yerine `batch_size`'lık parçalar halinde.
+
+        Returns:
+            Silinen satır sayısı
+        """
+        now = timezone.now()
+        purged = 0
+        while True:
+            pks = list(self.records.filter(expires_at__lte=now).values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                return purged
+            purged += self.records.filter(pk__in=pks).delete()[0]
+
+
+# =============================================================================
+# STORE SEÇİMİ
+# =============================================================================
+
+_stores: Dict[str, IdempotencyStore] = {}
+
+
+def get_store(name: Optional[str] = None) -> IdempotencyStore:
+    """
+    İsimlendirilmiş store (IDEMPOTENCY_STORES).
+
+    Raises:
+        ImproperlyConfigured: Tanımsız store adı
+    """
+    name = name or 'default'
+    store = _stores.get(name)
+    if store is None:
+        config = getattr(settings, 'IDEMPOTENCY_STORES', DEFAULT_STORES).get(name)
+        if config is None:
+            raise ImproperlyConfigured(f"IDEMPOTENCY_STORES içinde tanımsız store: {name}")
+        store = _stores[name] = import_string(config['BACKEND'])(**config.get('OPTIONS', {}))
+    return store
+
+
+@receiver(setting_changed)
+def _reset_stores(setting, **kwargs):
+    if setting in ('IDEMPOTENCY_STORES', 'CACHE_CODECS'):
+        _stores.clear()
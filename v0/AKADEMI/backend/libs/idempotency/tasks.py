@@ -0,0 +1,34 @@
+"""
+Idempotency Celery Tasks
+========================
+
+Kalıcı idempotency kayıtlarının periyodik temizliği.
+"""
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def purge_expired_idempotency_records():
+    """
+    Süresi dolmuş idempotency kayıtlarını sil.
+    
+    Tablo yalnızca eklemeli olduğundan rezervasyon ve sonuç satırları
+    burada temizlenir (bkz: stores.DatabaseStore).
+    """
+    from django.conf import settings
+    
+    from .stores import DatabaseStore, get_store
+    
+    purged = 0
+    for name in getattr(settings, 'IDEMPOTENCY_STORES', {}):
+        store = get_store(name)
+        if isinstance(store, DatabaseStore):
+            purged += store.purge()
+    
+    logger.info(f"Idempotency purge done: {purged} records")
+    return purged
@@ -0,0 +1 @@
+# Idempotency tests
@@ -0,0 +1,109 @@
+"""
+Idempotency Reservation Tests
+=============================
+
+Aynı Idempotency-Key ile eşzamanlı tekrarların view'ı bir kez
+çalıştırdığı ve key'in farklı gövdeyle yeniden kullanılamadığı doğrulanır.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from backend.libs.cache.testing import override_locmem_cache, run_parallel
+from backend.libs.idempotency import idempotent
+
+CACHE_STORES = {
+    'default': {'BACKEND': 'backend.libs.idempotency.stores.CacheStore'},
+}
+
+
+class ProgressView(APIView):
+    """Çağrı sayısını tutan yavaş progress endpoint'i."""
+
+    authentication_classes = []
+    permission_classes = []
+    calls = 0
+    duration = 0.2
+    status_code = 200
+
+    @idempotent(timeout=60)
+    def put(self, request):
+        type(self).calls += 1
+        time.sleep(self.duration)
+        return Response({'position': request.data['position'], 'call': self.calls}, status=self.status_code)
+
+
+def call(position=10, key='key-1'):
+    request = APIRequestFactory().put(
+        '/api/v1/courses/1/content/1/progress/',
+        {'position': position},
+        format='json',
+        HTTP_IDEMPOTENCY_KEY=key,
+    )
+    request.user = SimpleNamespace(id=1, is_authenticated=True)
+    return ProgressView.as_view()(request)
+
+
+@override_locmem_cache(
+    'idempotency-tests',
+    IDEMPOTENCY_STORES=CACHE_STORES,
+    IDEMPOTENCY_RESERVATION={'wait': 5.0, 'poll_interval': 0.01},
+)
+class ReservationTest(SimpleTestCase):
+    """In-flight rezervasyon testleri."""
+
+    def setUp(self):
+        cache.clear()
+        ProgressView.calls = 0
+        ProgressView.duration = 0.2
+        ProgressView.status_code = 200
+
+    def test_concurrent_duplicates_execute_once(self):
+        """Eşzamanlı 20 tekrar view'ı bir kez çalıştırır, hepsi aynı sonucu alır."""
+        responses = run_parallel(call, 20)
+
+        self.assertEqual(ProgressView.calls, 1)
+        self.assertEqual({response.status_code for response in responses}, {200})
+        self.assertEqual({response.data['call'] for response in responses}, {1})
+        self.assertEqual(sum(response.has_header('X-Idempotent-Replayed') for response in responses), 19)
+
+    def test_key_reuse_with_different_body_rejected(self):
+        """Aynı key farklı gövdeyle 422 döner."""
+        self.assertEqual(call(position=10).status_code, 200)
+
+        response = call(position=20)
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(ProgressView.calls, 1)
+
+    @override_settings(IDEMPOTENCY_RESERVATION={'wait': 0.05, 'poll_interval': 0.01})
+    def test_in_flight_timeout_conflict(self):
+        """İlk istek bekleme süresinde bitmezse tekrar 409 alır."""
+        ProgressView.duration = 0.5
+        first = threading.Thread(target=call)
+        first.start()
+        time.sleep(0.1)
+
+        response = call()
+        first.join()
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response['Retry-After'], '1')
+        self.assertEqual(ProgressView.calls, 1)
+
+    def test_failure_releases_key(self):
+        """Başarısız response kaydedilmez, tekrar deneme view'ı çalıştırır."""
+        ProgressView.duration = 0
+        ProgressView.status_code = 503
+        self.assertEqual(call().status_code, 503)
+
+        ProgressView.status_code = 200
+        self.assertEqual(call().status_code, 200)
+        self.assertEqual(ProgressView.calls, 2)
@@ -0,0 +1,250 @@
+"""
+Idempotency Store Tests
+=======================
+
+Cache ve kalıcı (DB) store'ların rezervasyon / tekrar oynatma davranışı
+ve middleware'in path bazında store seçimi.
+"""
+
+import threading
+import time
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.http import JsonResponse
+from django.test import RequestFactory, SimpleTestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from backend.libs.cache.testing import override_locmem_cache, run_parallel
+from backend.libs.idempotency import IdempotencyMiddleware, reservation
+from backend.libs.idempotency.models import IdempotencyRecord
+from backend.libs.idempotency.stores import DONE, IN_FLIGHT, CacheStore, DatabaseStore
+
+TEST_CODECS = {
+    'test-json-zlib': {'serializer': 'json', 'compression': 'zlib', 'threshold': 64},
+}
+
+TEST_STORES = {
+    'default': {
+        'BACKEND': 'backend.libs.idempotency.stores.CacheStore',
+        'OPTIONS': {'codec': 'test-json-zlib'},
+    },
+    'durable': {
+        'BACKEND': 'backend.libs.idempotency.stores.DatabaseStore',
+        'OPTIONS': {'codec': 'test-json-zlib'},
+    },
+}
+
+RECORD = {'status': 200, 'data': {'watched_seconds': 1210, 'completion_ratio': 0.62}}
+
+
+@override_locmem_cache('idempotency-store-tests', CACHE_CODECS=TEST_CODECS)
+class CacheStoreTest(SimpleTestCase):
+    """Codec'li cache store testleri."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_round_trip(self):
+        """Kodlanmış kayıt rezervasyon / sonuç olarak geri okunur."""
+        store = CacheStore(codec='test-json-zlib')
+
+        self.assertIsNone(store.reserve('key', 'fp', 30))
+        self.assertEqual(store.reserve('key', 'fp', 30)['state'], IN_FLIGHT)
+        self.assertIsInstance(cache.get('key'), bytes)
+
+        store.complete('key', 'fp', RECORD, 60)
+        record = store.reserve('key', 'fp', 30)
+
+        self.assertEqual(record['state'], DONE)
+        self.assertEqual(record['data'], RECORD['data'])
+
+
+@override_settings(CACHE_CODECS=TEST_CODECS)
+class DatabaseStoreTest(TransactionTestCase):
+    """Kalıcı store testleri (eşzamanlı istekler ayrı thread / bağlantıda)."""
+
+    def setUp(self):
+        self.store = DatabaseStore(codec='test-json-zlib')
+
+    def test_concurrent_reserve_single_winner(self):
+        """Eşzamanlı rezervasyonlardan yalnızca biri kazanır."""
+        results = run_parallel(lambda: self.store.reserve('key', 'fp', 30), 8, close_connections=True)
+
+        self.assertEqual(results.count(None), 1)
+        self.assertEqual(IdempotencyRecord.objects.count(), 1)
+
+    def test_result_replayed_append_only(self):
+        """Sonuç ayrı satır olarak eklenir ve tekrar oynatılır."""
+        self.assertIsNone(self.store.reserve('key', 'fp', 30))
+        self.store.complete('key', 'fp', RECORD, 60)
+
+        record = self.store.reserve('key', 'fp', 30)
+
+        self.assertEqual(record['state'], DONE)
+        self.assertEqual(record['status'], 200)
+        self.assertEqual(record['data'], RECORD['data'])
+        self.assertEqual(IdempotencyRecord.objects.count(), 2)
+
+    def test_expired_rows_replaced_and_purged(self):
+        """Süresi dolmuş satırlar yeni rezervasyonu engellemez, purge ile silinir."""
+        self.assertIsNone(self.store.reserve('key', 'fp', 30))
+        self.store.complete('key', 'fp', RECORD, 60)
+        IdempotencyRecord.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        self.assertIsNone(self.store.reserve('key', 'other', 30))
+        self.store.complete('key', 'other', RECORD, 60)
+        self.assertEqual(self.store.reserve('key', 'other', 30)['fingerprint'], 'other')
+
+        IdempotencyRecord.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(self.store.purge(batch_size=1), 2)
+        self.assertFalse(IdempotencyRecord.objects.exists())
+
+    def test_release_allows_retry(self):
+        """Sonuçsuz biten rezervasyon kaldırılır."""
+        self.assertIsNone(self.store.reserve('key', 'fp', 30))
+        self.store.release('key', 'fp')
+        self.assertIsNone(self.store.reserve('key', 'fp', 30))
+
+
+@override_locmem_cache(
+    'idempotency-store-tests',
+    CACHE_CODECS=TEST_CODECS,
+    IDEMPOTENCY_STORES=TEST_STORES,
+    IDEMPOTENCY_PATHS={
+        '/api/v1/courses/*/progress/': 'durable',
+        '/api/v1/courses/': 'default',
+    },
+)
+class MiddlewareStoreTest(TransactionTestCase):
+    """Middleware'in path bazında store seçimi."""
+
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+
+    def view(self, request):
+        self.calls += 1
+        return JsonResponse({'call': self.calls}, status=201)
+
+    def call(self, path):
+        request = RequestFactory().post(
+            path, '{"position": 10}',
+            content_type='application/json',
+            HTTP_IDEMPOTENCY_KEY='key-1',
+        )
+        return IdempotencyMiddleware(self.view)(request)
+
+    def test_progress_path_uses_durable_store(self):
+        """Progress path'i tabloya, diğerleri cache'e yazılır."""
+        progress = '/api/v1/courses/1/content/2/progress/'
+        self.assertEqual(self.call(progress).status_code, 201)
+        cache.clear()  # Eviction
+
+        replay = self.call(progress)
+
+        self.assertEqual(replay['X-Idempotent-Replayed'], 'true')
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(IdempotencyRecord.objects.filter(status_code=201).count(), 1)
+
+        self.call('/api/v1/courses/1/content/2/events/')
+        self.assertEqual(IdempotencyRecord.objects.filter(status_code=201).count(), 1)
+
+    def test_unmatched_path_not_tracked(self):
+        """Eşleşmeyen path idempotency uygulanmadan çalışır."""
+        self.call('/api/v1/users/')
+        self.call('/api/v1/users/')
+        self.assertEqual(self.calls, 2)
+
+
+@override_locmem_cache(
+    'idempotency-store-tests',
+    IDEMPOTENCY_RESERVATION={'wait': 1.0, 'poll_interval': 0.01},
+)
+class ExecuteWithDatabaseStoreTest(TransactionTestCase):
+    """reservation.execute kalıcı store ile."""
+
+    def test_in_flight_duplicate_waits_for_result(self):
+        """Eşzamanlı tekrar ilk sonucu tablodan alır."""
+        store = DatabaseStore()
+        calls = []
+
+        def run():
+            def call():
+                calls.append(1)
+                time.sleep(0.2)
+                return RECORD
+            try:
+                return reservation.execute('key', 'fp', call, lambda response: response, 60, store=store)
+            finally:
+                connection.close()
+
+        first = threading.Thread(target=run)
+        first.start()
+        time.sleep(0.05)
+        result = run()
+        first.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(result.replayed)
+        self.assertEqual(result.record['data'], RECORD['data'])
+
+
+@override_locmem_cache('idempotency-store-tests')
+class MiddlewareStackTest(TransactionTestCase):
+    """Ayarlardaki MIDDLEWARE zinciri üzerinden progress PUT'u."""
+
+    def setUp(self):
+        from rest_framework.test import APIClient
+        from rest_framework_simplejwt.tokens import AccessToken
+
+        from backend.courses.models import Course, CourseContent, CourseModule, Enrollment
+        from backend.player.models import PlaybackSession
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        cache.clear()
+        tenant = Tenant.objects.create(name='Test Akademi', slug='test-akademi')
+        user = User.objects.create_user(
+            email='student@test.com', password='testpass123', tenant=tenant, role='STUDENT',
+        )
+        course = Course.objects.create(
+            title='Course', slug='course', description='Test course description',
+            category='Technology', tenant=tenant,
+        )
+        module = CourseModule.objects.create(course=course, title='Module')
+        content = CourseContent.objects.create(
+            module=module, title='Video', type=CourseContent.ContentType.VIDEO,
+        )
+        Enrollment.objects.create(user=user, course=course, status=Enrollment.Status.ACTIVE)
+        self.session = PlaybackSession.objects.create(
+            tenant=tenant, user=user, course=course, content=content,
+        )
+        self.path = f'/api/v1/courses/{course.id}/content/{content.id}/progress/'
+        self.client = APIClient(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+
+    def put(self, position):
+        return self.client.put(
+            self.path,
+            {'session_id': str(self.session.id), 'last_position_seconds': position},
+            format='json',
+            HTTP_IDEMPOTENCY_KEY='progress-1',
+        )
+
+    def test_progress_put_recorded_in_durable_store(self):
+        """Progress PUT'u IdempotencyRecord'a yazılır, tekrarı view'ı çalıştırmaz."""
+        from backend.progress.models import VideoProgress
+
+        first = self.put(10)
+        self.assertEqual(first.status_code, 200, first.content)
+        self.assertEqual(IdempotencyRecord.objects.filter(status_code=200).count(), 1)
+        updated_at = VideoProgress.objects.get().updated_at
+        cache.clear()  # Eviction
+
+        replay = self.put(10)
+
+        self.assertEqual(replay['X-Idempotent-Replayed'], 'true')
+        self.assertEqual(replay.json()['content_id'], first.json()['content_id'])
+        self.assertEqual(VideoProgress.objects.get().updated_at, updated_at)
+        self.assertEqual(self.put(20).status_code, 422)
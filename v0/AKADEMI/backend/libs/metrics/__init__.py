@@ -0,0 +1,33 @@
+"""
+Endpoint Metrics
+================
+
+Endpoint bazında gecikme histogramları, DB süresi ve cache hit/miss
+sayaçları; Prometheus text formatında `/metrics/` ile sunulur.
+
+Kullanım:
+    # settings.py
+    MIDDLEWARE = ['backend.libs.metrics.middleware.MetricsMiddleware'] + MIDDLEWARE
+    METRICS_ENABLED = True
+    METRICS_MULTIPROC_DIR = '/var/run/akademi-metrics'  # çok worker'lı kurulum
+
+    # Cache erişimi kaydı
+    from backend.libs.metrics import record_cache
+    record_cache(hits=1)
+
+Örnek alarm (p99):
+    histogram_quantile(0.99, sum by (le, view) (
+        rate(akademi_http_request_duration_seconds_bucket{view="telemetry:events"}[5m])
+    ))
+"""
+
+from .middleware import MetricsMiddleware, record_cache
+from .registry import LATENCY_BUCKETS, MetricsRegistry, registry
+
+__all__ = [
+    'LATENCY_BUCKETS',
+    'MetricsMiddleware',
+    'MetricsRegistry',
+    'record_cache',
+    'registry',
+]
@@ -0,0 +1,120 @@
+"""
+Metrics Middleware
+==================
+
+İstek başına gecikme, DB süresi ve cache hit/miss sayılarını çözümlenen
+URL adı + tenant bazında process içi depoya (registry) yazar.
+
+Settings:
+    METRICS_ENABLED: Middleware'i aç (default: False)
+    METRICS_PATHS: Ölçülecek path prefix'leri (default: ['/api/'])
+    METRICS_TENANT_LABEL: Tenant etiketi ekle (default: True)
+
+Cache erişimleri `record_cache()` ile o anki isteğe yazılır
+(bkz: backend.libs.cache).
+"""
+
+import time
+from contextlib import ExitStack
+from contextvars import ContextVar
+from typing import Optional
+
+from django.conf import settings
+from django.db import connections
+
+from . import multiprocess
+from .registry import registry
+
+# Çözümlenemeyen (404) istekler tek seride toplanır
+UNRESOLVED = 'unresolved'
+
+
+class RequestStats:
+    """
+    Tek isteğin DB ve cache sayaçları.
+    """
+
+    __slots__ = ('db_seconds', 'db_queries', 'cache_hits', 'cache_misses')
+
+    def __init__(self):
+        self.db_seconds = 0.0
+        self.db_queries = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def db_wrapper(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_seconds += time.perf_counter() - start
+            self.db_queries += 1
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar('metrics_request_stats', default=None)
+
+
+def record_cache(hits: int = 0, misses: int = 0) -> None:
+    """Cache erişimini o anki isteğin sayaçlarına ekle."""
+    stats = _current.get()
+    if stats is not None:
+        stats.cache_hits += hits
+        stats.cache_misses += misses
+
+
+class MetricsMiddleware:
+    """
+    Endpoint metrik middleware'i.
+
+    Diğer middleware'lerin süresini de kapsaması için listenin başına
+    eklenmelidir.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'METRICS_ENABLED', False)
+        self.paths = getattr(settings, 'METRICS_PATHS', ['/api/'])
+        self.tenant_label = getattr(settings, 'METRICS_TENANT_LABEL', True)
+
+    def __call__(self, request):
+        if not self.enabled or not any(request.path.startswith(p) for p in self.paths):
+            return self.get_response(request)
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(stats.db_wrapper))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        duration = time.perf_counter() - start
+
+        registry.observe(
+            view=self._view(request),
+            tenant=self._tenant(request),
+            method=request.method,
+            status=response.status_code,
+            duration=duration,
+            db_seconds=stats.db_seconds,
+            db_queries=stats.db_queries,
+            cache_hits=stats.cache_hits,
+            cache_misses=stats.cache_misses,
+        )
+        multiprocess.maybe_flush()
+        return response
+
+    @staticmethod
+    def _view(request) -> str:
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match is None:
+            return UNRESOLVED
+        return resolver_match.view_name or resolver_match._func_path
+
+    def _tenant(self, request) -> str:
+        if not self.tenant_label:
+            return ''
+        tenant_id = getattr(getattr(request, 'user', None), 'tenant_id', None)
+        return str(tenant_id) if tenant_id else '-'
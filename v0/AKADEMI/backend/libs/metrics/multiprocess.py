@@ -0,0 +1,95 @@
+"""
+Multiprocess Metrics
+====================
+
+Çok worker'lı (gunicorn) kurulumda endpoint metriklerinin birleştirilmesi.
+
+Process içi depo yalnızca o worker'ın isteklerini görür; `/metrics/`
+isteği hangi worker'a düşerse onun sayaçları dönerdi. METRICS_MULTIPROC_DIR
+tanımlıysa her worker deposunun anlık görüntüsünü bu dizine
+`<pid>-<token>.json` olarak en fazla METRICS_FLUSH_INTERVAL saniyede bir
+(ve çıkışta) yazar; `/metrics/` dizindeki tüm görüntüleri birleştirip sunar.
+
+Ölen worker'ların dosyaları silinmez (sayaçlar monoton kalır). Dizin
+tüm worker'lar için ortak, process'lere özel ve deploy sırasında boş
+olmalıdır (prometheus_client multiprocess modu ile aynı kural).
+
+Settings:
+    METRICS_MULTIPROC_DIR: Paylaşılan dizin (default: '' - tek process)
+    METRICS_FLUSH_INTERVAL: Anlık görüntü aralığı, saniye (default: 1.0)
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Optional
+
+from django.conf import settings
+
+from .registry import MetricsRegistry, registry
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_state = {'path': None, 'pid': None, 'base': None, 'flushed_at': 0.0}
+
+
+def directory() -> Optional[str]:
+    """Paylaşılan dizin (tanımsızsa None)."""
+    return getattr(settings, 'METRICS_MULTIPROC_DIR', '') or None
+
+
+def _path(base: str) -> str:
+    # Fork sonrası yeni process kendi dosyasını açar; pid yeniden
+    # kullanılsa bile ölen worker'ın dosyası ezilmez
+    pid = os.getpid()
+    if _state['pid'] != pid or _state['base'] != base:
+        if _state['pid'] != pid:
+            atexit.register(flush)
+        _state.update(
+            pid=pid,
+            base=base,
+            path=os.path.join(base, f'{pid}-{uuid.uuid4().hex[:8]}.json'),
+            flushed_at=0.0,
+        )
+    return _state['path']
+
+
+def flush() -> None:
+    """Bu process'in deposunu paylaşılan dizine yaz."""
+    base = directory()
+    if not base:
+        return
+    with _lock:
+        path = _path(base)
+        try:
+            registry.dump(path)
+        except OSError as e:
+            logger.warning(f"Metrics snapshot could not be written: {e}")
+        _state['flushed_at'] = time.monotonic()
+
+
+def maybe_flush() -> None:
+    """Aralık dolduysa anlık görüntü yaz (istek başına çağrılır)."""
+    if directory() is None:
+        return
+    interval = getattr(settings, 'METRICS_FLUSH_INTERVAL', 1.0)
+    if time.monotonic() - _state['flushed_at'] >= interval or _state['pid'] != os.getpid():
+        flush()
+
+
+def collect() -> MetricsRegistry:
+    """
+    Sunulacak depo.
+
+    Paylaşılan dizin tanımlıysa tüm worker'ların birleşimi, değilse
+    process içi depo.
+    """
+    base = directory()
+    if base is None:
+        return registry
+    flush()
+    return MetricsRegistry.from_directory(base, registry.buckets)
@@ -0,0 +1,276 @@
+"""
+Metrics Registry
+================
+
+Process içi endpoint metrik deposu.
+
+Seri anahtarı (view, tenant, method) olup her seri için tutulanlar:
+    - Gecikme histogramı (HDR tarzı log-lineer kovalar)
+    - Durum sınıfı sayaçları (2xx, 4xx, 5xx ...)
+    - Toplam DB süresi ve sorgu sayısı
+    - Cache hit / miss sayaçları
+
+Kova sınırları her ikinin kuvveti için iki alt kovadır (1, 1.5, 2, 3, 4,
+6 ... ms); göreli hata ~%25 ile sınırlıdır ve seri başına ~30 kova yeter.
+Kayıt, sınır listesinde ikili arama + kilit altında birkaç toplama işidir.
+
+Her worker process'i kendi deposunu tutar. Çok worker'lı kurulumda
+depolar paylaşılan dizindeki anlık görüntülerden birleştirilir
+(bkz: backend.libs.metrics.multiprocess).
+"""
+
+import glob
+import json
+import os
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Gecikme kova üst sınırları (saniye): 1ms - ~50s
+LATENCY_BUCKETS = tuple(
+    round(base * factor / 1000, 6)
+    for base in (2 ** exponent for exponent in range(16))
+    for factor in (1, 1.5)
+)
+
+
+def _escape(value) -> str:
+    """Prometheus label değeri kaçışı."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels) -> str:
+    return ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+def _format(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """
+    Sabit kovalı histogram (kova başına sayaç, kümülatif değil).
+    """
+
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self, size: int):
+        # Son kova +Inf
+        self.counts = [0] * (size + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float, bounds: Tuple[float, ...]) -> None:
+        self.counts[bisect_left(bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float, bounds: Tuple[float, ...]) -> Optional[float]:
+        """Yaklaşık yüzdelik (kova üst sınırı)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return bounds[index] if index < len(bounds) else float('inf')
+        return float('inf')
+
+
+class Series:
+    """
+    Tek (view, tenant, method) serisinin metrikleri.
+    """
+
+    __slots__ = ('latency', 'statuses', 'db_seconds', 'db_queries', 'cache_hits', 'cache_misses')
+
+    def __init__(self, size: int):
+        self.latency = Histogram(size)
+        self.statuses: Dict[str, int] = {}
+        self.db_seconds = 0.0
+        self.db_queries = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+class MetricsRegistry:
+    """
+    Thread-safe process içi metrik deposu.
+    """
+
+    PREFIX = 'akademi'
+
+    def __init__(self, buckets: Optional[Iterable[float]] = None):
+        self.buckets = tuple(sorted(buckets or LATENCY_BUCKETS))
+        self._lock = threading.Lock()
+        self._series: Dict[tuple, Series] = {}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series = {}
+
+    def observe(
+        self,
+        view: str,
+        tenant: str,
+        method: str,
+        status: int,
+        duration: float,
+        db_seconds: float = 0.0,
+        db_queries: int = 0,
+        cache_hits: int = 0,
+        cache_misses: int = 0,
+    ) -> None:
+        """Tamamlanan bir isteği kaydet."""
+        key = (view, tenant, method)
+        status_class = f'{status // 100}xx'
+
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = Series(len(self.buckets))
+            series.latency.observe(duration, self.buckets)
+            series.statuses[status_class] = series.statuses.get(status_class, 0) + 1
+            series.db_seconds += db_seconds
+            series.db_queries += db_queries
+            series.cache_hits += cache_hits
+            series.cache_misses += cache_misses
+
+    def get(self, view: str, tenant: str, method: str) -> Optional[Series]:
+        return self._series.get((view, tenant, method))
+
+    def quantile(self, view: str, q: float, tenant: str = None, method: str = 'GET') -> Optional[float]:
+        """View için yaklaşık yüzdelik (tenant None: tüm tenant'lar)."""
+        merged = Histogram(len(self.buckets))
+        with self._lock:
+            for (series_view, series_tenant, series_method), series in self._series.items():
+                if series_view != view or series_method != method:
+                    continue
+                if tenant is not None and series_tenant != tenant:
+                    continue
+                for index, count in enumerate(series.latency.counts):
+                    merged.counts[index] += count
+                merged.count += series.latency.count
+        return merged.quantile(q, self.buckets)
+
+    # =========================================================================
+    # PROMETHEUS
+    # =========================================================================
+
+    def _snapshot(self) -> List[tuple]:
+        with self._lock:
+            return [
+                (
+                    key,
+                    list(series.latency.counts),
+                    series.latency.sum,
+                    series.latency.count,
+                    dict(series.statuses),
+                    series.db_seconds,
+                    series.db_queries,
+                    series.cache_hits,
+                    series.cache_misses,
+                )
+                for key, series in sorted(self._series.items())
+            ]
+
+    def render(self) -> str:
+        """Prometheus text exposition formatı (0.0.4)."""
+        snapshot = self._snapshot()
+        bounds = [_format(bound) for bound in self.buckets] + ['+Inf']
+        prefix = self.PREFIX
+
+        latency, requests, db_seconds, db_queries, cache = [], [], [], [], []
+
+        for (view, tenant, method), counts, total, count, statuses, db_sec, db_n, hits, misses in snapshot:
+            labels = _labels(view=view, tenant=tenant, method=method)
+
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                latency.append(f'{prefix}_http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            latency.append(f'{prefix}_http_request_duration_seconds_sum{{{labels}}} {_format(total)}')
+            latency.append(f'{prefix}_http_request_duration_seconds_count{{{labels}}} {count}')
+
+            for status_class, status_count in sorted(statuses.items()):
+                requests.append(f'{prefix}_http_requests_total{{{labels},status="{status_class}"}} {status_count}')
+
+            db_seconds.append(f'{prefix}_http_db_seconds_total{{{labels}}} {_format(db_sec)}')
+            db_queries.append(f'{prefix}_http_db_queries_total{{{labels}}} {db_n}')
+
+            if hits or misses:
+                cache.append(f'{prefix}_cache_requests_total{{{labels},result="hit"}} {hits}')
+                cache.append(f'{prefix}_cache_requests_total{{{labels},result="miss"}} {misses}')
+
+        lines = []
+        for name, kind, help_text, samples in (
+            ('http_request_duration_seconds', 'histogram', 'Request latency in seconds.', latency),
+            ('http_requests_total', 'counter', 'Requests by status class.', requests),
+            ('http_db_seconds_total', 'counter', 'Database time spent in requests.', db_seconds),
+            ('http_db_queries_total', 'counter', 'Database queries executed in requests.', db_queries),
+            ('cache_requests_total', 'counter', 'Cache lookups by result.', cache),
+        ):
+            lines.append(f'# HELP {prefix}_{name} {help_text}')
+            lines.append(f'# TYPE {prefix}_{name} {kind}')
+            lines.extend(samples)
+
+        return '\n'.join(lines) + '\n'
+
+    # =========================================================================
+    # ANLIK GÖRÜNTÜ (çok worker)
+    # =========================================================================
+
+    def dump(self, path: str) -> None:
+        """Deponun anlık görüntüsünü JSON dosyasına atomik olarak yaz."""
+        data = {
+            'buckets': list(self.buckets),
+            'series': [[list(key), *values] for key, *values in self._snapshot()],
+        }
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'w') as handle:
+            json.dump(data, handle, separators=(',', ':'))
+        os.replace(temp_path, path)
+
+    def merge(self, rows: Iterable[list]) -> None:
+        """dump() satırlarını depoya ekle."""
+        with self._lock:
+            for key, counts, total, count, statuses, db_sec, db_n, hits, misses in rows:
+                key = tuple(key)
+                series = self._series.get(key)
+                if series is None:
+                    series = self._series[key] = Series(len(self.buckets))
+                for index, bucket_count in enumerate(counts):
+                    series.latency.counts[index] += bucket_count
+                series.latency.sum += total
+                series.latency.count += count
+                for status_class, status_count in statuses.items():
+                    series.statuses[status_class] = series.statuses.get(status_class, 0) + status_count
+                series.db_seconds += db_sec
+                series.db_queries += db_n
+                series.cache_hits += hits
+                series.cache_misses += misses
+
+    @classmethod
+    def from_directory(cls, directory: str, buckets: Optional[Iterable[float]] = None) -> 'MetricsRegistry':
+        """
+        Dizindeki tüm anlık görüntüleri tek depoda birleştir.
+
+        Okunamayan dosyalar ve farklı kova sınırlarıyla yazılmış
+        görüntüler atlanır.
+        """
+        merged = cls(buckets)
+        for path in sorted(glob.glob(os.path.join(directory, '*.json'))):
+            try:
+                with open(path) as handle:
+                    data = json.load(handle)
+            except (OSError, ValueError):
+                continue
+            if tuple(data.get('buckets', ())) != merged.buckets:
+                continue
+            merged.merge(data.get('series', []))
+        return merged
+
+
+# Process geneli depo
+registry = MetricsRegistry()
@@ -0,0 +1 @@
+# Metrics tests
@@ -0,0 +1,201 @@
+"""
+Endpoint Metrics Tests
+======================
+
+Registry, Prometheus çıktısı, çok worker birleştirme, /metrics/ erişim
+kontrolü ve middleware ek yükü testleri.
+"""
+
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from backend.libs.metrics import multiprocess
+from backend.libs.metrics.middleware import MetricsMiddleware, UNRESOLVED
+from backend.libs.metrics.registry import MetricsRegistry, registry
+from backend.libs.metrics.views import metrics_view
+
+
+class MetricsRegistryTest(SimpleTestCase):
+    """MetricsRegistry testleri."""
+
+    def setUp(self):
+        self.registry = MetricsRegistry(buckets=(0.01, 0.1, 1.0))
+
+    def test_observe_and_quantile(self):
+        """Gözlemler seri bazında toplanır; yüzdelik kova üst sınırıdır."""
+        for duration in (0.005, 0.005, 0.05, 2.0):
+            self.registry.observe('courses:list', '1', 'GET', 200, duration, db_seconds=0.001, db_queries=2)
+        self.registry.observe('courses:list', '2', 'GET', 503, 0.5)
+
+        series = self.registry.get('courses:list', '1', 'GET')
+        self.assertEqual(series.latency.counts, [2, 1, 0, 1])
+        self.assertEqual(series.statuses, {'2xx': 4})
+        self.assertEqual(series.db_queries, 8)
+        self.assertEqual(self.registry.quantile('courses:list', 0.5, tenant='1'), 0.01)
+        self.assertEqual(self.registry.quantile('courses:list', 0.5), 0.1)
+        self.assertEqual(self.registry.quantile('courses:list', 0.99), float('inf'))
+        self.assertEqual(self.registry.quantile('courses:list', 0.5, tenant='2'), 1.0)
+        self.assertIsNone(self.registry.quantile('missing', 0.5))
+
+    def test_render(self):
+        """Kümülatif kovalar, +Inf, sayaçlar ve label kaçışı."""
+        self.registry.observe('a"b', '1', 'GET', 200, 0.05, cache_hits=3, cache_misses=1)
+
+        text = self.registry.render()
+
+        labels = 'view="a\\"b",tenant="1",method="GET"'
+        self.assertIn(f'akademi_http_request_duration_seconds_bucket{{{labels},le="0.01"}} 0', text)
+        self.assertIn(f'akademi_http_request_duration_seconds_bucket{{{labels},le="0.1"}} 1', text)
+        self.assertIn(f'akademi_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1', text)
+        self.assertIn(f'akademi_http_request_duration_seconds_count{{{labels}}} 1', text)
+        self.assertIn(f'akademi_http_requests_total{{{labels},status="2xx"}} 1', text)
+        self.assertIn(f'akademi_cache_requests_total{{{labels},result="hit"}} 3', text)
+        self.assertIn('# TYPE akademi_http_request_duration_seconds histogram', text)
+        self.assertTrue(text.endswith('\n'))
+
+    def test_directory_merge(self):
+        """Worker görüntüleri toplanır; bozuk ve farklı kovalı dosyalar atlanır."""
+        other = MetricsRegistry(buckets=self.registry.buckets)
+        self.registry.observe('courses:list', '1', 'GET', 200, 0.05, db_queries=1)
+        other.observe('courses:list', '1', 'GET', 500, 0.5, db_queries=2)
+        other.observe('courses:detail', '1', 'GET', 200, 0.005)
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.registry.dump(os.path.join(directory, 'a.json'))
+            other.dump(os.path.join(directory, 'b.json'))
+            MetricsRegistry(buckets=(1.0,)).dump(os.path.join(directory, 'c.json'))
+            with open(os.path.join(directory, 'd.json'), 'w') as handle:
+                handle.write('{bozuk')
+
+            merged = MetricsRegistry.from_directory(directory, self.registry.buckets)
+
+        series = merged.get('courses:list', '1', 'GET')
+        self.assertEqual(series.latency.count, 2)
+        self.assertEqual(series.latency.counts, [0, 1, 1, 0])
+        self.assertEqual(series.statuses, {'2xx': 1, '5xx': 1})
+        self.assertEqual(series.db_queries, 3)
+        self.assertIsNotNone(merged.get('courses:detail', '1', 'GET'))
+
+
+class MultiprocessTest(SimpleTestCase):
+    """Paylaşılan dizin üzerinden birleştirme testleri."""
+
+    def setUp(self):
+        registry.reset()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.addCleanup(registry.reset)
+
+    def test_collect_without_directory_is_process_registry(self):
+        with override_settings(METRICS_MULTIPROC_DIR=''):
+            self.assertIs(multiprocess.collect(), registry)
+
+    def test_collect_merges_other_workers(self):
+        """/metrics/ hangi worker'a düşerse düşsün tüm worker'ları görür."""
+        worker = MetricsRegistry(buckets=registry.buckets)
+        worker.observe('courses:list', '1', 'GET', 200, 0.05)
+        worker.dump(os.path.join(self.directory.name, '999-other.json'))
+        registry.observe('courses:list', '1', 'GET', 200, 0.05)
+
+        with override_settings(METRICS_MULTIPROC_DIR=self.directory.name):
+            merged = multiprocess.collect()
+
+        self.assertEqual(merged.get('courses:list', '1', 'GET').latency.count, 2)
+        # Bu process'in görüntüsü de dizine yazıldı
+        self.assertEqual(len(os.listdir(self.directory.name)), 2)
+
+    def test_maybe_flush_is_throttled(self):
+        with override_settings(METRICS_MULTIPROC_DIR=self.directory.name, METRICS_FLUSH_INTERVAL=60):
+            multiprocess.flush()
+            path = multiprocess._state['path']
+            modified = os.stat(path).st_mtime_ns
+            registry.observe('courses:list', '1', 'GET', 200, 0.05)
+            multiprocess.maybe_flush()
+
+            self.assertEqual(os.stat(path).st_mtime_ns, modified)
+
+
+class MetricsViewTest(SimpleTestCase):
+    """/metrics/ erişim kontrolü testleri."""
+
+    def get(self, user=None, **headers):
+        request = RequestFactory().get('/metrics/', **headers)
+        request.user = user or SimpleNamespace(is_staff=False)
+        return metrics_view(request)
+
+    @override_settings(METRICS_TOKEN='secret', METRICS_MULTIPROC_DIR='')
+    def test_token(self):
+        self.assertEqual(self.get(HTTP_AUTHORIZATION='Bearer secret').status_code, 200)
+        self.assertEqual(self.get(HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+        # Token tanımlıyken staff olmak yetmez
+        self.assertEqual(self.get(user=SimpleNamespace(is_staff=True)).status_code, 403)
+
+    @override_settings(METRICS_TOKEN='', METRICS_MULTIPROC_DIR='')
+    def test_staff_without_token(self):
+        response = self.get(user=SimpleNamespace(is_staff=True))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        self.assertEqual(self.get().status_code, 403)
+
+    def test_post_not_allowed(self):
+        request = RequestFactory().post('/metrics/')
+        request.user = SimpleNamespace(is_staff=True)
+        self.assertEqual(metrics_view(request).status_code, 405)
+
+
+@override_settings(METRICS_ENABLED=True, METRICS_PATHS=['/api/'], METRICS_MULTIPROC_DIR='')
+class MetricsMiddlewareTest(SimpleTestCase):
+    """Middleware kayıt ve ek yük testleri."""
+
+    # İstek başına ek yük üst sınırı; ölçülen ~8-14µs, CI gürültüsü için geniş
+    OVERHEAD_BUDGET_SECONDS = 200e-6
+
+    def setUp(self):
+        registry.reset()
+        self.addCleanup(registry.reset)
+        self.factory = RequestFactory()
+
+    def _request(self, path):
+        request = self.factory.get(path)
+        request.user = SimpleNamespace(tenant_id=5)
+        return request
+
+    def test_records_matching_paths_only(self):
+        middleware = MetricsMiddleware(lambda request: HttpResponse(status=201))
+
+        middleware(self._request('/api/v1/courses/'))
+        middleware(self._request('/admin/'))
+
+        series = registry.get(UNRESOLVED, '5', 'GET')
+        self.assertEqual(series.latency.count, 1)
+        self.assertEqual(series.statuses, {'2xx': 1})
+        self.assertEqual(len(registry._series), 1)
+
+    def test_overhead(self):
+        """Middleware'in istek başına ek yükü bütçe içinde."""
+        def view(request):
+            return HttpResponse()
+
+        middleware = MetricsMiddleware(view)
+        request = self._request('/api/v1/courses/')
+        rounds = 2000
+
+        def per_request(handler):
+            best = None
+            for _ in range(5):
+                start = time.perf_counter()
+                for _ in range(rounds):
+                    handler(request)
+                elapsed = (time.perf_counter() - start) / rounds
+                best = elapsed if best is None else min(best, elapsed)
+            return best
+
+        overhead = per_request(middleware) - per_request(view)
+
+        self.assertLess(overhead, self.OVERHEAD_BUDGET_SECONDS, f'{overhead * 1e6:.1f}µs')
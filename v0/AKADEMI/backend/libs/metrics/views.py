@@ -0,0 +1,37 @@
+"""
+Metrics Views
+=============
+
+Prometheus scrape endpoint'i.
+
+Settings:
+    METRICS_TOKEN: Tanımlıysa `Authorization: Bearer <token>` zorunlu;
+                   tanımsızsa yalnızca staff kullanıcılar erişebilir.
+    METRICS_MULTIPROC_DIR: Tanımlıysa tüm worker'ların birleşik metrikleri
+                           (bkz: backend.libs.metrics.multiprocess)
+"""
+
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.views.decorators.http import require_GET
+
+from . import multiprocess
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+@require_GET
+def metrics_view(request):
+    """Endpoint metrikleri (Prometheus text formatı)."""
+    token = getattr(settings, 'METRICS_TOKEN', '')
+
+    if token:
+        expected = f'Bearer {token}'
+        if not hmac.compare_digest(request.META.get('HTTP_AUTHORIZATION', ''), expected):
+            return HttpResponseForbidden()
+    elif not getattr(request.user, 'is_staff', False):
+        return HttpResponseForbidden()
+
+    return HttpResponse(multiprocess.collect().render(), content_type=CONTENT_TYPE)
@@ -0,0 +1,21 @@
+"""
+Query Count Instrumentation
+===========================
+
+İstek başına sorgu sayısı / süresi ölçümü, tekrarlanan sorgu (N+1)
+raporu ve view bazında sorgu bütçeleri.
+
+- QueryCounter: Sorguları sayan context manager
+- QueryCountMiddleware: Ayarla açılan istek ölçüm middleware'i
+- QueryBudgetMixin: Testlerde endpoint sorgu bütçesi kontrolü
+"""
+
+from .collector import QueryCounter, fingerprint
+from .middleware import QueryCountMiddleware, budget_for
+
+__all__ = [
+    'QueryCounter',
+    'fingerprint',
+    'QueryCountMiddleware',
+    'budget_for',
+]
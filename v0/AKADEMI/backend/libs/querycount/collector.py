@@ -0,0 +1,110 @@
+"""
+Query Collector
+===============
+
+Veritabanı sorgularını `connection.execute_wrapper` ile sayar.
+
+DEBUG kapalıyken de çalışır (connection.queries'e bağlı değildir).
+Aynı SQL şablonu (parametreler hariç) birden fazla çalıştıysa
+tekrarlanan sorgu olarak raporlanır - tipik N+1 belirtisi.
+
+Kullanım:
+    from backend.libs.querycount import QueryCounter
+
+    with QueryCounter() as counter:
+        ...
+    counter.count, counter.duration_ms, counter.duplicates()
+"""
+
+import re
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack
+from typing import Dict, List, Optional
+
+from django.db import connections
+
+
+# IN (%s, %s, ...) listelerini tek forma indir
+_IN_LIST = re.compile(r'IN \((?:%s, )*%s\)')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Sorgunun parametresiz şablonu.
+
+    Parametreler zaten %s placeholder'larıdır; değişken uzunluktaki
+    IN listeleri ve boşluklar normalize edilir.
+    """
+    sql = _WHITESPACE.sub(' ', sql.strip())
+    return _IN_LIST.sub('IN (...)', sql)
+
+
+class QueryCounter:
+    """
+    Sorgu sayacı (context manager).
+
+    Args:
+        using: Veritabanı alias'ları (None: tümü)
+    """
+
+    def __init__(self, using: Optional[List[str]] = None):
+        self.using = using
+        self.count = 0
+        self.duration = 0.0
+        self._fingerprints = Counter()
+        self._durations = defaultdict(float)
+        self._stack = None
+
+    def __enter__(self):
+        self._stack = ExitStack()
+        aliases = self.using or list(connections)
+        for alias in aliases:
+            self._stack.enter_context(connections[alias].execute_wrapper(self))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stack.close()
+        self._stack = None
+        return False
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            key = fingerprint(sql)
+            self.count += 1
+            self.duration += elapsed
+            self._fingerprints[key] += 1
+            self._durations[key] += elapsed
+
+    @property
+    def duration_ms(self) -> float:
+        return round(self.duration * 1000, 2)
+
+    def duplicates(self, threshold: int = 2) -> List[Dict]:
+        """
+        En az `threshold` kez çalışan sorgu şablonları.
+
+        Returns:
+            [{'sql', 'count', 'duration_ms'}] - tekrar sayısına göre azalan
+        """
+        return [
+            {
+                'sql': sql,
+                'count': count,
+                'duration_ms': round(self._durations[sql] * 1000, 2),
+            }
+            for sql, count in self._fingerprints.most_common()
+            if count >= threshold
+        ]
+
+    def report(self, threshold: int = 2, limit: int = 5, width: int = 200) -> str:
+        """İnsan okunur tekrar raporu."""
+        lines = [f"{self.count} queries in {self.duration_ms} ms"]
+        for item in self.duplicates(threshold)[:limit]:
+            lines.append(f"  {item['count']}x ({item['duration_ms']} ms) {item['sql'][:width]}")
+        return '\n'.join(lines)
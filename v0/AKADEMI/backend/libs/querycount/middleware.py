@@ -0,0 +1,86 @@
+"""
+Query Count Middleware
+======================
+
+İstek başına sorgu sayısı ve toplam DB süresini ölçer; tekrarlanan
+sorgu (N+1) raporunu ve bütçe aşımlarını loglar.
+
+Settings:
+    QUERY_COUNT_ENABLED: Middleware'i aç (default: False)
+    QUERY_COUNT_PATHS: İzlenecek path prefix'leri (default: ['/api/'])
+    QUERY_COUNT_DUPLICATE_THRESHOLD: Rapor için tekrar eşiği (default: 3)
+    QUERY_COUNT_HEADERS: X-Query-Count / X-Query-Time-Ms header'ları (default: DEBUG)
+    QUERY_BUDGETS: {view adı veya dotted path: max sorgu}
+    QUERY_BUDGET_DEFAULT: Bütçesi tanımsız view'lar için (default: None - sınırsız)
+
+Bütçe anahtarı URL adı (`instructor:dashboard`, `instructor:students-list`)
+veya view'ın dotted path'i (`backend.instructor.views.InstructorDashboardView`)
+olabilir.
+"""
+
+import logging
+from typing import Optional
+
+from django.conf import settings
+
+from .collector import QueryCounter
+
+logger = logging.getLogger(__name__)
+
+
+def budget_for(resolver_match) -> Optional[int]:
+    """Çözümlenen view için tanımlı sorgu bütçesi."""
+    budgets = getattr(settings, 'QUERY_BUDGETS', {})
+    default = getattr(settings, 'QUERY_BUDGET_DEFAULT', None)
+    if resolver_match is None:
+        return default
+
+    for key in (resolver_match.view_name, resolver_match._func_path):
+        if key and key in budgets:
+            return budgets[key]
+    return default
+
+
+class QueryCountMiddleware:
+    """
+    Sorgu sayısı / süresi ölçüm middleware'i.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'QUERY_COUNT_ENABLED', False)
+        self.paths = getattr(settings, 'QUERY_COUNT_PATHS', ['/api/'])
+        self.threshold = getattr(settings, 'QUERY_COUNT_DUPLICATE_THRESHOLD', 3)
+        self.headers = getattr(settings, 'QUERY_COUNT_HEADERS', settings.DEBUG)
+
+    def __call__(self, request):
+        if not self.enabled or not any(request.path.startswith(p) for p in self.paths):
+            return self.get_response(request)
+
+        with QueryCounter() as counter:
+            response = self.get_response(request)
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        view = resolver_match.view_name if resolver_match else request.path
+        budget = budget_for(resolver_match)
+        duplicates = counter.duplicates(self.threshold)
+
+        if budget is not None and counter.count > budget:
+            logger.warning(
+                f"[QUERY BUDGET] {request.method} {view}: {counter.count} queries "
+                f"(budget {budget})\n{counter.report(self.threshold)}"
+            )
+        elif duplicates:
+            logger.warning(
+                f"[N+1] {request.method} {view}: {counter.report(self.threshold)}"
+            )
+        else:
+            logger.debug(
+                f"[QUERY COUNT] {request.method} {view}: {counter.count} queries, {counter.duration_ms} ms"
+            )
+
+        if self.headers:
+            response['X-Query-Count'] = str(counter.count)
+            response['X-Query-Time-Ms'] = str(counter.duration_ms)
+
+        return response
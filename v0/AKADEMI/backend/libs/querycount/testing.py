@@ -0,0 +1,73 @@
+"""
+Query Budget Test Helpers
+=========================
+
+Endpoint'lerin sorgu bütçesini testlerde zorlar.
+
+Kullanım:
+    from backend.libs.querycount.testing import QueryBudgetMixin
+
+    class InstructorBudgetTest(QueryBudgetMixin, APITestCase):
+        query_budgets = [
+            ('/api/v1/instructor/dashboard/', 12),
+            ('/api/v1/instructor/students/', None),  # QUERY_BUDGETS ayarından
+        ]
+
+        @classmethod
+        def setUpTestData(cls):
+            ...  # tohum veri seti
+
+        def setUp(self):
+            self.client.force_authenticate(self.instructor)
+
+Bütçe aşılırsa test, tekrarlanan sorgu raporuyla başarısız olur.
+"""
+
+from contextlib import contextmanager
+
+from django.urls import resolve
+
+from .collector import QueryCounter
+from .middleware import budget_for
+
+
+class QueryBudgetMixin:
+    """
+    TestCase mixin'i: sorgu bütçesi assertion'ları.
+    """
+
+    # [(url, bütçe veya None)] - test_query_budgets ile kontrol edilir
+    query_budgets = []
+
+    @contextmanager
+    def assertQueryBudget(self, budget: int, label: str = ''):
+        """Blok `budget` sorgudan fazlasını çalıştırırsa başarısız ol."""
+        with QueryCounter() as counter:
+            yield counter
+        if counter.count > budget:
+            self.fail(
+                f"{label or 'Block'} exceeded query budget: "
+                f"{counter.count} > {budget}\n{counter.report()}"
+            )
+
+    def assertEndpointBudget(self, url: str, budget=None, method: str = 'get', **kwargs):
+        """
+        Endpoint'i çağır ve sorgu bütçesini kontrol et.
+
+        Bütçe verilmezse view için QUERY_BUDGETS ayarı kullanılır.
+        """
+        if budget is None:
+            budget = budget_for(resolve(url.split('?')[0]))
+        if budget is None:
+            self.fail(f"No query budget defined for {url}")
+
+        with self.assertQueryBudget(budget, label=f"{method.upper()} {url}"):
+            response = getattr(self.client, method)(url, **kwargs)
+
+        self.assertLess(response.status_code, 400, f"{method.upper()} {url} -> {response.status_code}")
+        return response
+
+    def test_query_budgets(self):
+        for url, budget in self.query_budgets:
+            with self.subTest(url=url):
+                self.assertEndpointBudget(url, budget)
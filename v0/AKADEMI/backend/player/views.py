@@ -10,12 +10,11 @@ from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from django.shortcuts import get_object_or_404
 from django.utils import timezone
 
-from backend.courses.models import Course, CourseContent, Enrollment
+from backend.courses.models import Enrollment
+from backend.courses.outline import CourseOutline
 from backend.libs.tenant_aware.mixins import TenantFilterMixin
-from backend.libs.idempotency.decorators import idempotent
 
 from .models import PlaybackSession
 from .serializers import (
@@ -51,17 +50,9 @@ class PlaybackSessionViewSet(TenantFilterMixin, viewsets.GenericViewSet):
         course_id = self.kwargs.get('course_id')
         content_id = self.kwargs.get('content_id')
         
-        course = get_object_or_404(
-            Course.objects.filter(tenant=self.request.user.tenant),
-            id=course_id
+        return CourseOutline.get_course_and_content(
+            self.request.user.tenant_id, course_id, content_id
         )
-        
-        content = get_object_or_404(
-            CourseContent.objects.filter(module__course=course),
-            id=content_id
-        )
-        
-        return course, content
     
     def check_enrollment(self, user, course):
         """Kullanıcının kursa kayıtlı olduğunu kontrol et."""
@@ -71,7 +62,6 @@ class PlaybackSessionViewSet(TenantFilterMixin, viewsets.GenericViewSet):
             status=Enrollment.Status.ACTIVE,
         ).exists()
     
-    @idempotent(timeout=60)
     def create(self, request, *args, **kwargs):
         """
         Yeni playback session başlat.
@@ -10,11 +10,10 @@ from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from django.shortcuts import get_object_or_404
 
-from backend.courses.models import Course, CourseContent, Enrollment
+from backend.courses.models import Enrollment
+from backend.courses.outline import CourseOutline
 from backend.player.models import PlaybackSession
-from backend.libs.idempotency.decorators import idempotent
 
 from .models import VideoProgress
 from .serializers import (
@@ -40,17 +39,9 @@ class ProgressView(APIView):
     
     def get_course_and_content(self, request, course_id, content_id):
         """URL'den course ve content objelerini al."""
-        course = get_object_or_404(
-            Course.objects.filter(tenant=request.user.tenant),
-            id=course_id
+        return CourseOutline.get_course_and_content(
+            request.user.tenant_id, course_id, content_id
         )
-        
-        content = get_object_or_404(
-            CourseContent.objects.filter(module__course=course),
-            id=content_id
-        )
-        
-        return course, content
     
     def check_enrollment(self, user, course):
         """Kullanıcının kursa kayıtlı olduğunu kontrol et."""
@@ -103,7 +94,6 @@ class ProgressView(APIView):
         serializer = ProgressResponseSerializer(progress)
         return Response(serializer.data)
     
-    @idempotent(timeout=30)
     def put(self, request, course_id, content_id):
         """
         İlerlemeyi güncelle.
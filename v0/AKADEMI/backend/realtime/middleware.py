@@ -21,9 +21,7 @@ def get_user_from_token(token):
     JWT token'dan kullanıcı döndürür.
     """
     from rest_framework_simplejwt.tokens import AccessToken
-    from django.contrib.auth import get_user_model
-    
-    User = get_user_model()
+    from backend.users.cache import UserCache
     
     try:
         # Token'ı decode et
@@ -33,9 +31,9 @@ def get_user_from_token(token):
         if not user_id:
             return AnonymousUser()
         
-        # Kullanıcıyı getir
-        user = User.objects.select_related('tenant').get(id=user_id)
-        return user
+        # Kullanıcıyı getir (iki katmanlı cache, tenant dahil)
+        user = UserCache.get(user_id)
+        return user or AnonymousUser()
         
     except Exception as e:
         logger.debug(f"Token doğrulama hatası: {e}")
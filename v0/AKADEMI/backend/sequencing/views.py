@@ -10,9 +10,8 @@ from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from django.shortcuts import get_object_or_404
 
-from backend.courses.models import Course, CourseContent, Enrollment
+from backend.courses.outline import CourseOutline
 
 from .serializers import LockStatusSerializer, EvaluateResponseSerializer
 from .services import PolicyEngine
@@ -32,17 +31,9 @@ class LockStatusView(APIView):
     
     def get_course_and_content(self, request, course_id, content_id):
         """URL'den course ve content objelerini al."""
-        course = get_object_or_404(
-            Course.objects.filter(tenant=request.user.tenant),
-            id=course_id
+        return CourseOutline.get_course_and_content(
+            request.user.tenant_id, course_id, content_id
         )
-        
-        content = get_object_or_404(
-            CourseContent.objects.filter(module__course=course),
-            id=content_id
-        )
-        
-        return course, content
     
     def get(self, request, course_id, content_id):
         """
@@ -103,17 +94,9 @@ class LockEvaluateView(APIView):
     
     def get_course_and_content(self, request, course_id, content_id):
         """URL'den course ve content objelerini al."""
-        course = get_object_or_404(
-            Course.objects.filter(tenant=request.user.tenant),
-            id=course_id
+        return CourseOutline.get_course_and_content(
+            request.user.tenant_id, course_id, content_id
         )
-        
-        content = get_object_or_404(
-            CourseContent.objects.filter(module__course=course),
-            id=content_id
-        )
-        
-        return course, content
     
     def post(self, request, course_id, content_id):
         """
@@ -6,3 +6,9 @@ class StudentConfig(AppConfig):
     name = 'backend.student'
     verbose_name = 'Öğrenci Modülü'
 
+
+    def ready(self):
+        try:
+            from . import signals  # noqa: F401
+        except ImportError:
+            pass
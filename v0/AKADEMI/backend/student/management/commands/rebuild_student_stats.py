@@ -0,0 +1,28 @@
+"""
+Öğrenci-kurs analitik özetini (StudentCourseStats) kaynak tablolardan yeniden oluşturur.
+
+Kullanım:
+    python manage.py rebuild_student_stats
+    python manage.py rebuild_student_stats --tenant 3 --tenant 5
+"""
+
+from django.core.management.base import BaseCommand
+
+from backend.student.stats import StudentStatsService
+
+
+class Command(BaseCommand):
+    help = 'Öğrenci-kurs analitik özetini (StudentCourseStats) mevcut kayıtlardan yeniden oluşturur.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tenant',
+            action='append',
+            type=int,
+            dest='tenants',
+            help='Sadece bu tenant ID için (birden fazla verilebilir)',
+        )
+
+    def handle(self, *args, **options):
+        rows = StudentStatsService.rebuild(options.get('tenants'))
+        self.stdout.write(self.style.SUCCESS(f'{rows} öğrenci-kurs özeti satırı oluşturuldu.'))
@@ -0,0 +1,124 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0002_initial"),
+        ("student", "0001_initial"),
+        ("tenants", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StudentCourseStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "enrollment_status",
+                    models.CharField(
+                        blank=True,
+                        help_text="Kurs kaydı yoksa boş",
+                        max_length=20,
+                        verbose_name="Kayıt Durumu",
+                    ),
+                ),
+                (
+                    "progress_percent",
+                    models.PositiveIntegerField(default=0, verbose_name="İlerleme %"),
+                ),
+                (
+                    "watch_seconds",
+                    models.PositiveBigIntegerField(
+                        default=0, verbose_name="İzleme Süresi (sn)"
+                    ),
+                ),
+                (
+                    "graded_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Notlanan Teslim"),
+                ),
+                (
+                    "score_sum",
+                    models.PositiveIntegerField(default=0, verbose_name="Puan Toplamı"),
+                ),
+                (
+                    "attended_sessions",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Katılınan Canlı Ders"
+                    ),
+                ),
+                (
+                    "last_activity_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Son Aktivite"
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "class_group",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Öğrencinin bu kurstaki aktif sınıfı",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="student_stats",
+                        to="student.classgroup",
+                        verbose_name="Sınıf",
+                    ),
+                ),
+                (
+                    "course",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="student_stats",
+                        to="courses.course",
+                        verbose_name="Kurs",
+                    ),
+                ),
+                (
+                    "tenant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="student_course_stats",
+                        to="tenants.tenant",
+                        verbose_name="Akademi",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="course_stats",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Öğrenci",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Öğrenci Kurs Özeti",
+                "verbose_name_plural": "Öğrenci Kurs Özetleri",
+                "indexes": [
+                    models.Index(
+                        fields=["course", "enrollment_status"],
+                        name="studentstats_course_idx",
+                    ),
+                    models.Index(
+                        fields=["class_group"], name="studentstats_class_idx"
+                    ),
+                    models.Index(fields=["tenant"], name="studentstats_tenant_idx"),
+                ],
+                "unique_together": {("user", "course")},
+            },
+        ),
+    ]
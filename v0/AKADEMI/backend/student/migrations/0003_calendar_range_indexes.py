@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("student", "0002_studentcoursestats"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="assignment",
+            index=models.Index(
+                fields=["class_group", "due_date"], name="assignment_class_due_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="livesession",
+            index=models.Index(
+                fields=["instructor", "scheduled_at"], name="livesession_instr_sched_idx"
+            ),
+        ),
+    ]
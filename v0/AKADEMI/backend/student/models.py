@@ -10,6 +10,7 @@ Student Models
 - Notification: Bildirim
 - Message: Mesaj
 - SupportTicket: Destek talebi
+- StudentCourseStats: Öğrenci-kurs analitik özeti
 """
 
 from django.conf import settings
@@ -184,6 +185,7 @@ class Assignment(models.Model):
         indexes = [
             models.Index(fields=['class_group', 'status'], name='assignment_class_status_idx'),
             models.Index(fields=['due_date'], name='assignment_due_idx'),
+            models.Index(fields=['class_group', 'due_date'], name='assignment_class_due_idx'),
         ]
 
     def __str__(self):
@@ -293,6 +295,7 @@ class LiveSession(models.Model):
         indexes = [
             models.Index(fields=['instructor', 'status'], name='livesession_instr_status_idx'),
             models.Index(fields=['scheduled_at'], name='livesession_scheduled_idx'),
+            models.Index(fields=['instructor', 'scheduled_at'], name='livesession_instr_sched_idx'),
         ]
 
     def __str__(self):
@@ -434,3 +437,83 @@ class SupportTicket(models.Model):
     def __str__(self):
         return f"{self.subject} ({self.get_status_display()})"
 
+
+
+class StudentCourseStats(models.Model):
+    """
+    Öğrenci-kurs analitik özeti (fact table).
+    
+    Eğitmen ekranlarının okuduğu denormalize tablo. İlerleme, notlama,
+    izleme ve katılım olaylarında artımlı güncellenir
+    (bkz: backend.student.stats); `rebuild_student_stats` komutu ile
+    sıfırdan oluşturulabilir.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='course_stats',
+        verbose_name=_('Öğrenci'),
+    )
+    course = models.ForeignKey(
+        'courses.Course',
+        on_delete=models.CASCADE,
+        related_name='student_stats',
+        verbose_name=_('Kurs'),
+    )
+    tenant = models.ForeignKey(
+        'tenants.Tenant',
+        on_delete=models.CASCADE,
+        related_name='student_course_stats',
+        verbose_name=_('Akademi'),
+    )
+    class_group = models.ForeignKey(
+        ClassGroup,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='student_stats',
+        verbose_name=_('Sınıf'),
+        help_text=_('Öğrencinin bu kurstaki aktif sınıfı'),
+    )
+    
+    # Kurs kaydı
+    enrollment_status = models.CharField(
+        _('Kayıt Durumu'),
+        max_length=20,
+        blank=True,
+        help_text=_('Kurs kaydı yoksa boş'),
+    )
+    progress_percent = models.PositiveIntegerField(_('İlerleme %'), default=0)
+    
+    # İzleme
+    watch_seconds = models.PositiveBigIntegerField(_('İzleme Süresi (sn)'), default=0)
+    
+    # Notlar (ortalama = score_sum / graded_count)
+    graded_count = models.PositiveIntegerField(_('Notlanan Teslim'), default=0)
+    score_sum = models.PositiveIntegerField(_('Puan Toplamı'), default=0)
+    
+    # Canlı ders katılımı
+    attended_sessions = models.PositiveIntegerField(_('Katılınan Canlı Ders'), default=0)
+    
+    last_activity_at = models.DateTimeField(_('Son Aktivite'), null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _('Öğrenci Kurs Özeti')
+        verbose_name_plural = _('Öğrenci Kurs Özetleri')
+        unique_together = ['user', 'course']
+        indexes = [
+            models.Index(fields=['course', 'enrollment_status'], name='studentstats_course_idx'),
+            models.Index(fields=['class_group'], name='studentstats_class_idx'),
+            models.Index(fields=['tenant'], name='studentstats_tenant_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.course_id}"
+
+    @property
+    def avg_score(self) -> float:
+        if not self.graded_count:
+            return 0
+        return self.score_sum / self.graded_count
@@ -0,0 +1,300 @@
+"""
+Student Risk Scoring
+====================
+
+Öğrenci risk skorunun (0-100) toplu hesaplanması.
+
+Bir kohortun (öğrenci listesi) özellik kolonları tek GROUP BY sorgusu ile
+öğrenci-kurs özet tablosundan (StudentCourseStats) çekilir ve tüm kohort
+NumPy ile tek vektörel geçişte skorlanır. NumPy yüklü değilse aynı
+formül satır bazında uygulanır.
+
+Özellikler ve risk katkısı (0 = risk yok, 1 = tam risk):
+    inactive_days  Son girişten beri gün      0 gün -> 0, 30+ gün -> 1
+    progress       Aktif kayıtların ilerlemesi   %100 -> 0, %0 -> 1
+    avg_score      Notlanan teslim ortalaması    100 -> 0, 0 -> 1
+    watch_hours    Toplam izleme (saat)          10+ -> 0, 0 -> 1
+    attendance     Biten canlı derslere katılım  %100 -> 0, %0 -> 1
+    integrity      Bütünlük skoru                100 -> 0, 0 -> 1
+
+Skor, değeri bilinen özelliklerin ağırlıklı ortalamasıdır (ör. hiç
+notlanmamış öğrencide puan özelliği hesaba katılmaz). Ağırlıklar tenant
+bazında TenantSettings.risk_weights ile değiştirilebilir.
+
+Kullanım:
+    from backend.student.risk import RiskScorer
+
+    ranking = RiskScorer.rank(student_ids, course_ids=my_course_ids)
+    ranking[0]  # {'user_id', 'tenant_id', 'score', 'level'}
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from django.db.models import Avg, Count, IntegerField, Max, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def _numpy():
+    """NumPy modülü (yüklü değilse None)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class RiskScorer:
+    """
+    Vektörel öğrenci risk skoru servisi.
+    """
+
+    FEATURES = ('inactive_days', 'progress', 'avg_score', 'watch_hours', 'attendance', 'integrity')
+
+    DEFAULT_WEIGHTS = {
+        'inactive_days': 0.25,
+        'progress': 0.25,
+        'avg_score': 0.25,
+        'watch_hours': 0.05,
+        'attendance': 0.10,
+        'integrity': 0.10,
+    }
+
+    # özellik -> (risksiz değer, tam riskli değer)
+    RANGES = {
+        'inactive_days': (0.0, 30.0),
+        'progress': (100.0, 0.0),
+        'avg_score': (100.0, 0.0),
+        'watch_hours': (10.0, 0.0),
+        'attendance': (100.0, 0.0),
+        'integrity': (100.0, 0.0),
+    }
+
+    # Seviye eşikleri (skor >= eşik)
+    HIGH_THRESHOLD = 60
+    MEDIUM_THRESHOLD = 35
+
+    LEVELS = ('high', 'medium', 'low')
+
+    @classmethod
+    def level(cls, score: float) -> str:
+        if score >= cls.HIGH_THRESHOLD:
+            return 'high'
+        if score >= cls.MEDIUM_THRESHOLD:
+            return 'medium'
+        return 'low'
+
+    # =========================================================================
+    # AĞIRLIKLAR
+    # =========================================================================
+
+    @classmethod
+    def weights_for(cls, tenant_ids: Iterable) -> Dict[object, dict]:
+        """
+        Tenant bazında ağırlıklar (varsayılanlarla birleştirilmiş).
+
+        Sayı olmayan (bool dahil) ve negatif değerler yok sayılır.
+        """
+        from backend.tenants.models import TenantSettings
+
+        tenant_ids = {pk for pk in tenant_ids if pk is not None}
+        weights = {pk: dict(cls.DEFAULT_WEIGHTS) for pk in tenant_ids}
+
+        if tenant_ids:
+            overrides = TenantSettings.objects.filter(
+                tenant_id__in=tenant_ids
+            ).exclude(risk_weights={}).values_list('tenant_id', 'risk_weights')
+            for tenant_id, custom in overrides:
+                for feature, value in (custom or {}).items():
+                    if feature in cls.RANGES and cls._valid_weight(value):
+                        weights[tenant_id][feature] = float(value)
+
+        return weights
+
+    @staticmethod
+    def _valid_weight(value) -> bool:
+        # bool, int alt sınıfıdır: true/false ağırlık sayılmaz
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        return value >= 0
+
+    # =========================================================================
+    # ÖZELLİKLER
+    # =========================================================================
+
+    @classmethod
+    def features(cls, user_ids, course_ids=None) -> Dict[str, list]:
+        """
+        Kohortun özellik kolonlarını tek sorgu ile çek.
+
+        Args:
+            user_ids: Öğrenci ID listesi veya values('id') alt sorgusu
+            course_ids: Metrikleri bu kurslarla sınırla (None: tüm kurslar)
+
+        Returns:
+            {'user_id': [...], 'tenant_id': [...], <özellik>: [...]}
+            Bilinmeyen değerler None.
+        """
+        from backend.courses.models import Enrollment
+        from backend.live.models import LiveSession
+        from backend.users.models import User
+
+        scope = Q()
+        if course_ids is not None:
+            scope = Q(course_stats__course_id__in=course_ids)
+
+        ended_sessions = LiveSession.objects.filter(
+            course_id=OuterRef('course_stats__course_id'),
+            status=LiveSession.Status.ENDED,
+        ).order_by().values('course_id').annotate(n=Count('id')).values('n')
+
+        rows = User.objects.filter(pk__in=user_ids).order_by().values_list(
+            'id', 'tenant_id', 'last_login',
+        ).annotate(
+            progress=Avg(
+                'course_stats__progress_percent',
+                filter=scope & Q(course_stats__enrollment_status=Enrollment.Status.ACTIVE),
+            ),
+            score_sum=Sum('course_stats__score_sum', filter=scope),
+            graded=Sum('course_stats__graded_count', filter=scope),
+            watch=Sum('course_stats__watch_seconds', filter=scope),
+            attended=Sum('course_stats__attended_sessions', filter=scope),
+            expected=Sum(
+                Coalesce(Subquery(ended_sessions), Value(0), output_field=IntegerField()),
+                filter=scope,
+            ),
+            integrity=Max('integrity_score__score'),
+        )
+
+        now = timezone.now()
+        columns = {name: [] for name in ('user_id', 'tenant_id') + cls.FEATURES}
+
+        for (user_id, tenant_id, last_login, progress, score_sum, graded,
+             watch, attended, expected, integrity) in rows:
+            columns['user_id'].append(user_id)
+            columns['tenant_id'].append(tenant_id)
+            columns['inactive_days'].append(
+                (now - last_login).total_seconds() / 86400 if last_login else None
+            )
+            columns['progress'].append(progress)
+            columns['avg_score'].append(score_sum / graded if graded else None)
+            columns['watch_hours'].append((watch or 0) / 3600)
+            columns['attendance'].append(
+                min((attended or 0) / expected * 100, 100) if expected else None
+            )
+            columns['integrity'].append(integrity)
+
+        return columns
+
+    # =========================================================================
+    # SKORLAMA
+    # =========================================================================
+
+    @classmethod
+    def score(cls, features: Dict[str, list], weights: Optional[Dict[object, dict]] = None) -> list:
+        """
+        Kohortu skorla.
+
+        Hiç girişi olmayan öğrencinin inaktiflik riski tamdır; diğer
+        bilinmeyen değerler skora katılmaz.
+
+        Args:
+            features: features() çıktısı
+            weights: {tenant_id: {özellik: ağırlık}} (None: weights_for)
+
+        Returns:
+            Satır sırasıyla 0-100 arası skorlar
+        """
+        if weights is None:
+            weights = cls.weights_for(set(features['tenant_id']))
+
+        np = _numpy()
+        if np is None:
+            return cls._score_python(features, weights)
+        return cls._score_numpy(np, features, weights).tolist()
+
+    @classmethod
+    def _score_numpy(cls, np, features, weights):
+        count = len(features['user_id'])
+        if not count:
+            return np.zeros(0)
+
+        # n x k özellik matrisi (bilinmeyen = NaN)
+        matrix = np.empty((count, len(cls.FEATURES)))
+        for index, feature in enumerate(cls.FEATURES):
+            matrix[:, index] = np.array(features[feature], dtype=float)
+
+        # Hiç giriş yok -> tam risk
+        inactive = cls.FEATURES.index('inactive_days')
+        matrix[:, inactive] = np.where(
+            np.isnan(matrix[:, inactive]), cls.RANGES['inactive_days'][1], matrix[:, inactive]
+        )
+
+        good = np.array([cls.RANGES[f][0] for f in cls.FEATURES])
+        bad = np.array([cls.RANGES[f][1] for f in cls.FEATURES])
+        risk = np.clip((matrix - good) / (bad - good), 0.0, 1.0)
+
+        # Tenant ağırlık tablosu -> satır bazında ağırlık matrisi
+        tenants = list(weights)
+        default_row = [cls.DEFAULT_WEIGHTS[f] for f in cls.FEATURES]
+        table = np.array(
+            [[weights[t][f] for f in cls.FEATURES] for t in tenants] + [default_row]
+        )
+        position = {tenant: index for index, tenant in enumerate(tenants)}
+        row_tenant = np.fromiter(
+            (position.get(t, len(tenants)) for t in features['tenant_id']), dtype=np.intp, count=count
+        )
+        weight_matrix = table[row_tenant]
+
+        known = ~np.isnan(risk)
+        numerator = np.where(known, risk * weight_matrix, 0.0).sum(axis=1)
+        denominator = np.where(known, weight_matrix, 0.0).sum(axis=1)
+
+        scores = np.zeros(count)
+        np.divide(numerator, denominator, out=scores, where=denominator > 0)
+        return np.round(scores * 100, 1)
+
+    @classmethod
+    def _score_python(cls, features, weights) -> list:
+        scores = []
+        for row in range(len(features['user_id'])):
+            tenant_weights = weights.get(features['tenant_id'][row], cls.DEFAULT_WEIGHTS)
+            numerator = denominator = 0.0
+            for feature in cls.FEATURES:
+                value = features[feature][row]
+                good, bad = cls.RANGES[feature]
+                if value is None:
+                    if feature != 'inactive_days':
+                        continue
+                    value = bad
+                risk = min(max((value - good) / (bad - good), 0.0), 1.0)
+                numerator += risk * tenant_weights[feature]
+                denominator += tenant_weights[feature]
+            scores.append(round(numerator / denominator * 100, 1) if denominator else 0.0)
+        return scores
+
+    @classmethod
+    def rank(cls, user_ids, course_ids=None, weights=None) -> List[dict]:
+        """
+        Kohortu skorla ve riske göre (yüksekten düşüğe) sırala.
+
+        Returns:
+            [{'user_id', 'tenant_id', 'score', 'level'}, ...]
+        """
+        features = cls.features(user_ids, course_ids=course_ids)
+        scores = cls.score(features, weights)
+
+        ranking = [
+            {
+                'user_id': user_id,
+                'tenant_id': tenant_id,
+                'score': score,
+                'level': cls.level(score),
+            }
+            for user_id, tenant_id, score in zip(features['user_id'], features['tenant_id'], scores)
+        ]
+        ranking.sort(key=lambda item: (-item['score'], item['user_id']))
+        return ranking
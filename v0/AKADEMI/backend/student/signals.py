@@ -0,0 +1,146 @@
+"""
+Student Signals
+===============
+
+Öğrenci-kurs analitik özetinin (StudentCourseStats) artımlı bakımı.
+
+Tüm güncellemeler commit sonrasında çalışır; geri alınan transaction
+özet tabloyu etkilemez.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from backend.courses.models import ContentProgress, Enrollment
+from backend.live.models import LiveSessionAttendanceSummary
+
+from .models import Assignment, AssignmentSubmission, ClassEnrollment, ClassGroup
+from .stats import StudentStatsService
+
+
+def _refresh_on_commit(user_id, course_id):
+    if user_id and course_id:
+        transaction.on_commit(lambda: StudentStatsService.refresh(user_id, course_id))
+
+
+# =============================================================================
+# KURS KAYDI
+# =============================================================================
+
+@receiver(post_save, sender=Enrollment)
+def sync_enrollment_stats(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Kayıt durumu / ilerleme değiştiğinde özet satırını güncelle."""
+    if raw:
+        return
+    if update_fields and not {'status', 'progress_percent', 'last_accessed_at'} & set(update_fields):
+        return
+    transaction.on_commit(lambda: StudentStatsService.sync_enrollment(instance))
+
+
+@receiver(post_delete, sender=Enrollment)
+def drop_enrollment_stats(sender, instance, **kwargs):
+    _refresh_on_commit(instance.user_id, instance.course_id)
+
+
+# =============================================================================
+# İZLEME SÜRESİ
+# =============================================================================
+
+@receiver(post_init, sender=ContentProgress)
+def remember_watched_seconds(sender, instance, **kwargs):
+    """Yüklenen izleme süresini sakla - kayıtta fark uygulanır."""
+    # Deferred alan ek sorgu tetiklemesin
+    instance._stats_watched_seconds = instance.__dict__.get('watched_seconds')
+
+
+@receiver(post_save, sender=ContentProgress)
+def add_watch_seconds(sender, instance, created, raw=False, **kwargs):
+    """İzleme süresi farkını özet satırına ekle."""
+    if raw:
+        return
+
+    current = instance.__dict__.get('watched_seconds')
+    previous = 0 if created else instance._stats_watched_seconds
+    instance._stats_watched_seconds = current
+
+    if current is None or previous is None or current == previous:
+        return
+
+    delta = current - previous
+    enrollment = instance._state.fields_cache.get('enrollment')
+    if enrollment is not None:
+        user_id, course_id = enrollment.user_id, enrollment.course_id
+    else:
+        user_id, course_id = Enrollment.objects.filter(
+            pk=instance.enrollment_id
+        ).values_list('user_id', 'course_id').first() or (None, None)
+
+    if user_id and course_id:
+        when = instance.updated_at
+        transaction.on_commit(
+            lambda: StudentStatsService.add_watch_seconds(user_id, course_id, delta, when)
+        )
+
+
+# =============================================================================
+# NOTLAMA, KATILIM, SINIF
+# =============================================================================
+
+def _refresh_submission(instance):
+    course_id = Assignment.objects.filter(
+        pk=instance.assignment_id
+    ).values_list('class_group__course_id', flat=True).first()
+    _refresh_on_commit(instance.student_id, course_id)
+
+
+@receiver(post_init, sender=AssignmentSubmission)
+def remember_submission_status(sender, instance, **kwargs):
+    """Yüklenen durumu sakla - notun geri alınmasını tespit etmek için."""
+    # Deferred alan ek sorgu tetiklemesin
+    instance._stats_status = instance.__dict__.get('status')
+
+
+@receiver(post_save, sender=AssignmentSubmission)
+def refresh_graded_stats(sender, instance, raw=False, **kwargs):
+    """Teslim notlandığında veya notu geri alındığında puan toplamlarını yenile."""
+    if raw:
+        return
+    graded = AssignmentSubmission.Status.GRADED
+    previous, current = instance._stats_status, instance.__dict__.get('status')
+    instance._stats_status = current
+    if graded in (previous, current):
+        _refresh_submission(instance)
+
+
+@receiver(post_delete, sender=AssignmentSubmission)
+def drop_graded_stats(sender, instance, **kwargs):
+    if instance.status == AssignmentSubmission.Status.GRADED:
+        _refresh_submission(instance)
+
+
+@receiver(post_save, sender=LiveSessionAttendanceSummary)
+def refresh_attendance_stats(sender, instance, raw=False, **kwargs):
+    """Katılım özeti hesaplandığında katılım sayısını yenile."""
+    if raw:
+        return
+    session = instance._state.fields_cache.get('session')
+    course_id = session.course_id if session is not None else None
+    if course_id is None:
+        from backend.live.models import LiveSession
+        course_id = LiveSession.objects.filter(
+            pk=instance.session_id
+        ).values_list('course_id', flat=True).first()
+    _refresh_on_commit(instance.user_id, course_id)
+
+
+@receiver(post_save, sender=ClassEnrollment)
+@receiver(post_delete, sender=ClassEnrollment)
+def refresh_class_stats(sender, instance, raw=False, **kwargs):
+    """Sınıf kaydı değiştiğinde öğrencinin sınıfını yenile."""
+    if raw:
+        return
+    course_id = ClassGroup.objects.filter(
+        pk=instance.class_group_id
+    ).values_list('course_id', flat=True).first()
+    _refresh_on_commit(instance.user_id, course_id)
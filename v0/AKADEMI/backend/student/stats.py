@@ -0,0 +1,263 @@
+"""
+Student Course Stats
+====================
+
+Öğrenci-kurs analitik özetinin (StudentCourseStats) bakımı.
+
+Eğitmen ekranları ilerleme, puan, izleme süresi ve katılım metriklerini
+ham tablolardan (Enrollment, ContentProgress, AssignmentSubmission,
+LiveSessionAttendanceSummary) her istekte toplamak yerine bu tablodan okur.
+
+Güncelleme kuralları:
+    - İzleme süresi: ContentProgress kaydedildiğinde fark F-expression ile
+      eklenir (heartbeat başına tek UPDATE).
+    - Kayıt durumu / ilerleme: Enrollment kaydedildiğinde satıra yazılır.
+    - Puan, katılım, sınıf: ilgili olayda satır tek başına yeniden
+      hesaplanır (öğrenci + kurs ile sınırlı küçük sorgular).
+
+Sinyal tetiklemeyen toplu işlemler sapma yaratabilir; `rebuild()`
+(`rebuild_student_stats` komutu) ile düzeltilir.
+
+Kullanım:
+    from backend.student.stats import StudentStatsService
+
+    StudentStatsService.refresh(user_id, course_id)
+    StudentStatsService.rebuild([tenant.id])
+"""
+
+import logging
+from typing import Dict, Iterable, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, FloatField, Max, Sum
+from django.db.models.functions import Cast, NullIf
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def avg_score_expression():
+    """Satır grubunun ağırlıklı ortalama puanı (notlanan teslim yoksa NULL)."""
+    return Cast(Sum('score_sum'), FloatField()) / NullIf(Sum('graded_count'), 0)
+
+
+class StudentStatsService:
+    """
+    Öğrenci-kurs özet servisi.
+    """
+
+    # =========================================================================
+    # ARTIMLI GÜNCELLEME
+    # =========================================================================
+
+    @classmethod
+    def add_watch_seconds(cls, user_id, course_id, delta: int, when=None) -> None:
+        """İzleme süresini atomik olarak artır (satır yoksa oluştur)."""
+        from .models import StudentCourseStats
+
+        if not delta:
+            return
+
+        updated = StudentCourseStats.objects.filter(
+            user_id=user_id, course_id=course_id
+        ).update(
+            watch_seconds=F('watch_seconds') + delta,
+            last_activity_at=when or timezone.now(),
+        )
+        if not updated:
+            cls.refresh(user_id, course_id)
+
+    @classmethod
+    def sync_enrollment(cls, enrollment) -> None:
+        """Kayıt durumu ve ilerlemeyi satıra yaz (satır yoksa oluştur)."""
+        from .models import StudentCourseStats
+
+        updates = {
+            'enrollment_status': enrollment.status,
+            'progress_percent': enrollment.progress_percent,
+        }
+        if enrollment.last_accessed_at:
+            updates['last_activity_at'] = enrollment.last_accessed_at
+
+        updated = StudentCourseStats.objects.filter(
+            user_id=enrollment.user_id, course_id=enrollment.course_id
+        ).update(**updates)
+        if not updated:
+            cls.refresh(enrollment.user_id, enrollment.course_id)
+
+    @classmethod
+    def refresh(cls, user_id, course_id) -> None:
+        """
+        Tek öğrenci-kurs satırını kaynaklardan yeniden hesapla.
+
+        Öğrencinin kursla kaydı (Enrollment veya aktif sınıf kaydı)
+        kalmadıysa satır silinir.
+        """
+        from .models import StudentCourseStats
+
+        rows = cls._collect(user_id=user_id, course_id=course_id)
+        row = rows.get((user_id, course_id))
+
+        if row is None:
+            StudentCourseStats.objects.filter(user_id=user_id, course_id=course_id).delete()
+            return
+
+        defaults = {
+            field: getattr(row, field)
+            for field in cls.STAT_FIELDS
+        }
+        try:
+            with transaction.atomic():
+                StudentCourseStats.objects.update_or_create(
+                    user_id=user_id, course_id=course_id, defaults=defaults
+                )
+        except IntegrityError:
+            # Eşzamanlı oluşturma - satır artık var
+            StudentCourseStats.objects.filter(
+                user_id=user_id, course_id=course_id
+            ).update(**defaults)
+
+    # =========================================================================
+    # HESAPLAMA
+    # =========================================================================
+
+    STAT_FIELDS = (
+        'tenant_id', 'class_group_id', 'enrollment_status', 'progress_percent',
+        'watch_seconds', 'graded_count', 'score_sum', 'attended_sessions',
+        'last_activity_at',
+    )
+
+    @classmethod
+    def _collect(
+        cls,
+        user_id=None,
+        course_id=None,
+        tenant_ids: Optional[Iterable] = None,
+    ) -> Dict[tuple, object]:
+        """
+        Özet satırlarını kaynak tablolardan gruplanmış sorgularla hesapla.
+
+        Kaynak başına tek GROUP BY sorgusu çalışır; kapsam öğrenci + kurs
+        (refresh) veya tenant listesi (rebuild) ile daraltılır.
+
+        Returns:
+            {(user_id, course_id): StudentCourseStats (kaydedilmemiş)}
+        """
+        from backend.courses.models import ContentProgress, Enrollment
+        from backend.live.models import LiveSession, LiveSessionAttendanceSummary
+
+        from .models import AssignmentSubmission, ClassEnrollment, StudentCourseStats
+
+        def scoped(queryset, user_field, course_field):
+            filters = {}
+            if user_id is not None:
+                filters[user_field] = user_id
+            if course_id is not None:
+                filters[course_field] = course_id
+            if tenant_ids is not None:
+                filters[course_field.replace('course_id', 'course__tenant_id') + '__in'] = tenant_ids
+            return queryset.filter(**filters).order_by()
+
+        tenant_ids = list(tenant_ids) if tenant_ids is not None else None
+        rows = {}
+
+        def row_for(key, tenant_id):
+            if key not in rows:
+                rows[key] = StudentCourseStats(
+                    user_id=key[0], course_id=key[1], tenant_id=tenant_id
+                )
+            return rows[key]
+
+        # Kurs kayıtları
+        enrollments = scoped(Enrollment.objects.all(), 'user_id', 'course_id').values_list(
+            'user_id', 'course_id', 'course__tenant_id', 'status', 'progress_percent', 'last_accessed_at'
+        )
+        for user, course, tenant, status, progress, accessed in enrollments:
+            row = row_for((user, course), tenant)
+            row.enrollment_status = status
+            row.progress_percent = progress
+            row.last_activity_at = accessed
+
+        # Aktif sınıf kayıtları
+        class_enrollments = scoped(
+            ClassEnrollment.objects.filter(status=ClassEnrollment.Status.ACTIVE),
+            'user_id', 'class_group__course_id',
+        ).values_list('user_id', 'class_group__course_id', 'class_group__course__tenant_id', 'class_group_id')
+        for user, course, tenant, class_group in class_enrollments:
+            row_for((user, course), tenant).class_group_id = class_group
+
+        # Aşağıdaki metrikler yalnızca kaydı olan satırlara yazılır
+
+        # İzleme süresi
+        watch = scoped(ContentProgress.objects.all(), 'enrollment__user_id', 'enrollment__course_id').values(
+            'enrollment__user_id', 'enrollment__course_id'
+        ).annotate(total=Sum('watched_seconds'), last=Max('updated_at'))
+        for item in watch:
+            row = rows.get((item['enrollment__user_id'], item['enrollment__course_id']))
+            if row is None:
+                continue
+            row.watch_seconds = item['total'] or 0
+            if item['last'] and (row.last_activity_at is None or item['last'] > row.last_activity_at):
+                row.last_activity_at = item['last']
+
+        # Notlanan teslimler
+        graded = scoped(
+            AssignmentSubmission.objects.filter(
+                status=AssignmentSubmission.Status.GRADED,
+                score__isnull=False,
+            ),
+            'student_id', 'assignment__class_group__course_id',
+        ).values('student_id', 'assignment__class_group__course_id').annotate(
+            n=Count('id'), total=Sum('score')
+        )
+        for item in graded:
+            row = rows.get((item['student_id'], item['assignment__class_group__course_id']))
+            if row is None:
+                continue
+            row.graded_count = item['n']
+            row.score_sum = item['total'] or 0
+
+        # Canlı ders katılımı (biten oturumlarda eşiği geçen)
+        attendance = scoped(
+            LiveSessionAttendanceSummary.objects.filter(
+                attended=True,
+                session__status=LiveSession.Status.ENDED,
+            ),
+            'user_id', 'session__course_id',
+        ).values('user_id', 'session__course_id').annotate(n=Count('id'))
+        for item in attendance:
+            row = rows.get((item['user_id'], item['session__course_id']))
+            if row is None:
+                continue
+            row.attended_sessions = item['n']
+
+        return rows
+
+    # =========================================================================
+    # YENİDEN OLUŞTURMA
+    # =========================================================================
+
+    @classmethod
+    def rebuild(cls, tenant_ids: Optional[Iterable] = None) -> int:
+        """
+        Özet tablosunu kaynaklardan sıfırdan oluştur.
+
+        İlk kurulum (backfill) ve veri onarımı içindir.
+
+        Returns:
+            Oluşturulan satır sayısı
+        """
+        from .models import StudentCourseStats
+
+        tenant_ids = list(tenant_ids) if tenant_ids is not None else None
+        rows = cls._collect(tenant_ids=tenant_ids)
+
+        with transaction.atomic():
+            existing = StudentCourseStats.objects.all()
+            if tenant_ids is not None:
+                existing = existing.filter(tenant_id__in=tenant_ids)
+            existing.delete()
+            StudentCourseStats.objects.bulk_create(rows.values(), batch_size=1000)
+
+        logger.info(f"Student course stats rebuilt: {len(rows)} row(s)")
+        return len(rows)
@@ -0,0 +1 @@
+# Student tests
@@ -0,0 +1,144 @@
+"""
+Student Risk Scoring Tests
+==========================
+
+RiskScorer formülü, NumPy / saf Python eşitliği ve tenant ağırlıkları
+testleri. 100k satırlık süre ölçümü: `risk_benchmark` komutu.
+"""
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from backend.student.benchmark import default_weights, synthetic_features
+from backend.student.risk import RiskScorer, _numpy
+
+
+class RiskScoreTest(SimpleTestCase):
+    """Skorlama formülü testleri (veritabanı yok)."""
+
+    def _row(self, **values):
+        features = {name: [None] for name in RiskScorer.FEATURES}
+        features.update({'user_id': [1], 'tenant_id': [1]})
+        features.update({name: [value] for name, value in values.items()})
+        return features
+
+    def test_extremes(self):
+        """Tam riskli ve risksiz öğrenci."""
+        worst = self._row(inactive_days=45, progress=0, avg_score=0, watch_hours=0, attendance=0, integrity=0)
+        best = self._row(inactive_days=0, progress=100, avg_score=100, watch_hours=12, attendance=100, integrity=100)
+
+        self.assertEqual(RiskScorer.score(worst, default_weights()), [100.0])
+        self.assertEqual(RiskScorer.score(best, default_weights()), [0.0])
+
+    def test_unknown_features_are_skipped(self):
+        """Bilinmeyen özellikler ortalamaya katılmaz; girişi olmayan tam inaktif sayılır."""
+        # Sadece ilerleme (%50) ve izleme (10+ saat) bilinir
+        known = self._row(inactive_days=0, progress=50, watch_hours=10)
+        never_logged_in = self._row(progress=100, watch_hours=10)
+
+        weights = RiskScorer.DEFAULT_WEIGHTS
+        expected = round(
+            0.5 * weights['progress'] / (weights['inactive_days'] + weights['progress'] + weights['watch_hours']) * 100, 1
+        )
+        self.assertEqual(RiskScorer.score(known, default_weights()), [expected])
+        self.assertGreater(RiskScorer.score(never_logged_in, default_weights())[0], 0)
+
+    def test_numpy_matches_python(self):
+        """Vektörel ve satır bazlı hesap aynı skorları verir."""
+        np = _numpy()
+        if np is None:
+            self.skipTest('NumPy yüklü değil')
+
+        features = synthetic_features(2000)
+        weights = default_weights()
+        weights[2]['progress'] = 0.6
+        # Ağırlık tablosunda olmayan tenant varsayılanı kullanır
+        features['tenant_id'][:10] = [99] * 10
+
+        vectorized = RiskScorer._score_numpy(np, features, weights).tolist()
+        python = RiskScorer._score_python(features, weights)
+
+        self.assertEqual(len(vectorized), len(python))
+        for a, b in zip(vectorized, python):
+            self.assertAlmostEqual(a, b, places=1)
+
+    def test_level_thresholds(self):
+        self.assertEqual(RiskScorer.level(RiskScorer.HIGH_THRESHOLD), 'high')
+        self.assertEqual(RiskScorer.level(RiskScorer.MEDIUM_THRESHOLD), 'medium')
+        self.assertEqual(RiskScorer.level(RiskScorer.MEDIUM_THRESHOLD - 0.1), 'low')
+
+
+class RiskScorerDatabaseTest(TestCase):
+    """Ağırlık ve özellik sorguları testleri."""
+
+    @classmethod
+    def setUpTestData(cls):
+        from backend.courses.models import Course, Enrollment
+        from backend.student.stats import StudentStatsService
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        cls.tenant = Tenant.objects.create(name='Test Akademi', slug='test-akademi')
+        course = Course.objects.create(
+            title='Course',
+            slug='course',
+            description='Test course description',
+            category='Technology',
+            tenant=cls.tenant,
+        )
+
+        # Aktif ve ilerlemiş / hiç giriş yapmamış ve ilerlemesiz
+        cls.engaged = User.objects.create_user(
+            email='engaged@test.com', password='testpass123', tenant=cls.tenant, role='STUDENT',
+        )
+        cls.idle = User.objects.create_user(
+            email='idle@test.com', password='testpass123', tenant=cls.tenant, role='STUDENT',
+        )
+        User.objects.filter(pk=cls.engaged.pk).update(last_login=timezone.now())
+        Enrollment.objects.create(user=cls.engaged, course=course, progress_percent=90)
+        Enrollment.objects.create(user=cls.idle, course=course, progress_percent=0)
+
+        StudentStatsService.rebuild()
+
+    def _set_weights(self, risk_weights):
+        from backend.tenants.models import TenantSettings
+
+        TenantSettings.objects.update_or_create(tenant=self.tenant, defaults={'risk_weights': risk_weights})
+
+    def test_weights_for_rejects_invalid_values(self):
+        """Bool, metin, negatif, boş ve bilinmeyen özellikler yok sayılır."""
+        self._set_weights({
+            'progress': 0.5,
+            'avg_score': 1,
+            'inactive_days': True,
+            'watch_hours': '0.3',
+            'attendance': -1,
+            'integrity': None,
+            'unknown': 1,
+        })
+
+        weights = RiskScorer.weights_for([self.tenant.id, None])
+
+        expected = dict(RiskScorer.DEFAULT_WEIGHTS, progress=0.5, avg_score=1.0)
+        self.assertEqual(weights, {self.tenant.id: expected})
+
+    def test_rank(self):
+        """Özellikler özet tablosundan okunur, riske göre sıralanır."""
+        from backend.users.models import User
+
+        ranking = RiskScorer.rank(User.objects.filter(role='STUDENT').values('id'))
+
+        self.assertEqual([item['user_id'] for item in ranking], [self.idle.id, self.engaged.id])
+        self.assertEqual([item['level'] for item in ranking], ['high', 'low'])
+        self.assertEqual({item['tenant_id'] for item in ranking}, {self.tenant.id})
+
+    def test_rank_uses_tenant_weights(self):
+        """Tenant ağırlığı skoru değiştirir."""
+        from backend.users.models import User
+
+        students = User.objects.filter(pk=self.engaged.pk).values('id')
+        before = RiskScorer.rank(students)[0]['score']
+        self._set_weights({'watch_hours': 0})
+        after = RiskScorer.rank(students)[0]['score']
+
+        self.assertLess(after, before)
@@ -0,0 +1,192 @@
+"""
+Student Course Stats Tests
+==========================
+
+Öğrenci-kurs özet tablosunun (StudentCourseStats) sinyallerle artımlı
+bakımı ve rebuild ile tutarlılığı testleri.
+"""
+
+from django.test import TestCase
+from django.utils import timezone
+
+from backend.student.models import StudentCourseStats
+from backend.student.stats import StudentStatsService
+
+
+class StudentStatsSignalsTest(TestCase):
+    """StudentCourseStats sinyal testleri."""
+
+    @classmethod
+    def setUpTestData(cls):
+        from backend.courses.models import Course, CourseContent, CourseModule
+        from backend.student.models import Assignment, ClassGroup
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        cls.tenant = Tenant.objects.create(name='Test Akademi', slug='test-akademi')
+        cls.instructor = User.objects.create_user(
+            email='instructor@test.com', password='testpass123', tenant=cls.tenant, role='INSTRUCTOR',
+        )
+        cls.student = User.objects.create_user(
+            email='student@test.com', password='testpass123', tenant=cls.tenant, role='STUDENT',
+        )
+        cls.course = Course.objects.create(
+            title='Course',
+            slug='course',
+            description='Test course description',
+            category='Technology',
+            tenant=cls.tenant,
+        )
+        cls.class_group = ClassGroup.objects.create(name='Class', tenant=cls.tenant, course=cls.course)
+        cls.content = CourseContent.objects.create(
+            module=CourseModule.objects.create(course=cls.course, title='Module'),
+            title='Video',
+            type=CourseContent.ContentType.VIDEO,
+        )
+        cls.assignment = Assignment.objects.create(
+            title='Assignment',
+            description='Test assignment',
+            class_group=cls.class_group,
+            created_by=cls.instructor,
+            due_date=timezone.now(),
+            status=Assignment.Status.PUBLISHED,
+        )
+
+    def _stats(self):
+        return StudentCourseStats.objects.filter(user=self.student, course=self.course).first()
+
+    def _enroll(self, **fields):
+        from backend.courses.models import Enrollment
+
+        with self.captureOnCommitCallbacks(execute=True):
+            return Enrollment.objects.create(user=self.student, course=self.course, **fields)
+
+    def test_updates_wait_for_commit(self):
+        """Sinyaller commit öncesi özet tabloya yazmaz."""
+        from backend.courses.models import Enrollment
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            Enrollment.objects.create(user=self.student, course=self.course)
+
+        self.assertIsNone(self._stats())
+        self.assertTrue(callbacks)
+
+    def test_enrollment_sync_and_delete(self):
+        """Kayıt oluşturma / ilerleme / silme özet satırına yansır."""
+        enrollment = self._enroll(progress_percent=10)
+        self.assertEqual(self._stats().progress_percent, 10)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            enrollment.progress_percent = 60
+            enrollment.save(update_fields=['progress_percent'])
+        self.assertEqual(self._stats().progress_percent, 60)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            enrollment.delete()
+        self.assertIsNone(self._stats())
+
+    def test_watch_seconds_delta(self):
+        """İzleme süresi kayıt başına fark olarak eklenir."""
+        from backend.courses.models import ContentProgress
+
+        enrollment = self._enroll()
+        with self.captureOnCommitCallbacks(execute=True):
+            progress = ContentProgress.objects.create(
+                enrollment=enrollment, content=self.content, watched_seconds=120,
+            )
+        with self.captureOnCommitCallbacks(execute=True):
+            progress.watched_seconds = 300
+            progress.save()
+        # Değişmeyen süre tekrar eklenmez
+        with self.captureOnCommitCallbacks(execute=True):
+            progress.progress_percent = 50
+            progress.save()
+
+        self.assertEqual(self._stats().watch_seconds, 300)
+
+    def test_graded_submission_and_class(self):
+        """Notlanan teslim ve aktif sınıf kaydı özet satırına yazılır."""
+        from backend.student.models import AssignmentSubmission, ClassEnrollment
+
+        self._enroll()
+        with self.captureOnCommitCallbacks(execute=True):
+            ClassEnrollment.objects.create(user=self.student, class_group=self.class_group)
+            AssignmentSubmission.objects.create(
+                assignment=self.assignment,
+                student=self.student,
+                status=AssignmentSubmission.Status.GRADED,
+                score=85,
+                submitted_at=timezone.now(),
+            )
+
+        stats = self._stats()
+        self.assertEqual(stats.class_group_id, self.class_group.id)
+        self.assertEqual((stats.graded_count, stats.score_sum), (1, 85))
+
+    def test_ungraded_submission(self):
+        """Notu geri alınan teslim puan toplamlarından düşer."""
+        from backend.student.models import AssignmentSubmission
+
+        self._enroll()
+        with self.captureOnCommitCallbacks(execute=True):
+            AssignmentSubmission.objects.create(
+                assignment=self.assignment,
+                student=self.student,
+                status=AssignmentSubmission.Status.GRADED,
+                score=85,
+                submitted_at=timezone.now(),
+            )
+
+        submission = AssignmentSubmission.objects.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            submission.status = AssignmentSubmission.Status.SUBMITTED
+            submission.save()
+
+        stats = self._stats()
+        self.assertEqual((stats.graded_count, stats.score_sum), (0, 0))
+
+    def test_attendance(self):
+        """Biten canlı derste eşiği geçen katılım sayılır."""
+        from backend.live.models import LiveSession, LiveSessionAttendanceSummary
+
+        now = timezone.now()
+        self._enroll()
+        session = LiveSession.objects.create(
+            tenant=self.tenant,
+            course=self.course,
+            created_by=self.instructor,
+            title='Live',
+            scheduled_start=now,
+            scheduled_end=now,
+            status=LiveSession.Status.ENDED,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            LiveSessionAttendanceSummary.objects.create(
+                session=session, user=self.student, first_join=now, attended=True,
+            )
+
+        self.assertEqual(self._stats().attended_sessions, 1)
+
+    def test_incremental_matches_rebuild(self):
+        """Artımlı güncellenen satır rebuild sonucuyla aynı."""
+        from backend.courses.models import ContentProgress
+        from backend.student.models import AssignmentSubmission, ClassEnrollment
+
+        enrollment = self._enroll(progress_percent=30)
+        with self.captureOnCommitCallbacks(execute=True):
+            ClassEnrollment.objects.create(user=self.student, class_group=self.class_group)
+            ContentProgress.objects.create(enrollment=enrollment, content=self.content, watched_seconds=90)
+            AssignmentSubmission.objects.create(
+                assignment=self.assignment,
+                student=self.student,
+                status=AssignmentSubmission.Status.GRADED,
+                score=70,
+                submitted_at=timezone.now(),
+            )
+
+        fields = [field for field in StudentStatsService.STAT_FIELDS if field != 'last_activity_at']
+        incremental = StudentCourseStats.objects.filter(pk=self._stats().pk).values(*fields).get()
+        StudentStatsService.rebuild()
+        rebuilt = StudentCourseStats.objects.filter(user=self.student, course=self.course).values(*fields).get()
+
+        self.assertEqual(incremental, rebuilt)
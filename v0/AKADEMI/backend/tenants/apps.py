@@ -7,3 +7,10 @@ class TenantsConfig(AppConfig):
     label = 'tenants'
     verbose_name = 'Akademiler'
 
+
+    def ready(self):
+        # Sayaç sinyallerini import et
+        try:
+            from . import signals  # noqa: F401
+        except ImportError:
+            pass
@@ -0,0 +1,65 @@
+"""
+Tenant Cache
+============
+
+Tenant ve TenantSettings için iki katmanlı (process LRU + paylaşılan)
+cache okuyucuları (bkz: backend.libs.cache.tiered).
+
+Tenant neredeyse her istekte (request.user.tenant) okunur. Kayıt,
+silme ve sayaç (stats_*) güncellemelerinde commit sonrası invalidate
+edilir (bkz: backend.tenants.signals, TenantCounters).
+
+Kullanım:
+    from backend.tenants.cache import TenantCache
+
+    tenant = TenantCache.get(tenant_id)
+    settings = TenantCache.get_settings(tenant_id)
+"""
+
+from typing import Iterable
+
+from backend.libs.cache.invalidation import invalidate
+from backend.libs.cache.tiered import tiered_cache
+
+
+class TenantCache:
+    """
+    Tenant referans verisi cache'i.
+    """
+
+    TENANT_FAMILY = 'tenant'
+    SETTINGS_FAMILY = 'tenant_settings'
+
+    @classmethod
+    def get(cls, tenant_id):
+        """Tenant (yoksa None)."""
+        from .models import Tenant
+
+        if not tenant_id:
+            return None
+        return tiered_cache(cls.TENANT_FAMILY).get_or_set(
+            str(tenant_id),
+            lambda: Tenant.objects.filter(pk=tenant_id).first(),
+        )
+
+    @classmethod
+    def get_settings(cls, tenant_id):
+        """Tenant ayarları (yoksa None)."""
+        from .models import TenantSettings
+
+        if not tenant_id:
+            return None
+        return tiered_cache(cls.SETTINGS_FAMILY).get_or_set(
+            str(tenant_id),
+            lambda: TenantSettings.objects.filter(tenant_id=tenant_id).first(),
+        )
+
+    @classmethod
+    def invalidate(cls, tenant_ids: Iterable) -> None:
+        """Tenant kayıtlarını commit sonrası invalidate et."""
+        invalidate(tiered={cls.TENANT_FAMILY: [str(pk) for pk in tenant_ids if pk]})
+
+    @classmethod
+    def invalidate_settings(cls, tenant_ids: Iterable) -> None:
+        """Tenant ayarlarını commit sonrası invalidate et."""
+        invalidate(tiered={cls.SETTINGS_FAMILY: [str(pk) for pk in tenant_ids if pk]})
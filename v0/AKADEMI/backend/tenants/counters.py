@@ -0,0 +1,184 @@
+"""
+Tenant Counters
+===============
+
+Tenant.stats_* alanlarının artımlı bakımı.
+
+Kullanıcı, kurs ve dosya kayıtları oluşturulduğunda / silindiğinde
+ilgili sayaç aynı transaction içinde F-expression ile güncellenir.
+Böylece kota kontrolleri (can_add_user, can_add_course,
+storage_used_percent) canlı COUNT sorgusuna ihtiyaç duymaz.
+
+Sinyal tetiklemeyen toplu işlemler (bulk_create, queryset.update)
+sayaçlarda sapma yaratabilir; bunlar periyodik `reconcile()` ile
+toplu olarak düzeltilir.
+
+Kullanım:
+    from backend.tenants.counters import TenantCounters
+
+    TenantCounters.reconcile()               # Tüm tenant'lar
+    TenantCounters.reconcile([tenant.id])    # Belirli tenant'lar
+"""
+
+import logging
+import math
+from typing import Dict, Iterable, Optional
+
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Ceil, Greatest
+
+logger = logging.getLogger(__name__)
+
+
+BYTES_PER_MB = 1024 * 1024
+
+
+def file_size_mb(size: Optional[int]) -> int:
+    """Dosya boyutunu MB'a yuvarla (yukarı)."""
+    if not size:
+        return 0
+    return int(math.ceil(size / BYTES_PER_MB))
+
+
+class TenantCounters:
+    """
+    Tenant sayaç servisi.
+    """
+
+    # Sayaç alanları
+    USERS = 'stats_users'
+    COURSES = 'stats_courses'
+    STORAGE_MB = 'stats_storage_used_mb'
+
+    FIELDS = (USERS, COURSES, STORAGE_MB)
+
+    # =========================================================================
+    # ARTIMLI GÜNCELLEME
+    # =========================================================================
+
+    @classmethod
+    def adjust(cls, tenant_id, field: str, delta: int) -> None:
+        """
+        Sayaçı atomik olarak artır / azalt.
+
+        Negatif sonuçlar 0'a sabitlenir (PositiveIntegerField).
+        """
+        if not tenant_id or not delta:
+            return
+
+        from .cache import TenantCache
+        from .models import Tenant
+
+        if delta > 0:
+            expression = F(field) + delta
+        else:
+            expression = Greatest(F(field) + delta, 0)
+
+        Tenant.objects.filter(pk=tenant_id).update(**{field: expression})
+        TenantCache.invalidate([tenant_id])
+
+    @classmethod
+    def apply_change(cls, field: str, old: tuple, new: tuple) -> None:
+        """
+        Bir kaydın önceki ve yeni katkısı arasındaki farkı uygula.
+
+        Args:
+            field: Sayaç alanı
+            old: (tenant_id, katkı) - kayıt öncesi durum
+            new: (tenant_id, katkı) - kayıt sonrası durum
+        """
+        old_tenant, old_value = old
+        new_tenant, new_value = new
+
+        if old_tenant == new_tenant:
+            cls.adjust(new_tenant, field, new_value - old_value)
+            return
+
+        cls.adjust(old_tenant, field, -old_value)
+        cls.adjust(new_tenant, field, new_value)
+
+    # =========================================================================
+    # MUTABAKAT
+    # =========================================================================
+
+    @classmethod
+    def compute(cls, tenant_ids: Optional[Iterable] = None) -> Dict[int, dict]:
+        """
+        Gerçek değerleri toplu olarak hesapla (model başına tek sorgu).
+
+        Returns:
+            {tenant_id: {'stats_users': int, 'stats_courses': int,
+                         'stats_storage_used_mb': int}}
+        """
+        from backend.users.models import User
+        from backend.courses.models import Course
+        from backend.storage.models import FileUpload
+
+        if tenant_ids is not None:
+            tenant_ids = list(tenant_ids)
+
+        def scoped(queryset):
+            queryset = queryset.filter(tenant__isnull=False).order_by()
+            if tenant_ids is not None:
+                queryset = queryset.filter(tenant_id__in=tenant_ids)
+            return queryset.values('tenant_id')
+
+        result = {}
+
+        def row_for(tenant_id):
+            return result.setdefault(tenant_id, {field: 0 for field in cls.FIELDS})
+
+        for row in scoped(User.objects.all()).annotate(total=Count('id')):
+            row_for(row['tenant_id'])[cls.USERS] = row['total']
+
+        for row in scoped(Course.objects.all()).annotate(total=Count('id')):
+            row_for(row['tenant_id'])[cls.COURSES] = row['total']
+
+        storage_rows = scoped(
+            FileUpload.objects.exclude(status=FileUpload.Status.DELETED)
+        ).annotate(
+            total=Sum(Ceil(F('file_size') / float(BYTES_PER_MB)))
+        )
+        for row in storage_rows:
+            row_for(row['tenant_id'])[cls.STORAGE_MB] = int(row['total'] or 0)
+
+        return result
+
+    @classmethod
+    def reconcile(cls, tenant_ids: Optional[Iterable] = None) -> int:
+        """
+        Sapmış sayaçları toplu olarak düzelt.
+
+        Sadece değeri farklı olan tenant'lar tek bulk_update ile yazılır.
+
+        Returns:
+            Düzeltilen tenant sayısı
+        """
+        from .cache import TenantCache
+        from .models import Tenant
+
+        actual = cls.compute(tenant_ids)
+
+        tenants = Tenant.objects.only('id', *cls.FIELDS)
+        if tenant_ids is not None:
+            tenants = tenants.filter(pk__in=list(tenant_ids))
+
+        empty = {field: 0 for field in cls.FIELDS}
+        drifted = []
+
+        for tenant in tenants.iterator():
+            expected = actual.get(tenant.id, empty)
+            changed = False
+            for field in cls.FIELDS:
+                if getattr(tenant, field) != expected[field]:
+                    setattr(tenant, field, expected[field])
+                    changed = True
+            if changed:
+                drifted.append(tenant)
+
+        if drifted:
+            Tenant.objects.bulk_update(drifted, cls.FIELDS, batch_size=500)
+            TenantCache.invalidate(tenant.id for tenant in drifted)
+            logger.info(f"Tenant counters reconciled: {len(drifted)} tenant(s) drifted")
+
+        return len(drifted)
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tenants", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tenantsettings",
+            name="risk_weights",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text='Öğrenci risk skoru özellik ağırlıkları, örn: {"progress": 0.4}. Boş bırakılan özellikler varsayılanı kullanır.',
+                verbose_name="Risk Ağırlıkları",
+            ),
+        ),
+    ]
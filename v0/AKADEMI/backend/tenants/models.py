@@ -270,12 +270,16 @@ class Tenant(models.Model):
         return self.stats_courses < self.course_limit
 
     def update_stats(self):
-        """İstatistikleri güncelle."""
-        from backend.users.models import User
+        """
+        İstatistikleri gerçek değerlerden yeniden hesapla.
+        
+        Sayaçlar normalde sinyallerle artımlı güncellenir
+        (bkz: backend.tenants.counters); bu metod tek tenant mutabakatıdır.
+        """
+        from .counters import TenantCounters
         
-        self.stats_users = self.users.count()
-        # self.stats_courses = self.courses.count()  # Course modeli oluşturulduğunda
-        self.save(update_fields=['stats_users', 'stats_courses'])
+        TenantCounters.reconcile([self.pk])
+        self.refresh_from_db(fields=list(TenantCounters.FIELDS))
 
 
 class TenantSettings(models.Model):
@@ -345,6 +349,15 @@ class TenantSettings(models.Model):
         blank=True,
     )
     
+    # Analitik
+    risk_weights = models.JSONField(
+        _('Risk Ağırlıkları'),
+        default=dict,
+        blank=True,
+        help_text=_('Öğrenci risk skoru özellik ağırlıkları, örn: {"progress": 0.4}. '
+                    'Boş bırakılan özellikler varsayılanı kullanır.'),
+    )
+    
     # Özelleştirme
     custom_css = models.TextField(
         _('Özel CSS'),
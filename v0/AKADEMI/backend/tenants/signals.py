@@ -0,0 +1,122 @@
+"""
+Tenant Signals
+==============
+
+Tenant sayaçlarının (stats_*) artımlı bakımı.
+
+Her izlenen model için yüklendiği andaki (tenant, katkı) durumu
+post_init'te saklanır; post_save / post_delete'te aradaki fark
+TenantCounters ile aynı transaction içinde uygulanır.
+
+Tenant / TenantSettings değişikliklerinde iki katmanlı cache
+invalidate edilir (bkz: backend.tenants.cache).
+"""
+
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from backend.courses.models import Course
+from backend.storage.models import FileUpload
+from backend.users.models import User
+
+from .cache import TenantCache
+from .counters import TenantCounters, file_size_mb
+from .models import Tenant, TenantSettings
+
+
+SNAPSHOT_ATTR = '_tenant_counter_snapshot'
+
+
+def _user_contribution(instance):
+    return 1
+
+
+def _course_contribution(instance):
+    return 1
+
+
+def _file_contribution(instance):
+    if instance.status == FileUpload.Status.DELETED:
+        return 0
+    return file_size_mb(instance.file_size)
+
+
+# model -> (sayaç alanı, katkı fonksiyonu, katkının okuduğu alanlar)
+TRACKED_MODELS = {
+    User: (TenantCounters.USERS, _user_contribution, ()),
+    Course: (TenantCounters.COURSES, _course_contribution, ()),
+    FileUpload: (TenantCounters.STORAGE_MB, _file_contribution, ('status', 'file_size')),
+}
+
+
+def _is_loaded(instance, attnames) -> bool:
+    """Alanlar yüklenmiş mi? (deferred alan ek sorgu tetiklemesin)"""
+    return all(name in instance.__dict__ for name in ('tenant_id',) + attnames)
+
+
+def _state(instance, contribution):
+    """Kaydın mevcut (tenant_id, katkı) durumu."""
+    # Ham FK değeri - tenant ilişkisini yüklemez
+    tenant_id = instance.__dict__.get('tenant_id')
+    if tenant_id is None:
+        return None, 0
+    return tenant_id, contribution(instance)
+
+
+def _snapshot(sender, instance, **kwargs):
+    """Kayıt yüklendiğinde / kaydedildiğinde durumu sakla."""
+    # Not: from_db _state.adding'i __init__ sonrası ayarlar; yeni kayıtlar
+    # post_save'de `created` ile ayırt edilir.
+    _, contribution, attnames = TRACKED_MODELS[sender]
+    if _is_loaded(instance, attnames):
+        setattr(instance, SNAPSHOT_ATTR, _state(instance, contribution))
+    else:
+        setattr(instance, SNAPSHOT_ATTR, None)
+
+
+def _on_save(sender, instance, created, raw=False, **kwargs):
+    """Oluşturma / güncellemede sayaç farkını uygula."""
+    if raw:
+        return
+
+    field, contribution, attnames = TRACKED_MODELS[sender]
+    old = (None, 0) if created else getattr(instance, SNAPSHOT_ATTR, None)
+
+    if old is None or not _is_loaded(instance, attnames):
+        # Snapshot yok (deferred yükleme vb.) - mutabakata bırak
+        return
+
+    new = _state(instance, contribution)
+    TenantCounters.apply_change(field, old, new)
+    setattr(instance, SNAPSHOT_ATTR, new)
+
+
+def _on_delete(sender, instance, **kwargs):
+    """Silmede kaydın katkısını düş."""
+    field, contribution, attnames = TRACKED_MODELS[sender]
+    old = getattr(instance, SNAPSHOT_ATTR, None)
+    if old is None:
+        if not _is_loaded(instance, attnames):
+            return
+        old = _state(instance, contribution)
+    TenantCounters.apply_change(field, old, (None, 0))
+
+
+for _model in TRACKED_MODELS:
+    post_init.connect(_snapshot, sender=_model, dispatch_uid=f'tenant_counters_init_{_model.__name__}')
+    post_save.connect(_on_save, sender=_model, dispatch_uid=f'tenant_counters_save_{_model.__name__}')
+    post_delete.connect(_on_delete, sender=_model, dispatch_uid=f'tenant_counters_delete_{_model.__name__}')
+
+
+# =============================================================================
+# CACHE INVALIDATION
+# =============================================================================
+
+@receiver([post_save, post_delete], sender=Tenant, dispatch_uid='tenant_cache_invalidation')
+def invalidate_tenant_cache(sender, instance, **kwargs):
+    TenantCache.invalidate([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=TenantSettings, dispatch_uid='tenant_settings_cache_invalidation')
+def invalidate_tenant_settings_cache(sender, instance, **kwargs):
+    TenantCache.invalidate_settings([instance.tenant_id])
@@ -0,0 +1,45 @@
+"""
+Tenant Celery Tasks
+===================
+
+Tenant sayaçlarının periyodik mutabakatı.
+"""
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def reconcile_tenant_counters():
+    """
+    Tenant.stats_* sayaçlarını gerçek değerlerle karşılaştır ve düzelt.
+    
+    Sinyal tetiklemeyen toplu işlemlerin (bulk_create, queryset.update)
+    yarattığı sapmaları kapatır.
+    """
+    from .counters import TenantCounters
+    
+    drifted = TenantCounters.reconcile()
+    
+    logger.info(f"Tenant counter reconciliation done: {drifted} drifted")
+    return drifted
+
+
+@shared_task
+def warm_tenant_caches():
+    """
+    Aktif tenant'ların sık ziyaret edilen sayfalarını cache'e doldur.
+    
+    Endpoint listesi ve paralellik CACHE_WARMER ayarından gelir
+    (bkz: backend.libs.cache.warmer).
+    """
+    from backend.libs.cache.warmer import CacheWarmer
+    
+    results = CacheWarmer.warm()
+    failed = sum(1 for result in results if not result.ok)
+    
+    logger.info(f"Tenant cache warming done: {len(results)} pages, {failed} failed")
+    return len(results)
@@ -0,0 +1 @@
+# Tenants tests
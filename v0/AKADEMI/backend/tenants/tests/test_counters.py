@@ -0,0 +1,143 @@
+"""
+Tenant Counter Tests
+====================
+
+Tenant.stats_* sayaçlarının artımlı bakımı ve mutabakat testleri.
+"""
+
+from django.test import TestCase
+
+from backend.tenants.counters import BYTES_PER_MB, TenantCounters
+
+
+class TenantCountersTest(TestCase):
+    """TenantCounters + sinyal testleri."""
+
+    def setUp(self):
+        from backend.tenants.models import Tenant
+
+        self.tenant = Tenant.objects.create(name='Akademi A', slug='akademi-a')
+        self.other_tenant = Tenant.objects.create(name='Akademi B', slug='akademi-b')
+
+    def _counters(self, tenant):
+        tenant.refresh_from_db(fields=list(TenantCounters.FIELDS))
+        return tuple(getattr(tenant, field) for field in TenantCounters.FIELDS)
+
+    def _user(self, index, tenant=None):
+        from backend.users.models import User
+
+        return User.objects.create_user(
+            email=f'user{index}@test.com',
+            password='testpass123',
+            tenant=tenant or self.tenant,
+            role='STUDENT',
+        )
+
+    def _course(self, index, tenant=None):
+        from backend.courses.models import Course
+
+        return Course.objects.create(
+            title=f'Course {index}',
+            slug=f'course-{index}',
+            description='Test course description',
+            category='Technology',
+            tenant=tenant or self.tenant,
+        )
+
+    def _upload(self, size, tenant=None):
+        from backend.storage.models import FileUpload
+
+        return FileUpload.objects.create(
+            tenant=tenant or self.tenant,
+            file=f'uploads/test-{size}.bin',
+            original_filename='test.bin',
+            file_size=size,
+        )
+
+    def test_create_and_delete_adjust_counters(self):
+        """Kayıt oluşturma artırır, silme azaltır."""
+        users = [self._user(index) for index in range(3)]
+        course = self._course(1)
+        self._course(2)
+
+        self.assertEqual(self._counters(self.tenant), (3, 2, 0))
+
+        users[0].delete()
+        course.delete()
+
+        self.assertEqual(self._counters(self.tenant), (2, 1, 0))
+
+    def test_storage_counts_rounded_mb_and_skips_deleted(self):
+        """Dosyalar yukarı yuvarlanmış MB sayılır; silinmiş (soft) dosya düşer."""
+        from backend.storage.models import FileUpload
+
+        upload = self._upload(int(1.5 * BYTES_PER_MB))
+        self._upload(10)
+
+        self.assertEqual(self._counters(self.tenant)[2], 3)
+
+        upload.status = FileUpload.Status.DELETED
+        upload.save()
+
+        self.assertEqual(self._counters(self.tenant)[2], 1)
+
+    def test_moving_user_between_tenants(self):
+        """Tenant değiştiren kullanıcı eski tenant'tan düşer, yenisine eklenir."""
+        user = self._user(1)
+
+        user.tenant = self.other_tenant
+        user.save()
+
+        self.assertEqual(self._counters(self.tenant)[0], 0)
+        self.assertEqual(self._counters(self.other_tenant)[0], 1)
+
+    def test_decrement_never_goes_negative(self):
+        """Sapmış sayaç silmede 0'ın altına inmez."""
+        from backend.tenants.models import Tenant
+
+        user = self._user(1)
+        Tenant.objects.filter(pk=self.tenant.pk).update(stats_users=0)
+
+        user.delete()
+
+        self.assertEqual(self._counters(self.tenant)[0], 0)
+
+    def test_reconcile_fixes_drift(self):
+        """Sinyalsiz toplu işlemlerin yarattığı sapma mutabakatla düzelir."""
+        from backend.courses.models import Course
+        from backend.tenants.models import Tenant
+
+        self._user(1)
+        self._user(2, tenant=self.other_tenant)
+        self._upload(2 * BYTES_PER_MB)
+        # Sinyal tetiklemeyen işlemler
+        Course.objects.bulk_create([
+            Course(
+                title=f'Bulk {index}',
+                slug=f'bulk-{index}',
+                description='Test course description',
+                category='Technology',
+                tenant=self.tenant,
+            )
+            for index in range(4)
+        ])
+        Tenant.objects.filter(pk=self.other_tenant.pk).update(stats_users=7)
+
+        self.assertEqual(self._counters(self.tenant), (1, 0, 2))
+
+        fixed = TenantCounters.reconcile()
+
+        self.assertEqual(fixed, 2)
+        self.assertEqual(self._counters(self.tenant), (1, 4, 2))
+        self.assertEqual(self._counters(self.other_tenant), (1, 0, 0))
+        self.assertEqual(TenantCounters.reconcile(), 0)
+
+    def test_reconcile_scoped_to_given_tenants(self):
+        """tenant_ids verilirse sadece o tenant'lar düzeltilir."""
+        from backend.tenants.models import Tenant
+
+        Tenant.objects.update(stats_courses=5)
+
+        self.assertEqual(TenantCounters.reconcile([self.tenant.id]), 1)
+        self.assertEqual(self._counters(self.tenant)[1], 0)
+        self.assertEqual(self._counters(self.other_tenant)[1], 5)
@@ -17,6 +17,7 @@ from backend.users.permissions import (
     IsTenantAdmin,
 )
 
+from .cache import TenantCache
 from .models import Tenant, TenantSettings
 from .serializers import (
     TenantCreateSerializer,
@@ -121,6 +122,12 @@ class TenantViewSet(viewsets.ModelViewSet):
         """
         tenant = self.get_object()
         
+        # Okuma: iki katmanlı cache
+        if request.method == 'GET':
+            settings = TenantCache.get_settings(tenant.id)
+            if settings is not None:
+                return Response(TenantSettingsSerializer(settings).data)
+        
         # Settings objesi yoksa oluştur
         settings, _ = TenantSettings.objects.get_or_create(tenant=tenant)
         
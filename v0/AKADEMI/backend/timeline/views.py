@@ -13,9 +13,11 @@ from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 
 from backend.courses.models import Course, CourseContent
+from backend.courses.outline import CourseOutline
+from backend.libs.cache.conditional import conditional_view, model_validators
 from backend.player.models import PlaybackSession
 
-from .models import TimelineNode
+from .models import TimelineNode, TimelineNodeInteraction
 from .serializers import (
     TimelineNodeSerializer,
     TimelineResponseSerializer,
@@ -32,25 +34,36 @@ class TimelineView(APIView):
     Timeline API.
     
     Endpoint:
-        GET /timeline/  → Timeline node'larını getir
+        GET /timeline/  → Timeline node'larını getir (ETag / 304)
     """
     
     permission_classes = [IsAuthenticated]
     
     def get_course_and_content(self, request, course_id, content_id):
         """URL'den course ve content objelerini al."""
-        course = get_object_or_404(
-            Course.objects.filter(tenant=request.user.tenant),
-            id=course_id
+        return CourseOutline.get_course_and_content(
+            request.user.tenant_id, course_id, content_id
         )
+    
+    def get_validators(self, request, course_id, content_id):
+        """
+        Timeline doğrulayıcıları (ETag / Last-Modified).
         
-        content = get_object_or_404(
-            CourseContent.objects.filter(module__course=course),
-            id=content_id
+        Node'lar ve kullanıcının etkileşimlerinin sayısı + son değişikliği;
+        yanıt serialize edilmeden 304 kararı verilir.
+        """
+        course, content = self.get_course_and_content(request, course_id, content_id)
+        include_inactive = (
+            request.query_params.get('include_inactive', '').lower() == 'true'
+            and request.user.is_staff
+        )
+        return model_validators(
+            TimelineNode.objects.filter(content=content),
+            TimelineNodeInteraction.objects.filter(user=request.user, node__content=content),
+            salt=f"{request.user.pk}:{include_inactive}",
         )
-        
-        return course, content
     
+    @conditional_view(lambda view, request, *args, **kwargs: view.get_validators(request, *args, **kwargs))
     def get(self, request, course_id, content_id):
         """
         Timeline node'larını getir.
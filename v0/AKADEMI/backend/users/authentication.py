@@ -0,0 +1,46 @@
+"""
+User Authentication
+===================
+
+Kullanıcıyı iki katmanlı cache'ten (bkz: backend.users.cache) okuyan
+JWT doğrulaması.
+
+Her istekte yapılan `User.objects.get()` + `request.user.tenant`
+sorguları yerine yerel katmandan (mikrosaniye) okunur.
+
+Kullanım (settings):
+    REST_FRAMEWORK['DEFAULT_AUTHENTICATION_CLASSES'] = [
+        'backend.users.authentication.CachedJWTAuthentication',
+        ...
+    ]
+"""
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from .cache import UserCache
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    Kullanıcıyı cache'ten okuyan JWTAuthentication.
+    """
+
+    def get_user(self, validated_token):
+        if (
+            api_settings.USER_ID_FIELD != 'id'
+            or getattr(api_settings, 'CHECK_REVOKE_TOKEN', False)
+            or api_settings.USER_ID_CLAIM not in validated_token
+        ):
+            return super().get_user(validated_token)
+
+        user = UserCache.get(validated_token[api_settings.USER_ID_CLAIM])
+
+        if user is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        return user
@@ -0,0 +1,54 @@
+"""
+User Cache
+==========
+
+Kimlik doğrulamada okunan kullanıcılar için iki katmanlı (process LRU +
+paylaşılan) cache (bkz: backend.libs.cache.tiered).
+
+Kullanıcının tenant ilişkisi TenantCache'ten doldurulur; böylece
+`request.user.tenant` ek sorgu çalıştırmaz. Kullanıcı kaydedildiğinde /
+silindiğinde commit sonrası invalidate edilir (bkz: backend.users.signals).
+
+Kullanım:
+    from backend.users.cache import UserCache
+
+    user = UserCache.get(user_id)
+"""
+
+from typing import Iterable
+
+from django.contrib.auth import get_user_model
+from backend.libs.cache.invalidation import invalidate
+from backend.libs.cache.tiered import tiered_cache
+
+
+class UserCache:
+    """
+    Kullanıcı cache'i.
+    """
+
+    FAMILY = 'user'
+
+    @classmethod
+    def get(cls, user_id):
+        """Kullanıcı (tenant ilişkisi doldurulmuş) - yoksa None."""
+        from backend.tenants.cache import TenantCache
+
+        User = get_user_model()
+
+        if not user_id:
+            return None
+        user = tiered_cache(cls.FAMILY).get_or_set(
+            str(user_id),
+            lambda: User.objects.filter(pk=user_id).first(),
+        )
+        if user is not None and user.tenant_id:
+            tenant = TenantCache.get(user.tenant_id)
+            if tenant is not None:
+                User.tenant.field.set_cached_value(user, tenant)
+        return user
+
+    @classmethod
+    def invalidate(cls, user_ids: Iterable) -> None:
+        """Kullanıcıları commit sonrası invalidate et."""
+        invalidate(tiered={cls.FAMILY: [str(pk) for pk in user_ids if pk]})
@@ -11,10 +11,11 @@ Signals:
 - user_logged_in: Kullanıcı giriş yaptığında (audit log)
 - user_logged_out: Kullanıcı çıkış yaptığında (audit log)
 - user_login_failed: Başarısız giriş denemesi (audit log)
+- post_save / post_delete: Kimlik doğrulama cache'i invalidation (UserCache)
 """
 
 import logging
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 from django.contrib.auth.signals import user_logged_in, user_logged_out, user_login_failed
@@ -138,3 +139,18 @@ def save_user_profile(sender, instance, **kwargs):
     except Exception:
         pass
 
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """
+    Kullanıcı değiştiğinde kimlik doğrulama cache'ini temizle.
+    
+    Sadece last_login güncellemesi (her girişte) cache'i bozmaz.
+    """
+    update_fields = kwargs.get('update_fields')
+    if update_fields and set(update_fields) <= {'last_login', 'last_login_ip'}:
+        return
+    
+    from .cache import UserCache
+    UserCache.invalidate([instance.pk])
@@ -0,0 +1 @@
+# Users tests
@@ -0,0 +1,121 @@
+"""
+User Cache Tests
+================
+
+UserCache ve CachedJWTAuthentication testleri.
+"""
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from backend.libs.cache.tiered import tiered_cache
+from backend.users.authentication import CachedJWTAuthentication
+from backend.users.cache import UserCache
+
+
+class UserCacheTestMixin:
+    """Her testte paylaşılan ve yerel katmanları boşalt."""
+
+    def setUp(self):
+        cache.clear()
+        for family in ('user', 'tenant'):
+            tiered_cache(family).clear_local()
+
+    @classmethod
+    def setUpTestData(cls):
+        from backend.tenants.models import Tenant
+        from backend.users.models import User
+
+        cls.tenant = Tenant.objects.create(name='Test Akademi', slug='test-akademi')
+        cls.user = User.objects.create_user(
+            email='student@test.com',
+            password='testpass123',
+            first_name='Ada',
+            tenant=cls.tenant,
+            role='STUDENT',
+        )
+
+
+class UserCacheTest(UserCacheTestMixin, TestCase):
+    """UserCache testleri."""
+
+    def test_cached_user_and_tenant_without_queries(self):
+        """İkinci okuma kullanıcı ve tenant için sorgu çalıştırmaz."""
+        UserCache.get(self.user.id)
+
+        with self.assertNumQueries(0):
+            user = UserCache.get(self.user.id)
+            tenant = user.tenant
+
+        self.assertEqual(user.email, 'student@test.com')
+        self.assertEqual(tenant.slug, 'test-akademi')
+
+    def test_missing_user(self):
+        self.assertIsNone(UserCache.get(None))
+        self.assertIsNone(UserCache.get(999999))
+
+    def test_save_invalidates_after_commit(self):
+        """Kaydedilen kullanıcı commit sonrası yeniden okunur."""
+        UserCache.get(self.user.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.first_name = 'Ayşe'
+            self.user.save()
+
+        self.assertEqual(UserCache.get(self.user.id).first_name, 'Ayşe')
+
+    def test_last_login_update_keeps_cache(self):
+        """Sadece last_login güncellemesi cache'i bozmaz."""
+        UserCache.get(self.user.id)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.user.save(update_fields=['last_login'])
+
+        self.assertEqual(callbacks, [])
+
+
+class CachedJWTAuthenticationTest(UserCacheTestMixin, TestCase):
+    """CachedJWTAuthentication testleri."""
+
+    def _user_for(self, user):
+        authentication = CachedJWTAuthentication()
+        token = authentication.get_validated_token(str(AccessToken.for_user(user)))
+        return authentication.get_user(token)
+
+    def test_user_read_from_cache(self):
+        """Doğrulanan kullanıcı ikinci istekte sorgusuz gelir."""
+        self._user_for(self.user)
+
+        with self.assertNumQueries(0):
+            user = self._user_for(self.user)
+            user.tenant
+
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_inactive_user_rejected(self):
+        """Pasife alınan kullanıcı invalidation sonrası reddedilir."""
+        self._user_for(self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self._user_for(self.user)
+
+    def test_deleted_user_rejected(self):
+        from backend.users.models import User
+
+        user = User.objects.create_user(
+            email='deleted@test.com', password='testpass123', tenant=self.tenant, role='STUDENT',
+        )
+        token = str(AccessToken.for_user(user))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user.delete()
+
+        authentication = CachedJWTAuthentication()
+        with self.assertRaises(AuthenticationFailed):
+            authentication.get_user(authentication.get_validated_token(token))